@@ -16,70 +16,247 @@
 #
 
 
+import importlib
+from typing import TYPE_CHECKING
+
 from google.cloud.aiplatform import version as aiplatform_version
 
 __version__ = aiplatform_version.__version__
 
+_METADATA = "google.cloud.aiplatform.metadata"
+_TRAINING_JOBS = "google.cloud.aiplatform.training_jobs"
+_TENSORBOARD = "google.cloud.aiplatform.tensorboard"
+_EXPERIMENT_TRACKER = "_experiment_tracker"
+_TENSORBOARD_TRACKER = "_tensorboard_tracker"
 
-from google.cloud.aiplatform import initializer
+# Maps the public names that are loaded on first access (PEP 562) to the module
+# and the attribute path that define them. This keeps `import aiplatform` from
+# importing every resource module, and their dependencies, up front.
+_LAZY_ATTRIBUTES = {
+    "ImageDataset": ("google.cloud.aiplatform.datasets", "ImageDataset"),
+    "TabularDataset": ("google.cloud.aiplatform.datasets", "TabularDataset"),
+    "TextDataset": ("google.cloud.aiplatform.datasets", "TextDataset"),
+    "TimeSeriesDataset": ("google.cloud.aiplatform.datasets", "TimeSeriesDataset"),
+    "VideoDataset": ("google.cloud.aiplatform.datasets", "VideoDataset"),
+    "EntityType": ("google.cloud.aiplatform.featurestore", "EntityType"),
+    "Feature": ("google.cloud.aiplatform.featurestore", "Feature"),
+    "Featurestore": ("google.cloud.aiplatform.featurestore", "Featurestore"),
+    "MatchingEngineIndex": (
+        "google.cloud.aiplatform.matching_engine",
+        "MatchingEngineIndex",
+    ),
+    "MatchingEngineIndexEndpoint": (
+        "google.cloud.aiplatform.matching_engine",
+        "MatchingEngineIndexEndpoint",
+    ),
+    "uploader_tracker": (f"{_TENSORBOARD}.uploader_tracker", ""),
+    "Endpoint": ("google.cloud.aiplatform.models", "Endpoint"),
+    "PrivateEndpoint": ("google.cloud.aiplatform.models", "PrivateEndpoint"),
+    "Model": ("google.cloud.aiplatform.models", "Model"),
+    "ModelRegistry": ("google.cloud.aiplatform.models", "ModelRegistry"),
+    "ModelEvaluation": ("google.cloud.aiplatform.model_evaluation", "ModelEvaluation"),
+    "BatchPredictionJob": ("google.cloud.aiplatform.jobs", "BatchPredictionJob"),
+    "CustomJob": ("google.cloud.aiplatform.jobs", "CustomJob"),
+    "HyperparameterTuningJob": (
+        "google.cloud.aiplatform.jobs",
+        "HyperparameterTuningJob",
+    ),
+    "ModelDeploymentMonitoringJob": (
+        "google.cloud.aiplatform.jobs",
+        "ModelDeploymentMonitoringJob",
+    ),
+    "PipelineJob": ("google.cloud.aiplatform.pipeline_jobs", "PipelineJob"),
+    "PipelineJobSchedule": (
+        "google.cloud.aiplatform.pipeline_job_schedules",
+        "PipelineJobSchedule",
+    ),
+    "Tensorboard": (_TENSORBOARD, "Tensorboard"),
+    "TensorboardExperiment": (_TENSORBOARD, "TensorboardExperiment"),
+    "TensorboardRun": (_TENSORBOARD, "TensorboardRun"),
+    "TensorboardTimeSeries": (_TENSORBOARD, "TensorboardTimeSeries"),
+    "CustomTrainingJob": (_TRAINING_JOBS, "CustomTrainingJob"),
+    "CustomContainerTrainingJob": (_TRAINING_JOBS, "CustomContainerTrainingJob"),
+    "CustomPythonPackageTrainingJob": (
+        _TRAINING_JOBS,
+        "CustomPythonPackageTrainingJob",
+    ),
+    "AutoMLTabularTrainingJob": (_TRAINING_JOBS, "AutoMLTabularTrainingJob"),
+    "AutoMLForecastingTrainingJob": (_TRAINING_JOBS, "AutoMLForecastingTrainingJob"),
+    "SequenceToSequencePlusForecastingTrainingJob": (
+        _TRAINING_JOBS,
+        "SequenceToSequencePlusForecastingTrainingJob",
+    ),
+    "TemporalFusionTransformerForecastingTrainingJob": (
+        _TRAINING_JOBS,
+        "TemporalFusionTransformerForecastingTrainingJob",
+    ),
+    "TimeSeriesDenseEncoderForecastingTrainingJob": (
+        _TRAINING_JOBS,
+        "TimeSeriesDenseEncoderForecastingTrainingJob",
+    ),
+    "AutoMLImageTrainingJob": (_TRAINING_JOBS, "AutoMLImageTrainingJob"),
+    "AutoMLTextTrainingJob": (_TRAINING_JOBS, "AutoMLTextTrainingJob"),
+    "AutoMLVideoTrainingJob": (_TRAINING_JOBS, "AutoMLVideoTrainingJob"),
+    "get_pipeline_df": (
+        f"{_METADATA}.metadata",
+        "_LegacyExperimentService.get_pipeline_df",
+    ),
+    "log_params": (f"{_METADATA}.metadata", f"{_EXPERIMENT_TRACKER}.log_params"),
+    "log_metrics": (f"{_METADATA}.metadata", f"{_EXPERIMENT_TRACKER}.log_metrics"),
+    "log_classification_metrics": (
+        f"{_METADATA}.metadata",
+        f"{_EXPERIMENT_TRACKER}.log_classification_metrics",
+    ),
+    "log_model": (f"{_METADATA}.metadata", f"{_EXPERIMENT_TRACKER}.log_model"),
+    "get_experiment_df": (
+        f"{_METADATA}.metadata",
+        f"{_EXPERIMENT_TRACKER}.get_experiment_df",
+    ),
+    "start_run": (f"{_METADATA}.metadata", f"{_EXPERIMENT_TRACKER}.start_run"),
+    "autolog": (f"{_METADATA}.metadata", f"{_EXPERIMENT_TRACKER}.autolog"),
+    "start_execution": (
+        f"{_METADATA}.metadata",
+        f"{_EXPERIMENT_TRACKER}.start_execution",
+    ),
+    "log": (f"{_METADATA}.metadata", f"{_EXPERIMENT_TRACKER}.log"),
+    "log_time_series_metrics": (
+        f"{_METADATA}.metadata",
+        f"{_EXPERIMENT_TRACKER}.log_time_series_metrics",
+    ),
+    "end_run": (f"{_METADATA}.metadata", f"{_EXPERIMENT_TRACKER}.end_run"),
+    "upload_tb_log": (
+        f"{_TENSORBOARD}.uploader_tracker",
+        f"{_TENSORBOARD_TRACKER}.upload_tb_log",
+    ),
+    "start_upload_tb_log": (
+        f"{_TENSORBOARD}.uploader_tracker",
+        f"{_TENSORBOARD_TRACKER}.start_upload_tb_log",
+    ),
+    "end_upload_tb_log": (
+        f"{_TENSORBOARD}.uploader_tracker",
+        f"{_TENSORBOARD_TRACKER}.end_upload_tb_log",
+    ),
+    "save_model": (f"{_METADATA}._models", "save_model"),
+    "get_experiment_model": (
+        f"{_METADATA}.schema.google.artifact_schema",
+        "ExperimentModel.get",
+    ),
+    "Experiment": (f"{_METADATA}.experiment_resources", "Experiment"),
+    "ExperimentRun": (f"{_METADATA}.experiment_run_resource", "ExperimentRun"),
+    "Artifact": (f"{_METADATA}.artifact", "Artifact"),
+    "Execution": (f"{_METADATA}.execution", "Execution"),
+    "Context": (f"{_METADATA}.context", "Context"),
+    "as_completed": ("google.cloud.aiplatform._job_watcher", "as_completed"),
+    "as_completed_async": (
+        "google.cloud.aiplatform._job_watcher",
+        "as_completed_async",
+    ),
+    "wait_all": ("google.cloud.aiplatform._job_watcher", "wait_all"),
+    "wait_all_async": ("google.cloud.aiplatform._job_watcher", "wait_all_async"),
+}
 
-from google.cloud.aiplatform.datasets import (
-    ImageDataset,
-    TabularDataset,
-    TextDataset,
-    TimeSeriesDataset,
-    VideoDataset,
-)
-from google.cloud.aiplatform import explain
-from google.cloud.aiplatform import gapic
-from google.cloud.aiplatform import hyperparameter_tuning
-from google.cloud.aiplatform.featurestore import (
-    EntityType,
-    Feature,
-    Featurestore,
-)
-from google.cloud.aiplatform.matching_engine import (
-    MatchingEngineIndex,
-    MatchingEngineIndexEndpoint,
-)
-from google.cloud.aiplatform import metadata
-from google.cloud.aiplatform.tensorboard import uploader_tracker
-from google.cloud.aiplatform.models import Endpoint
-from google.cloud.aiplatform.models import PrivateEndpoint
-from google.cloud.aiplatform.models import Model
-from google.cloud.aiplatform.models import ModelRegistry
-from google.cloud.aiplatform.model_evaluation import ModelEvaluation
-from google.cloud.aiplatform.jobs import (
-    BatchPredictionJob,
-    CustomJob,
-    HyperparameterTuningJob,
-    ModelDeploymentMonitoringJob,
-)
-from google.cloud.aiplatform.pipeline_jobs import PipelineJob
-from google.cloud.aiplatform.pipeline_job_schedules import (
-    PipelineJobSchedule,
-)
-from google.cloud.aiplatform.tensorboard import (
-    Tensorboard,
-    TensorboardExperiment,
-    TensorboardRun,
-    TensorboardTimeSeries,
-)
-from google.cloud.aiplatform.training_jobs import (
-    CustomTrainingJob,
-    CustomContainerTrainingJob,
-    CustomPythonPackageTrainingJob,
-    AutoMLTabularTrainingJob,
-    AutoMLForecastingTrainingJob,
-    SequenceToSequencePlusForecastingTrainingJob,
-    TemporalFusionTransformerForecastingTrainingJob,
-    TimeSeriesDenseEncoderForecastingTrainingJob,
-    AutoMLImageTrainingJob,
-    AutoMLTextTrainingJob,
-    AutoMLVideoTrainingJob,
-)
+# Drops the attributes loaded before a reload of the package, so that they are
+# loaded again from the reloaded modules.
+for _name in _LAZY_ATTRIBUTES:
+    globals().pop(_name, None)
+
+
+def __getattr__(name: str):
+    """Loads the lazily imported public names and submodules of the package."""
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute_path = _LAZY_ATTRIBUTES[name]
+        value = importlib.import_module(module_name)
+        for attribute in filter(None, attribute_path.split(".")):
+            value = getattr(value, attribute)
+        globals()[name] = value
+        return value
+    # Submodules, e.g. `aiplatform.models`, were available without importing them.
+    if not name.startswith("__"):
+        module_name = f"{__name__}.{name}"
+        try:
+            return importlib.import_module(module_name)
+        except ModuleNotFoundError as e:
+            if e.name != module_name:
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from google.cloud.aiplatform import helpers
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+from google.cloud.aiplatform import initializer  # noqa: E402
+
+if TYPE_CHECKING:
+    from google.cloud.aiplatform.datasets import (
+        ImageDataset,
+        TabularDataset,
+        TextDataset,
+        TimeSeriesDataset,
+        VideoDataset,
+    )
+    from google.cloud.aiplatform import explain
+    from google.cloud.aiplatform import gapic
+    from google.cloud.aiplatform import hyperparameter_tuning
+    from google.cloud.aiplatform.featurestore import (
+        EntityType,
+        Feature,
+        Featurestore,
+    )
+    from google.cloud.aiplatform.matching_engine import (
+        MatchingEngineIndex,
+        MatchingEngineIndexEndpoint,
+    )
+    from google.cloud.aiplatform import metadata  # noqa: F401
+    from google.cloud.aiplatform.tensorboard import uploader_tracker  # noqa: F401
+    from google.cloud.aiplatform.models import Endpoint
+    from google.cloud.aiplatform.models import PrivateEndpoint
+    from google.cloud.aiplatform.models import Model
+    from google.cloud.aiplatform.models import ModelRegistry
+    from google.cloud.aiplatform.model_evaluation import ModelEvaluation
+    from google.cloud.aiplatform.jobs import (
+        BatchPredictionJob,
+        CustomJob,
+        HyperparameterTuningJob,
+        ModelDeploymentMonitoringJob,
+    )
+    from google.cloud.aiplatform.pipeline_jobs import PipelineJob
+    from google.cloud.aiplatform._job_watcher import (
+        as_completed,
+        as_completed_async,
+        wait_all,
+        wait_all_async,
+    )
+    from google.cloud.aiplatform.pipeline_job_schedules import (
+        PipelineJobSchedule,
+    )
+    from google.cloud.aiplatform.tensorboard import (
+        Tensorboard,
+        TensorboardExperiment,
+        TensorboardRun,
+        TensorboardTimeSeries,
+    )
+    from google.cloud.aiplatform.training_jobs import (
+        CustomTrainingJob,
+        CustomContainerTrainingJob,
+        CustomPythonPackageTrainingJob,
+        AutoMLTabularTrainingJob,
+        AutoMLForecastingTrainingJob,
+        SequenceToSequencePlusForecastingTrainingJob,
+        TemporalFusionTransformerForecastingTrainingJob,
+        TimeSeriesDenseEncoderForecastingTrainingJob,
+        AutoMLImageTrainingJob,
+        AutoMLTextTrainingJob,
+        AutoMLVideoTrainingJob,
+    )
+    from google.cloud.aiplatform import helpers
+    from google.cloud.aiplatform.metadata.experiment_resources import Experiment
+    from google.cloud.aiplatform.metadata.experiment_run_resource import (
+        ExperimentRun,
+    )
+    from google.cloud.aiplatform.metadata.artifact import Artifact
+    from google.cloud.aiplatform.metadata.execution import Execution
+    from google.cloud.aiplatform.metadata.context import Context  # noqa: F401
 
 """
 Usage:
@@ -89,35 +266,6 @@ aiplatform.init(project='my_project')
 """
 init = initializer.global_config.init
 
-get_pipeline_df = metadata.metadata._LegacyExperimentService.get_pipeline_df
-
-log_params = metadata.metadata._experiment_tracker.log_params
-log_metrics = metadata.metadata._experiment_tracker.log_metrics
-log_classification_metrics = (
-    metadata.metadata._experiment_tracker.log_classification_metrics
-)
-log_model = metadata.metadata._experiment_tracker.log_model
-get_experiment_df = metadata.metadata._experiment_tracker.get_experiment_df
-start_run = metadata.metadata._experiment_tracker.start_run
-autolog = metadata.metadata._experiment_tracker.autolog
-start_execution = metadata.metadata._experiment_tracker.start_execution
-log = metadata.metadata._experiment_tracker.log
-log_time_series_metrics = metadata.metadata._experiment_tracker.log_time_series_metrics
-end_run = metadata.metadata._experiment_tracker.end_run
-
-upload_tb_log = uploader_tracker._tensorboard_tracker.upload_tb_log
-start_upload_tb_log = uploader_tracker._tensorboard_tracker.start_upload_tb_log
-end_upload_tb_log = uploader_tracker._tensorboard_tracker.end_upload_tb_log
-
-save_model = metadata._models.save_model
-get_experiment_model = metadata.schema.google.artifact_schema.ExperimentModel.get
-
-Experiment = metadata.experiment_resources.Experiment
-ExperimentRun = metadata.experiment_run_resource.ExperimentRun
-Artifact = metadata.artifact.Artifact
-Execution = metadata.execution.Execution
-Context = metadata.context.Context
-
 
 __all__ = (
     "end_run",
@@ -138,6 +286,10 @@ __all__ = (
     "start_execution",
     "save_model",
     "get_experiment_model",
+    "as_completed",
+    "as_completed_async",
+    "wait_all",
+    "wait_all_async",
     "Artifact",
     "AutoMLImageTrainingJob",
     "AutoMLTabularTrainingJob",
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Waits on many jobs with shared, adaptive polling.
+
+Instead of polling each job with its own getter request, the watcher polls
+each kind of job of a location with one List request, filtered to the jobs
+updated since the oldest update it knows of.
+"""
+
+import asyncio
+import collections
+import time
+from typing import (
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from google.cloud.aiplatform import base
+from google.cloud.aiplatform import initializer
+
+_LOGGER = base.Logger(__name__)
+
+# Jobs are polled after this fraction of the time they have been running, so
+# that long running jobs, which are expected to keep running for a while, are
+# polled less often.
+_POLL_INTERVAL_FRACTION = 0.1
+_MIN_POLL_INTERVAL = 5
+_MAX_POLL_INTERVAL = 60
+
+_Job = TypeVar("_Job", bound=base.VertexAiStatefulResource)
+
+
+def get_poll_interval(
+    elapsed_secs: float,
+    min_interval: Optional[float] = None,
+    max_interval: Optional[float] = None,
+) -> float:
+    """Returns how long to wait before polling a job again.
+
+    Args:
+        elapsed_secs (float):
+            Required. How long the job has been running, in seconds.
+        min_interval (float):
+            Optional. The shortest interval, in seconds. Defaults to 5 seconds.
+        max_interval (float):
+            Optional. The longest interval, in seconds. Defaults to 60 seconds.
+
+    Returns:
+        The poll interval in seconds.
+    """
+    if min_interval is None:
+        min_interval = _MIN_POLL_INTERVAL
+    if max_interval is None:
+        max_interval = max(_MAX_POLL_INTERVAL, min_interval)
+    interval = max(elapsed_secs * _POLL_INTERVAL_FRACTION, min_interval)
+    return min(interval, max_interval)
+
+
+class JobWatcher:
+    """Polls the states of many jobs with one List request per kind of job.
+
+    Jobs are grouped by their List method, project, location and credentials.
+    Each job is polled at an interval that grows with the time it has been
+    running, and a group is listed when any of its jobs is due.
+    """
+
+    def __init__(self, jobs: Iterable[_Job]):
+        """Starts watching jobs.
+
+        Args:
+            jobs (Iterable[_Job]):
+                Required. The jobs to watch. Jobs that are still being created
+                are waited on first.
+        """
+        self._start_time = time.time()
+        self._pending: Dict[str, _Job] = {}
+        self._next_poll_times: Dict[str, float] = {}
+        for job in jobs:
+            job._wait_for_resource_creation()
+            self._pending[job.resource_name] = job
+            # Every job is polled right away.
+            self._next_poll_times[job.resource_name] = self._start_time
+
+    @property
+    def pending_jobs(self) -> List[_Job]:
+        """The jobs that have not completed yet."""
+        return list(self._pending.values())
+
+    @property
+    def next_poll_time(self) -> Optional[float]:
+        """The time at which the next job is due, or None if none is pending."""
+        return min(self._next_poll_times.values(), default=None)
+
+    def poll(self) -> List[_Job]:
+        """Lists the groups of jobs that are due and updates their resources.
+
+        Returns:
+            The jobs that completed since the previous poll.
+        """
+        now = time.time()
+        groups: Dict[Hashable, List[_Job]] = collections.defaultdict(list)
+        for job in self._pending.values():
+            groups[self._get_group_key(job)].append(job)
+
+        completed_jobs = []
+        for group_jobs in groups.values():
+            if all(
+                self._next_poll_times[job.resource_name] > now for job in group_jobs
+            ):
+                continue
+            self._list_group(group_jobs)
+            for job in group_jobs:
+                if job._gca_resource.state in job._valid_done_states:
+                    _LOGGER.info(
+                        "%s %s completed with state:\n%s"
+                        % (
+                            job.__class__.__name__,
+                            job.resource_name,
+                            job._gca_resource.state,
+                        )
+                    )
+                    completed_jobs.append(job)
+                    del self._pending[job.resource_name]
+                    del self._next_poll_times[job.resource_name]
+                else:
+                    self._next_poll_times[job.resource_name] = now + get_poll_interval(
+                        self._get_elapsed_secs(job, now)
+                    )
+        return completed_jobs
+
+    @staticmethod
+    def _get_group_key(job: _Job) -> Tuple[type, str, str, str, int]:
+        """Returns the key of the jobs that can be listed by the same request."""
+        return (
+            type(job.api_client),
+            job._list_method,
+            job.project,
+            job.location,
+            id(job.credentials),
+        )
+
+    def _get_elapsed_secs(self, job: _Job, now: float) -> float:
+        """Returns how long a job has been running, in seconds."""
+        create_time = job._gca_resource.create_time
+        if create_time is None:
+            return now - self._start_time
+        return max(now - create_time.timestamp(), 0)
+
+    @staticmethod
+    def _list_group(jobs: List[_Job]):
+        """Lists the jobs of a group updated since the oldest known update.
+
+        A job that is updated after the previous poll has a later update time
+        than the one it had then, so it is returned by the filtered request.
+        """
+        job = jobs[0]
+        list_request = {
+            "parent": initializer.global_config.common_location_path(
+                project=job.project, location=job.location
+            )
+        }
+        update_times = [job._gca_resource.update_time for job in jobs]
+        if all(update_times):
+            oldest_update_time = min(update_times).rfc3339()
+            list_request["filter"] = f'update_time>="{oldest_update_time}"'
+
+        jobs_by_name = {job.resource_name: job for job in jobs}
+        list_method = getattr(job.api_client, job._list_method)
+        for gca_resource in list_method(request=list_request):
+            job = jobs_by_name.get(gca_resource.name)
+            if job is not None:
+                job._gca_resource = gca_resource
+
+
+def as_completed(
+    jobs: Iterable[_Job], timeout: Optional[float] = None
+) -> Iterator[_Job]:
+    """Yields jobs as they complete.
+
+    The states of the jobs are polled with one List request per kind of job
+    and location, instead of one request per job.
+
+    Example usage:
+        ```
+        jobs = [aiplatform.BatchPredictionJob.submit(...) for ...]
+        for job in aiplatform.as_completed(jobs):
+            print(job.resource_name, job.state)
+        ```
+
+    Args:
+        jobs (Iterable[_Job]):
+            Required. The jobs to wait on, for example `CustomJob` or
+            `BatchPredictionJob` objects.
+        timeout (float):
+            Optional. The maximum time to wait, in seconds. Waits until all the
+            jobs complete if None.
+
+    Yields:
+        The completed jobs, in completion order. Failed and cancelled jobs are
+        yielded as well.
+
+    Raises:
+        TimeoutError: If jobs are still running after `timeout` seconds.
+    """
+    watcher = JobWatcher(jobs)
+    deadline = None if timeout is None else time.time() + timeout
+    while True:
+        yield from watcher.poll()
+        next_poll_time = watcher.next_poll_time
+        if next_poll_time is None:
+            return
+        if deadline is not None and next_poll_time > deadline:
+            raise TimeoutError(
+                f"{len(watcher.pending_jobs)} jobs did not complete in "
+                f"{timeout} seconds."
+            )
+        time.sleep(max(next_poll_time - time.time(), 0))
+
+
+def wait_all(jobs: Iterable[_Job], timeout: Optional[float] = None) -> List[_Job]:
+    """Blocks until all the jobs complete.
+
+    Args:
+        jobs (Iterable[_Job]):
+            Required. The jobs to wait on.
+        timeout (float):
+            Optional. The maximum time to wait, in seconds. Waits until all the
+            jobs complete if None.
+
+    Returns:
+        The jobs, in completion order.
+
+    Raises:
+        TimeoutError: If jobs are still running after `timeout` seconds.
+    """
+    return list(as_completed(jobs, timeout=timeout))
+
+
+async def as_completed_async(
+    jobs: Iterable[_Job], timeout: Optional[float] = None
+) -> AsyncIterator[_Job]:
+    """Asynchronously yields jobs as they complete.
+
+    The List requests run in the default executor of the event loop, so that
+    they do not block it.
+
+    Args:
+        jobs (Iterable[_Job]):
+            Required. The jobs to wait on.
+        timeout (float):
+            Optional. The maximum time to wait, in seconds. Waits until all the
+            jobs complete if None.
+
+    Yields:
+        The completed jobs, in completion order.
+
+    Raises:
+        TimeoutError: If jobs are still running after `timeout` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    watcher = await loop.run_in_executor(None, JobWatcher, list(jobs))
+    deadline = None if timeout is None else time.time() + timeout
+    while True:
+        for job in await loop.run_in_executor(None, watcher.poll):
+            yield job
+        next_poll_time = watcher.next_poll_time
+        if next_poll_time is None:
+            return
+        if deadline is not None and next_poll_time > deadline:
+            raise TimeoutError(
+                f"{len(watcher.pending_jobs)} jobs did not complete in "
+                f"{timeout} seconds."
+            )
+        await asyncio.sleep(max(next_poll_time - time.time(), 0))
+
+
+async def wait_all_async(
+    jobs: Iterable[_Job], timeout: Optional[float] = None
+) -> List[_Job]:
+    """Asynchronously waits until all the jobs complete.
+
+    Args:
+        jobs (Iterable[_Job]):
+            Required. The jobs to wait on.
+        timeout (float):
+            Optional. The maximum time to wait, in seconds. Waits until all the
+            jobs complete if None.
+
+    Returns:
+        The jobs, in completion order.
+
+    Raises:
+        TimeoutError: If jobs are still running after `timeout` seconds.
+    """
+    return [job async for job in as_completed_async(jobs, timeout=timeout)]
@@ -21,6 +21,7 @@ from typing import (
     Any,
     Dict,
     FrozenSet,
+    Iterator,
     Optional,
     List,
     Tuple,
@@ -409,6 +410,60 @@ class _VertexAiPipelineBasedService(base.VertexAiStatefulResource):
 
         return service_pipeline_jobs
 
+    @classmethod
+    def list_iter(
+        cls,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[str] = None,
+    ) -> Iterator["_VertexAiPipelineBasedService"]:
+        """Lazily lists the PipelineJob resources associated with this Pipeline
+        Based service, one page of pipeline executions at a time.
+
+        Args:
+            page_size (int):
+                Optional. The maximum number of pipeline executions per page.
+                The service default is used if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the executions of the current page are consumed.
+            project (str):
+                Optional. The project to retrieve the Pipeline Based Services from.
+                If not set, the project set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve the Pipeline Based Services from.
+                If not set, location set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve the Pipeline Based
+                Services from. Overrides credentials set in aiplatform.init.
+        Yields:
+            The Pipeline Based Services.
+        """
+
+        filter_str = f"metadata.component_type.string_value={cls._component_identifier}"
+
+        for pipeline_execution in aiplatform.Execution.list_iter(
+            filter=filter_str,
+            page_size=page_size,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+        ):
+            if "pipeline_job_resource_name" in pipeline_execution.metadata:
+                # See `list` for why this is wrapped in a try/except.
+                try:
+                    yield cls(
+                        pipeline_execution.metadata["pipeline_job_resource_name"],
+                        project=project,
+                        location=location,
+                        credentials=credentials,
+                    )
+                except ValueError:
+                    continue
+
     def wait(self):
         """Wait for the PipelineJob to complete."""
         pipeline_run = self.backing_pipeline_job
@@ -31,6 +31,7 @@ from typing import (
     Dict,
     List,
     Iterable,
+    Iterator,
     Optional,
     Sequence,
     Tuple,
@@ -56,6 +57,32 @@ from google.protobuf import json_format
 # This is the default retry callback to be used with get methods.
 _DEFAULT_RETRY = retry.Retry()
 
+_T = TypeVar("_T")
+
+
+def _prefetch_iter(iterable: Iterable[_T]) -> Iterator[_T]:
+    """Iterates over an iterable, fetching the next item on a background thread.
+
+    Args:
+        iterable (Iterable[_T]):
+            Required. An iterable whose items are slow to fetch, like the pages
+            of a pager.
+
+    Yields:
+        The items of the iterable. An item is fetched while the previous one
+        is consumed.
+    """
+    iterator = iter(iterable)
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        sentinel = object()
+        next_item = executor.submit(next, iterator, sentinel)
+        while True:
+            item = next_item.result()
+            if item is sentinel:
+                return
+            next_item = executor.submit(next, iterator, sentinel)
+            yield item
+
 
 class VertexLogger(logging.getLoggerClass()):
     """Logging wrapper class with high level helper methods."""
@@ -1038,8 +1065,109 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         sdk_resource._gca_resource = gapic_resource
         return sdk_resource
 
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: proto.Message) -> bool:
+        """Returns whether a listed GAPIC resource is an instance of this class.
+
+        Override in subclasses that share a List method with other classes.
+
+        Args:
+            gapic_resource (proto.Message):
+                Required. A GAPIC resource returned by the List method.
+
+        Returns:
+            True if the resource is listed by this class.
+        """
+        return True
+
     # TODO(b/144545165): Improve documentation for list filtering once available
-    # TODO(b/184910159): Expose `page_size` field in list method
+    @classmethod
+    def _list_iter(
+        cls,
+        cls_filter: Callable[[proto.Message], bool] = lambda _: True,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        read_mask: Optional[field_mask.FieldMask] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+    ) -> Iterator[VertexAiResourceNoun]:
+        """Private method to lazily list the instances of this Vertex AI
+        Resource, page by page. Takes the same arguments as `_list`.
+
+        Args:
+            page_size (int):
+                Optional. The maximum number of resources per page. The service
+                default is used if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the resources of the current page are consumed.
+
+        Yields:
+            The SDK resource objects.
+        """
+        if parent:
+            parent_resources = utils.extract_project_and_location_from_parent(parent)
+            if parent_resources:
+                project, location = (
+                    parent_resources["project"],
+                    parent_resources["location"],
+                )
+
+        resource = cls._empty_constructor(
+            project=project, location=location, credentials=credentials
+        )
+
+        # Fetch credentials once and re-use for all `_empty_constructor()` calls
+        creds = resource.credentials
+
+        resource_list_method = getattr(resource.api_client, resource._list_method)
+
+        list_request = {
+            "parent": parent
+            or initializer.global_config.common_location_path(
+                project=project, location=location
+            ),
+        }
+
+        if read_mask is not None:
+            list_request["read_mask"] = read_mask
+
+        if filter:
+            list_request["filter"] = filter
+
+        if order_by:
+            list_request["order_by"] = order_by
+
+        if page_size:
+            list_request["page_size"] = page_size
+
+        resource_list = resource_list_method(request=list_request) or []
+        # Pagers fetch the next page when the previous one is consumed. Mocked
+        # List methods may return a plain sequence of resources instead.
+        pages = getattr(resource_list, "pages", None)
+        if prefetch and pages is not None:
+            # List methods are named after the repeated field of their response,
+            # e.g. `list_models` returns `ListModelsResponse.models`.
+            resources_field = cls._list_method[len("list_") :]
+            resource_list = (
+                gapic_resource
+                for page in _prefetch_iter(pages)
+                for gapic_resource in getattr(page, resources_field)
+            )
+
+        for gapic_resource in resource_list:
+            if cls_filter(gapic_resource):
+                yield cls._construct_sdk_resource_from_gapic(
+                    gapic_resource,
+                    project=project,
+                    location=location,
+                    credentials=creds,
+                )
+
     @classmethod
     def _list(
         cls,
@@ -1092,49 +1220,18 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         Returns:
             List[VertexAiResourceNoun] - A list of SDK resource objects
         """
-        if parent:
-            parent_resources = utils.extract_project_and_location_from_parent(parent)
-            if parent_resources:
-                project, location = (
-                    parent_resources["project"],
-                    parent_resources["location"],
-                )
-
-        resource = cls._empty_constructor(
-            project=project, location=location, credentials=credentials
-        )
-
-        # Fetch credentials once and re-use for all `_empty_constructor()` calls
-        creds = resource.credentials
-
-        resource_list_method = getattr(resource.api_client, resource._list_method)
-
-        list_request = {
-            "parent": parent
-            or initializer.global_config.common_location_path(
-                project=project, location=location
-            ),
-        }
-
-        # `read_mask` is only passed from PipelineJob.list() for now
-        if read_mask is not None:
-            list_request["read_mask"] = read_mask
-
-        if filter:
-            list_request["filter"] = filter
-
-        if order_by:
-            list_request["order_by"] = order_by
-
-        resource_list = resource_list_method(request=list_request) or []
-
-        return [
-            cls._construct_sdk_resource_from_gapic(
-                gapic_resource, project=project, location=location, credentials=creds
+        return list(
+            cls._list_iter(
+                cls_filter=cls_filter,
+                filter=filter,
+                order_by=order_by,
+                read_mask=read_mask,
+                project=project,
+                location=location,
+                credentials=credentials,
+                parent=parent,
             )
-            for gapic_resource in resource_list
-            if cls_filter(gapic_resource)
-        ]
+        )
 
     @classmethod
     def _list_with_local_order(
@@ -1266,6 +1363,79 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
             parent=parent,
         )
 
+    @classmethod
+    def list_iter(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        read_mask: Optional[field_mask.FieldMask] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+    ) -> Iterator[VertexAiResourceNoun]:
+        """Lazily lists the instances of this Vertex AI Resource, page by page.
+
+        Unlike `list`, resources are yielded as their page is received, and
+        only one page (two when prefetching) is held in memory at a time.
+
+        Example Usage:
+
+        for model in aiplatform.Model.list_iter(
+            page_size=1000,
+            read_mask=field_mask.FieldMask(paths=["name", "display_name"]),
+        ):
+            print(model.display_name)
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Unlike `list`, resources are never sorted locally, so this must
+                be supported by the List method of the resource.
+            page_size (int):
+                Optional. The maximum number of resources per page. The service
+                default is used if not set.
+            read_mask (field_mask.FieldMask):
+                Optional. The fields to return for each resource, for the
+                resources whose List method supports it. All the fields are
+                returned if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the resources of the current page are consumed.
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            parent (str):
+                Optional. The parent resource name if any to retrieve list from.
+
+        Yields:
+            The SDK resource objects.
+        """
+        return cls._list_iter(
+            cls_filter=cls._list_cls_filter,
+            filter=filter,
+            order_by=order_by,
+            read_mask=read_mask,
+            page_size=page_size,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+        )
+
     @optional_sync()
     def delete(self, sync: bool = True) -> None:
         """Deletes this Vertex AI resource. WARNING: This deletion is
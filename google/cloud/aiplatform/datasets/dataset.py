@@ -672,6 +672,10 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
 
         return self
 
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: gca_dataset.Dataset) -> bool:
+        return gapic_resource.metadata_schema_uri in cls._supported_metadata_schema_uris
+
     @classmethod
     def list(
         cls,
@@ -712,13 +716,8 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
             List[base.VertexAiResourceNoun] - A list of Dataset resource objects
         """
 
-        dataset_subclass_filter = (
-            lambda gapic_obj: gapic_obj.metadata_schema_uri
-            in cls._supported_metadata_schema_uris
-        )
-
         return cls._list_with_local_order(
-            cls_filter=dataset_subclass_filter,
+            cls_filter=cls._list_cls_filter,
             filter=filter,
             order_by=order_by,
             project=project,
@@ -15,11 +15,15 @@
 # limitations under the License.
 #
 
+import collections
+from concurrent import futures
 import datetime
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import uuid
 from google.protobuf import timestamp_pb2
 
+from google.api_core import exceptions as api_exceptions
+from google.api_core import retry as api_retry
 from google.auth import credentials as auth_credentials
 from google.protobuf import field_mask_pb2
 
@@ -42,6 +46,167 @@ from google.cloud import bigquery
 
 _LOGGER = base.Logger(__name__)
 _ALL_FEATURE_IDS = "*"
+# The maximum number of entity IDs of a streaming read request.
+_MAX_ENTITY_IDS_PER_STREAMING_READ = 100
+# The maximum number of concurrent streaming read requests of a read.
+_MAX_CONCURRENT_STREAMING_READS = 8
+_ENTITY_ID_COLUMN = "entity_id"
+# The maximum number of feature values of a write request.
+_MAX_FEATURE_VALUES_PER_WRITE_REQUEST = 100_000
+_DEFAULT_MAX_CONCURRENT_WRITE_REQUESTS = 4
+_DEFAULT_WRITE_RETRY = api_retry.Retry(
+    predicate=api_retry.if_exception_type(
+        api_exceptions.Aborted,
+        api_exceptions.DeadlineExceeded,
+        api_exceptions.ResourceExhausted,
+        api_exceptions.ServiceUnavailable,
+    ),
+    initial=1.0,
+    maximum=32.0,
+    multiplier=2.0,
+    timeout=300.0,
+)
+# The FeatureValue field set from a DataFrame column, by numpy dtype kind.
+_DTYPE_KIND_TO_FEATURE_VALUE_FIELD = {
+    "b": "bool_value",
+    "i": "int64_value",
+    "u": "int64_value",
+    "f": "double_value",
+}
+
+
+class _FeatureValueColumns:
+    """Accumulates the feature values of entity views column by column.
+
+    Values are appended as the entity views arrive, so that a DataFrame or an
+    Arrow RecordBatch is created from whole columns instead of from a dict per
+    entity.
+    """
+
+    def __init__(self):
+        self.feature_ids: List[str] = []
+        self.columns: Dict[str, List[Any]] = {_ENTITY_ID_COLUMN: []}
+        self._header_feature_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.columns[_ENTITY_ID_COLUMN])
+
+    def add_header(
+        self,
+        header: gca_featurestore_online_service.ReadFeatureValuesResponse.Header,
+    ) -> None:
+        """Sets the feature IDs of the following entity views.
+
+        Args:
+            header (gca_featurestore_online_service.ReadFeatureValuesResponse.Header):
+                Required. The header of a read response.
+        """
+        self.set_feature_ids(
+            [feature_descriptor.id for feature_descriptor in header.feature_descriptors]
+        )
+
+    def set_feature_ids(self, feature_ids: List[str]) -> None:
+        """Sets the feature IDs of the following entity views.
+
+        Args:
+            feature_ids (List[str]):
+                Required. The feature IDs of the data of the following entity views.
+        """
+        for feature_id in feature_ids:
+            if feature_id not in self.columns:
+                self.feature_ids.append(feature_id)
+                self.columns[feature_id] = [None] * len(self)
+        self._header_feature_ids = feature_ids
+
+    def add_entity_view(
+        self,
+        entity_view: gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView,
+    ) -> None:
+        """Appends the feature values of an entity view to the columns.
+
+        Args:
+            entity_view (gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView):
+                Required. The entity view to append.
+        """
+        entity_view_pb = entity_view._pb
+        num_rows = len(self) + 1
+        self.columns[_ENTITY_ID_COLUMN].append(entity_view_pb.entity_id)
+        for feature_id, feature_data in zip(
+            self._header_feature_ids, entity_view_pb.data
+        ):
+            self.columns[feature_id].append(_get_feature_value(feature_data))
+        if len(entity_view_pb.data) != len(self.feature_ids):
+            for column in self.columns.values():
+                if len(column) < num_rows:
+                    column.append(None)
+
+    def extend(self, other: "_FeatureValueColumns") -> None:
+        """Appends the columns of another instance.
+
+        Args:
+            other (_FeatureValueColumns):
+                Required. The columns to append.
+        """
+        self.set_feature_ids(other.feature_ids)
+        for column_name, column in self.columns.items():
+            other_column = other.columns.get(column_name)
+            if other_column is None:
+                column.extend([None] * len(other))
+            else:
+                column.extend(other_column)
+
+    def to_dataframe(self) -> "pd.DataFrame":  # noqa: F821
+        """Creates a DataFrame with a column per feature.
+
+        Raises:
+            ImportError: If pandas is not installed when using this method.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                f"Pandas is not installed. Please install pandas to use "
+                f"{_EntityType.read.__name__}"
+            )
+        return pd.DataFrame(
+            data=self.columns, columns=[_ENTITY_ID_COLUMN] + self.feature_ids
+        )
+
+    def to_record_batch(self) -> "pyarrow.RecordBatch":  # noqa: F821
+        """Creates an Arrow RecordBatch with a column per feature.
+
+        Raises:
+            ImportError: If pyarrow is not installed when using this method.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError(
+                f"Pyarrow is not installed. Please install pyarrow to use "
+                f"{_EntityType.read_record_batches.__name__}"
+            )
+        column_names = [_ENTITY_ID_COLUMN] + self.feature_ids
+        return pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(self.columns[name]) for name in column_names],
+            names=column_names,
+        )
+
+
+def _get_feature_value(feature_data: Any) -> Any:
+    """Returns the Python value of the raw `ReadFeatureValuesResponse.EntityView.Data`.
+
+    Array values are returned as lists and missing values as None.
+    """
+    if not feature_data.HasField("value"):
+        return None
+    feature_value = feature_data.value
+    value_type = feature_value.WhichOneof("value")
+    if value_type is None:
+        return None
+    value = getattr(feature_value, value_type)
+    if hasattr(value, "values"):
+        return list(value.values)
+    return value
 
 
 class _EntityType(base.VertexAiResourceNounWithFutureManager):
@@ -355,6 +520,83 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             ),
         )
 
+    @classmethod
+    def list_iter(
+        cls,
+        featurestore_name: str,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        read_mask: Optional[field_mask_pb2.FieldMask] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Iterator["_EntityType"]:
+        """Lazily lists existing managed entityType resources in a featurestore,
+        page by page.
+
+        Example Usage:
+
+            for my_entity_type in aiplatform.EntityType.list_iter(
+                featurestore_name='my_featurestore_id', page_size=100
+            ):
+                print(my_entity_type.resource_name)
+
+        Args:
+            featurestore_name (str):
+                Required. A fully-qualified featurestore resource name or a featurestore ID
+                of an existing featurestore to list entityTypes in.
+                Example: "projects/123/locations/us-central1/featurestores/my_featurestore_id"
+                or "my_featurestore_id" when project and location are initialized or passed.
+            filter (str):
+                Optional. Lists the EntityTypes that match the filter expression.
+                See `list` for the supported filters.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by. See
+                `list` for the supported fields.
+            page_size (int):
+                Optional. The maximum number of entityTypes per page. The service
+                default is used if not set.
+            read_mask (field_mask_pb2.FieldMask):
+                Optional. The fields to return for each entityType. All the
+                fields are returned if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the entityTypes of the current page are consumed.
+            project (str):
+                Optional. Project to list entityTypes in. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to list entityTypes in. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to list entityTypes. Overrides
+                credentials set in aiplatform.init.
+
+        Yields:
+            The managed entityType resource objects.
+        """
+        return super().list_iter(
+            filter=filter,
+            order_by=order_by,
+            page_size=page_size,
+            read_mask=read_mask,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=utils.full_resource_name(
+                resource_name=featurestore_name,
+                resource_noun=featurestore.Featurestore._resource_noun,
+                parse_resource_name_method=featurestore.Featurestore._parse_resource_name,
+                format_resource_name_method=featurestore.Featurestore._format_resource_name,
+                project=project,
+                location=location,
+                resource_id_validator=featurestore.Featurestore._resource_id_validator,
+            ),
+        )
+
     def list_features(
         self,
         filter: Optional[str] = None,
@@ -1428,10 +1670,13 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
     ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
         """Reads feature values for given feature IDs of given entity IDs in this EntityType.
 
+        A list of more than 100 entity IDs is read with concurrent streaming
+        requests of up to 100 entity IDs each.
+
         Args:
             entity_ids (Union[str, List[str]]):
                 Required. ID for a specific entity, or a list of IDs of entities
-                to read Feature values of. The maximum number of IDs is 100 if a list.
+                to read Feature values of.
             feature_ids (Union[str, List[str]]):
                 Required. ID for a specific feature, or a list of IDs of Features in the EntityType
                 for reading feature values. Default to "*", where value of all features will be read.
@@ -1444,12 +1689,7 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             pd.DataFrame: entities' feature values in DataFrame
         """
         self.wait()
-        if isinstance(feature_ids, str):
-            feature_ids = [feature_ids]
-
-        feature_selector = gca_feature_selector.FeatureSelector(
-            id_matcher=gca_feature_selector.IdMatcher(ids=feature_ids)
-        )
+        feature_selector = self._get_feature_selector(feature_ids)
 
         if isinstance(entity_ids, str):
             read_feature_values_request = (
@@ -1466,37 +1706,202 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                     timeout=read_request_timeout,
                 )
             )
-            header = read_feature_values_response.header
-            entity_views = [read_feature_values_response.entity_view]
-        elif isinstance(entity_ids, list):
-            streaming_read_feature_values_request = (
-                gca_featurestore_online_service.StreamingReadFeatureValuesRequest(
-                    entity_type=self.resource_name,
-                    entity_ids=entity_ids,
-                    feature_selector=feature_selector,
-                )
+            feature_value_columns = _FeatureValueColumns()
+            feature_value_columns.add_header(read_feature_values_response.header)
+            feature_value_columns.add_entity_view(
+                read_feature_values_response.entity_view
             )
-            streaming_read_feature_values_responses = list(
-                self._featurestore_online_client.streaming_read_feature_values(
-                    request=streaming_read_feature_values_request,
-                    metadata=request_metadata,
-                    timeout=read_request_timeout,
-                )
+        else:
+            feature_value_columns = _FeatureValueColumns()
+            for chunk_columns in self._streaming_read_chunks(
+                entity_ids=entity_ids,
+                feature_selector=feature_selector,
+                entity_ids_per_request=_MAX_ENTITY_IDS_PER_STREAMING_READ,
+                request_metadata=request_metadata,
+                read_request_timeout=read_request_timeout,
+            ):
+                feature_value_columns.extend(chunk_columns)
+
+        return feature_value_columns.to_dataframe()
+
+    def read_record_batches(
+        self,
+        entity_ids: List[str],
+        feature_ids: Union[str, List[str]] = "*",
+        batch_size: int = _MAX_ENTITY_IDS_PER_STREAMING_READ,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+    ) -> Iterator["pyarrow.RecordBatch"]:  # noqa: F821
+        """Reads feature values of given entity IDs as a stream of Arrow RecordBatches.
+
+        Each batch of entity IDs is read with its own streaming request, and up to
+        8 requests run concurrently. RecordBatches are yielded in the order of the
+        entity IDs as soon as their request completes.
+
+        Example Usage:
+
+            my_entity_type = aiplatform.EntityType(
+                entity_type_name="my_entity_type_id",
+                featurestore_id="my_featurestore_id",
             )
-            header = streaming_read_feature_values_responses[0].header
-            entity_views = [
-                response.entity_view
-                for response in streaming_read_feature_values_responses[1:]
-            ]
+            for record_batch in my_entity_type.read_record_batches(
+                entity_ids=my_entity_ids,
+            ):
+                process(record_batch)
+
+        Args:
+            entity_ids (List[str]):
+                Required. The IDs of entities to read Feature values of.
+            feature_ids (Union[str, List[str]]):
+                Optional. ID for a specific feature, or a list of IDs of Features in
+                the EntityType for reading feature values. Default to "*", where
+                value of all features will be read.
+            batch_size (int):
+                Optional. The number of entities of each RecordBatch, at most 100.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for each read request in seconds.
+
+        Yields:
+            pyarrow.RecordBatch: A RecordBatch with an `entity_id` column and a
+                column per feature.
+
+        Raises:
+            ValueError: If batch_size is not between 1 and 100.
+            ImportError: If pyarrow is not installed when using this method.
+        """
+        if not 1 <= batch_size <= _MAX_ENTITY_IDS_PER_STREAMING_READ:
+            raise ValueError(
+                "batch_size must be between 1 and "
+                f"{_MAX_ENTITY_IDS_PER_STREAMING_READ}."
+            )
+        self.wait()
+        for feature_value_columns in self._streaming_read_chunks(
+            entity_ids=entity_ids,
+            feature_selector=self._get_feature_selector(feature_ids),
+            entity_ids_per_request=batch_size,
+            request_metadata=request_metadata,
+            read_request_timeout=read_request_timeout,
+        ):
+            yield feature_value_columns.to_record_batch()
+
+    @staticmethod
+    def _get_feature_selector(
+        feature_ids: Union[str, List[str]]
+    ) -> gca_feature_selector.FeatureSelector:
+        """Creates a feature selector matching the given feature IDs."""
+        if isinstance(feature_ids, str):
+            feature_ids = [feature_ids]
+        return gca_feature_selector.FeatureSelector(
+            id_matcher=gca_feature_selector.IdMatcher(ids=feature_ids)
+        )
 
-        feature_ids = [
-            feature_descriptor.id for feature_descriptor in header.feature_descriptors
+    def _streaming_read_chunks(
+        self,
+        entity_ids: List[str],
+        feature_selector: gca_feature_selector.FeatureSelector,
+        entity_ids_per_request: int,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+    ) -> Iterator[_FeatureValueColumns]:
+        """Reads chunks of entity IDs with concurrent streaming requests.
+
+        Args:
+            entity_ids (List[str]):
+                Required. The IDs of entities to read Feature values of.
+            feature_selector (gca_feature_selector.FeatureSelector):
+                Required. The selector of the features to read.
+            entity_ids_per_request (int):
+                Required. The number of entity IDs of each streaming request.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for each read request in seconds.
+
+        Yields:
+            _FeatureValueColumns: The feature values of each chunk of entity IDs, in
+                the order of the entity IDs.
+        """
+        chunks = [
+            entity_ids[start : start + entity_ids_per_request]
+            for start in range(0, len(entity_ids), entity_ids_per_request)
         ]
+        if len(chunks) <= 1:
+            if chunks:
+                yield self._streaming_read(
+                    entity_ids=chunks[0],
+                    feature_selector=feature_selector,
+                    request_metadata=request_metadata,
+                    read_request_timeout=read_request_timeout,
+                )
+            return
+
+        with futures.ThreadPoolExecutor(
+            max_workers=min(len(chunks), _MAX_CONCURRENT_STREAMING_READS)
+        ) as executor:
+            pending = collections.deque()
+            try:
+                for chunk in chunks:
+                    if len(pending) >= _MAX_CONCURRENT_STREAMING_READS:
+                        yield pending.popleft().result()
+                    pending.append(
+                        executor.submit(
+                            self._streaming_read,
+                            entity_ids=chunk,
+                            feature_selector=feature_selector,
+                            request_metadata=request_metadata,
+                            read_request_timeout=read_request_timeout,
+                        )
+                    )
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _streaming_read(
+        self,
+        entity_ids: List[str],
+        feature_selector: gca_feature_selector.FeatureSelector,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+    ) -> _FeatureValueColumns:
+        """Reads feature values of up to 100 entities with a streaming request.
+
+        The feature values are added to the columns as the responses arrive.
 
-        return self._construct_dataframe(
-            feature_ids=feature_ids,
-            entity_views=entity_views,
+        Args:
+            entity_ids (List[str]):
+                Required. The IDs of entities to read Feature values of.
+            feature_selector (gca_feature_selector.FeatureSelector):
+                Required. The selector of the features to read.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for the read request in seconds.
+
+        Returns:
+            _FeatureValueColumns: The feature values of the entities.
+        """
+        streaming_read_feature_values_request = (
+            gca_featurestore_online_service.StreamingReadFeatureValuesRequest(
+                entity_type=self.resource_name,
+                entity_ids=entity_ids,
+                feature_selector=feature_selector,
+            )
         )
+        feature_value_columns = _FeatureValueColumns()
+        for response in self._featurestore_online_client.streaming_read_feature_values(
+            request=streaming_read_feature_values_request,
+            metadata=request_metadata,
+            timeout=read_request_timeout,
+        ):
+            if response._pb.HasField("header"):
+                feature_value_columns.add_header(response.header)
+            if response._pb.HasField("entity_view"):
+                feature_value_columns.add_entity_view(response.entity_view)
+        return feature_value_columns
 
     @staticmethod
     def _construct_dataframe(
@@ -1525,30 +1930,11 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             pd.DataFrame - entities feature values in DataFrame
         )
         """
-
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError(
-                f"Pandas is not installed. Please install pandas to use "
-                f"{_EntityType._construct_dataframe.__name__}"
-            )
-
-        data = []
+        feature_value_columns = _FeatureValueColumns()
+        feature_value_columns.set_feature_ids(feature_ids)
         for entity_view in entity_views:
-            entity_data = {"entity_id": entity_view.entity_id}
-            for feature_id, feature_data in zip(feature_ids, entity_view.data):
-                if feature_data._pb.HasField("value"):
-                    value_type = feature_data.value._pb.WhichOneof("value")
-                    feature_value = getattr(feature_data.value, value_type)
-                    if hasattr(feature_value, "values"):
-                        feature_value = feature_value.values
-                    entity_data[feature_id] = feature_value
-                else:
-                    entity_data[feature_id] = None
-            data.append(entity_data)
-
-        return pd.DataFrame(data=data, columns=["entity_id"] + feature_ids)
+            feature_value_columns.add_entity_view(entity_view)
+        return feature_value_columns.to_dataframe()
 
     def write_feature_values(
         self,
@@ -1574,6 +1960,9 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             "pd.DataFrame",  # type: ignore # noqa: F821 - skip check for undefined name 'pd'
         ],
         feature_time: Union[str, datetime.datetime] = None,
+        max_payloads_per_request: Optional[int] = None,
+        max_concurrent_requests: int = _DEFAULT_MAX_CONCURRENT_WRITE_REQUESTS,
+        retry: Optional[api_retry.Retry] = _DEFAULT_WRITE_RETRY,
     ) -> "EntityType":  # noqa: F821
         """Streaming ingestion. Write feature values directly to Feature Store.
 
@@ -1704,6 +2093,16 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 Timestamp will be applied to generate_timestmap in all FeatureValue.
                 If not provided, curreent timestamp is used. This param is not used
                 when instances is List[WriteFeatureValuesPayload].
+            max_payloads_per_request (int):
+                Optional. The maximum number of payloads of a write request. The
+                payloads are split into requests of at most 100,000 feature values
+                regardless.
+            max_concurrent_requests (int):
+                Optional. The maximum number of write requests in flight at a time.
+            retry (google.api_core.retry.Retry):
+                Optional. How to retry each write request. By default, requests that
+                failed with a quota or transient server error are retried with
+                exponential backoff. No retry is made if None.
 
         Returns:
             EntityType - The updated EntityType object.
@@ -1715,9 +2114,8 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
         elif isinstance(instances, List):
             payloads = instances
         else:
-            instances_dict = instances.to_dict(orient="index")
-            payloads = self._generate_payloads(
-                instances=instances_dict, feature_time=feature_time
+            payloads = self._generate_payloads_from_dataframe(
+                df=instances, feature_time=feature_time
             )
 
         _LOGGER.log_action_start_against_resource(
@@ -1726,14 +2124,159 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             self,
         )
 
-        self._featurestore_online_client.write_feature_values(
-            entity_type=self.resource_name, payloads=payloads
+        write_feature_values = self._featurestore_online_client.write_feature_values
+        if retry is not None:
+            write_feature_values = retry(write_feature_values)
+
+        batches = self._split_payloads(
+            payloads=payloads, max_payloads_per_request=max_payloads_per_request
         )
+        if len(batches) <= 1:
+            for batch in batches:
+                write_feature_values(entity_type=self.resource_name, payloads=batch)
+        else:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(len(batches), max_concurrent_requests)
+            ) as executor:
+                write_futures = [
+                    executor.submit(
+                        write_feature_values,
+                        entity_type=self.resource_name,
+                        payloads=batch,
+                    )
+                    for batch in batches
+                ]
+                for write_future in futures.as_completed(write_futures):
+                    write_future.result()
 
         _LOGGER.log_action_completed_against_resource("feature values", "written", self)
 
         return self
 
+    @staticmethod
+    def _split_payloads(
+        payloads: List[gca_featurestore_online_service.WriteFeatureValuesPayload],
+        max_payloads_per_request: Optional[int] = None,
+    ) -> List[List[gca_featurestore_online_service.WriteFeatureValuesPayload]]:
+        """Splits payloads into batches that fit in a write request.
+
+        Args:
+            payloads (List[gca_featurestore_online_service.WriteFeatureValuesPayload]):
+                Required. The payloads to split.
+            max_payloads_per_request (int):
+                Optional. The maximum number of payloads of a batch.
+
+        Returns:
+            List[List[gca_featurestore_online_service.WriteFeatureValuesPayload]] -
+            The batches of consecutive payloads, each with at most 100,000 feature
+            values.
+        """
+        batches = []
+        batch = []
+        batch_feature_values = 0
+        for payload in payloads:
+            num_feature_values = len(payload.feature_values)
+            if batch and (
+                batch_feature_values + num_feature_values
+                > _MAX_FEATURE_VALUES_PER_WRITE_REQUEST
+                or (max_payloads_per_request and len(batch) >= max_payloads_per_request)
+            ):
+                batches.append(batch)
+                batch = []
+                batch_feature_values = 0
+            batch.append(payload)
+            batch_feature_values += num_feature_values
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @classmethod
+    def _generate_payloads_from_dataframe(
+        cls,
+        df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        feature_time: Union[str, datetime.datetime] = None,
+    ) -> List[gca_featurestore_online_service.WriteFeatureValuesPayload]:
+        """Generates GAPIC WriteFeatureValuesPayloads from a pandas DataFrame.
+
+        Columns of bool, integer and float dtypes, except uint64, are converted in
+        bulk, other columns value by value. The feature timestamp is converted once for the
+        whole DataFrame, or once per row if feature_time names a column.
+
+        Args:
+            df (pd.DataFrame):
+                Required. DataFrame where the index holds the entity IDs and each
+                column represents a feature.
+            feature_time Union[str, datetime.datetime]:
+                Optional. Either string representing column name which stores
+                feature timestamp, or timestamp to apply to entire DataFrame.
+        Returns:
+            List[gca_featurestore_online_service.WriteFeatureValuesPayload] -
+            A list of WriteFeatureValuesPayload objects ready to be written to the Feature Store.
+        """
+        payload_pb_class = (
+            gca_featurestore_online_service.WriteFeatureValuesPayload.pb()
+        )
+        payload_pbs = [
+            payload_pb_class(entity_id=str(entity_id)) for entity_id in df.index
+        ]
+
+        row_timestamps = None
+        if feature_time is not None and cls._is_timestamp(feature_time):
+            timestamp_pb = cls._to_timestamp_pb(feature_time)
+            row_timestamps = [timestamp_pb] * len(payload_pbs)
+        elif isinstance(feature_time, str) and feature_time in df.columns:
+            # Missing timestamps, including NaT which is not equal to itself, are
+            # not applied.
+            row_timestamps = [
+                cls._to_timestamp_pb(value)
+                if cls._is_timestamp(value) and value == value
+                else None
+                for value in df[feature_time].tolist()
+            ]
+
+        for feature_id, column in df.items():
+            if feature_id == feature_time:
+                continue
+            values = column.tolist()
+            dtype_kind = getattr(column.dtype, "kind", None)
+            # uint64 values may not fit in an int64, so they are converted one by
+            # one like other Python ints.
+            if dtype_kind == "u" and column.dtype.itemsize >= 8:
+                dtype_kind = None
+            value_field = _DTYPE_KIND_TO_FEATURE_VALUE_FIELD.get(dtype_kind)
+            if value_field is None and all(isinstance(value, str) for value in values):
+                value_field = "string_value"
+            if value_field:
+                for payload_pb, value in zip(payload_pbs, values):
+                    setattr(payload_pb.feature_values[feature_id], value_field, value)
+            else:
+                for payload_pb, value in zip(payload_pbs, values):
+                    payload_pb.feature_values[feature_id].CopyFrom(
+                        cls._convert_value_to_gapic_feature_value(
+                            feature_id=feature_id, value=value
+                        )._pb
+                    )
+            if row_timestamps is not None:
+                for payload_pb, timestamp_pb in zip(payload_pbs, row_timestamps):
+                    if timestamp_pb is not None:
+                        payload_pb.feature_values[
+                            feature_id
+                        ].metadata.generate_time.CopyFrom(timestamp_pb)
+
+        return [
+            gca_featurestore_online_service.WriteFeatureValuesPayload.wrap(payload_pb)
+            for payload_pb in payload_pbs
+        ]
+
+    @staticmethod
+    def _to_timestamp_pb(
+        timestamp: Union[datetime.datetime, timestamp_pb2.Timestamp]
+    ) -> timestamp_pb2.Timestamp:
+        """Converts a timestamp the same way as FeatureValue.Metadata.generate_time."""
+        return gca_featurestore_online_service.FeatureValue.Metadata(
+            generate_time=timestamp
+        )._pb.generate_time
+
     @classmethod
     def _generate_payloads(
         cls,
@@ -1778,6 +2321,16 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             timestamp_to_all_field = feature_time
 
         for entity_id, features in instances.items():
+            # Create a FeatureValue Metadata with generate_time if
+            # valid feature_time param is provided.
+            timestamp = cls._apply_feature_timestamp(
+                cls, features, timestamp_to_all_field, feature_time
+            )
+            metadata = None
+            if timestamp:
+                metadata = gca_featurestore_online_service.FeatureValue.Metadata(
+                    generate_time=timestamp
+                )
             feature_values = {}
             for feature_id, value in features.items():
                 if feature_id == feature_time:
@@ -1785,17 +2338,8 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 feature_value = cls._convert_value_to_gapic_feature_value(
                     feature_id=feature_id, value=value
                 )
-                # Create a FeatureValue Metadata with generate_time if
-                # valid feature_time param is provided.
-                timestamp = cls._apply_feature_timestamp(
-                    cls, features, timestamp_to_all_field, feature_time
-                )
-                if timestamp:
-                    feature_value.metadata = (
-                        gca_featurestore_online_service.FeatureValue.Metadata(
-                            generate_time=timestamp
-                        )
-                    )
+                if metadata:
+                    feature_value.metadata = metadata
                 feature_values[feature_id] = feature_value
             payload = gca_featurestore_online_service.WriteFeatureValuesPayload(
                 entity_id=entity_id, feature_values=feature_values
@@ -17,10 +17,24 @@
 
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform.featurestore import _entity_type
-from google.cloud.aiplatform.preview.featurestore import entity_type
 
 
 class EntityType(_entity_type._EntityType, base.PreviewMixin):
     """Public managed EntityType resource for Vertex AI."""
 
-    _preview_class = entity_type.EntityType
+    _preview_class = (
+        "google.cloud.aiplatform.preview.featurestore.entity_type.EntityType"
+    )
+
+    @property
+    def preview(self):
+        """Return an EntityType instance with preview features enabled."""
+        # Imported on use, since the preview module imports this one.
+        from google.cloud.aiplatform.preview.featurestore import entity_type
+
+        if not hasattr(self, "_preview_instance"):
+            self._preview_instance = entity_type.EntityType(
+                self.resource_name, credentials=self.credentials
+            )
+
+        return self._preview_instance
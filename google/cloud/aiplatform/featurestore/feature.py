@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from google.auth import credentials as auth_credentials
 from google.protobuf import field_mask_pb2
@@ -349,6 +349,94 @@ class Feature(base.VertexAiResourceNounWithFutureManager):
             ),
         )
 
+    @classmethod
+    def list_iter(
+        cls,
+        entity_type_name: str,
+        featurestore_id: Optional[str] = None,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        read_mask: Optional[field_mask_pb2.FieldMask] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Iterator["Feature"]:
+        """Lazily lists existing managed feature resources in an entityType,
+        page by page.
+
+        Example Usage:
+
+            for my_feature in aiplatform.Feature.list_iter(
+                entity_type_name='my_entity_type_id',
+                featurestore_id='my_featurestore_id',
+                page_size=100,
+            ):
+                print(my_feature.resource_name)
+
+        Args:
+            entity_type_name (str):
+                Required. A fully-qualified entityType resource name or an entity_type ID of an existing entityType
+                to list features in. The EntityType must exist in the Featurestore if provided by the featurestore_id.
+                Example: "projects/123/locations/us-central1/featurestores/my_featurestore_id/entityTypes/my_entity_type_id"
+                or "my_entity_type_id" when project and location are initialized or passed, with featurestore_id passed.
+            featurestore_id (str):
+                Optional. Featurestore ID of an existing featurestore to list features in,
+                when entity_type_name is passed as entity_type ID.
+            filter (str):
+                Optional. Lists the Features that match the filter expression.
+                See `list` for the supported filters.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by. See
+                `list` for the supported fields.
+            page_size (int):
+                Optional. The maximum number of features per page. The service
+                default is used if not set.
+            read_mask (field_mask_pb2.FieldMask):
+                Optional. The fields to return for each feature. All the
+                fields are returned if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the features of the current page are consumed.
+            project (str):
+                Optional. Project to list features in. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to list features in. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to list features. Overrides
+                credentials set in aiplatform.init.
+
+        Yields:
+            The managed feature resource objects.
+        """
+        return super().list_iter(
+            filter=filter,
+            order_by=order_by,
+            page_size=page_size,
+            read_mask=read_mask,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=utils.full_resource_name(
+                resource_name=entity_type_name,
+                resource_noun=featurestore.EntityType._resource_noun,
+                parse_resource_name_method=featurestore.EntityType._parse_resource_name,
+                format_resource_name_method=featurestore.EntityType._format_resource_name,
+                parent_resource_name_fields={
+                    featurestore.Featurestore._resource_noun: featurestore_id
+                }
+                if featurestore_id
+                else featurestore_id,
+                project=project,
+                location=location,
+                resource_id_validator=featurestore.EntityType._resource_id_validator,
+            ),
+        )
+
     @classmethod
     def search(
         cls,
@@ -16,13 +16,27 @@
 #
 
 
+import collections
 from concurrent import futures
+import functools
 import inspect
 import logging
 import pkg_resources  # noqa: F401 # Note this is used after copybara replacement
 import os
+import threading
 import types
-from typing import Iterator, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from google.api_core import client_options
 from google.api_core import gapic_v1
@@ -50,6 +64,122 @@ _TVertexAiServiceClientWithOverride = TypeVar(
 
 _TOP_GOOGLE_CONSTRUCTOR_METHOD_TAG = "top_google_constructor_method"
 
+_T = TypeVar("_T")
+
+# Maximum number of clients kept by the global client cache.
+_DEFAULT_CLIENT_CACHE_MAX_SIZE = 128
+
+
+class _ClientCache:
+    """Process-wide LRU cache of service clients.
+
+    Instantiating a client creates its transport and gRPC channel, so clients
+    instantiated with the same class, credentials and options are shared instead.
+    The cache is cleared in a forked child process, since gRPC channels must not
+    be used across a fork.
+    """
+
+    def __init__(self, max_size: int = _DEFAULT_CLIENT_CACHE_MAX_SIZE):
+        """Initializes an empty cache.
+
+        Args:
+            max_size (int):
+                Optional. Maximum number of cached clients. The least recently used
+                client is evicted when a new one would exceed it.
+        """
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # Maps a key to the credentials the client was created with, which keeps
+        # the id of the credentials in the key from being reused, and the client.
+        self._clients: "collections.OrderedDict[Tuple, Tuple[Any, Any]]" = (
+            collections.OrderedDict()
+        )
+        self._pid = os.getpid()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_create(
+        self,
+        key: Tuple,
+        create_client: Callable[[], _T],
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> _T:
+        """Returns the cached client for the key, creating it on a miss.
+
+        Args:
+            key (Tuple):
+                Required. Hashable key of the client, which must include the id of
+                the credentials.
+            create_client (Callable[[], _T]):
+                Required. Function creating the client on a miss.
+            credentials (auth_credentials.Credentials):
+                Optional. Credentials of the client.
+
+        Returns:
+            The cached or created client.
+        """
+        with self._lock:
+            self._clear_if_forked()
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        # Clients are created outside the lock, since creating one can be slow.
+        client = create_client()
+
+        with self._lock:
+            self._clear_if_forked()
+            # Another thread may have created the same client in the meantime.
+            entry = self._clients.setdefault(key, (credentials, client))
+            self._clients.move_to_end(key)
+            while len(self._clients) > self._max_size:
+                self._clients.popitem(last=False)
+                self._evictions += 1
+            return entry[1]
+
+    def clear(self):
+        """Removes all the cached clients."""
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of hits, misses and evictions, and the cache size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._clients),
+            }
+
+    def _clear_if_forked(self):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._clients.clear()
+
+
+def _client_options_key(
+    options: Optional[Union[client_options.ClientOptions, Dict[str, Any]]]
+) -> Tuple:
+    """Returns a hashable key for client options."""
+    if options is None:
+        return ()
+    if isinstance(options, client_options.ClientOptions):
+        options = vars(options)
+    return tuple(sorted((name, repr(value)) for name, value in options.items()))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_aiplatform_version() -> str:
+    """Returns the version of the installed google-cloud-aiplatform package."""
+    return pkg_resources.get_distribution(
+        "google-cloud-aiplatform",
+    ).version
+
 
 class _Config:
     """Stores common parameters and options for API calls."""
@@ -404,6 +534,11 @@ class _Config:
         """Instantiates a given VertexAiServiceClient with optional
         overrides.
 
+        Clients are cached process-wide by class, credentials, client options and
+        appended user agent and GAPIC version, so that their gRPC channels are
+        reused. The user agent of a cached client names the top level method that
+        created it.
+
         Args:
             client_class (utils.VertexAiServiceClientWithOverride):
                 Required. A Vertex AI Service Client with optional overrides.
@@ -421,9 +556,52 @@ class _Config:
         Returns:
             client: Instantiated Vertex AI Service client with optional overrides
         """
-        gapic_version = pkg_resources.get_distribution(
-            "google-cloud-aiplatform",
-        ).version
+        credentials = credentials or self.credentials
+        options = self.get_client_options(
+            location_override=location_override,
+            prediction_client=prediction_client,
+            api_base_path_override=api_base_path_override,
+            api_path_override=api_path_override,
+        )
+
+        def _create_client() -> _TVertexAiServiceClientWithOverride:
+            return client_class(
+                credentials=credentials,
+                client_options=options,
+                client_info=self._create_client_info(
+                    appended_user_agent=appended_user_agent,
+                    appended_gapic_version=appended_gapic_version,
+                ),
+            )
+
+        if not getattr(client_class, "_is_cached", True):
+            return _create_client()
+
+        key = (
+            client_class,
+            id(credentials),
+            _client_options_key(options),
+            tuple(appended_user_agent or ()),
+            appended_gapic_version,
+        )
+        return global_client_cache.get_or_create(key, _create_client, credentials)
+
+    def _create_client_info(
+        self,
+        appended_user_agent: Optional[List[str]] = None,
+        appended_gapic_version: Optional[str] = None,
+    ) -> gapic_v1.client_info.ClientInfo:
+        """Creates the client info of a client, tagged with the calling method.
+
+        Args:
+            appended_user_agent (List[str]):
+                Optional. User agent appended in the client info.
+            appended_gapic_version (str):
+                Optional. GAPIC version suffix appended in the client info.
+        Returns:
+            The client info.
+        """
+        gapic_version = _get_aiplatform_version()
 
         if appended_gapic_version:
             gapic_version = f"{gapic_version}+{appended_gapic_version}"
@@ -441,28 +619,18 @@ class _Config:
         if appended_user_agent:
             user_agent = f"{user_agent} {' '.join(appended_user_agent)}"
 
-        client_info = gapic_v1.client_info.ClientInfo(
+        return gapic_v1.client_info.ClientInfo(
             gapic_version=gapic_version,
             user_agent=user_agent,
         )
 
-        kwargs = {
-            "credentials": credentials or self.credentials,
-            "client_options": self.get_client_options(
-                location_override=location_override,
-                prediction_client=prediction_client,
-                api_base_path_override=api_base_path_override,
-                api_path_override=api_path_override,
-            ),
-            "client_info": client_info,
-        }
-
-        return client_class(**kwargs)
-
 
 # global config to store init parameters: ie, aiplatform.init(project=..., location=...)
 global_config = _Config()
 
+# process-wide cache of the clients created by create_client
+global_client_cache = _ClientCache()
+
 global_pool = futures.ThreadPoolExecutor(
     max_workers=min(32, max(4, (os.cpu_count() or 0) * 5))
 )
@@ -33,6 +33,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.rpc import status_pb2
 
 from google.cloud import aiplatform
+from google.cloud.aiplatform import _job_watcher
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform.compat.types import (
     batch_prediction_job as gca_bp_job_compat,
@@ -101,7 +102,7 @@ _JOB_PENDING_STATES = (
 )
 
 # _block_until_complete wait times
-_JOB_WAIT_TIME = 5  # start at five seconds
+_JOB_WAIT_TIME = 5  # start at five seconds, then poll less often as time passes
 _LOG_WAIT_TIME = 5
 _MAX_WAIT_TIME = 60 * 5  # 5 minute wait
 _WAIT_TIME_MULTIPLIER = 2  # scale wait by 2 every iteration
@@ -237,14 +238,18 @@ class _Job(base.VertexAiStatefulResource):
 
         log_wait = _LOG_WAIT_TIME
 
-        previous_time = time.time()
+        start_time = previous_time = time.time()
         while self.state not in _JOB_COMPLETE_STATES:
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 self._log_job_state()
                 log_wait = min(log_wait * _WAIT_TIME_MULTIPLIER, _MAX_WAIT_TIME)
                 previous_time = current_time
-            time.sleep(_JOB_WAIT_TIME)
+            time.sleep(
+                _job_watcher.get_poll_interval(
+                    current_time - start_time, min_interval=_JOB_WAIT_TIME
+                )
+            )
 
         self._log_job_state()
 
@@ -1083,7 +1088,7 @@ class _RunnableJob(_Job):
 
         log_wait = _LOG_WAIT_TIME
 
-        previous_time = time.time()
+        start_time = previous_time = time.time()
         while self.state not in _JOB_COMPLETE_STATES:
             current_time = time.time()
             if current_time - previous_time >= _LOG_WAIT_TIME:
@@ -1091,7 +1096,11 @@ class _RunnableJob(_Job):
                 log_wait = min(log_wait * _WAIT_TIME_MULTIPLIER, _MAX_WAIT_TIME)
                 previous_time = current_time
             self._log_web_access_uris()
-            time.sleep(_JOB_WAIT_TIME)
+            time.sleep(
+                _job_watcher.get_poll_interval(
+                    current_time - start_time, min_interval=_JOB_WAIT_TIME
+                )
+            )
 
         self._log_job_state()
 
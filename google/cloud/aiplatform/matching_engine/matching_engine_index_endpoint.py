@@ -15,8 +15,12 @@
 # limitations under the License.
 #
 
+import asyncio
+from concurrent import futures
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence, Tuple
+import itertools
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from google.auth import credentials as auth_credentials
 from google.cloud.aiplatform import base
@@ -37,8 +41,34 @@ from google.protobuf import field_mask_pb2
 
 import grpc
 
+if TYPE_CHECKING:
+    import numpy as np
+
 _LOGGER = base.Logger(__name__)
 
+# Port of the match service of deployed indexes.
+_MATCH_GRPC_PORT = 10000
+# Number of channels to a deployed index, used round-robin by match calls.
+_DEFAULT_MATCH_CHANNEL_POOL_SIZE = 4
+# Channels are kept alive between match calls, so that queries do not pay for
+# the connection setup.
+_MATCH_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+)
+# Maximum number of queries in a BatchMatch call of match.
+_DEFAULT_MAX_QUERIES_PER_BATCH_MATCH = 100
+# Maximum number of concurrent BatchMatch calls of match.
+_DEFAULT_MAX_CONCURRENT_BATCH_MATCHES = 8
+
+# Wire type of length-delimited protobuf fields: messages, strings and packed
+# repeated numbers.
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+# Vectors of float32 numbers are serialized as packed little-endian floats.
+_PACKED_FLOAT_DTYPE = "<f4"
+
 
 @dataclass
 class MatchNeighbor:
@@ -74,6 +104,197 @@ class Namespace:
     deny_tokens: list = field(default_factory=list)
 
 
+class _MatchChannelPool:
+    """Keep-alive gRPC channels to the match service of a deployed index.
+
+    Calls are spread over the channels round-robin.
+    """
+
+    def __init__(self, target: str, size: int, create_channel=None):
+        """Opens the channels to the target.
+
+        Args:
+            target (str):
+                Required. Address and port of the match service.
+            size (int):
+                Required. Number of channels.
+            create_channel:
+                Optional. Function creating a channel from the target and options,
+                e.g. `grpc.aio.insecure_channel`. Defaults to
+                `grpc.insecure_channel`.
+        """
+        create_channel = create_channel or grpc.insecure_channel
+        self.target = target
+        self._channels = [
+            create_channel(target, options=_MATCH_CHANNEL_OPTIONS) for _ in range(size)
+        ]
+        self._stubs = [
+            match_service_pb2_grpc.MatchServiceStub(channel)
+            for channel in self._channels
+        ]
+        self._next_stub_index = itertools.count()
+
+    def next_stub(self) -> match_service_pb2_grpc.MatchServiceStub:
+        """Returns the stub of the next channel."""
+        return self._stubs[next(self._next_stub_index) % len(self._stubs)]
+
+    def close(self) -> Any:
+        """Closes the channels.
+
+        Returns:
+            The results of closing the channels, which are awaitables for
+            `grpc.aio` channels.
+        """
+        return [channel.close() for channel in self._channels]
+
+
+def _close_async_match_channel_pool(
+    loop: asyncio.AbstractEventLoop, pool: _MatchChannelPool
+) -> None:
+    """Closes a grpc.aio channel pool on the event loop its channels are bound to.
+
+    If the loop cannot be run right away, the channels are closed when it runs
+    again. The channels of a pool whose loop is closed cannot be closed anymore
+    and are released when garbage collected.
+    """
+
+    async def _close():
+        await asyncio.gather(*pool.close())
+
+    if loop.is_closed():
+        return
+    try:
+        asyncio.get_running_loop()
+        can_run_loop = False
+    except RuntimeError:
+        can_run_loop = not loop.is_running()
+    if can_run_loop:
+        loop.run_until_complete(_close())
+    else:
+        loop.call_soon_threadsafe(lambda: loop.create_task(_close()))
+
+
+def _batch_queries(queries: List[Any], max_queries: int) -> List[List[Any]]:
+    """Splits queries into batches of at most `max_queries` queries."""
+    if max_queries < 1:
+        raise ValueError("max_queries_per_request must be at least 1.")
+    return [
+        queries[start : start + max_queries]
+        for start in range(0, len(queries), max_queries)
+    ]
+
+
+def _build_match_restricts(
+    filter: Optional[List[Namespace]],
+) -> List[match_service_pb2.Namespace]:
+    """Converts Namespaces to the restricts of match requests."""
+    return [
+        match_service_pb2.Namespace(
+            name=namespace.name,
+            allow_tokens=namespace.allow_tokens,
+            deny_tokens=namespace.deny_tokens,
+        )
+        for namespace in filter or []
+    ]
+
+
+def _field_number(message_descriptor, field_name: str) -> int:
+    """Returns the number of a field of a protobuf message."""
+    return message_descriptor.fields_by_name[field_name].number
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encodes a non-negative integer as a protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _encode_field_prefix(field_number: int, size: int) -> bytes:
+    """Encodes the tag and length of a length-delimited field of `size` bytes."""
+    return _encode_varint(
+        (field_number << 3) | _WIRE_TYPE_LENGTH_DELIMITED
+    ) + _encode_varint(size)
+
+
+def _encode_vector_messages(
+    template: bytes, vector_field_number: int, vectors: "np.ndarray"
+) -> List[bytes]:
+    """Serializes one message per vector, appending its packed floats to a template.
+
+    Protobuf messages can be concatenated, so the fields shared by all the
+    messages are serialized once in the template.
+
+    Args:
+        template (bytes):
+            Required. The serialized fields shared by all the messages.
+        vector_field_number (int):
+            Required. The number of the repeated float field of the vectors.
+        vectors (np.ndarray):
+            Required. A C-contiguous array of little-endian float32 vectors.
+
+    Returns:
+        List[bytes] - The serialized messages, one for each vector.
+    """
+    prefix = template + _encode_field_prefix(
+        vector_field_number, vectors.shape[1] * vectors.itemsize
+    )
+    return [prefix + vector.tobytes() for vector in vectors]
+
+
+def _encode_repeated_field(field_number: int, messages: List[bytes]) -> bytes:
+    """Serializes messages as the items of a repeated message field."""
+    return b"".join(
+        _encode_field_prefix(field_number, len(message)) + message
+        for message in messages
+    )
+
+
+def _to_query_array(queries: Any) -> "np.ndarray":
+    """Converts queries to a C-contiguous array of little-endian float32 vectors.
+
+    Raises:
+        ValueError: If the queries are not a 2-D array.
+    """
+    import numpy as np
+
+    queries = np.asarray(queries)
+    if queries.ndim != 2:
+        raise ValueError(
+            "queries must be a 2-D array of shape (n_queries, dimensions), got "
+            f"an array of shape {queries.shape}."
+        )
+    return np.ascontiguousarray(queries, dtype=_PACKED_FLOAT_DTYPE)
+
+
+def _neighbors_to_arrays(
+    neighbor_lists: List[List[Tuple[str, float]]], num_neighbors: int
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Converts the (id, distance) pairs of each query to arrays.
+
+    Queries with fewer than `num_neighbors` neighbors are padded with empty ids
+    and NaN distances.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] - The ids, an object array of strings, and
+        the float32 distances, both of shape (n_queries, num_neighbors).
+    """
+    import numpy as np
+
+    ids = np.full((len(neighbor_lists), num_neighbors), "", dtype=object)
+    distances = np.full((len(neighbor_lists), num_neighbors), np.nan, dtype=np.float32)
+    for row, neighbors in enumerate(neighbor_lists):
+        neighbors = neighbors[:num_neighbors]
+        if neighbors:
+            row_ids, row_distances = zip(*neighbors)
+            ids[row, : len(neighbors)] = row_ids
+            distances[row, : len(neighbors)] = row_distances
+    return ids, distances
+
+
 class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
     """Matching Engine index endpoint resource for Vertex AI."""
 
@@ -86,6 +307,9 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
     _parse_resource_name_method = "parse_index_endpoint_path"
     _format_resource_name_method = "index_endpoint_path"
 
+    # Guards setting up the match channel pools of an endpoint.
+    _match_channel_pools_setup_lock = threading.Lock()
+
     def __init__(
         self,
         index_endpoint_name: str,
@@ -943,6 +1167,102 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
 
         super().delete(sync=sync)
 
+    def _sync_gca_resource(self):
+        """Sync GAPIC service representation of client class resource.
+
+        Closes the match channels, since the indexes may have been redeployed.
+        """
+        super()._sync_gca_resource()
+        with self._get_match_channel_pools_lock():
+            pools = self._match_channel_pools
+            async_pools = self._async_match_channel_pools
+            self._match_channel_pools = {}
+            self._async_match_channel_pools = {}
+        for pool in pools.values():
+            pool.close()
+        for loop, pool in async_pools.values():
+            _close_async_match_channel_pool(loop, pool)
+
+    def _get_match_channel_pools_lock(self) -> threading.Lock:
+        """Returns the lock of the match channel pools, setting them up if needed.
+
+        The pools are set up lazily, since endpoints constructed from a GAPIC
+        resource, like the ones returned by `list`, skip `__init__`.
+        """
+        lock = getattr(self, "_match_channel_pools_lock", None)
+        if lock is None:
+            with MatchingEngineIndexEndpoint._match_channel_pools_setup_lock:
+                lock = getattr(self, "_match_channel_pools_lock", None)
+                if lock is None:
+                    # Maps a deployed index id to the channel pool to its match
+                    # service.
+                    self._match_channel_pools: Dict[str, _MatchChannelPool] = {}
+                    # Maps a deployed index id to the event loop and grpc.aio
+                    # channel pool used by match_async, since grpc.aio channels
+                    # are bound to their loop.
+                    self._async_match_channel_pools: Dict[
+                        str, Tuple[asyncio.AbstractEventLoop, _MatchChannelPool]
+                    ] = {}
+                    lock = self._match_channel_pools_lock = threading.Lock()
+        return lock
+
+    def _get_match_grpc_target(self, deployed_index_id: str) -> str:
+        """Returns the address and port of the match service of a deployed index.
+
+        Raises:
+            RuntimeError: If no index with the id is deployed to this endpoint.
+        """
+        # Find the deployed index by id
+        deployed_indexes = [
+            deployed_index
+            for deployed_index in self.deployed_indexes
+            if deployed_index.id == deployed_index_id
+        ]
+
+        if not deployed_indexes:
+            raise RuntimeError(f"No deployed index with id '{deployed_index_id}' found")
+
+        # Retrieve server ip from deployed index
+        server_ip = deployed_indexes[0].private_endpoints.match_grpc_address
+        return "{}:{}".format(server_ip, _MATCH_GRPC_PORT)
+
+    def _get_match_channel_pool(self, deployed_index_id: str) -> _MatchChannelPool:
+        """Returns the channel pool to a deployed index, opening it if needed."""
+        lock = self._get_match_channel_pools_lock()
+        pool = self._match_channel_pools.get(deployed_index_id)
+        if pool is not None:
+            return pool
+        with lock:
+            pool = self._match_channel_pools.get(deployed_index_id)
+            if pool is None:
+                pool = _MatchChannelPool(
+                    self._get_match_grpc_target(deployed_index_id),
+                    size=_DEFAULT_MATCH_CHANNEL_POOL_SIZE,
+                )
+                self._match_channel_pools[deployed_index_id] = pool
+            return pool
+
+    def _get_async_match_channel_pool(
+        self, deployed_index_id: str
+    ) -> _MatchChannelPool:
+        """Returns the grpc.aio channel pool to a deployed index for this loop."""
+        loop = asyncio.get_running_loop()
+        with self._get_match_channel_pools_lock():
+            old_loop, old_pool = self._async_match_channel_pools.get(
+                deployed_index_id, (None, None)
+            )
+            if old_loop is loop:
+                return old_pool
+            pool = _MatchChannelPool(
+                self._get_match_grpc_target(deployed_index_id),
+                size=_DEFAULT_MATCH_CHANNEL_POOL_SIZE,
+                create_channel=grpc.aio.insecure_channel,
+            )
+            self._async_match_channel_pools[deployed_index_id] = (loop, pool)
+        if old_pool is not None:
+            _close_async_match_channel_pool(old_loop, old_pool)
+        return pool
+
     @property
     def description(self) -> str:
         """Description of the index endpoint."""
@@ -1021,6 +1341,127 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
             for embedding_neighbors in response.nearest_neighbors
         ]
 
+    def find_neighbors_array(
+        self,
+        *,
+        deployed_index_id: str,
+        queries: "np.ndarray",
+        num_neighbors: int = 10,
+        filter: Optional[List[Namespace]] = [],
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Retrieves nearest neighbors for an array of embedding queries on the specified deployed index which is deployed to public endpoint.
+
+        Works like `find_neighbors`, but serializes the queries directly from the
+        array, builds the filter once for all the queries and returns the
+        neighbors as arrays.
+
+        ```
+        Example usage:
+            ids, distances = my_index_endpoint.find_neighbors_array(
+                deployed_index_id="public_test1",
+                queries=np.array([[1, 1], [2, 2]], dtype=np.float32),
+            )
+        ```
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            queries (np.ndarray):
+                Required. A 2-D array of shape (n_queries, dimensions), with one
+                embedding per row. It is converted to float32.
+            num_neighbors (int):
+                Required. The number of nearest neighbors to be retrieved from database for
+                each query.
+            filter (List[Namespace]):
+                Optional. A list of Namespaces for filtering the matching results.
+        Returns:
+            Tuple[np.ndarray, np.ndarray] - The ids of the neighbors, an object
+            array of strings, and their float32 distances, both of shape
+            (n_queries, num_neighbors). Missing neighbors have an empty id and a
+            NaN distance.
+        """
+        if not self._public_match_client:
+            raise ValueError(
+                "Please make sure index has been deployed to public endpoint, and follow the example usage to call this method."
+            )
+
+        find_neighbors_request = self._build_find_neighbors_request_from_array(
+            deployed_index_id, _to_query_array(queries), num_neighbors, filter
+        )
+        response = self._public_match_client.find_neighbors(find_neighbors_request)
+
+        response_pb = gca_match_service_v1beta1.FindNeighborsResponse.pb(response)
+        return _neighbors_to_arrays(
+            [
+                [
+                    (neighbor.datapoint.datapoint_id, neighbor.distance)
+                    for neighbor in embedding_neighbors.neighbors
+                ]
+                for embedding_neighbors in response_pb.nearest_neighbors
+            ],
+            num_neighbors,
+        )
+
+    def _build_find_neighbors_request_from_array(
+        self,
+        deployed_index_id: str,
+        queries: "np.ndarray",
+        num_neighbors: int,
+        filter: Optional[List[Namespace]],
+    ) -> gca_match_service_v1beta1.FindNeighborsRequest:
+        """Builds the FindNeighbors request of an array of queries."""
+        datapoint_template = gca_index_v1beta1.IndexDatapoint.serialize(
+            gca_index_v1beta1.IndexDatapoint(
+                restricts=[
+                    gca_index_v1beta1.IndexDatapoint.Restriction(
+                        namespace=namespace.name,
+                        allow_list=namespace.allow_tokens,
+                        deny_list=namespace.deny_tokens,
+                    )
+                    for namespace in filter or []
+                ]
+            )
+        )
+        datapoints = _encode_vector_messages(
+            datapoint_template,
+            _field_number(
+                gca_index_v1beta1.IndexDatapoint.pb().DESCRIPTOR, "feature_vector"
+            ),
+            queries,
+        )
+
+        query_template = gca_match_service_v1beta1.FindNeighborsRequest.Query.serialize(
+            gca_match_service_v1beta1.FindNeighborsRequest.Query(
+                neighbor_count=num_neighbors
+            )
+        )
+        datapoint_field_number = _field_number(
+            gca_match_service_v1beta1.FindNeighborsRequest.Query.pb().DESCRIPTOR,
+            "datapoint",
+        )
+        encoded_queries = [
+            query_template
+            + _encode_field_prefix(datapoint_field_number, len(datapoint))
+            + datapoint
+            for datapoint in datapoints
+        ]
+
+        request_template = gca_match_service_v1beta1.FindNeighborsRequest.serialize(
+            gca_match_service_v1beta1.FindNeighborsRequest(
+                index_endpoint=self.resource_name,
+                deployed_index_id=deployed_index_id,
+            )
+        )
+        return gca_match_service_v1beta1.FindNeighborsRequest.deserialize(
+            request_template
+            + _encode_repeated_field(
+                _field_number(
+                    gca_match_service_v1beta1.FindNeighborsRequest.pb().DESCRIPTOR,
+                    "queries",
+                ),
+                encoded_queries,
+            )
+        )
+
     def read_index_datapoints(
         self,
         *,
@@ -1073,9 +1514,15 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         queries: List[List[float]],
         num_neighbors: int = 1,
         filter: Optional[List[Namespace]] = [],
+        max_queries_per_request: int = _DEFAULT_MAX_QUERIES_PER_BATCH_MATCH,
+        max_concurrent_requests: int = _DEFAULT_MAX_CONCURRENT_BATCH_MATCHES,
     ) -> List[List[MatchNeighbor]]:
         """Retrieves nearest neighbors for the given embedding queries on the specified deployed index.
 
+        The queries are sent over a pool of kept-alive gRPC channels to the
+        deployed index, which is reused by later calls. Large query lists are split
+        into BatchMatch calls that are sent concurrently.
+
         Args:
             deployed_index_id (str):
                 Required. The ID of the DeployedIndex to match the queries against.
@@ -1089,56 +1536,271 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
                 For example, [Namespace("color", ["red"], []), Namespace("shape", [], ["squared"])] will match datapoints
                 that satisfy "red color" but not include datapoints with "squared shape".
                 Please refer to https://cloud.google.com/vertex-ai/docs/matching-engine/filtering#json for more detail.
+            max_queries_per_request (int):
+                Optional. The maximum number of queries in a BatchMatch call.
+            max_concurrent_requests (int):
+                Optional. The maximum number of BatchMatch calls in flight at a time.
 
         Returns:
             List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
         """
+        batch_requests = [
+            self._build_batch_match_request(
+                deployed_index_id, batch, num_neighbors, filter
+            )
+            for batch in _batch_queries(queries, max_queries_per_request)
+        ]
+        responses = self._send_batch_match_requests(
+            deployed_index_id, batch_requests, max_concurrent_requests
+        )
 
-        # Find the deployed index by id
-        deployed_indexes = [
-            deployed_index
-            for deployed_index in self.deployed_indexes
-            if deployed_index.id == deployed_index_id
+        return [
+            neighbors
+            for response in responses
+            for neighbors in self._to_match_neighbors(response)
         ]
 
-        if not deployed_indexes:
-            raise RuntimeError(f"No deployed index with id '{deployed_index_id}' found")
+    def match_array(
+        self,
+        deployed_index_id: str,
+        queries: "np.ndarray",
+        num_neighbors: int = 1,
+        filter: Optional[List[Namespace]] = [],
+        max_queries_per_request: int = _DEFAULT_MAX_QUERIES_PER_BATCH_MATCH,
+        max_concurrent_requests: int = _DEFAULT_MAX_CONCURRENT_BATCH_MATCHES,
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Retrieves nearest neighbors for an array of embedding queries on the specified deployed index.
 
-        # Retrieve server ip from deployed index
-        server_ip = deployed_indexes[0].private_endpoints.match_grpc_address
+        Works like `match`, but serializes the queries directly from the array,
+        builds the filter once for all the queries and returns the neighbors as
+        arrays, which keeps the client CPU time low for large batches.
 
-        # Set up channel and stub
-        channel = grpc.insecure_channel("{}:10000".format(server_ip))
-        stub = match_service_pb2_grpc.MatchServiceStub(channel)
+        Example usage:
+            ```
+            ids, distances = my_index_endpoint.match_array(
+                deployed_index_id="my_deployed_index",
+                queries=np.random.rand(1000, 768).astype(np.float32),
+                num_neighbors=10,
+            )
+            ```
+
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            queries (np.ndarray):
+                Required. A 2-D array of shape (n_queries, dimensions), with one
+                embedding per row. It is converted to float32.
+            num_neighbors (int):
+                Required. The number of nearest neighbors to be retrieved from database for
+                each query.
+            filter (List[Namespace]):
+                Optional. A list of Namespaces for filtering the matching results.
+            max_queries_per_request (int):
+                Optional. The maximum number of queries in a BatchMatch call.
+            max_concurrent_requests (int):
+                Optional. The maximum number of BatchMatch calls in flight at a time.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray] - The ids of the neighbors, an object
+            array of strings, and their float32 distances, both of shape
+            (n_queries, num_neighbors). Missing neighbors have an empty id and a
+            NaN distance.
+        """
+        queries = _to_query_array(queries)
+        if max_queries_per_request < 1:
+            raise ValueError("max_queries_per_request must be at least 1.")
+
+        batch_requests = [
+            self._build_batch_match_request_from_array(
+                deployed_index_id,
+                queries[start : start + max_queries_per_request],
+                num_neighbors,
+                filter,
+            )
+            for start in range(0, len(queries), max_queries_per_request)
+        ]
+        responses = self._send_batch_match_requests(
+            deployed_index_id, batch_requests, max_concurrent_requests
+        )
+
+        return _neighbors_to_arrays(
+            [
+                [
+                    (neighbor.id, neighbor.distance)
+                    for neighbor in embedding_neighbors.neighbor
+                ]
+                for response in responses
+                for embedding_neighbors in response.responses[0].responses
+            ],
+            num_neighbors,
+        )
+
+    def _send_batch_match_requests(
+        self,
+        deployed_index_id: str,
+        batch_requests: List[match_service_pb2.BatchMatchRequest],
+        max_concurrent_requests: int,
+    ) -> List[match_service_pb2.BatchMatchResponse]:
+        """Sends BatchMatch requests to a deployed index, concurrently if several.
+
+        Returns:
+            List[match_service_pb2.BatchMatchResponse] - The responses, in the
+            order of the requests.
+        """
+        pool = self._get_match_channel_pool(deployed_index_id)
 
+        # Perform the requests
+        if len(batch_requests) <= 1 or max_concurrent_requests <= 1:
+            return [
+                pool.next_stub().BatchMatch(batch_request)
+                for batch_request in batch_requests
+            ]
+        with futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrent_requests, len(batch_requests))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda batch_request: pool.next_stub().BatchMatch(batch_request),
+                    batch_requests,
+                )
+            )
+
+    async def match_async(
+        self,
+        deployed_index_id: str,
+        queries: List[List[float]],
+        num_neighbors: int = 1,
+        filter: Optional[List[Namespace]] = [],
+        max_queries_per_request: int = _DEFAULT_MAX_QUERIES_PER_BATCH_MATCH,
+        max_concurrent_requests: int = _DEFAULT_MAX_CONCURRENT_BATCH_MATCHES,
+    ) -> List[List[MatchNeighbor]]:
+        """Asynchronously retrieves nearest neighbors for the given embedding queries on the specified deployed index.
+
+        Works like `match`, but sends the BatchMatch calls over `grpc.aio`
+        channels, which are reused by later calls in the same event loop.
+
+        Example usage:
+            ```
+            neighbors = await my_index_endpoint.match_async(
+                deployed_index_id="my_deployed_index", queries=[[1.0, 2.0]]
+            )
+            ```
+
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            queries (List[List[float]]):
+                Required. A list of queries. Each query is a list of floats, representing a single embedding.
+            num_neighbors (int):
+                Required. The number of nearest neighbors to be retrieved from database for
+                each query.
+            filter (List[Namespace]):
+                Optional. A list of Namespaces for filtering the matching results.
+            max_queries_per_request (int):
+                Optional. The maximum number of queries in a BatchMatch call.
+            max_concurrent_requests (int):
+                Optional. The maximum number of BatchMatch calls in flight at a time.
+
+        Returns:
+            List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
+        """
+        pool = self._get_async_match_channel_pool(deployed_index_id)
+        semaphore = asyncio.Semaphore(max(max_concurrent_requests, 1))
+
+        async def _batch_match(batch: List[List[float]]):
+            batch_request = self._build_batch_match_request(
+                deployed_index_id, batch, num_neighbors, filter
+            )
+            async with semaphore:
+                return await pool.next_stub().BatchMatch(batch_request)
+
+        responses = await asyncio.gather(
+            *(
+                _batch_match(batch)
+                for batch in _batch_queries(queries, max_queries_per_request)
+            )
+        )
+        return [
+            neighbors
+            for response in responses
+            for neighbors in self._to_match_neighbors(response)
+        ]
+
+    @staticmethod
+    def _build_batch_match_request(
+        deployed_index_id: str,
+        queries: List[List[float]],
+        num_neighbors: int,
+        filter: Optional[List[Namespace]],
+    ) -> match_service_pb2.BatchMatchRequest:
+        """Builds the BatchMatch request of queries to a deployed index."""
         # Create the batch match request
         batch_request = match_service_pb2.BatchMatchRequest()
         batch_request_for_index = (
             match_service_pb2.BatchMatchRequest.BatchMatchRequestPerIndex()
         )
         batch_request_for_index.deployed_index_id = deployed_index_id
-        requests = []
-        for query in queries:
-            request = match_service_pb2.MatchRequest(
+        restricts = _build_match_restricts(filter)
+        requests = [
+            match_service_pb2.MatchRequest(
                 num_neighbors=num_neighbors,
                 deployed_index_id=deployed_index_id,
                 float_val=query,
+                restricts=restricts,
             )
-            for namespace in filter:
-                restrict = match_service_pb2.Namespace()
-                restrict.name = namespace.name
-                restrict.allow_tokens.extend(namespace.allow_tokens)
-                restrict.deny_tokens.extend(namespace.deny_tokens)
-                request.restricts.append(restrict)
-            requests.append(request)
+            for query in queries
+        ]
 
         batch_request_for_index.requests.extend(requests)
         batch_request.requests.append(batch_request_for_index)
+        return batch_request
 
-        # Perform the request
-        response = stub.BatchMatch(batch_request)
+    @staticmethod
+    def _build_batch_match_request_from_array(
+        deployed_index_id: str,
+        queries: "np.ndarray",
+        num_neighbors: int,
+        filter: Optional[List[Namespace]],
+    ) -> match_service_pb2.BatchMatchRequest:
+        """Builds the BatchMatch request of an array of queries to a deployed index.
+
+        The requests of the queries are serialized from the array and parsed once,
+        instead of copying each query into a message.
+        """
+        match_requests = _encode_vector_messages(
+            match_service_pb2.MatchRequest(
+                num_neighbors=num_neighbors,
+                deployed_index_id=deployed_index_id,
+                restricts=_build_match_restricts(filter),
+            ).SerializeToString(),
+            _field_number(match_service_pb2.MatchRequest.DESCRIPTOR, "float_val"),
+            queries,
+        )
+        per_index_descriptor = (
+            match_service_pb2.BatchMatchRequest.BatchMatchRequestPerIndex.DESCRIPTOR
+        )
+        batch_request_for_index = (
+            match_service_pb2.BatchMatchRequest.BatchMatchRequestPerIndex(
+                deployed_index_id=deployed_index_id
+            ).SerializeToString()
+            + _encode_repeated_field(
+                _field_number(per_index_descriptor, "requests"), match_requests
+            )
+        )
+        batch_requests_field_number = _field_number(
+            match_service_pb2.BatchMatchRequest.DESCRIPTOR, "requests"
+        )
+        return match_service_pb2.BatchMatchRequest.FromString(
+            _encode_repeated_field(
+                batch_requests_field_number, [batch_request_for_index]
+            )
+        )
 
-        # Wrap the results in MatchNeighbor objects and return
+    @staticmethod
+    def _to_match_neighbors(
+        response: match_service_pb2.BatchMatchResponse,
+    ) -> List[List[MatchNeighbor]]:
+        """Wraps the results of a BatchMatch response in MatchNeighbor objects."""
         return [
             [
                 MatchNeighbor(id=neighbor.id, distance=neighbor.distance)
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Background logging of Experiment Run parameters and metrics.
+
+Logging from a training loop should not wait for metadata or Tensorboard RPCs.
+`AsyncRunLogger` buffers the logged values, coalescing the updates of the same
+key, and writes them from a background thread.
+"""
+
+import atexit
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from google.cloud.aiplatform import base
+
+from google.protobuf import timestamp_pb2
+
+_LOGGER = base.Logger(__name__)
+
+# Buffered values are written at least this often.
+DEFAULT_FLUSH_INTERVAL_SECS = 5.0
+# Time series points are written in batches of at most this many points. A
+# batch is written as soon as this many points are buffered.
+DEFAULT_MAX_BATCH_POINTS = 1000
+# Logging time series metrics blocks while this many points are buffered.
+DEFAULT_MAX_PENDING_POINTS = 10000
+
+# The (time_series_data, step, wall_time) of the time series metrics of a step.
+TimeSeriesDataPoint = Tuple[Dict[str, float], int, timestamp_pb2.Timestamp]
+
+
+class AsyncRunLogger:
+    """Writes logged parameters and metrics from a background thread.
+
+    Values logged for the same key before they are written are coalesced, the
+    last one wins. Time series metrics of the same step are merged, and the
+    steps are written in batches of several steps.
+
+    Errors of the background writes are raised by the next call of the logger.
+    The values that were not written are buffered again and retried with the
+    next write.
+    """
+
+    def __init__(
+        self,
+        write_params: Callable[[Dict[str, Union[float, int, str]]], None],
+        write_metrics: Callable[[Dict[str, Union[float, int, str]]], None],
+        write_time_series_metrics: Callable[[List[TimeSeriesDataPoint]], None],
+        *,
+        flush_interval_secs: float = DEFAULT_FLUSH_INTERVAL_SECS,
+        max_batch_points: int = DEFAULT_MAX_BATCH_POINTS,
+        max_pending_points: int = DEFAULT_MAX_PENDING_POINTS,
+    ):
+        """Starts the background thread of the logger.
+
+        Args:
+            write_params (Callable[[Dict[str, Union[float, int, str]]], None]):
+                Required. Writes parameters.
+            write_metrics (Callable[[Dict[str, Union[float, int, str]]], None]):
+                Required. Writes summary metrics.
+            write_time_series_metrics (Callable[[List[TimeSeriesDataPoint]], None]):
+                Required. Writes the time series metrics of several steps.
+            flush_interval_secs (float):
+                Optional. The maximum time in seconds that logged values are
+                buffered.
+            max_batch_points (int):
+                Optional. The maximum number of time series points written at a
+                time. A batch is written as soon as this many points are buffered.
+            max_pending_points (int):
+                Optional. The maximum number of buffered time series points.
+                Logging time series metrics blocks while the buffer is full.
+
+        Raises:
+            ValueError: If max_batch_points or max_pending_points is not positive.
+        """
+        if max_batch_points < 1 or max_pending_points < 1:
+            raise ValueError(
+                "max_batch_points and max_pending_points must be at least 1."
+            )
+        self._write_params = write_params
+        self._write_metrics = write_metrics
+        self._write_time_series_metrics = write_time_series_metrics
+        self._flush_interval_secs = flush_interval_secs
+        self._max_batch_points = max_batch_points
+        self._max_pending_points = max_pending_points
+
+        self._condition = threading.Condition()
+        self._params: Dict[str, Union[float, int, str]] = {}
+        self._metrics: Dict[str, Union[float, int, str]] = {}
+        # Maps a step to its time series metrics and wall time.
+        self._steps: Dict[int, Tuple[Dict[str, float], timestamp_pb2.Timestamp]] = {}
+        self._pending_points = 0
+        # Sequence numbers of the last logged and the last written updates.
+        self._logged_sequence = 0
+        self._written_sequence = 0
+        self._flush_requested = False
+        self._closed = False
+        self._error: Optional[Exception] = None
+
+        self._thread = threading.Thread(
+            target=self._run, name="AsyncRunLogger", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log_params(self, params: Dict[str, Union[float, int, str]]):
+        """Buffers parameters to be written."""
+        with self._condition:
+            self._check_open()
+            self._params.update(params)
+            self._logged_sequence += 1
+
+    def log_metrics(self, metrics: Dict[str, Union[float, int, str]]):
+        """Buffers summary metrics to be written."""
+        with self._condition:
+            self._check_open()
+            self._metrics.update(metrics)
+            self._logged_sequence += 1
+
+    def log_time_series_metrics(
+        self,
+        metrics: Dict[str, float],
+        step: int,
+        wall_time: timestamp_pb2.Timestamp,
+    ):
+        """Buffers the time series metrics of a step to be written.
+
+        Blocks while the buffer holds max_pending_points points.
+        """
+        with self._condition:
+            self._check_open()
+            while (
+                self._pending_points >= self._max_pending_points
+                and self._error is None
+                and not self._closed
+            ):
+                self._condition.wait()
+            self._check_open()
+
+            step_metrics, _ = self._steps.get(step, ({}, None))
+            self._pending_points -= len(step_metrics)
+            step_metrics = {**step_metrics, **metrics}
+            self._pending_points += len(step_metrics)
+            self._steps[step] = (step_metrics, wall_time)
+            self._logged_sequence += 1
+
+            if self._pending_points >= self._max_batch_points:
+                self._condition.notify_all()
+
+    def flush(self):
+        """Blocks until the values logged before the call are written.
+
+        Raises:
+            Exception: The first error of the background writes since the last
+                call of the logger.
+        """
+        with self._condition:
+            sequence = self._logged_sequence
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._written_sequence < sequence and self._thread.is_alive():
+                self._condition.wait()
+            self._raise_error()
+
+    def close(self):
+        """Writes the buffered values and stops the background thread.
+
+        Raises:
+            Exception: The first error of the background writes since the last
+                call of the logger.
+        """
+        atexit.unregister(self.close)
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        with self._condition:
+            self._raise_error()
+
+    def _check_open(self):
+        """Raises the pending error, or an error if the logger is closed."""
+        if self._closed:
+            raise RuntimeError("The logger is closed.")
+        self._raise_error()
+
+    def _raise_error(self):
+        """Raises the pending error of the background writes, once."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self):
+        """Writes the buffered values until the logger is closed."""
+        write_failed = False
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self._flush_interval_secs
+                # After a failed write, the values buffered again are retried
+                # after the flush interval even if they fill a batch.
+                while not (
+                    self._closed
+                    or self._flush_requested
+                    or (
+                        not write_failed
+                        and self._pending_points >= self._max_batch_points
+                    )
+                ):
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+
+                params, self._params = self._params, {}
+                metrics, self._metrics = self._metrics, {}
+                steps, self._steps = self._steps, {}
+                self._pending_points = 0
+                self._flush_requested = False
+                sequence = self._logged_sequence
+                closed = self._closed
+                # Wakes up the callers blocked on the buffer size.
+                self._condition.notify_all()
+
+            write_failed = False
+            try:
+                self._write(params, metrics, steps)
+            except Exception as e:
+                _LOGGER.warning(f"Failed to write logged experiment run values: {e}")
+                write_failed = True
+                with self._condition:
+                    self._error = self._error or e
+
+            with self._condition:
+                self._written_sequence = sequence
+                self._condition.notify_all()
+
+            if closed:
+                return
+
+    def _rebuffer(
+        self,
+        params: Dict[str, Union[float, int, str]],
+        metrics: Dict[str, Union[float, int, str]],
+        steps: Dict[int, Tuple[Dict[str, float], timestamp_pb2.Timestamp]],
+    ):
+        """Merges values that were not written back into the buffers.
+
+        The values logged since they were taken from the buffers win. The merged
+        values count as a new update, so that the next flush writes them.
+        """
+        if params or metrics or steps:
+            self._logged_sequence += 1
+        self._params = {**params, **self._params}
+        self._metrics = {**metrics, **self._metrics}
+        for step, (step_metrics, wall_time) in steps.items():
+            logged_metrics, logged_wall_time = self._steps.get(step, ({}, wall_time))
+            self._pending_points -= len(logged_metrics)
+            step_metrics = {**step_metrics, **logged_metrics}
+            self._pending_points += len(step_metrics)
+            self._steps[step] = (step_metrics, logged_wall_time)
+
+    def _write(
+        self,
+        params: Dict[str, Union[float, int, str]],
+        metrics: Dict[str, Union[float, int, str]],
+        steps: Dict[int, Tuple[Dict[str, float], timestamp_pb2.Timestamp]],
+    ):
+        """Writes buffered values, time series points in batches of steps.
+
+        If a write fails, the values that were not written are buffered again
+        before the error is raised.
+        """
+        try:
+            if params:
+                self._write_params(params)
+                params = {}
+            if metrics:
+                self._write_metrics(metrics)
+                metrics = {}
+
+            batch: List[TimeSeriesDataPoint] = []
+            batch_points = 0
+            for step, (step_metrics, wall_time) in list(steps.items()):
+                if batch and batch_points + len(step_metrics) > self._max_batch_points:
+                    self._write_time_series_metrics(batch)
+                    for _, written_step, _ in batch:
+                        del steps[written_step]
+                    batch, batch_points = [], 0
+                batch.append((step_metrics, step, wall_time))
+                batch_points += len(step_metrics)
+            if batch:
+                self._write_time_series_metrics(batch)
+        except Exception:
+            with self._condition:
+                self._rebuffer(params, metrics, steps)
+            raise
@@ -16,14 +16,24 @@
 #
 
 import abc
+import collections
+from concurrent import futures
 from dataclasses import dataclass
+import json
 import logging
-from typing import Dict, List, NamedTuple, Optional, Tuple, Type, Union
+import os
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union
 
 from google.api_core import exceptions
 from google.auth import credentials as auth_credentials
 
 from google.cloud.aiplatform import base
+from google.cloud.aiplatform.compat.types import execution as gca_execution
+from google.cloud.aiplatform.compat.types import tensorboard_service
+from google.cloud.aiplatform.compat.types import (
+    tensorboard_time_series as gca_tensorboard_time_series,
+)
 from google.cloud.aiplatform.metadata import artifact
 from google.cloud.aiplatform.metadata import constants
 from google.cloud.aiplatform.metadata import context
@@ -36,6 +46,18 @@ from google.cloud.aiplatform.tensorboard import tensorboard_resource
 
 _LOGGER = base.Logger(__name__)
 
+# Maximum number of runs queried concurrently by Experiment.get_data_frame.
+_DEFAULT_MAX_CONCURRENT_ROW_QUERIES = 16
+# Maximum number of time series read by a BatchReadTensorboardTimeSeriesData
+# request.
+_MAX_TIME_SERIES_PER_BATCH_READ = 100
+# Cached rows of runs in these states are queried again, since their time series
+# metrics change without updating the run.
+_ACTIVE_RUN_STATES = (
+    gca_execution.Execution.State.NEW.name,
+    gca_execution.Execution.State.RUNNING.name,
+)
+
 
 @dataclass
 class _ExperimentRow:
@@ -80,6 +102,114 @@ class _ExperimentRow:
         return result
 
 
+class _LatestTimeSeriesMetricsReader:
+    """Reads the latest time series metrics of several runs in batched requests.
+
+    Runs register their TensorboardRun while their rows are queried, then the time
+    series of all the runs are read with one request per Tensorboard and batch of
+    time series, instead of one request per run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Maps a Tensorboard resource name to the time series to read from it,
+        # with the row and metric key to read them into.
+        self._time_series: Dict[
+            str, List[Tuple[str, _ExperimentRow, str]]
+        ] = collections.defaultdict(list)
+        self._credentials: Dict[str, Optional[auth_credentials.Credentials]] = {}
+
+    def add(
+        self,
+        tensorboard_run_name: str,
+        row: _ExperimentRow,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ):
+        """Lists the scalar time series of a TensorboardRun to read them into a row.
+
+        Args:
+            tensorboard_run_name (str):
+                Required. The resource name of the TensorboardRun of the run.
+            row (_ExperimentRow):
+                Required. The row of the run.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to read the time series.
+        """
+        time_series = tensorboard_resource.TensorboardTimeSeries.list(
+            tensorboard_run_name=tensorboard_run_name, credentials=credentials
+        )
+        resource_name_parts = tensorboard_resource.TensorboardRun._parse_resource_name(
+            tensorboard_run_name
+        )
+        tensorboard_name = tensorboard_resource.Tensorboard._format_resource_name(
+            project=resource_name_parts["project"],
+            location=resource_name_parts["location"],
+            tensorboard=resource_name_parts["tensorboard"],
+        )
+
+        row.time_series_metrics = {}
+        with self._lock:
+            self._credentials[tensorboard_name] = credentials
+            self._time_series[tensorboard_name].extend(
+                (ts.resource_name, row, ts.display_name)
+                for ts in time_series
+                if ts.gca_resource.value_type
+                == gca_tensorboard_time_series.TensorboardTimeSeries.ValueType.SCALAR
+            )
+
+    def read(self, max_workers: int = _DEFAULT_MAX_CONCURRENT_ROW_QUERIES):
+        """Reads the latest value of the added time series into their rows.
+
+        Args:
+            max_workers (int):
+                Optional. The maximum number of concurrent requests.
+        """
+        batch_size = _MAX_TIME_SERIES_PER_BATCH_READ
+        batches = [
+            (tensorboard_name, time_series[start : start + batch_size])
+            for tensorboard_name, time_series in self._time_series.items()
+            for start in range(0, len(time_series), batch_size)
+        ]
+        if not batches:
+            return
+        with futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(batches))
+        ) as executor:
+            for _ in executor.map(lambda batch: self._read_batch(*batch), batches):
+                pass
+
+    def _read_batch(
+        self,
+        tensorboard_name: str,
+        time_series: List[Tuple[str, _ExperimentRow, str]],
+    ):
+        """Reads a batch of time series of a Tensorboard into their rows."""
+        api_client = tensorboard_resource.Tensorboard._instantiate_client(
+            location=tensorboard_resource.Tensorboard._parse_resource_name(
+                tensorboard_name
+            )["location"],
+            credentials=self._credentials[tensorboard_name],
+        )
+        response = api_client.batch_read_tensorboard_time_series_data(
+            request=tensorboard_service.BatchReadTensorboardTimeSeriesDataRequest(
+                tensorboard=tensorboard_name,
+                time_series=[
+                    time_series_name for time_series_name, _, _ in time_series
+                ],
+            )
+        )
+
+        # Responses identify time series by ID, which is unique in a Tensorboard.
+        targets = {
+            time_series_name.split("/")[-1]: (row, display_name)
+            for time_series_name, row, display_name in time_series
+        }
+        for data in response.time_series_data:
+            if data.values:
+                row, display_name = targets[data.tensorboard_time_series_id]
+                row.time_series_metrics[display_name] = data.values[-1].scalar.value
+
+
 class Experiment:
     """Represents a Vertex AI Experiment resource."""
 
@@ -397,14 +527,31 @@ class Experiment:
             )
         self._metadata_context.delete()
 
-    def get_data_frame(self) -> "pd.DataFrame":  # noqa: F821
+    def get_data_frame(
+        self,
+        *,
+        max_workers: int = _DEFAULT_MAX_CONCURRENT_ROW_QUERIES,
+        cache_path: Optional[str] = None,
+    ) -> "pd.DataFrame":  # noqa: F821
         """Get parameters, metrics, and time series metrics of all runs in this experiment as Dataframe.
 
+        The runs are queried concurrently, and their latest time series metrics
+        are read in batches across runs.
+
         ```
         my_experiment = aiplatform.Experiment('my-experiment')
         df = my_experiment.get_data_frame()
         ```
 
+        Args:
+            max_workers (int):
+                Optional. The maximum number of runs queried concurrently.
+            cache_path (str):
+                Optional. Path of a local JSON file caching the rows of the runs
+                between calls. Runs that have not been updated since their row was
+                cached are not queried again, except for NEW and RUNNING runs,
+                whose time series metrics can change without updating the run.
+
         Returns:
             pd.DataFrame: Pandas Dataframe of Experiment Runs.
 
@@ -442,29 +589,47 @@ class Experiment:
 
         executions = execution.Execution.list(filter_str, **service_request_args)
 
-        rows = []
-        for metadata_context in contexts:
-            row_dict = (
-                _SUPPORTED_LOGGABLE_RESOURCES[context.Context][
-                    metadata_context.schema_title
-                ]
-                ._query_experiment_row(metadata_context)
-                .to_dict()
-            )
-            row_dict.update({"experiment_name": self.name})
-            rows.append(row_dict)
-
-        # backward compatibility
-        for metadata_execution in executions:
-            row_dict = (
-                _SUPPORTED_LOGGABLE_RESOURCES[execution.Execution][
-                    metadata_execution.schema_title
-                ]
-                ._query_experiment_row(metadata_execution)
-                .to_dict()
+        # executions for backward compatibility
+        nodes = [
+            (node, _SUPPORTED_LOGGABLE_RESOURCES[node_type][node.schema_title])
+            for node_type, node_list in (
+                (context.Context, contexts),
+                (execution.Execution, executions),
             )
-            row_dict.update({"experiment_name": self.name})
-            rows.append(row_dict)
+            for node in node_list
+        ]
+
+        cached_rows = self._read_cached_rows(cache_path) if cache_path else {}
+        rows: List[Optional[Dict[str, Any]]] = [
+            self._get_cached_row(cached_rows, node) for node, _ in nodes
+        ]
+
+        time_series_reader = _LatestTimeSeriesMetricsReader()
+        queried_rows: Dict[int, _ExperimentRow] = {}
+        indexes_to_query = [index for index, row in enumerate(rows) if row is None]
+        if indexes_to_query:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(indexes_to_query))
+            ) as executor:
+                queried_rows = dict(
+                    zip(
+                        indexes_to_query,
+                        executor.map(
+                            lambda index: nodes[index][1]._query_experiment_row(
+                                nodes[index][0], time_series_reader=time_series_reader
+                            ),
+                            indexes_to_query,
+                        ),
+                    )
+                )
+            time_series_reader.read(max_workers=max_workers)
+
+        for index, row in queried_rows.items():
+            rows[index] = row.to_dict()
+            rows[index].update({"experiment_name": self.name})
+
+        if cache_path:
+            self._write_cached_rows(cache_path, nodes, rows)
 
         df = pd.DataFrame(rows)
 
@@ -493,6 +658,86 @@ class Experiment:
 
         return df
 
+    def _read_cached_rows(self, cache_path: str) -> Dict[str, Dict[str, Any]]:
+        """Reads the cached rows of the runs of this experiment.
+
+        Args:
+            cache_path (str): Required. Path of the JSON cache file.
+        Returns:
+            Dictionary mapping the resource name of each cached run to its update
+            time and row. Empty if the cache does not exist or is invalid.
+        """
+        try:
+            with open(cache_path) as cache_file:
+                cache = json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            _LOGGER.warning(f"Ignoring invalid experiment cache {cache_path}: {e}")
+            return {}
+        if cache.get("experiment") != self.resource_name:
+            return {}
+        return cache.get("runs", {})
+
+    @staticmethod
+    def _get_update_time(
+        node: Union[context.Context, execution.Execution]
+    ) -> Optional[str]:
+        """Returns the update time of a run node, or None if it is not set."""
+        update_time = node.gca_resource.update_time
+        return update_time.isoformat() if update_time else None
+
+    @classmethod
+    def _get_cached_row(
+        cls,
+        cached_rows: Dict[str, Dict[str, Any]],
+        node: Union[context.Context, execution.Execution],
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the cached row of a run if it is up to date, None otherwise."""
+        cached_row = cached_rows.get(node.resource_name)
+        update_time = cls._get_update_time(node)
+        if (
+            not cached_row
+            or not update_time
+            or cached_row["update_time"] != update_time
+            or cached_row["row"].get("state") in _ACTIVE_RUN_STATES
+        ):
+            return None
+        return cached_row["row"]
+
+    def _write_cached_rows(
+        self,
+        cache_path: str,
+        nodes: List[Tuple[Union[context.Context, execution.Execution], Any]],
+        rows: List[Dict[str, Any]],
+    ):
+        """Replaces the cached rows of the runs of this experiment.
+
+        Args:
+            cache_path (str): Required. Path of the JSON cache file.
+            nodes (List[Tuple[Union[context.Context, execution.Execution], Any]]):
+                Required. The metadata nodes of the runs.
+            rows (List[Dict[str, Any]]):
+                Required. The rows of the runs, in the order of the nodes.
+        """
+        cache = {
+            "experiment": self.resource_name,
+            "runs": {
+                node.resource_name: {
+                    "update_time": self._get_update_time(node),
+                    "row": row,
+                }
+                for (node, _), row in zip(nodes, rows)
+                if self._get_update_time(node)
+            },
+        }
+        # Written to a temporary file first, so that readers never see a partial
+        # cache.
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(temporary_path, cache_path)
+
     def _lookup_backing_tensorboard(self) -> Optional[tensorboard_resource.Tensorboard]:
         """Returns backing tensorboard if one is set.
 
@@ -678,12 +923,16 @@ class _ExperimentLoggable(abc.ABC):
     @classmethod
     @abc.abstractmethod
     def _query_experiment_row(
-        cls, node: Union[context.Context, execution.Execution]
+        cls,
+        node: Union[context.Context, execution.Execution],
+        time_series_reader: Optional[_LatestTimeSeriesMetricsReader] = None,
     ) -> _ExperimentRow:
         """Should return parameters and metrics for this resource as a run row.
 
         Args:
             node: The metadata node that represents this resource.
+            time_series_reader: If set, time series metrics of the row should be
+                added to it instead of being read.
         Returns:
             A populated run row for this resource.
         """
@@ -26,11 +26,13 @@ from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import pipeline_jobs
 from google.cloud.aiplatform import jobs
+from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.compat.types import artifact as gca_artifact
 from google.cloud.aiplatform.compat.types import execution as gca_execution
 from google.cloud.aiplatform.compat.types import (
     tensorboard_time_series as gca_tensorboard_time_series,
 )
+from google.cloud.aiplatform.metadata import _async_run_logger
 from google.cloud.aiplatform.metadata import artifact
 from google.cloud.aiplatform.metadata import constants
 from google.cloud.aiplatform.metadata import context
@@ -97,6 +99,9 @@ class ExperimentRun(
 ):
     """A Vertex AI Experiment run."""
 
+    # Set by enable_async_logging to log from a background thread.
+    _async_logger: Optional[_async_run_logger.AsyncRunLogger] = None
+
     def __init__(
         self,
         run_name: str,
@@ -364,6 +369,19 @@ class ExperimentRun(
         Returns:
             Tuple of Tensorboard Run Artifact and TensorboardRun is it exists.
         """
+        tensorboard_run_artifact = self._get_tensorboard_run_artifact()
+        if tensorboard_run_artifact:
+            return experiment_resources._VertexResourceWithMetadata(
+                resource=tensorboard_resource.TensorboardRun(
+                    tensorboard_run_artifact.metadata[
+                        constants.GCP_ARTIFACT_RESOURCE_NAME_KEY
+                    ]
+                ),
+                metadata=tensorboard_run_artifact,
+            )
+
+    def _get_tensorboard_run_artifact(self) -> Optional[artifact.Artifact]:
+        """Returns this run's TensorboardRun Artifact if it exists."""
         with experiment_resources._SetLoggerLevel(resource):
             try:
                 tensorboard_run_artifact = artifact.Artifact(
@@ -373,19 +391,11 @@ class ExperimentRun(
                     credentials=self._metadata_node.credentials,
                 )
             except exceptions.NotFound:
-                tensorboard_run_artifact = None
+                return None
 
-        if tensorboard_run_artifact and self._is_backing_tensorboard_run_artifact(
-            tensorboard_run_artifact
-        ):
-            return experiment_resources._VertexResourceWithMetadata(
-                resource=tensorboard_resource.TensorboardRun(
-                    tensorboard_run_artifact.metadata[
-                        constants.GCP_ARTIFACT_RESOURCE_NAME_KEY
-                    ]
-                ),
-                metadata=tensorboard_run_artifact,
-            )
+        if self._is_backing_tensorboard_run_artifact(tensorboard_run_artifact):
+            return tensorboard_run_artifact
+        return None
 
     @classmethod
     def get(
@@ -549,13 +559,21 @@ class ExperimentRun(
 
     @classmethod
     def _query_experiment_row(
-        cls, node: Union[context.Context, execution.Execution]
+        cls,
+        node: Union[context.Context, execution.Execution],
+        time_series_reader: Optional[
+            experiment_resources._LatestTimeSeriesMetricsReader
+        ] = None,
     ) -> experiment_resources._ExperimentRow:
         """Retrieves the runs metric and parameters into an experiment run row.
 
         Args:
             node (Union[context._Context, execution.Execution]):
                 Required. Metadata node instance that represents this run.
+            time_series_reader (experiment_resources._LatestTimeSeriesMetricsReader):
+                Optional. If set, the time series metrics of this run are added to
+                the reader, which reads them into the row, instead of being read
+                here.
         Returns:
             Experiment run row that represents this run.
         """
@@ -568,14 +586,27 @@ class ExperimentRun(
         )
 
         if isinstance(node, context.Context):
-            this_experiment_run._backing_tensorboard_run = (
-                this_experiment_run._lookup_tensorboard_run_artifact()
-            )
+            if time_series_reader:
+                tensorboard_run_artifact = (
+                    this_experiment_run._get_tensorboard_run_artifact()
+                )
+                if tensorboard_run_artifact:
+                    time_series_reader.add(
+                        tensorboard_run_artifact.metadata[
+                            constants.GCP_ARTIFACT_RESOURCE_NAME_KEY
+                        ],
+                        row,
+                        credentials=node.credentials,
+                    )
+            else:
+                this_experiment_run._backing_tensorboard_run = (
+                    this_experiment_run._lookup_tensorboard_run_artifact()
+                )
+                row.time_series_metrics = (
+                    this_experiment_run._get_latest_time_series_metric_columns()
+                )
             row.params = node.metadata[constants._PARAM_KEY]
             row.metrics = node.metadata[constants._METRIC_KEY]
-            row.time_series_metrics = (
-                this_experiment_run._get_latest_time_series_metric_columns()
-            )
             row.state = node.metadata[constants._STATE_KEY]
         else:
             this_experiment_run._metadata_metric_artifact = (
@@ -950,15 +981,37 @@ class ExperimentRun(
                     "Please set this experiment run with backing tensorboard resource to use log_time_series_metrics."
                 )
 
-        self._soft_create_time_series(metric_keys=set(metrics.keys()))
+        if not self._async_logger:
+            self._soft_create_time_series(metric_keys=set(metrics.keys()))
 
         if not step:
             step = self._largest_step or self._get_latest_time_series_step()
             step += 1
             self._largest_step = step
 
-        self._backing_tensorboard_run.resource.write_tensorboard_scalar_data(
-            time_series_data=metrics, step=step, wall_time=wall_time
+        if self._async_logger:
+            # The time series are created in the background.
+            self._async_logger.log_time_series_metrics(
+                metrics, step, wall_time or utils.get_timestamp_proto()
+            )
+            return
+
+        self._write_time_series_metrics([(metrics, step, wall_time)])
+
+    def _write_time_series_metrics(
+        self, data_points: List[_async_run_logger.TimeSeriesDataPoint]
+    ):
+        """Writes the time series metrics of several steps to the backing TensorboardRun.
+
+        Args:
+            data_points (List[_async_run_logger.TimeSeriesDataPoint]):
+                Required. The (metrics, step, wall_time) of each step.
+        """
+        self._soft_create_time_series(
+            metric_keys={key for metrics, _, _ in data_points for key in metrics}
+        )
+        self._backing_tensorboard_run.resource.write_tensorboard_scalar_data_points(
+            data_points
         )
 
     def _soft_create_time_series(self, metric_keys: Set[str]):
@@ -1013,6 +1066,13 @@ class ExperimentRun(
                     f"Value for key {key} is of type {type(value).__name__} but must be one of float, int, str"
                 )
 
+        if self._async_logger:
+            self._async_logger.log_params(params)
+        else:
+            self._write_params(params)
+
+    def _write_params(self, params: Dict[str, Union[float, int, str]]):
+        """Writes parameters to the metadata of this run."""
         if self._is_legacy_experiment_run():
             self._metadata_node.update(metadata=params)
         else:
@@ -1044,12 +1104,79 @@ class ExperimentRun(
                     f"Value for key {key} is of type {type(value).__name__} but must be one of float, int, str"
                 )
 
+        if self._async_logger:
+            self._async_logger.log_metrics(metrics)
+        else:
+            self._write_metrics(metrics)
+
+    def _write_metrics(self, metrics: Dict[str, Union[float, int, str]]):
+        """Writes summary metrics to the metadata of this run."""
         if self._is_legacy_experiment_run():
             self._metadata_metric_artifact.update(metadata=metrics)
         else:
             # TODO: query the latest metrics artifact resource before logging.
             self._metadata_node.update(metadata={constants._METRIC_KEY: metrics})
 
+    def enable_async_logging(
+        self,
+        *,
+        flush_interval_secs: float = _async_run_logger.DEFAULT_FLUSH_INTERVAL_SECS,
+        max_batch_points: int = _async_run_logger.DEFAULT_MAX_BATCH_POINTS,
+        max_pending_points: int = _async_run_logger.DEFAULT_MAX_PENDING_POINTS,
+    ) -> "ExperimentRun":
+        """Logs parameters and metrics of this run from a background thread.
+
+        `log_params`, `log_metrics` and `log_time_series_metrics` then return
+        without waiting for RPCs. Values logged for the same key are coalesced,
+        and time series metrics of several steps are written together. Logged
+        values are written at least every `flush_interval_secs`, on `flush` and
+        on `end_run`.
+
+        ```
+        with aiplatform.start_run('my-run').enable_async_logging() as my_run:
+            for step in range(1000):
+                my_run.log_time_series_metrics({'loss': loss}, step=step)
+        ```
+
+        Args:
+            flush_interval_secs (float):
+                Optional. The maximum time in seconds that logged values are
+                buffered.
+            max_batch_points (int):
+                Optional. The maximum number of time series points written in a
+                request. A request is sent as soon as this many points are
+                buffered.
+            max_pending_points (int):
+                Optional. The maximum number of buffered time series points.
+                `log_time_series_metrics` blocks while the buffer is full.
+
+        Returns:
+            This experiment run.
+        """
+        if not self._async_logger:
+            self._async_logger = _async_run_logger.AsyncRunLogger(
+                write_params=self._write_params,
+                write_metrics=self._write_metrics,
+                write_time_series_metrics=self._write_time_series_metrics,
+                flush_interval_secs=flush_interval_secs,
+                max_batch_points=max_batch_points,
+                max_pending_points=max_pending_points,
+            )
+        return self
+
+    def flush(self):
+        """Blocks until the parameters and metrics logged to this run are written.
+
+        Only needed with `enable_async_logging`, otherwise values are written
+        when logged.
+
+        Raises:
+            Exception: The first error writing values in the background since the
+                last call.
+        """
+        if self._async_logger:
+            self._async_logger.flush()
+
     @_v1_not_supported
     def log_classification_metrics(
         self,
@@ -1263,6 +1390,7 @@ class ExperimentRun(
                 'Please install the SDK using "pip install google-cloud-aiplatform[metadata]"'
             )
 
+        self.flush()
         if not self._backing_tensorboard_run:
             return pd.DataFrame({})
         data = self._backing_tensorboard_run.resource.read_time_series_data()
@@ -1345,11 +1473,18 @@ class ExperimentRun(
     ):
         """Ends this experiment run and sets state to COMPLETE.
 
+        Values logged with `enable_async_logging` are written first.
+
         Args:
             state (aiplatform.gapic.Execution.State):
                 Optional. Override the state at the end of run. Defaults to COMPLETE.
         """
-        self.update_state(state)
+        async_logger, self._async_logger = self._async_logger, None
+        try:
+            if async_logger:
+                async_logger.close()
+        finally:
+            self.update_state(state)
 
     def delete(self, *, delete_backing_tensorboard_run: bool = False):
         """Deletes this experiment run.
@@ -1409,6 +1544,7 @@ class ExperimentRun(
         Returns:
             Parameters logged to this experiment run.
         """
+        self.flush()
         if self._is_legacy_experiment_run():
             return self._metadata_node.metadata
         else:
@@ -1420,6 +1556,7 @@ class ExperimentRun(
         Returns:
             Summary metrics logged to this experiment run.
         """
+        self.flush()
         if self._is_legacy_experiment_run():
             return self._metadata_metric_artifact.metadata
         else:
@@ -20,7 +20,7 @@ import collections
 import re
 import threading
 from copy import deepcopy
-from typing import Dict, Optional, Union, Any, List
+from typing import Dict, Iterator, Optional, Union, Any, List
 
 import proto
 from google.api_core import exceptions
@@ -377,6 +377,69 @@ class _Resource(base.VertexAiResourceNounWithFutureManager, abc.ABC):
             order_by=order_by,
         )
 
+    @classmethod
+    def list_iter(
+        cls,
+        filter: Optional[str] = None,  # pylint: disable=redefined-builtin
+        metadata_store_id: str = "default",
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Iterator["_Resource"]:
+        """Lazily lists the resources that match the list filter in target
+        metadataStore, page by page.
+
+        Args:
+            filter (str):
+                Optional. A query to filter available resources for
+                matching results.
+            metadata_store_id (str):
+                The <metadata_store_id> portion of the resource name with
+                the format:
+                projects/123/locations/us-central1/metadataStores/<metadata_store_id>/<resource_noun>/<resource_id>
+                If not provided, the MetadataStore's ID will be set to "default".
+            order_by (str):
+                Optional. How the list of messages is ordered. See `list`.
+            page_size (int):
+                Optional. The maximum number of resources per page. The service
+                default is used if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the resources of the current page are consumed.
+            project (str):
+                Project used to create this resource. Overrides project set in
+                aiplatform.init.
+            location (str):
+                Location used to create this resource. Overrides location set in
+                aiplatform.init.
+            credentials (auth_credentials.Credentials):
+                Custom credentials used to create this resource. Overrides
+                credentials set in aiplatform.init.
+
+        Yields:
+            The managed Metadata resources.
+        """
+        parent = (
+            initializer.global_config.common_location_path(
+                project=project, location=location
+            )
+            + f"/metadataStores/{metadata_store_id}"
+        )
+
+        return super().list_iter(
+            filter=filter,
+            order_by=order_by,
+            page_size=page_size,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+        )
+
     @classmethod
     def _create(
         cls,
@@ -17,7 +17,7 @@
 
 import abc
 
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence
 
 from google.auth import credentials as auth_credentials
 
@@ -217,6 +217,68 @@ class BaseContextSchema(context.Context):
             credentials=credentials,
         )
 
+    @classmethod
+    def list_iter(
+        cls,
+        filter: Optional[str] = None,  # pylint: disable=redefined-builtin
+        metadata_store_id: str = "default",
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Iterator["BaseContextSchema"]:
+        """Lazily lists the Context resources with a particular schema, page
+        by page.
+
+        Args:
+            filter (str):
+                Optional. A query to filter available resources for
+                matching results.
+            metadata_store_id (str):
+                The <metadata_store_id> portion of the resource name with
+                the format:
+                projects/123/locations/us-central1/metadataStores/<metadata_store_id>/<resource_noun>/<resource_id>
+                If not provided, the MetadataStore's ID will be set to "default".
+            order_by (str):
+                Optional. How the list of messages is ordered. See `list`.
+            page_size (int):
+                Optional. The maximum number of contexts per page. The service
+                default is used if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the contexts of the current page are consumed.
+            project (str):
+                Project used to create this resource. Overrides project set in
+                aiplatform.init.
+            location (str):
+                Location used to create this resource. Overrides location set in
+                aiplatform.init.
+            credentials (auth_credentials.Credentials):
+                Custom credentials used to create this resource. Overrides
+                credentials set in aiplatform.init.
+
+        Yields:
+            The context resources with a particular schema.
+        """
+        schema_filter = f'schema_title="{cls.schema_title}"'
+        if filter:
+            filter = f"{filter} AND {schema_filter}"
+        else:
+            filter = schema_filter
+
+        return super().list_iter(
+            filter=filter,
+            metadata_store_id=metadata_store_id,
+            order_by=order_by,
+            page_size=page_size,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+        )
+
     def add_artifacts_and_executions(
         self,
         artifact_resource_names: Optional[Sequence[str]] = None,
@@ -15,8 +15,9 @@
 # limitations under the License.
 #
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+from google.protobuf import field_mask_pb2
 from google.protobuf import struct_pb2
 
 from google.auth import credentials as auth_credentials
@@ -176,3 +177,69 @@ class ModelEvaluation(base.VertexAiResourceNounWithFutureManager):
             credentials=credentials,
             parent=model,
         )
+
+    @classmethod
+    def list_iter(
+        cls,
+        model: str,
+        filter: Optional[str] = None,
+        page_size: Optional[int] = None,
+        read_mask: Optional[field_mask_pb2.FieldMask] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Iterator["ModelEvaluation"]:
+        """Lazily lists the ModelEvaluation resources on the provided model,
+        page by page.
+
+        The List method of model evaluations does not support ordering, so
+        unlike `list` there is no `order_by` argument.
+
+        Example Usage:
+
+        for evaluation in aiplatform.ModelEvaluation.list_iter(
+            model="projects/123/locations/us-central1/models/456",
+            page_size=100,
+        ):
+            print(evaluation.resource_name)
+
+        Args:
+            model (str):
+                Required. The resource name of the model to list evaluations for.
+                For example: "projects/123/locations/us-central1/models/456".
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            page_size (int):
+                Optional. The maximum number of evaluations per page. The service
+                default is used if not set.
+            read_mask (field_mask_pb2.FieldMask):
+                Optional. The fields to return for each evaluation. All the
+                fields are returned if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the evaluations of the current page are consumed.
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+
+        Yields:
+            ModelEvaluation - The evaluations of the model.
+        """
+        return super().list_iter(
+            filter=filter,
+            page_size=page_size,
+            read_mask=read_mask,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=model,
+        )
@@ -15,6 +15,9 @@
 # limitations under the License.
 #
 import asyncio
+import collections
+from concurrent import futures
+import functools
 import json
 import pathlib
 import re
@@ -23,7 +26,10 @@ import tempfile
 import requests
 from typing import (
     Any,
+    AsyncIterator,
     Dict,
+    Iterable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -35,6 +41,8 @@ from typing import (
 
 from google.api_core import operation
 from google.api_core import exceptions as api_exceptions
+from google.api_core import retry as api_retry
+from google.api_core import retry_async as api_retry_async
 from google.auth import credentials as auth_credentials
 from google.auth.transport import requests as google_auth_requests
 import proto
@@ -49,6 +57,7 @@ from google.cloud.aiplatform import models
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import gcs_utils
 from google.cloud.aiplatform.utils import _explanation_utils
+from google.cloud.aiplatform.utils import _value_utils
 from google.cloud.aiplatform import model_evaluation
 from google.cloud.aiplatform.compat.services import endpoint_service_client
 
@@ -69,7 +78,7 @@ from google.cloud.aiplatform.constants import (
 
 from google.cloud.aiplatform_v1.types import model as model_v1
 
-from google.protobuf import field_mask_pb2, timestamp_pb2
+from google.protobuf import field_mask_pb2, struct_pb2, timestamp_pb2
 from google.protobuf import json_format
 
 if TYPE_CHECKING:
@@ -84,6 +93,33 @@ _RAW_PREDICT_MODEL_VERSION_ID_KEY = "X-Vertex-AI-Model-Version-Id"
 
 _LOGGER = base.Logger(__name__)
 
+# Default chunking and concurrency of Endpoint.predict_many.
+_DEFAULT_MAX_INSTANCES_PER_REQUEST = 100
+# Online prediction requests are limited to 1.5 MB; leave room for the envelope.
+_DEFAULT_MAX_BYTES_PER_REQUEST = 1_400_000
+_DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+_PREDICT_MANY_RETRY_PREDICATE = api_retry.if_exception_type(
+    api_exceptions.ResourceExhausted,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.InternalServerError,
+)
+_DEFAULT_PREDICT_MANY_RETRY = api_retry.Retry(
+    predicate=_PREDICT_MANY_RETRY_PREDICATE,
+    initial=1.0,
+    maximum=32.0,
+    multiplier=2.0,
+    timeout=300.0,
+)
+_DEFAULT_PREDICT_MANY_ASYNC_RETRY = api_retry_async.AsyncRetry(
+    predicate=_PREDICT_MANY_RETRY_PREDICATE,
+    initial=1.0,
+    maximum=32.0,
+    multiplier=2.0,
+    timeout=300.0,
+)
+
 
 _SUPPORTED_MODEL_FILE_NAMES = [
     "model.pkl",
@@ -160,6 +196,64 @@ class Prediction(NamedTuple):
     explanations: Optional[Sequence[gca_explanation_compat.Explanation]] = None
 
 
+def _validate_predictions_format(predictions_format: str) -> None:
+    """Validates the requested representation of predictions.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if predictions_format not in _value_utils.PREDICTIONS_FORMATS:
+        raise ValueError(
+            f"Unsupported predictions_format {predictions_format!r}. Supported "
+            f"formats are {', '.join(_value_utils.PREDICTIONS_FORMATS)}."
+        )
+
+
+def _convert_predictions(
+    predictions: Sequence[struct_pb2.Value], predictions_format: str
+) -> Any:
+    """Converts the predictions of a response to the requested representation."""
+    if predictions_format == _value_utils.PREDICTIONS_FORMAT_NUMPY:
+        return _value_utils.values_to_numpy(predictions)
+    if predictions_format == _value_utils.PREDICTIONS_FORMAT_PROTO:
+        return list(predictions)
+    return _value_utils.values_to_python(predictions)
+
+
+def _chunk_instances(
+    instances: Iterable[Any], max_instances: int, max_bytes: int
+) -> Iterator[List[Any]]:
+    """Lazily splits instances into chunks limited by count and JSON size.
+
+    Args:
+        instances (Iterable[Any]):
+            Required. The instances to split.
+        max_instances (int):
+            Required. The maximum number of instances in a chunk.
+        max_bytes (int):
+            Required. The maximum size of the JSON encoded instances of a chunk. An
+            instance that is larger by itself forms its own chunk.
+
+    Yields:
+        Lists of consecutive instances.
+    """
+    chunk = []
+    chunk_bytes = 0
+    for instance in instances:
+        # Accounts for the separator between instances of the JSON array.
+        instance_bytes = len(json.dumps(instance).encode("utf-8")) + 1
+        if chunk and (
+            len(chunk) >= max_instances or chunk_bytes + instance_bytes > max_bytes
+        ):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(instance)
+        chunk_bytes += instance_bytes
+    if chunk:
+        yield chunk
+
+
 class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
 
     client_class = utils.EndpointClientWithOverride
@@ -1541,6 +1635,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         parameters: Optional[Dict] = None,
         timeout: Optional[float] = None,
         use_raw_predict: Optional[bool] = False,
+        predictions_format: str = _value_utils.PREDICTIONS_FORMAT_PYTHON,
     ) -> Prediction:
         """Make a prediction against this Endpoint.
 
@@ -1568,20 +1663,38 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
             use_raw_predict (bool):
                 Optional. Default value is False. If set to True, the underlying prediction call will be made
                 against Endpoint.raw_predict().
+            predictions_format (str):
+                Optional. How the returned predictions are represented. Default
+                value is "python", i.e. a list of Python objects. "numpy" returns a
+                float64 numpy array if the predictions are all numbers or all lists
+                of the same number of numbers. "proto" returns the
+                `google.protobuf.Value` messages of the response unconverted.
 
         Returns:
             prediction (aiplatform.Prediction):
                 Prediction with returned predictions and Model ID.
+
+        Raises:
+            ValueError: If `predictions_format` is not supported, or is "numpy"
+                and the predictions are not homogeneous numbers.
         """
         self.wait()
+        _validate_predictions_format(predictions_format)
         if use_raw_predict:
+            if predictions_format == _value_utils.PREDICTIONS_FORMAT_PROTO:
+                raise ValueError(
+                    "predictions_format 'proto' is not supported with use_raw_predict."
+                )
             raw_predict_response = self.raw_predict(
                 body=json.dumps({"instances": instances, "parameters": parameters}),
                 headers={"Content-Type": "application/json"},
             )
             json_response = raw_predict_response.json()
+            predictions = json_response["predictions"]
+            if predictions_format == _value_utils.PREDICTIONS_FORMAT_NUMPY:
+                predictions = _value_utils.python_to_numpy(predictions)
             return Prediction(
-                predictions=json_response["predictions"],
+                predictions=predictions,
                 deployed_model_id=raw_predict_response.headers[
                     _RAW_PREDICT_DEPLOYED_MODEL_ID_KEY
                 ],
@@ -1601,10 +1714,9 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
             )
 
             return Prediction(
-                predictions=[
-                    json_format.MessageToDict(item)
-                    for item in prediction_response.predictions.pb
-                ],
+                predictions=_convert_predictions(
+                    prediction_response.predictions.pb, predictions_format
+                ),
                 deployed_model_id=prediction_response.deployed_model_id,
                 model_version_id=prediction_response.model_version_id,
                 model_resource_name=prediction_response.model,
@@ -1616,6 +1728,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         *,
         parameters: Optional[Dict] = None,
         timeout: Optional[float] = None,
+        predictions_format: str = _value_utils.PREDICTIONS_FORMAT_PYTHON,
     ) -> Prediction:
         """Make an asynchronous prediction against this Endpoint.
         Example usage:
@@ -1645,12 +1758,23 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
                 [PredictSchemata's][google.cloud.aiplatform.v1beta1.Model.predict_schemata]
                 ``parameters_schema_uri``.
             timeout (float): Optional. The timeout for this request in seconds.
+            predictions_format (str):
+                Optional. How the returned predictions are represented. Default
+                value is "python", i.e. a list of Python objects. "numpy" returns a
+                float64 numpy array if the predictions are all numbers or all lists
+                of the same number of numbers. "proto" returns the
+                `google.protobuf.Value` messages of the response unconverted.
 
         Returns:
             prediction (aiplatform.Prediction):
                 Prediction with returned predictions and Model ID.
+
+        Raises:
+            ValueError: If `predictions_format` is not supported, or is "numpy"
+                and the predictions are not homogeneous numbers.
         """
         self.wait()
+        _validate_predictions_format(predictions_format)
 
         prediction_response = await self._prediction_async_client.predict(
             endpoint=self._gca_resource.name,
@@ -1660,15 +1784,157 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         )
 
         return Prediction(
-            predictions=[
-                json_format.MessageToDict(item)
-                for item in prediction_response.predictions.pb
-            ],
+            predictions=_convert_predictions(
+                prediction_response.predictions.pb, predictions_format
+            ),
             deployed_model_id=prediction_response.deployed_model_id,
             model_version_id=prediction_response.model_version_id,
             model_resource_name=prediction_response.model,
         )
 
+    def predict_many(
+        self,
+        instances: Iterable[Any],
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        max_instances_per_request: int = _DEFAULT_MAX_INSTANCES_PER_REQUEST,
+        max_bytes_per_request: int = _DEFAULT_MAX_BYTES_PER_REQUEST,
+        max_concurrent_requests: int = _DEFAULT_MAX_CONCURRENT_REQUESTS,
+        retry: Optional[api_retry.Retry] = _DEFAULT_PREDICT_MANY_RETRY,
+    ) -> Iterator[Prediction]:
+        """Makes predictions for any number of instances in concurrent requests.
+
+        The instances are consumed lazily and split into requests of at most
+        `max_instances_per_request` instances and about `max_bytes_per_request`
+        bytes of JSON. Up to `max_concurrent_requests` requests are in flight at a
+        time and every request is retried on its own.
+
+        Example usage:
+            ```
+            for prediction in my_endpoint.predict_many(instances=iter_rows()):
+                handle(prediction.predictions)
+            ```
+
+        Args:
+            instances (Iterable[Any]):
+                Required. The instances that are the input to the prediction calls.
+                Any iterable, e.g. a generator, is accepted.
+            parameters (Dict):
+                Optional. The parameters that govern the predictions, sent with every
+                request.
+            timeout (float): Optional. The timeout for each request in seconds.
+            max_instances_per_request (int):
+                Optional. The maximum number of instances in a request.
+            max_bytes_per_request (int):
+                Optional. The maximum size of the JSON encoded instances of a request.
+                An instance that is larger by itself is sent in its own request.
+            max_concurrent_requests (int):
+                Optional. The maximum number of requests in flight at a time.
+            retry (google.api_core.retry.Retry):
+                Optional. How to retry each request. By default, requests that failed
+                with a quota or transient server error are retried with exponential
+                backoff. No retry is made if None.
+
+        Yields:
+            prediction (aiplatform.Prediction):
+                The prediction of each request, in the order of the instances.
+        """
+        self.wait()
+
+        def _predict_chunk(chunk: List[Any]) -> Prediction:
+            predict_fn = functools.partial(
+                self.predict, instances=chunk, parameters=parameters, timeout=timeout
+            )
+            if retry is not None:
+                predict_fn = retry(predict_fn)
+            return predict_fn()
+
+        with futures.ThreadPoolExecutor(
+            max_workers=max_concurrent_requests
+        ) as executor:
+            pending = collections.deque()
+            for chunk in _chunk_instances(
+                instances, max_instances_per_request, max_bytes_per_request
+            ):
+                if len(pending) >= max_concurrent_requests:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_predict_chunk, chunk))
+            while pending:
+                yield pending.popleft().result()
+
+    async def predict_many_async(
+        self,
+        instances: Iterable[Any],
+        *,
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        max_instances_per_request: int = _DEFAULT_MAX_INSTANCES_PER_REQUEST,
+        max_bytes_per_request: int = _DEFAULT_MAX_BYTES_PER_REQUEST,
+        max_concurrent_requests: int = _DEFAULT_MAX_CONCURRENT_REQUESTS,
+        retry: Optional[api_retry_async.AsyncRetry] = _DEFAULT_PREDICT_MANY_ASYNC_RETRY,
+    ) -> AsyncIterator[Prediction]:
+        """Asynchronously makes predictions for any number of instances.
+
+        Works like `predict_many`, but sends the requests with the asynchronous
+        prediction client.
+
+        Example usage:
+            ```
+            async for prediction in my_endpoint.predict_many_async(instances=rows):
+                handle(prediction.predictions)
+            ```
+
+        Args:
+            instances (Iterable[Any]):
+                Required. The instances that are the input to the prediction calls.
+                Any iterable, e.g. a generator, is accepted.
+            parameters (Dict):
+                Optional. The parameters that govern the predictions, sent with every
+                request.
+            timeout (float): Optional. The timeout for each request in seconds.
+            max_instances_per_request (int):
+                Optional. The maximum number of instances in a request.
+            max_bytes_per_request (int):
+                Optional. The maximum size of the JSON encoded instances of a request.
+                An instance that is larger by itself is sent in its own request.
+            max_concurrent_requests (int):
+                Optional. The maximum number of requests in flight at a time.
+            retry (google.api_core.retry_async.AsyncRetry):
+                Optional. How to retry each request. By default, requests that failed
+                with a quota or transient server error are retried with exponential
+                backoff. No retry is made if None.
+
+        Yields:
+            prediction (aiplatform.Prediction):
+                The prediction of each request, in the order of the instances.
+        """
+        self.wait()
+
+        async def _predict_chunk(chunk: List[Any]) -> Prediction:
+            predict_fn = functools.partial(
+                self.predict_async,
+                instances=chunk,
+                parameters=parameters,
+                timeout=timeout,
+            )
+            if retry is not None:
+                predict_fn = retry(predict_fn)
+            return await predict_fn()
+
+        pending = collections.deque()
+        try:
+            for chunk in _chunk_instances(
+                instances, max_instances_per_request, max_bytes_per_request
+            ):
+                if len(pending) >= max_concurrent_requests:
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(_predict_chunk(chunk)))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
     def raw_predict(
         self, body: bytes, headers: Dict[str, str]
     ) -> requests.models.Response:
@@ -1756,10 +2022,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         )
 
         return Prediction(
-            predictions=[
-                json_format.MessageToDict(item)
-                for item in explain_response.predictions.pb
-            ],
+            predictions=_value_utils.values_to_python(explain_response.predictions.pb),
             deployed_model_id=explain_response.deployed_model_id,
             explanations=explain_response.explanations,
         )
@@ -1820,14 +2083,16 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         )
 
         return Prediction(
-            predictions=[
-                json_format.MessageToDict(item)
-                for item in explain_response.predictions.pb
-            ],
+            predictions=_value_utils.values_to_python(explain_response.predictions.pb),
             deployed_model_id=explain_response.deployed_model_id,
             explanations=explain_response.explanations,
         )
 
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: gca_endpoint_compat.Endpoint) -> bool:
+        # `network` is empty for public Endpoints
+        return not gapic_resource.network
+
     @classmethod
     def list(
         cls,
@@ -1868,9 +2133,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         """
 
         return cls._list_with_local_order(
-            cls_filter=lambda ep: not bool(
-                ep.network
-            ),  # `network` is empty for public Endpoints
+            cls_filter=cls._list_cls_filter,
             filter=filter,
             order_by=order_by,
             project=project,
@@ -2382,6 +2645,11 @@ class PrivateEndpoint(Endpoint):
 
         return response.status < _SUCCESSFUL_HTTP_RESPONSE
 
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: gca_endpoint_compat.Endpoint) -> bool:
+        # Only PrivateEndpoints have a network set
+        return bool(gapic_resource.network)
+
     @classmethod
     def list(
         cls,
@@ -2426,9 +2694,7 @@ class PrivateEndpoint(Endpoint):
         """
 
         return cls._list_with_local_order(
-            cls_filter=lambda ep: bool(
-                ep.network
-            ),  # Only PrivateEndpoints have a network set
+            cls_filter=cls._list_cls_filter,
             filter=filter,
             order_by=order_by,
             project=project,
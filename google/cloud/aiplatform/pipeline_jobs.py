@@ -759,7 +759,11 @@ class PipelineJob(
 
     @classmethod
     def _query_experiment_row(
-        cls, node: context.Context
+        cls,
+        node: context.Context,
+        time_series_reader: Optional[
+            experiment_resources._LatestTimeSeriesMetricsReader
+        ] = None,
     ) -> experiment_resources._ExperimentRow:
         """Queries the PipelineJob metadata as an experiment run parameter and metric row.
 
@@ -770,6 +774,8 @@ class PipelineJob(
         Args:
             node (context._Context):
                 Required. System.PipelineRun context that represents a PipelineJob Run.
+            time_series_reader (experiment_resources._LatestTimeSeriesMetricsReader):
+                Optional. Unused, PipelineJob runs have no time series metrics.
         Returns:
             Experiment run row representing this PipelineJob.
         """
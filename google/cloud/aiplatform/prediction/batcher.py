@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from concurrent import futures
+import itertools
+import logging
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class MicroBatcher:
+    """Groups concurrent prediction calls into vectorized batches.
+
+    Instances passed to ``predict`` by concurrent requests are concatenated along
+    their first dimension, predicted with a single call of ``predict_fn`` and the
+    results are split back to the callers in the same order. A batch is sent as
+    soon as it holds ``max_batch_size`` instances or its oldest request has waited
+    ``max_wait_seconds``. Requests are never split: a request that does not fit
+    in the current batch starts the next one, and a request with more than
+    ``max_batch_size`` instances is predicted as a batch of its own.
+
+    ``predict_fn`` must accept a list or numpy array of instances and return one
+    result per instance. Requests that cannot be batched, e.g. because their
+    instances have no length, fail without affecting other batches.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[Any], Any],
+        max_batch_size: int,
+        max_wait_seconds: float,
+        executor: Optional[futures.Executor] = None,
+    ):
+        """Initializes a MicroBatcher instance.
+
+        Args:
+            predict_fn (Callable[[Any], Any]):
+                Required. The function that performs prediction on a batch.
+            max_batch_size (int):
+                Required. The maximum number of instances in a batch.
+            max_wait_seconds (float):
+                Required. The maximum time a request waits for other requests to
+                join its batch.
+            executor (futures.Executor):
+                Optional. The executor that runs ``predict_fn``. The default executor
+                of the event loop is used if not provided.
+
+        Raises:
+            ValueError: If max_batch_size is smaller than 1 or max_wait_seconds is
+                negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if max_wait_seconds < 0:
+            raise ValueError("max_wait_seconds must not be negative.")
+
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def predict(self, instances: Any) -> Any:
+        """Performs prediction on instances as part of a batch.
+
+        Args:
+            instances (Any):
+                Required. A list or numpy array of the instances of one request.
+
+        Returns:
+            The prediction results of the given instances.
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        result = loop.create_future()
+        await self._queue.put((instances, result))
+        return await result
+
+    async def close(self) -> None:
+        """Stops the batcher and cancels the requests that are not predicted yet.
+
+        Must be called from the event loop that ran the predictions. ``predict``
+        starts the batcher again if called afterwards.
+        """
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        while not self._queue.empty():
+            _, result = self._queue.get_nowait()
+            result.cancel()
+
+    async def _run(self) -> None:
+        """Collects queued requests into batches and predicts them in order."""
+        # The request that did not fit in the previous batch.
+        next_request = None
+        batch = []
+        try:
+            while True:
+                if next_request is None:
+                    next_request = await self._queue.get()
+                batch = [next_request]
+                try:
+                    next_request = await self._collect_batch(batch)
+                except Exception as exception:
+                    next_request = None
+                    _fail_batch(batch, exception)
+                    continue
+
+                await self._predict_batch(batch)
+        except asyncio.CancelledError:
+            for _, result in batch + ([next_request] if next_request else []):
+                result.cancel()
+            raise
+
+    async def _collect_batch(
+        self, batch: List[Tuple[Any, asyncio.Future]]
+    ) -> Optional[Tuple[Any, asyncio.Future]]:
+        """Adds queued requests to a batch until it is full or its wait is over.
+
+        Args:
+            batch (List[Tuple[Any, asyncio.Future]]):
+                Required. The batch to fill, holding its first request.
+
+        Returns:
+            The request that did not fit in the batch, if any.
+        """
+        loop = asyncio.get_running_loop()
+        batch_size = len(batch[0][0])
+        deadline = loop.time() + self._max_wait_seconds
+        while batch_size < self._max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            # Added before its size is known, so it fails with the batch if its
+            # instances have no length.
+            batch.append(request)
+            request_size = len(request[0])
+            if batch_size + request_size > self._max_batch_size:
+                return batch.pop()
+            batch_size += request_size
+        return None
+
+    async def _predict_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Predicts a batch and resolves the futures of its requests."""
+        requests = [instances for instances, _ in batch]
+        try:
+            prediction_results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._predict_fn, _concatenate(requests)
+            )
+            split_results = _split(prediction_results, [len(i) for i in requests])
+        except Exception as exception:
+            _fail_batch(batch, exception)
+            return
+
+        for (_, result), request_results in zip(batch, split_results):
+            if not result.done():
+                result.set_result(request_results)
+
+
+def _fail_batch(batch: List[Tuple[Any, asyncio.Future]], exception: Exception):
+    """Resolves the futures of the requests of a batch with an exception."""
+    logging.info(
+        f"Prediction of a batch of {len(batch)} requests failed: {exception!r}"
+    )
+    for _, result in batch:
+        if not result.done():
+            result.set_exception(exception)
+
+
+def _concatenate(requests: Sequence[Any]) -> Any:
+    """Concatenates the instances of several requests into one batch."""
+    if len(requests) == 1:
+        return requests[0]
+    if all(isinstance(instances, np.ndarray) for instances in requests):
+        return np.concatenate(requests)
+    return list(itertools.chain.from_iterable(requests))
+
+
+def _split(prediction_results: Any, sizes: Sequence[int]) -> List[Any]:
+    """Splits the results of a batch back into the results of each request.
+
+    Raises:
+        ValueError: If the number of results does not match the number of instances.
+    """
+    if len(prediction_results) != sum(sizes):
+        raise ValueError(
+            f"The number of prediction results ({len(prediction_results)}) does not "
+            f"match the number of instances in the batch ({sum(sizes)})."
+        )
+    split_results = []
+    start = 0
+    for size in sizes:
+        split_results.append(prediction_results[start : start + size])
+        start += size
+    return split_results
@@ -16,8 +16,14 @@
 #
 
 from abc import ABC, abstractmethod
+import asyncio
+from concurrent import futures
+import functools
 import logging
-from typing import Optional, Type
+import multiprocessing
+import os
+import tempfile
+from typing import Any, Callable, List, Optional, Sequence, Type
 import traceback
 
 try:
@@ -31,8 +37,16 @@ except ImportError:
     )
 
 from google.cloud.aiplatform.prediction import handler_utils
+from google.cloud.aiplatform.prediction.batcher import MicroBatcher
 from google.cloud.aiplatform.prediction.predictor import Predictor
 from google.cloud.aiplatform.prediction.serializer import DefaultSerializer
+from google.cloud.aiplatform.utils import prediction_utils
+
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+
+# The predictor of the current process if predictions run in a process pool.
+_process_predictor: Optional[Predictor] = None
 
 
 class Handler(ABC):
@@ -76,6 +90,11 @@ class PredictionHandler(Handler):
         self,
         artifacts_uri: str,
         predictor: Optional[Type[Predictor]] = None,
+        max_batch_size: Optional[int] = None,
+        max_batch_wait_seconds: float = 0.005,
+        executor_type: str = THREAD_EXECUTOR,
+        executor_workers: int = 1,
+        max_pending_requests: Optional[int] = None,
     ):
         """Initializes a Handler instance.
 
@@ -85,17 +104,103 @@ class PredictionHandler(Handler):
             predictor (Type[Predictor]):
                 Optional. The Predictor class this handler uses to initiate predictor
                 instance if given.
+            max_batch_size (int):
+                Optional. If larger than 1, the instances of concurrent requests are
+                grouped into batches of up to this many instances, and each batch is
+                preprocessed and predicted with single ``preprocess`` and
+                ``predict`` calls in the executor. ``preprocess`` receives
+                ``{"instances": [...]}`` with the instances of the batch, and
+                ``predict`` must return one result per instance. Requests whose
+                body is not of that form, e.g. because it has ``parameters``, are
+                predicted on their own.
+            max_batch_wait_seconds (float):
+                Optional. The maximum time a request waits for other requests to join
+                its batch. Only used if max_batch_size is larger than 1.
+            executor_type (str):
+                Optional. Where preprocess, predict and postprocess run, so that they
+                never block the event loop. "thread" runs them in a thread pool of
+                this process. "process" runs them in a pool of processes which each
+                load their own predictor, so the predictor class must be importable.
+                Each process loads its predictor in its own temporary working
+                directory, so that processes do not overwrite each other's
+                downloaded artifacts. The default is "thread".
+            executor_workers (int):
+                Optional. The number of threads or processes of the executor. The
+                default of 1 runs the predictor methods one at a time.
+            max_pending_requests (int):
+                Optional. The maximum number of requests handled at the same time.
+                Further requests are rejected with status code 429. Unbounded if not
+                provided.
 
         Raises:
-            ValueError: If predictor is None.
+            ValueError: If predictor is None, or if executor_type is not supported.
         """
         if predictor is None:
             raise ValueError(
                 "PredictionHandler must have a predictor class passed to the init function."
             )
+        if executor_type not in (THREAD_EXECUTOR, PROCESS_EXECUTOR):
+            raise ValueError(
+                f'Unsupported executor type: "{executor_type}". Supported types are '
+                f'"{THREAD_EXECUTOR}" and "{PROCESS_EXECUTOR}".'
+            )
+
+        self._executor_type = executor_type
+        if executor_type == PROCESS_EXECUTOR:
+            self._predictor = None
+            self._executor = futures.ProcessPoolExecutor(
+                max_workers=executor_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_load_process_predictor,
+                initargs=(predictor, artifacts_uri),
+            )
+        else:
+            self._predictor = predictor()
+            self._predictor.load(artifacts_uri)
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=executor_workers,
+                thread_name_prefix="predictor",
+            )
+
+        self._max_pending_requests = max_pending_requests
+        self._pending_requests = 0
+
+        self._batcher = None
+        if max_batch_size is not None and max_batch_size > 1:
+            self._batcher = MicroBatcher(
+                functools.partial(
+                    _predict_instances,
+                    self._get_predictor_fn(("preprocess", "predict")),
+                ),
+                max_batch_size=max_batch_size,
+                max_wait_seconds=max_batch_wait_seconds,
+                executor=self._executor,
+            )
+
+    def _get_predictor_fn(self, method_names: Sequence[str]) -> Callable[[Any], Any]:
+        """Gets a function that chains the given predictor methods on its argument.
 
-        self._predictor = predictor()
-        self._predictor.load(artifacts_uri)
+        Args:
+            method_names (Sequence[str]):
+                Required. The names of the predictor methods to call in order.
+
+        Returns:
+            A picklable function that can be submitted to the executor.
+        """
+        if self._executor_type == PROCESS_EXECUTOR:
+            return functools.partial(_run_process_predictor, tuple(method_names))
+        return functools.partial(_run_predictor, self._predictor, tuple(method_names))
+
+    async def _run_in_executor(self, method_names: Sequence[str], argument: Any) -> Any:
+        """Chains the given predictor methods on the argument in the executor."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_predictor_fn(method_names), argument
+        )
+
+    async def close(self) -> None:
+        """Stops batching and cancels the requests waiting for their batch."""
+        if self._batcher is not None:
+            await self._batcher.close()
 
     async def handle(self, request: Request) -> Response:
         """Handles a prediction request.
@@ -108,16 +213,43 @@ class PredictionHandler(Handler):
             The response of the prediction request.
 
         Raises:
-            HTTPException: If any exception is thrown from predictor object.
+            HTTPException: If any exception is thrown from predictor object, or with
+                status code 429 if max_pending_requests requests are being handled.
         """
+        if (
+            self._max_pending_requests is not None
+            and self._pending_requests >= self._max_pending_requests
+        ):
+            raise HTTPException(
+                status_code=429,
+                detail=(
+                    f"Too many pending prediction requests. At most "
+                    f"{self._max_pending_requests} requests are handled at the same time."
+                ),
+            )
+
+        self._pending_requests += 1
+        try:
+            return await self._handle(request)
+        finally:
+            self._pending_requests -= 1
+
+    async def _handle(self, request: Request) -> Response:
+        """Deserializes, predicts and serializes a prediction request."""
         request_body = await request.body()
         content_type = handler_utils.get_content_type_from_headers(request.headers)
         prediction_input = DefaultSerializer.deserialize(request_body, content_type)
 
         try:
-            prediction_results = self._predictor.postprocess(
-                self._predictor.predict(self._predictor.preprocess(prediction_input))
-            )
+            if self._batcher is None or not _is_batchable(prediction_input):
+                prediction_results = await self._run_in_executor(
+                    ("preprocess", "predict", "postprocess"), prediction_input
+                )
+            else:
+                prediction_results = await self._run_in_executor(
+                    ("postprocess",),
+                    await self._batcher.predict(prediction_input["instances"]),
+                )
         except HTTPException:
             raise
         except Exception as exception:
@@ -135,4 +267,48 @@ class PredictionHandler(Handler):
 
         accept = handler_utils.get_accept_from_headers(request.headers)
         data = DefaultSerializer.serialize(prediction_results, accept)
-        return Response(content=data, media_type=accept)
+        return Response(
+            content=data, media_type=DefaultSerializer.get_media_type(accept) or accept
+        )
+
+
+def _is_batchable(prediction_input: Any) -> bool:
+    """Returns whether the input only holds a list of instances."""
+    return (
+        isinstance(prediction_input, dict)
+        and list(prediction_input) == ["instances"]
+        and isinstance(prediction_input["instances"], list)
+    )
+
+
+def _predict_instances(predictor_fn: Callable[[Any], Any], instances: List[Any]) -> Any:
+    """Calls a predictor function on the prediction input of a batch of instances."""
+    return predictor_fn({"instances": instances})
+
+
+def _run_predictor(
+    predictor: Predictor, method_names: Sequence[str], argument: Any
+) -> Any:
+    """Chains the given predictor methods on the argument."""
+    for method_name in method_names:
+        argument = getattr(predictor, method_name)(argument)
+    return argument
+
+
+def _load_process_predictor(predictor: Type[Predictor], artifacts_uri: str) -> None:
+    """Loads the predictor of a process of the process pool executor.
+
+    Predictors download or copy the artifacts to the working directory, so each
+    process loads its predictor in a working directory of its own.
+    """
+    global _process_predictor
+    if artifacts_uri and not artifacts_uri.startswith(prediction_utils.GCS_URI_PREFIX):
+        artifacts_uri = os.path.abspath(artifacts_uri)
+    os.chdir(tempfile.mkdtemp(prefix="vertex-cpr-predictor-"))
+    _process_predictor = predictor()
+    _process_predictor.load(artifacts_uri)
+
+
+def _run_process_predictor(method_names: Sequence[str], argument: Any) -> Any:
+    """Chains the given methods of the predictor of the current process."""
+    return _run_predictor(_process_predictor, method_names, argument)
@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 
 try:
     import starlette
@@ -117,3 +117,38 @@ def parse_accept_header(accept_header: Optional[str]) -> Dict[str, float]:
             results[media_type.split(";")[0].strip()] = float(q)
 
     return results
+
+
+def negotiate_media_type(
+    accept_header: Optional[str], supported_media_types: Sequence[str]
+) -> Optional[str]:
+    """Selects the supported media type that the accept header prefers.
+
+    Media ranges like "*/*" and "application/*" match every supported media type of
+    their range. Ties are broken by the order of the supported media types.
+
+    Args:
+        accept_header (str):
+            Optional. The accept header.
+        supported_media_types (Sequence[str]):
+            Required. The supported media types in order of preference.
+
+    Returns:
+        The preferred supported media type, or None if the accept header allows none
+        of them.
+    """
+    accept_dict = parse_accept_header(accept_header)
+
+    best_media_type = None
+    best_quality = 0.0
+    for media_type in supported_media_types:
+        quality = accept_dict.get(media_type)
+        if quality is None:
+            quality = accept_dict.get(media_type.split("/")[0] + "/*")
+        if quality is None:
+            quality = accept_dict.get(prediction.ANY_ACCEPT_TYPE, 0.0)
+        if quality > best_quality:
+            best_media_type = media_type
+            best_quality = quality
+
+    return best_media_type
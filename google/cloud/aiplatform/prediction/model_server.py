@@ -16,6 +16,7 @@
 #
 
 import importlib
+import inspect
 import logging
 import multiprocessing
 import os
@@ -41,6 +42,7 @@ except ImportError:
     )
 
 from google.cloud.aiplatform.constants import prediction
+from google.cloud.aiplatform.prediction.handler import PredictionHandler
 from google.cloud.aiplatform import version
 
 
@@ -50,6 +52,25 @@ class CprModelServer:
     def __init__(self):
         """Initializes a fastapi application and sets the configs.
 
+        If the handler is a ``PredictionHandler``, the following environment
+        variables configure how it runs the predictor:
+            VERTEX_CPR_MAX_BATCH_SIZE:
+                The maximum number of instances predicted together. Batching is
+                disabled if it is unset or not larger than 1.
+            VERTEX_CPR_MAX_BATCH_WAIT_MS:
+                The maximum time in milliseconds a request waits for other requests
+                to join its batch. The default is 5.
+            VERTEX_CPR_EXECUTOR_TYPE:
+                "thread" or "process", the kind of pool that runs the predictor
+                methods off the event loop. The default is "thread".
+            VERTEX_CPR_EXECUTOR_WORKERS:
+                The number of threads or processes of the pool in each model server
+                worker. The default is 1.
+            VERTEX_CPR_MAX_PENDING_REQUESTS:
+                The maximum number of requests handled at the same time by each model
+                server worker. Further requests are rejected with status code 429.
+                Unbounded if unset.
+
         Raises:
             ValueError: If either HANDLER_MODULE or HANDLER_CLASS is not set in the
                 environment variables. Or if any of AIP_HTTP_PORT, AIP_HEALTH_ROUTE,
@@ -78,7 +99,9 @@ class CprModelServer:
             )
 
         self.handler = handler_class(
-            os.environ.get("AIP_STORAGE_URI"), predictor=predictor_class
+            os.environ.get("AIP_STORAGE_URI"),
+            predictor=predictor_class,
+            **self._get_handler_kwargs(handler_class),
         )
 
         if "AIP_HTTP_PORT" not in os.environ:
@@ -108,6 +131,9 @@ class CprModelServer:
             endpoint=self.predict,
             methods=["POST"],
         )
+        if isinstance(self.handler, PredictionHandler):
+            # Stops the batcher of the handler before the event loop closes.
+            self.app.add_event_handler("shutdown", self.handler.close)
 
     async def __call__(self, scope, receive, send):
         await self.app(scope, receive, send)
@@ -120,6 +146,72 @@ class CprModelServer:
             level=logging.INFO,
         )
 
+    def _get_handler_kwargs(self, handler_class) -> dict:
+        """Gets the batching and executor arguments of the handler from the environment.
+
+        Args:
+            handler_class:
+                Required. The handler class to initialize.
+
+        Returns:
+            The keyword arguments of the handler set by the environment variables, or
+            an empty dict if none is set or the handler does not support them.
+        """
+        handler_kwargs = {}
+
+        max_batch_size = int(os.environ.get("VERTEX_CPR_MAX_BATCH_SIZE", "1"))
+        if max_batch_size > 1:
+            max_batch_wait_ms = float(
+                os.environ.get("VERTEX_CPR_MAX_BATCH_WAIT_MS", "5")
+            )
+            logging.info(
+                f"Batching up to {max_batch_size} instances with a maximum wait of "
+                f"{max_batch_wait_ms} ms."
+            )
+            handler_kwargs["max_batch_size"] = max_batch_size
+            handler_kwargs["max_batch_wait_seconds"] = max_batch_wait_ms / 1000
+
+        if "VERTEX_CPR_EXECUTOR_TYPE" in os.environ:
+            handler_kwargs["executor_type"] = os.environ["VERTEX_CPR_EXECUTOR_TYPE"]
+        if "VERTEX_CPR_EXECUTOR_WORKERS" in os.environ:
+            handler_kwargs["executor_workers"] = int(
+                os.environ["VERTEX_CPR_EXECUTOR_WORKERS"]
+            )
+        if "VERTEX_CPR_MAX_PENDING_REQUESTS" in os.environ:
+            handler_kwargs["max_pending_requests"] = int(
+                os.environ["VERTEX_CPR_MAX_PENDING_REQUESTS"]
+            )
+
+        if handler_kwargs and not (
+            inspect.isclass(handler_class)
+            and issubclass(handler_class, PredictionHandler)
+        ):
+            logging.warning(
+                f"The environment variables for {list(handler_kwargs)} are ignored "
+                "because they are only supported by PredictionHandler."
+            )
+            return {}
+
+        # Subclasses may override __init__ without the batching and executor
+        # arguments, so only the arguments their __init__ accepts are passed.
+        parameters = inspect.signature(handler_class.__init__).parameters
+        if any(
+            parameter.kind == inspect.Parameter.VAR_KEYWORD
+            for parameter in parameters.values()
+        ):
+            return handler_kwargs
+        unsupported_kwargs = [name for name in handler_kwargs if name not in parameters]
+        if unsupported_kwargs:
+            logging.warning(
+                f"The environment variables for {unsupported_kwargs} are ignored "
+                f"because {handler_class.__name__}.__init__ does not accept them."
+            )
+        return {
+            name: value
+            for name, value in handler_kwargs.items()
+            if name not in unsupported_kwargs
+        }
+
     def health(self):
         """Executes a health check."""
         return {}
@@ -177,6 +269,8 @@ def set_number_of_workers_from_env() -> None:
         VERTEX_CPR_MAX_WORKERS:
             The maximum number of workers can be used given the value of VERTEX_CPR_WORKERS_PER_CORE
             and the number of cores.
+    Each worker runs its predictor in an executor sized by VERTEX_CPR_EXECUTOR_WORKERS,
+    see CprModelServer.
     """
     workers_per_core_str = os.getenv("VERTEX_CPR_WORKERS_PER_CORE", "1")
     max_workers_str = os.getenv("VERTEX_CPR_MAX_WORKERS")
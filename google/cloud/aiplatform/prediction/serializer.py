@@ -16,9 +16,12 @@
 #
 
 from abc import ABC, abstractmethod
+import io
 import json
 from typing import Any, Optional
 
+import numpy as np
+
 try:
     from fastapi import HTTPException
 except ImportError:
@@ -27,11 +30,23 @@ except ImportError:
         'Please install the SDK using `pip install "google-cloud-aiplatform[prediction]>=1.16.0"`.'
     )
 
-from google.cloud.aiplatform.constants import prediction as prediction_constants
 from google.cloud.aiplatform.prediction import handler_utils
 
 
 APPLICATION_JSON = "application/json"
+APPLICATION_NPY = "application/x-npy"
+APPLICATION_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+APPLICATION_MSGPACK = "application/msgpack"
+APPLICATION_X_MSGPACK = "application/x-msgpack"
+
+# The media types supported by DefaultSerializer, in order of preference.
+SUPPORTED_MEDIA_TYPES = (
+    APPLICATION_JSON,
+    APPLICATION_NPY,
+    APPLICATION_ARROW_STREAM,
+    APPLICATION_MSGPACK,
+    APPLICATION_X_MSGPACK,
+)
 
 
 class Serializer(ABC):
@@ -65,7 +80,25 @@ class Serializer(ABC):
 
 
 class DefaultSerializer(Serializer):
-    """Default serializer for serialization and deserialization for prediction."""
+    """Default serializer for serialization and deserialization for prediction.
+
+    Supported media types:
+        application/json:
+            The request is decoded with ``json.loads``. Numpy arrays and scalars in
+            the prediction results are encoded as lists and numbers.
+        application/x-npy:
+            A single array in the ``.npy`` format. The request is decoded into a
+            read-only numpy array that shares the memory of the request body.
+        application/vnd.apache.arrow.stream:
+            An Arrow IPC stream. The request is decoded into a 2-D numpy array with
+            one column per field, or, if the stream has a single fixed size list
+            field, into a 2-D numpy array of its lists. Requires ``pyarrow``.
+        application/msgpack, application/x-msgpack:
+            The request is decoded with ``msgpack.unpackb``. Requires ``msgpack``.
+
+    For the binary array formats, prediction results that are a dict with a single
+    "predictions" key are serialized as the array of the predictions.
+    """
 
     @staticmethod
     def deserialize(data: Any, content_type: Optional[str]) -> Any:
@@ -78,7 +111,7 @@ class DefaultSerializer(Serializer):
                 Optional. The specified content type of the request.
 
         Raises:
-            HTTPException: If Json deserialization failed or the specified content type is not
+            HTTPException: If deserialization failed or the specified content type is not
                 supported.
         """
         if content_type == APPLICATION_JSON:
@@ -91,15 +124,30 @@ class DefaultSerializer(Serializer):
                         f"JSON deserialization failed for the request data: {data}.\n"
                         'To specify a different type, please set the "content-type" header '
                         "in the request.\nCurrently supported content-type in DefaultSerializer: "
-                        f'"{APPLICATION_JSON}".'
+                        f"{_format_media_types()}."
                     ),
                 )
-        else:
+
+        deserialize_fn = _DESERIALIZERS.get(content_type)
+        if deserialize_fn is None:
             raise HTTPException(
                 status_code=400,
                 detail=(
                     f"Unsupported content type of the request: {content_type}.\n"
-                    f'Currently supported content-type in DefaultSerializer: "{APPLICATION_JSON}".'
+                    f"Currently supported content-type in DefaultSerializer: {_format_media_types()}."
+                ),
+            )
+
+        try:
+            return deserialize_fn(data)
+        except HTTPException:
+            raise
+        except Exception as exception:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f'Deserialization of the "{content_type}" request data failed: '
+                    f"{exception}."
                 ),
             )
 
@@ -114,16 +162,13 @@ class DefaultSerializer(Serializer):
                 Optional. The specified content type of the response.
 
         Raises:
-            HTTPException: If Json serialization failed or the specified accept is not supported.
+            HTTPException: If serialization failed or the specified accept is not supported.
         """
-        accept_dict = handler_utils.parse_accept_header(accept)
+        media_type = DefaultSerializer.get_media_type(accept)
 
-        if (
-            APPLICATION_JSON in accept_dict
-            or prediction_constants.ANY_ACCEPT_TYPE in accept_dict
-        ):
+        if media_type == APPLICATION_JSON:
             try:
-                return json.dumps(prediction)
+                return json.dumps(prediction, default=_to_json_compatible)
             except TypeError:
                 raise HTTPException(
                     status_code=400,
@@ -131,14 +176,185 @@ class DefaultSerializer(Serializer):
                         f"JSON serialization failed for the prediction result: {prediction}.\n"
                         'To specify a different type, please set the "accept" header '
                         "in the request.\nCurrently supported accept in DefaultSerializer: "
-                        f'"{APPLICATION_JSON}".'
+                        f"{_format_media_types()}."
                     ),
                 )
-        else:
+
+        if media_type is None:
             raise HTTPException(
                 status_code=400,
                 detail=(
                     f"Unsupported accept of the response: {accept}.\n"
-                    f'Currently supported accept in DefaultSerializer: "{APPLICATION_JSON}".'
+                    f"Currently supported accept in DefaultSerializer: {_format_media_types()}."
+                ),
+            )
+
+        try:
+            return _SERIALIZERS[media_type](prediction)
+        except HTTPException:
+            raise
+        except Exception as exception:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f'Serialization of the prediction result as "{media_type}" failed: '
+                    f"{exception}."
                 ),
             )
+
+    @staticmethod
+    def get_media_type(accept: Optional[str]) -> Optional[str]:
+        """Gets the media type of the response negotiated from the accept header.
+
+        Args:
+            accept (str):
+                Optional. The specified content type of the response.
+
+        Returns:
+            The supported media type preferred by the accept header, or None if the
+            accept header allows none of the supported media types.
+        """
+        return handler_utils.negotiate_media_type(accept, SUPPORTED_MEDIA_TYPES)
+
+
+def _format_media_types() -> str:
+    """Formats the supported media types for error messages."""
+    return ", ".join(f'"{media_type}"' for media_type in SUPPORTED_MEDIA_TYPES)
+
+
+def _import_pyarrow():
+    """Imports pyarrow, which is only required for Arrow IPC streams."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f'pyarrow is not installed and is required for "{APPLICATION_ARROW_STREAM}". '
+                'Please install it using "pip install pyarrow".'
+            ),
+        )
+    return pyarrow
+
+
+def _import_msgpack():
+    """Imports msgpack, which is only required for MessagePack data."""
+    try:
+        import msgpack
+    except ImportError:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f'msgpack is not installed and is required for "{APPLICATION_MSGPACK}". '
+                'Please install it using "pip install msgpack".'
+            ),
+        )
+    return msgpack
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """Converts numpy values that the json module cannot encode.
+
+    Raises:
+        TypeError: If the value is not a numpy array or scalar.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _get_prediction_array(prediction: Any) -> np.ndarray:
+    """Gets the array to serialize from prediction results."""
+    if isinstance(prediction, dict) and list(prediction) == ["predictions"]:
+        prediction = prediction["predictions"]
+    return np.asarray(prediction)
+
+
+def _deserialize_npy(data: bytes) -> np.ndarray:
+    """Decodes a .npy payload without copying its data.
+
+    Raises:
+        ValueError: If the payload is not a valid .npy array or holds Python objects.
+    """
+    stream = io.BytesIO(data)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject:
+        raise ValueError("arrays of Python objects are not supported")
+
+    return np.frombuffer(
+        data, dtype=dtype, count=int(np.prod(shape)), offset=stream.tell()
+    ).reshape(shape, order="F" if fortran_order else "C")
+
+
+def _serialize_npy(prediction: Any) -> bytes:
+    """Encodes prediction results as a .npy payload."""
+    stream = io.BytesIO()
+    np.save(stream, _get_prediction_array(prediction), allow_pickle=False)
+    return stream.getvalue()
+
+
+def _deserialize_arrow_stream(data: bytes) -> np.ndarray:
+    """Decodes an Arrow IPC stream into a 2-D numpy array."""
+    pyarrow = _import_pyarrow()
+    table = pyarrow.ipc.open_stream(pyarrow.py_buffer(data)).read_all()
+    if table.num_columns == 1 and pyarrow.types.is_fixed_size_list(
+        table.schema.types[0]
+    ):
+        column = table.column(0).combine_chunks()
+        return column.flatten().to_numpy().reshape(len(column), -1)
+    return np.column_stack([column.to_numpy() for column in table.columns])
+
+
+def _serialize_arrow_stream(prediction: Any) -> bytes:
+    """Encodes prediction results as an Arrow IPC stream.
+
+    1-D results are encoded as a "predictions" column and 2-D results as a
+    "predictions" column of fixed size lists.
+    """
+    pyarrow = _import_pyarrow()
+    array = _get_prediction_array(prediction)
+    if array.ndim == 1:
+        column = pyarrow.array(array)
+    elif array.ndim == 2:
+        column = pyarrow.FixedSizeListArray.from_arrays(
+            pyarrow.array(np.ascontiguousarray(array).ravel()), array.shape[1]
+        )
+    else:
+        raise ValueError(f"arrays with {array.ndim} dimensions are not supported")
+    table = pyarrow.table({"predictions": column})
+
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _deserialize_msgpack(data: bytes) -> Any:
+    """Decodes a MessagePack payload."""
+    return _import_msgpack().unpackb(data, raw=False)
+
+
+def _serialize_msgpack(prediction: Any) -> bytes:
+    """Encodes prediction results as a MessagePack payload."""
+    return _import_msgpack().packb(prediction, default=_to_json_compatible)
+
+
+_DESERIALIZERS = {
+    APPLICATION_NPY: _deserialize_npy,
+    APPLICATION_ARROW_STREAM: _deserialize_arrow_stream,
+    APPLICATION_MSGPACK: _deserialize_msgpack,
+    APPLICATION_X_MSGPACK: _deserialize_msgpack,
+}
+
+_SERIALIZERS = {
+    APPLICATION_NPY: _serialize_npy,
+    APPLICATION_ARROW_STREAM: _serialize_arrow_stream,
+    APPLICATION_MSGPACK: _serialize_msgpack,
+    APPLICATION_X_MSGPACK: _serialize_msgpack,
+}
@@ -19,6 +19,7 @@ import joblib
 import numpy as np
 import os
 import pickle
+from typing import Union
 
 from google.cloud.aiplatform.constants import prediction
 from google.cloud.aiplatform.utils import prediction_utils
@@ -56,15 +57,22 @@ class SklearnPredictor(Predictor):
                 f"One of the following model files must be provided: {valid_filenames}."
             )
 
-    def preprocess(self, prediction_input: dict) -> np.ndarray:
+    def preprocess(self, prediction_input: Union[dict, np.ndarray]) -> np.ndarray:
         """Converts the request body to a numpy array before prediction.
+
+        Binary requests, e.g. "application/x-npy", are deserialized into numpy arrays
+        which are used as the instances directly.
+
         Args:
-            prediction_input (dict):
+            prediction_input (Union[dict, np.ndarray]):
                 Required. The prediction input that needs to be preprocessed.
         Returns:
             The preprocessed prediction input.
         """
-        instances = prediction_input["instances"]
+        if isinstance(prediction_input, np.ndarray):
+            instances = prediction_input
+        else:
+            instances = prediction_input["instances"]
         return np.asarray(instances)
 
     def predict(self, instances: np.ndarray) -> np.ndarray:
@@ -19,6 +19,7 @@ import joblib
 import logging
 import os
 import pickle
+from typing import Union
 
 import numpy as np
 import xgboost as xgb
@@ -71,15 +72,22 @@ class XgboostPredictor(Predictor):
             )
         self._booster = booster
 
-    def preprocess(self, prediction_input: dict) -> xgb.DMatrix:
+    def preprocess(self, prediction_input: Union[dict, np.ndarray]) -> xgb.DMatrix:
         """Converts the request body to a Data Matrix before prediction.
+
+        Binary requests, e.g. "application/x-npy", are deserialized into numpy arrays
+        which are used as the instances directly.
+
         Args:
-            prediction_input (dict):
+            prediction_input (Union[dict, np.ndarray]):
                 Required. The prediction input that needs to be preprocessed.
         Returns:
             The preprocessed prediction input.
         """
-        instances = prediction_input["instances"]
+        if isinstance(prediction_input, np.ndarray):
+            instances = prediction_input
+        else:
+            instances = prediction_input["instances"]
         return xgb.DMatrix(instances)
 
     def predict(self, instances: xgb.DMatrix) -> np.ndarray:
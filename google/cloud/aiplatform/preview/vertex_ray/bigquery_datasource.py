@@ -15,12 +15,14 @@
 # limitations under the License.
 #
 
+import functools
 import logging
 import os
 import tempfile
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import uuid
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 from google.api_core import client_info
@@ -53,6 +55,260 @@ bqstorage_info = v1_client_info.ClientInfo(
 MAX_RETRY_CNT = 10
 RATE_LIMIT_EXCEEDED_SLEEP_TIME = 11
 
+# Record batches streamed from a read stream are coalesced into blocks of about
+# this size, so that a stream is never materialized as a whole.
+_TARGET_BLOCK_SIZE_BYTES = 128 * 1024 * 1024
+# Record batches appended with the Storage Write API are kept under the 10 MB
+# limit of an AppendRows request.
+_MAX_APPEND_ROWS_REQUEST_BYTES = 8 * 1024 * 1024
+_APPEND_ROWS_RETRY_EXCEPTIONS = (
+    exceptions.Aborted,
+    exceptions.InternalServerError,
+    exceptions.ResourceExhausted,
+    exceptions.ServiceUnavailable,
+)
+
+
+# Whether the installed BigQuery Storage client can append Arrow record batches.
+_ARROW_APPENDS_SUPPORTED = hasattr(
+    bigquery_storage.types.AppendRowsRequest, "ArrowData"
+)
+
+# Arrow types appendable with the Storage Write API: a predicate on the Arrow
+# type, the BigQuery type of the column and the Arrow type the column is
+# written as.
+_ARROW_TO_BIGQUERY_TYPES = (
+    (pa.types.is_boolean, "BOOLEAN", pa.bool_()),
+    (
+        lambda t: pa.types.is_signed_integer(t)
+        or t in (pa.uint8(), pa.uint16(), pa.uint32()),
+        "INTEGER",
+        pa.int64(),
+    ),
+    (pa.types.is_floating, "FLOAT", pa.float64()),
+    (
+        lambda t: pa.types.is_string(t) or pa.types.is_large_string(t),
+        "STRING",
+        pa.string(),
+    ),
+    (
+        lambda t: pa.types.is_binary(t) or pa.types.is_large_binary(t),
+        "BYTES",
+        pa.binary(),
+    ),
+    (pa.types.is_date32, "DATE", pa.date32()),
+    (
+        lambda t: pa.types.is_timestamp(t) and t.tz is not None,
+        "TIMESTAMP",
+        pa.timestamp("us", tz="UTC"),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_read_client() -> bigquery_storage.BigQueryReadClient:
+    """Returns the BigQuery Storage Read API client of this worker process."""
+    return bigquery_storage.BigQueryReadClient(client_info=bqstorage_info)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_write_client() -> bigquery_storage.BigQueryWriteClient:
+    """Returns the BigQuery Storage Write API client of this worker process."""
+    return bigquery_storage.BigQueryWriteClient(client_info=bqstorage_info)
+
+
+def _read_stream(stream_name: str) -> Iterator[Block]:
+    """Streams the record batches of a read stream as blocks.
+
+    Record batches are coalesced into blocks of about _TARGET_BLOCK_SIZE_BYTES.
+    """
+    reader = _get_read_client().read_rows(stream_name)
+    batches = []
+    batches_size = 0
+    for page in reader.rows().pages:
+        batch = page.to_arrow()
+        batches.append(batch)
+        batches_size += batch.nbytes
+        if batches_size >= _TARGET_BLOCK_SIZE_BYTES:
+            yield pa.Table.from_batches(batches)
+            batches = []
+            batches_size = 0
+    if batches:
+        yield pa.Table.from_batches(batches)
+
+
+def _read_session_schema(
+    read_session: bigquery_storage.types.ReadSession,
+) -> Optional[pa.Schema]:
+    """Returns the Arrow schema of a read session, if the session has one."""
+    serialized_schema = read_session.arrow_schema.serialized_schema
+    if not serialized_schema:
+        return None
+    return pa.ipc.read_schema(pa.py_buffer(serialized_schema))
+
+
+def _to_bigquery_field(
+    field: pa.Field,
+) -> Optional[Tuple[bigquery.SchemaField, pa.Field]]:
+    """Maps an Arrow field to the BigQuery field it is appended to.
+
+    Returns:
+        The BigQuery field and the Arrow field the column must be cast to before
+        being appended, or None if the type cannot be appended as Arrow.
+    """
+    arrow_type = field.type
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        item = _to_bigquery_field(pa.field(field.name, arrow_type.value_type))
+        if item is None or item[0].mode == "REPEATED":
+            return None
+        bigquery_item, arrow_item = item
+        return (
+            bigquery.SchemaField(
+                field.name,
+                bigquery_item.field_type,
+                mode="REPEATED",
+                fields=bigquery_item.fields,
+            ),
+            pa.field(field.name, pa.list_(arrow_item.type)),
+        )
+    if pa.types.is_struct(arrow_type):
+        children = [
+            _to_bigquery_field(arrow_type[i]) for i in range(arrow_type.num_fields)
+        ]
+        if not children or any(child is None for child in children):
+            return None
+        return (
+            bigquery.SchemaField(
+                field.name, "RECORD", fields=[child[0] for child in children]
+            ),
+            pa.field(field.name, pa.struct([child[1] for child in children])),
+        )
+    for predicate, bigquery_type, write_type in _ARROW_TO_BIGQUERY_TYPES:
+        if predicate(arrow_type):
+            return (
+                bigquery.SchemaField(field.name, bigquery_type),
+                pa.field(field.name, write_type),
+            )
+    return None
+
+
+def _get_write_schema(
+    schema: pa.Schema,
+) -> Optional[Tuple[List[bigquery.SchemaField], pa.Schema]]:
+    """Maps the Arrow schema of the blocks to the schema of the table.
+
+    Returns:
+        The BigQuery schema of the table and the Arrow schema blocks must be cast
+        to before being appended, or None if a type cannot be appended as Arrow.
+    """
+    fields = [_to_bigquery_field(field) for field in schema]
+    if any(field is None for field in fields):
+        return None
+    return [field[0] for field in fields], pa.schema([field[1] for field in fields])
+
+
+def _append_rows(
+    write_client: bigquery_storage.BigQueryWriteClient,
+    write_stream: str,
+    block: pa.Table,
+) -> None:
+    """Appends a block to a write stream as Arrow record batches."""
+    serialized_schema = block.schema.serialize().to_pybytes()
+    rows_per_request = max(
+        1, block.num_rows * _MAX_APPEND_ROWS_REQUEST_BYTES // max(block.nbytes, 1)
+    )
+    batches = block.to_batches(max_chunksize=rows_per_request)
+    metadata = (("x-goog-request-params", f"write_stream={write_stream}"),)
+
+    requests = (
+        bigquery_storage.types.AppendRowsRequest(
+            write_stream=write_stream,
+            arrow_rows=bigquery_storage.types.AppendRowsRequest.ArrowData(
+                writer_schema=bigquery_storage.types.ArrowSchema(
+                    serialized_schema=serialized_schema
+                ),
+                rows=bigquery_storage.types.ArrowRecordBatch(
+                    serialized_record_batch=batch.serialize().to_pybytes()
+                ),
+            ),
+        )
+        for batch in batches
+    )
+    for response in write_client.append_rows(requests=requests, metadata=metadata):
+        if response.row_errors:
+            raise ValueError(
+                f"[Ray on Vertex AI]: {len(response.row_errors)} rows could "
+                + f"not be appended to {write_stream}: "
+                + response.row_errors[0].message
+            )
+        if response.error.code:
+            raise exceptions.from_grpc_status(
+                response.error.code, response.error.message
+            )
+
+
+def _write_block_with_storage_write_api(
+    block: pa.Table, project_id: str, dataset: str, write_schema: pa.Schema
+) -> bool:
+    """Appends a block to a table with the BigQuery Storage Write API.
+
+    The block is appended to a pending write stream of its own, which is
+    committed once all its rows are appended. A stream that failed with a
+    retryable error is dropped without being committed and the block is
+    appended again to a new stream, up to MAX_RETRY_CNT times.
+
+    Returns:
+        Whether the block was written. It is not if it cannot be cast to the
+        schema of the table.
+    """
+    try:
+        block = block.cast(write_schema, safe=False)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        logging.info(
+            "[Ray on Vertex AI]: The block cannot be converted for the BigQuery "
+            + "Storage Write API. Writing it with a load job."
+        )
+        logging.debug(e)
+        return False
+
+    dataset_id, table_id = dataset.split(".", 1)
+    write_client = _get_write_client()
+    table_path = write_client.table_path(project_id, dataset_id, table_id)
+    retry_cnt = 0
+    while True:
+        write_stream = write_client.create_write_stream(
+            parent=table_path,
+            write_stream=bigquery_storage.types.WriteStream(
+                type_=bigquery_storage.types.WriteStream.Type.PENDING
+            ),
+        )
+        try:
+            _append_rows(write_client, write_stream.name, block)
+            break
+        except _APPEND_ROWS_RETRY_EXCEPTIONS as e:
+            retry_cnt += 1
+            if retry_cnt >= MAX_RETRY_CNT:
+                raise
+            logging.info(
+                "[Ray on Vertex AI]: Appending rows failed... Sleeping to try again"
+            )
+            logging.debug(e)
+            time.sleep(min(2**retry_cnt, RATE_LIMIT_EXCEEDED_SLEEP_TIME))
+
+    write_client.finalize_write_stream(name=write_stream.name)
+    response = write_client.batch_commit_write_streams(
+        bigquery_storage.types.BatchCommitWriteStreamsRequest(
+            parent=table_path, write_streams=[write_stream.name]
+        )
+    )
+    if response.stream_errors:
+        raise ValueError(
+            f"[Ray on Vertex AI]: The rows appended to {write_stream.name} could "
+            + "not be committed: "
+            + response.stream_errors[0].error_message
+        )
+    return True
+
 
 class _BigQueryDatasourceReader(Reader):
     def __init__(
@@ -61,12 +317,22 @@ class _BigQueryDatasourceReader(Reader):
         dataset: Optional[str] = None,
         query: Optional[str] = None,
         parallelism: Optional[int] = -1,
+        columns: Optional[List[str]] = None,
+        row_restriction: Optional[str] = None,
         **kwargs: Optional[Dict[str, Any]],
     ):
         self._project_id = project_id or initializer.global_config.project
         self._dataset = dataset
         self._query = query
+        self._parallelism = parallelism
+        self._columns = columns
+        self._row_restriction = row_restriction
         self._kwargs = kwargs
+        # The table to read, resolved once since a query must run only once.
+        self._table = None
+        # The read session created for the last requested parallelism.
+        self._read_session = None
+        self._read_session_parallelism = None
 
         if query is not None and dataset is not None:
             raise ValueError(
@@ -75,62 +341,39 @@ class _BigQueryDatasourceReader(Reader):
             )
 
     def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
-        def _read_single_partition(stream) -> Block:
-            client = bigquery_storage.BigQueryReadClient(client_info=bqstorage_info)
-            reader = client.read_rows(stream.name)
-            return reader.to_arrow()
-
-        if self._query:
-            query_client = bigquery.Client(
-                project=self._project_id, client_info=bq_info
-            )
-            query_job = query_client.query(self._query)
-            query_job.result()
-            destination = str(query_job.destination)
-            dataset_id = destination.split(".")[-2]
-            table_id = destination.split(".")[-1]
-        else:
-            self._validate_dataset_table_exist(self._project_id, self._dataset)
-            dataset_id = self._dataset.split(".")[0]
-            table_id = self._dataset.split(".")[1]
-
-        bqs_client = bigquery_storage.BigQueryReadClient(client_info=bqstorage_info)
-        table = f"projects/{self._project_id}/datasets/{dataset_id}/tables/{table_id}"
-
         if parallelism == -1:
             parallelism = None
-        requested_session = bigquery_storage.types.ReadSession(
-            table=table,
-            data_format=bigquery_storage.types.DataFormat.ARROW,
-        )
-        read_session = bqs_client.create_read_session(
-            parent=f"projects/{self._project_id}",
-            read_session=requested_session,
-            max_stream_count=parallelism,
-        )
+        read_session = self._get_read_session(parallelism)
 
         read_tasks = []
         logging.info(f"Created streams: {len(read_session.streams)}")
-        if len(read_session.streams) < parallelism:
+        if parallelism is not None and len(read_session.streams) < parallelism:
             logging.info(
                 "[Ray on Vertex AI]: The number of streams created by the "
                 + "BigQuery Storage Read API is less than the requested "
                 + "parallelism due to the size of the dataset."
             )
 
+        schema = _read_session_schema(read_session)
+        stream_size_bytes = None
+        if read_session.estimated_total_bytes_scanned and read_session.streams:
+            stream_size_bytes = read_session.estimated_total_bytes_scanned // len(
+                read_session.streams
+            )
         for stream in read_session.streams:
             # Create a metadata block object to store schema, etc.
             metadata = BlockMetadata(
                 num_rows=None,
-                size_bytes=None,
-                schema=None,
+                size_bytes=stream_size_bytes,
+                schema=schema,
                 input_files=None,
                 exec_stats=None,
             )
 
-            # Create the read task and pass the no-arg wrapper and metadata in
+            # Create the read task and pass the no-arg wrapper and metadata in.
+            # Only the stream name is captured, so that the task pickles small.
             read_task = ReadTask(
-                lambda stream=stream: [_read_single_partition(stream)],
+                lambda stream_name=stream.name: _read_stream(stream_name),
                 metadata,
             )
             read_tasks.append(read_task)
@@ -138,8 +381,69 @@ class _BigQueryDatasourceReader(Reader):
         return read_tasks
 
     def estimate_inmemory_data_size(self) -> Optional[int]:
-        # TODO(b/281891467): Implement this method
-        return None
+        parallelism = None if self._parallelism == -1 else self._parallelism
+        read_session = self._get_read_session(parallelism)
+        return read_session.estimated_total_bytes_scanned or None
+
+    def _get_table(self) -> str:
+        """Returns the resource name of the table to read.
+
+        Runs the query, if any, to materialize its result in a table.
+        """
+        if self._table is not None:
+            return self._table
+
+        if self._query:
+            query_client = bigquery.Client(
+                project=self._project_id, client_info=bq_info
+            )
+            query_job = query_client.query(self._query)
+            query_job.result()
+            destination = str(query_job.destination)
+            dataset_id = destination.split(".")[-2]
+            table_id = destination.split(".")[-1]
+        else:
+            self._validate_dataset_table_exist(self._project_id, self._dataset)
+            dataset_id = self._dataset.split(".")[0]
+            table_id = self._dataset.split(".")[1]
+
+        self._table = (
+            f"projects/{self._project_id}/datasets/{dataset_id}/tables/{table_id}"
+        )
+        return self._table
+
+    def _get_read_session(
+        self, parallelism: Optional[int]
+    ) -> bigquery_storage.types.ReadSession:
+        """Returns a read session with at most `parallelism` streams.
+
+        The session is reused by `estimate_inmemory_data_size` and
+        `get_read_tasks` as long as the parallelism does not change. The selected
+        columns and the row restriction are pushed down to the session.
+        """
+        if (
+            self._read_session is not None
+            and self._read_session_parallelism == parallelism
+        ):
+            return self._read_session
+
+        requested_session = bigquery_storage.types.ReadSession(
+            table=self._get_table(),
+            data_format=bigquery_storage.types.DataFormat.ARROW,
+        )
+        if self._columns:
+            requested_session.read_options.selected_fields = self._columns
+        if self._row_restriction:
+            requested_session.read_options.row_restriction = self._row_restriction
+
+        bqs_client = bigquery_storage.BigQueryReadClient(client_info=bqstorage_info)
+        self._read_session = bqs_client.create_read_session(
+            parent=f"projects/{self._project_id}",
+            read_session=requested_session,
+            max_stream_count=parallelism,
+        )
+        self._read_session_parallelism = parallelism
+        return self._read_session
 
     def _validate_dataset_table_exist(self, project_id: str, dataset: str) -> None:
         client = bigquery.Client(project=project_id, client_info=bq_info)
@@ -174,11 +478,21 @@ class BigQueryDatasource(Datasource):
         project_id: Optional[str] = None,
         dataset: Optional[str] = None,
     ) -> WriteResult:
-        def _write_single_block(block: Block, project_id: str, dataset: str):
+        def _write_single_block(
+            block: Block,
+            project_id: str,
+            dataset: str,
+            table_schema: Optional[List[bigquery.SchemaField]] = None,
+        ):
             block = BlockAccessor.for_block(block).to_arrow()
 
             client = bigquery.Client(project=project_id, client_info=bq_info)
-            job_config = bigquery.LoadJobConfig(autodetect=True)
+            # Blocks are loaded with the schema of the table created for the
+            # Storage Write API, if any, so that they cannot disagree with it.
+            if table_schema is None:
+                job_config = bigquery.LoadJobConfig(autodetect=True)
+            else:
+                job_config = bigquery.LoadJobConfig(schema=table_schema)
             job_config.source_format = bigquery.SourceFormat.PARQUET
             job_config.write_disposition = bigquery.WriteDisposition.WRITE_APPEND
 
@@ -225,6 +539,34 @@ class BigQueryDatasource(Datasource):
         # Delete table if it already exists
         client.delete_table(f"{project_id}.{dataset}", not_found_ok=True)
 
-        for block in blocks:
-            _write_single_block(block, project_id, dataset)
+        # The schema of the table is derived once from the first block. The
+        # table is created with it, so that blocks are appended to explicitly
+        # created write streams of the new table rather than to its default
+        # stream, which may still route rows to the deleted table.
+        write_schema = None
+        for i, block in enumerate(blocks):
+            block = BlockAccessor.for_block(block).to_arrow()
+            if i == 0 and _ARROW_APPENDS_SUPPORTED:
+                write_schema = _get_write_schema(block.schema)
+                if write_schema is None:
+                    logging.info(
+                        "[Ray on Vertex AI]: The blocks have columns that the "
+                        + "BigQuery Storage Write API cannot append as Arrow. "
+                        + "Writing them with load jobs."
+                    )
+                else:
+                    client.create_table(
+                        bigquery.Table(
+                            f"{project_id}.{dataset}", schema=write_schema[0]
+                        ),
+                        exists_ok=True,
+                    )
+            if write_schema is None:
+                _write_single_block(block, project_id, dataset)
+            elif not _write_block_with_storage_write_api(
+                block, project_id, dataset, write_schema[1]
+            ):
+                _write_single_block(
+                    block, project_id, dataset, table_schema=write_schema[0]
+                )
         return "ok"
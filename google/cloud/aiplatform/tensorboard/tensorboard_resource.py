@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from google.auth import credentials as auth_credentials
 from google.protobuf import field_mask_pb2
@@ -570,6 +570,86 @@ class TensorboardExperiment(_TensorboardServiceResource):
             parent=parent,
         )
 
+    @classmethod
+    def list_iter(
+        cls,
+        tensorboard_name: str,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        read_mask: Optional[field_mask_pb2.FieldMask] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Iterator["TensorboardExperiment"]:
+        """Lazily lists TensorboardExperiments in a Tensorboard resource, page
+        by page.
+
+        Example Usage:
+
+            for experiment in aiplatform.TensorboardExperiment.list_iter(
+                tensorboard_name='projects/my-project/locations/us-central1/tensorboards/123',
+                page_size=100,
+            ):
+                print(experiment.display_name)
+
+        Args:
+            tensorboard_name(str):
+                Required. The resource name or resource ID of the
+                Tensorboard to list
+                TensorboardExperiments. Format, if resource name:
+                'projects/{project}/locations/{location}/tensorboards/{tensorboard}'
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            page_size (int):
+                Optional. The maximum number of TensorboardExperiments per page. The service
+                default is used if not set.
+            read_mask (field_mask_pb2.FieldMask):
+                Optional. The fields to return for each TensorboardExperiment. All the
+                fields are returned if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the TensorboardExperiments of the current page are consumed.
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+        Yields:
+            TensorboardExperiment - The TensorboardExperiments in the list.
+        """
+
+        parent = utils.full_resource_name(
+            resource_name=tensorboard_name,
+            resource_noun=Tensorboard._resource_noun,
+            parse_resource_name_method=Tensorboard._parse_resource_name,
+            format_resource_name_method=Tensorboard._format_resource_name,
+            project=project,
+            location=location,
+        )
+
+        return super().list_iter(
+            filter=filter,
+            order_by=order_by,
+            page_size=page_size,
+            read_mask=read_mask,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+        )
+
 
 class TensorboardRun(_TensorboardServiceResource):
     """Managed tensorboard resource for Vertex AI."""
@@ -849,6 +929,95 @@ class TensorboardRun(_TensorboardServiceResource):
 
         return tensorboard_runs
 
+    @classmethod
+    def list_iter(
+        cls,
+        tensorboard_experiment_name: str,
+        tensorboard_id: Optional[str] = None,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        read_mask: Optional[field_mask_pb2.FieldMask] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Iterator["TensorboardRun"]:
+        """Lazily lists the TensorboardRuns in a TensorboardExperiment, page
+        by page.
+
+        Example Usage:
+
+            for run in aiplatform.TensorboardRun.list_iter(
+                tensorboard_experiment_name='projects/my-project/locations/us-central1/tensorboards/123/experiments/456',
+                page_size=100,
+            ):
+                print(run.display_name)
+
+        Args:
+            tensorboard_experiment_name (str):
+                Required. The resource name or resource ID of the
+                TensorboardExperiment to list
+                TensorboardRun. Format, if resource name:
+                'projects/{project}/locations/{location}/tensorboards/{tensorboard}/experiments/{experiment}'
+
+                If resource ID is provided then tensorboard_id must be provided.
+            tensorboard_id (str):
+                Optional. The resource ID of the Tensorboard that contains the TensorboardExperiment
+                to list TensorboardRun.
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            page_size (int):
+                Optional. The maximum number of TensorboardRuns per page. The service
+                default is used if not set.
+            read_mask (field_mask_pb2.FieldMask):
+                Optional. The fields to return for each TensorboardRun. All the
+                fields are returned if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the TensorboardRuns of the current page are consumed.
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+        Yields:
+            TensorboardRun - The TensorboardRuns in the list.
+        """
+
+        parent = utils.full_resource_name(
+            resource_name=tensorboard_experiment_name,
+            resource_noun=TensorboardExperiment._resource_noun,
+            parse_resource_name_method=TensorboardExperiment._parse_resource_name,
+            format_resource_name_method=TensorboardExperiment._format_resource_name,
+            parent_resource_name_fields={Tensorboard._resource_noun: tensorboard_id},
+            project=project,
+            location=location,
+        )
+
+        for tensorboard_run in super().list_iter(
+            filter=filter,
+            order_by=order_by,
+            page_size=page_size,
+            read_mask=read_mask,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+        ):
+            tensorboard_run._sync_time_series_display_name_to_id_mapping()
+            yield tensorboard_run
+
     def write_tensorboard_scalar_data(
         self,
         time_series_data: Dict[str, float],
@@ -869,18 +1038,59 @@ class TensorboardRun(_TensorboardServiceResource):
                 If not provided, this will be generated based on the value from time.time()
         """
 
-        if not wall_time:
-            wall_time = utils.get_timestamp_proto()
+        self.write_tensorboard_scalar_data_points([(time_series_data, step, wall_time)])
 
-        ts_data = []
+    def write_tensorboard_scalar_data_points(
+        self,
+        data_points: Sequence[
+            Tuple[Dict[str, float], int, Optional[timestamp_pb2.Timestamp]]
+        ],
+    ):
+        """Writes tensorboard scalar data of several steps to this run in one request.
+
+        ```
+        tb_run.write_tensorboard_scalar_data_points(
+            [({'loss': 0.5}, 1, None), ({'loss': 0.4}, 2, None)]
+        )
+        ```
 
+        Args:
+            data_points (Sequence[Tuple[Dict[str, float], int, Optional[timestamp_pb2.Timestamp]]]):
+                Required. The (time_series_data, step, wall_time) tuples to write,
+                where time_series_data maps TensorboardTimeSeries display names to
+                scalar values at the step. If wall_time is None, this will be
+                generated based on the value from time.time()
+        """
+        display_names = {
+            display_name
+            for time_series_data, _, _ in data_points
+            for display_name in time_series_data
+        }
         if any(
-            key not in self._time_series_display_name_to_id_mapping
-            for key in time_series_data.keys()
+            display_name not in self._time_series_display_name_to_id_mapping
+            for display_name in display_names
         ):
             self._sync_time_series_display_name_to_id_mapping()
 
-        for display_name, value in time_series_data.items():
+        # Points of the same time series are sent together, in the given order.
+        values_by_display_name: Dict[
+            str, List[gca_tensorboard_data.TimeSeriesDataPoint]
+        ] = {}
+        for time_series_data, step, wall_time in data_points:
+            if not wall_time:
+                wall_time = utils.get_timestamp_proto()
+            for display_name, value in time_series_data.items():
+                values_by_display_name.setdefault(display_name, []).append(
+                    gca_tensorboard_data.TimeSeriesDataPoint(
+                        scalar=gca_tensorboard_data.Scalar(value=value),
+                        wall_time=wall_time,
+                        step=step,
+                    )
+                )
+
+        ts_data = []
+
+        for display_name, values in values_by_display_name.items():
             time_series_id = self._time_series_display_name_to_id_mapping.get(
                 display_name
             )
@@ -894,13 +1104,7 @@ class TensorboardRun(_TensorboardServiceResource):
                 gca_tensorboard_data.TimeSeriesData(
                     tensorboard_time_series_id=time_series_id,
                     value_type=gca_tensorboard_time_series.TensorboardTimeSeries.ValueType.SCALAR,
-                    values=[
-                        gca_tensorboard_data.TimeSeriesDataPoint(
-                            scalar=gca_tensorboard_data.Scalar(value=value),
-                            wall_time=wall_time,
-                            step=step,
-                        )
-                    ],
+                    values=values,
                 )
             )
 
@@ -1307,3 +1511,94 @@ class TensorboardTimeSeries(_TensorboardServiceResource):
             credentials=credentials,
             parent=parent,
         )
+
+    @classmethod
+    def list_iter(
+        cls,
+        tensorboard_run_name: str,
+        tensorboard_id: Optional[str] = None,
+        tensorboard_experiment_id: Optional[str] = None,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        read_mask: Optional[field_mask_pb2.FieldMask] = None,
+        prefetch: bool = True,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Iterator["TensorboardTimeSeries"]:
+        """Lazily lists the TensorboardTimeSeries in a TensorboardRun, page by
+        page.
+
+        Example Usage:
+
+            for time_series in aiplatform.TensorboardTimeSeries.list_iter(
+                tensorboard_run_name='projects/my-project/locations/us-central1/tensorboards/123/experiments/my-experiment/runs/my-run',
+                page_size=100,
+            ):
+                print(time_series.display_name)
+
+        Args:
+            tensorboard_run_name (str):
+                Required. The resource name or ID of the TensorboardRun
+                to list the TensorboardTimeseries from. Resource name format:
+                ``projects/{project}/locations/{location}/tensorboards/{tensorboard}/experiments/{experiment}/runs/{run}``
+
+                If resource ID is provided then tensorboard_id and tensorboard_experiment_id must be provided.
+            tensorboard_id (str):
+                Optional. The resource ID of the Tensorboard to list the TensorboardTimeSeries from.
+            tensorboard_experiment_id (str):
+                Optional. The ID of the TensorboardExperiment to list the TensorboardTimeSeries from.
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            page_size (int):
+                Optional. The maximum number of TensorboardTimeSeries per page. The service
+                default is used if not set.
+            read_mask (field_mask_pb2.FieldMask):
+                Optional. The fields to return for each TensorboardTimeSeries. All the
+                fields are returned if not set.
+            prefetch (bool):
+                Optional. Whether to fetch the next page on a background thread
+                while the TensorboardTimeSeries of the current page are consumed.
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+        Yields:
+            TensorboardTimeSeries - The TensorboardTimeSeries in the list.
+        """
+
+        parent = utils.full_resource_name(
+            resource_name=tensorboard_run_name,
+            resource_noun=TensorboardRun._resource_noun,
+            parse_resource_name_method=TensorboardRun._parse_resource_name,
+            format_resource_name_method=TensorboardRun._format_resource_name,
+            parent_resource_name_fields={
+                Tensorboard._resource_noun: tensorboard_id,
+                TensorboardExperiment._resource_noun: tensorboard_experiment_id,
+            },
+            project=project,
+            location=location,
+        )
+
+        return super().list_iter(
+            filter=filter,
+            order_by=order_by,
+            page_size=page_size,
+            read_mask=read_mask,
+            prefetch=prefetch,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+        )
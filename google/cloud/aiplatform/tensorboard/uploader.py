@@ -18,12 +18,24 @@
 
 import abc
 from collections import defaultdict
+from concurrent import futures
 import functools
 import logging
 import os
+import queue
 import re
+import threading
 import time
-from typing import ContextManager, Dict, FrozenSet, Generator, Iterable, Optional, Tuple
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Optional,
+    Tuple,
+)
 import uuid
 
 from google.api_core import exceptions
@@ -105,6 +117,14 @@ _DEFAULT_MAX_TENSOR_POINT_SIZE = 16 * (2**10)  # 16KiB
 
 _DEFAULT_MAX_BLOB_SIZE = 10 * (2**30)  # 10GiB
 
+# Default maximum number of items waiting between two stages of a pipelined
+# upload.
+_DEFAULT_MAX_PIPELINE_QUEUE_SIZE = 1024
+
+# Interval in seconds at which a pipeline stage blocked on a full queue checks
+# whether the upload cycle was aborted.
+_PIPELINE_POLL_INTERVAL_SECS = 0.1
+
 logger = tb_logging.get_logger()
 logger.setLevel(logging.WARNING)
 
@@ -141,6 +161,9 @@ class TensorBoardUploader(object):
         one_shot: bool = False,
         event_file_inactive_secs: Optional[int] = None,
         run_name_prefix=None,
+        num_workers: int = 1,
+        num_blob_upload_workers: int = 1,
+        max_queue_size: int = _DEFAULT_MAX_PIPELINE_QUEUE_SIZE,
     ):
         """Constructs a TensorBoardUploader.
 
@@ -180,6 +203,15 @@ class TensorBoardUploader(object):
             considered inactive.
           run_name_prefix: If present, all runs created by this invocation will have
             their name prefixed by this value.
+          num_workers: Number of threads reading runs and sending write requests.
+            If greater than 1, the upload is pipelined: runs are sharded across
+            reader threads, a single thread builds the batched requests and
+            sender threads send them, with the stages connected by bounded
+            queues.
+          num_blob_upload_workers: Number of threads uploading the blobs of an
+            event concurrently.
+          max_queue_size: Maximum number of items waiting between two stages of
+            a pipelined upload.
         """
         self._experiment_name = experiment_name
         self._experiment_display_name = experiment_display_name
@@ -267,6 +299,13 @@ class TensorBoardUploader(object):
         )
         self._tracker = upload_tracker.UploadTracker(verbosity=self._verbosity)
 
+        self._num_workers = num_workers
+        self._num_blob_upload_workers = num_blob_upload_workers
+        self._max_queue_size = max_queue_size
+        self._stage_metrics = uploader_utils.UploadStageMetrics()
+        self._send_stage = None
+        self._blob_upload_executor = None
+
         self._create_additional_senders()
 
     def _create_or_get_experiment(self) -> tensorboard_experiment.TensorboardExperiment:
@@ -308,6 +347,18 @@ class TensorBoardUploader(object):
             self._experiment.name, self._api
         )
 
+        if self._num_workers > 1:
+            self._send_stage = _RequestSendStage(
+                num_workers=self._num_workers,
+                max_queue_size=self._max_queue_size,
+                stage_metrics=self._stage_metrics,
+            )
+        if self._num_blob_upload_workers > 1:
+            self._blob_upload_executor = futures.ThreadPoolExecutor(
+                max_workers=self._num_blob_upload_workers,
+                thread_name_prefix="tensorboard-blob",
+            )
+
         self._request_sender = _BatchedRequestSender(
             self._experiment.name,
             self._api,
@@ -320,6 +371,9 @@ class TensorBoardUploader(object):
             blob_storage_folder=self._blob_storage_folder,
             one_platform_resource_manager=self._one_platform_resource_manager,
             tracker=self._tracker,
+            send_stage=self._send_stage,
+            blob_upload_executor=self._blob_upload_executor,
+            stage_metrics=self._stage_metrics,
         )
 
         # Update partials with experiment name
@@ -328,10 +382,20 @@ class TensorBoardUploader(object):
                 experiment_resource_name=self._experiment.name,
             )
 
-        self._dispatcher = _Dispatcher(
-            request_sender=self._request_sender,
-            additional_senders=self._additional_senders,
-        )
+        if self._num_workers > 1:
+            self._dispatcher = _PipelinedDispatcher(
+                request_sender=self._request_sender,
+                additional_senders=self._additional_senders,
+                num_readers=self._num_workers,
+                max_queue_size=self._max_queue_size,
+                stage_metrics=self._stage_metrics,
+                send_stage=self._send_stage,
+            )
+        else:
+            self._dispatcher = _Dispatcher(
+                request_sender=self._request_sender,
+                additional_senders=self._additional_senders,
+            )
 
     def _should_profile(self) -> bool:
         """Indicate if profile plugin should be enabled."""
@@ -370,6 +434,18 @@ class TensorBoardUploader(object):
     def get_experiment_resource_name(self):
         return self._experiment.name
 
+    def get_stage_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Returns the lag metrics of the stages of a pipelined upload.
+
+        Returns:
+          A mapping from stage name to its metrics. The "read" stage measures the
+          wait of runs for a reader thread, "build" the wait of events for the
+          request builder, "send" the wait of requests for a sender thread and
+          "blob" the wait of blobs for an upload thread. Stages that are not used
+          are absent.
+        """
+        return self._stage_metrics.snapshot()
+
     def start_uploading(self):
         """Blocks forever to continuously upload data from the logdir.
 
@@ -391,11 +467,14 @@ class TensorBoardUploader(object):
                     "performance."
                 )
 
-        while self._continue_uploading:
-            self._logdir_poll_rate_limiter.tick()
-            self._upload_once()
-            if self._one_shot:
-                break
+        try:
+            while self._continue_uploading:
+                self._logdir_poll_rate_limiter.tick()
+                self._upload_once()
+                if self._one_shot:
+                    break
+        finally:
+            self._shutdown_workers()
         if self._one_shot and not self._tracker.has_data():
             logger.warning(
                 "One-shot mode was used on a logdir (%s) without any uploadable data"
@@ -405,6 +484,15 @@ class TensorBoardUploader(object):
     def _end_uploading(self):
         self._continue_uploading = False
 
+    def _shutdown_workers(self):
+        """Stops the threads of a pipelined upload."""
+        if isinstance(self._dispatcher, _PipelinedDispatcher):
+            self._dispatcher.close()
+        if self._send_stage is not None:
+            self._send_stage.close()
+        if self._blob_upload_executor is not None:
+            self._blob_upload_executor.shutdown(wait=True)
+
     def _pre_create_runs_and_time_series(self):
         """Iterates though the log dir to collect TensorboardRuns and
         TensorboardTimeSeries that need to be created, and creates them in batch
@@ -525,6 +613,9 @@ class _BatchedRequestSender(object):
         blob_storage_folder: str,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
         tracker: upload_tracker.UploadTracker,
+        send_stage: Optional["_RequestSendStage"] = None,
+        blob_upload_executor: Optional[futures.Executor] = None,
+        stage_metrics: Optional[uploader_utils.UploadStageMetrics] = None,
     ):
         """Constructs _BatchedRequestSender for the given experiment resource.
 
@@ -544,6 +635,11 @@ class _BatchedRequestSender(object):
           one_platform_resource_manager: An instance of the One Platform
             resource management class.
           tracker: Upload tracker to track information about uploads.
+          send_stage: If present, the write requests are sent by this stage
+            instead of the calling thread.
+          blob_upload_executor: If present, the blobs of an event are uploaded
+            concurrently with this executor.
+          stage_metrics: Metrics to record the lag of blob uploads to.
         """
         self._experiment_resource_name = experiment_resource_name
         self._api = api
@@ -558,6 +654,7 @@ class _BatchedRequestSender(object):
             max_request_size=upload_limits.max_scalar_request_size,
             tracker=self._tracker,
             one_platform_resource_manager=self._one_platform_resource_manager,
+            send_stage=send_stage,
         )
         self._tensor_request_sender = _TensorBatchedRequestSender(
             experiment_resource_id=experiment_resource_name,
@@ -567,6 +664,7 @@ class _BatchedRequestSender(object):
             max_tensor_point_size=upload_limits.max_tensor_point_size,
             tracker=self._tracker,
             one_platform_resource_manager=self._one_platform_resource_manager,
+            send_stage=send_stage,
         )
         self._blob_request_sender = _BlobRequestSender(
             experiment_resource_id=experiment_resource_name,
@@ -578,6 +676,9 @@ class _BatchedRequestSender(object):
             blob_storage_folder=blob_storage_folder,
             tracker=self._tracker,
             one_platform_resource_manager=self._one_platform_resource_manager,
+            send_stage=send_stage,
+            blob_upload_executor=blob_upload_executor,
+            stage_metrics=stage_metrics,
         )
 
     def send_request(
@@ -739,6 +840,217 @@ class _Dispatcher(object):
         self._request_sender.flush()
 
 
+class _PipelinedDispatcher(_Dispatcher):
+    """Dispatches the requests through a pipeline of concurrent stages.
+
+    Runs are sharded across a pool of reader threads, which read and filter the
+    events of their runs and pass them through a bounded queue to the calling
+    thread. The calling thread builds the batched requests, which are sent by a
+    `_RequestSendStage` if the request senders were given one.
+    """
+
+    def __init__(
+        self,
+        request_sender: _BatchedRequestSender,
+        additional_senders: Optional[Dict[str, uploader_utils.RequestSender]] = None,
+        num_readers: int = 1,
+        max_queue_size: int = _DEFAULT_MAX_PIPELINE_QUEUE_SIZE,
+        stage_metrics: Optional[uploader_utils.UploadStageMetrics] = None,
+        send_stage: Optional["_RequestSendStage"] = None,
+    ):
+        """Construct a _PipelinedDispatcher object for the TensorboardUploader.
+
+        Args:
+            request_sender: A `_BatchedRequestSender` for handling events.
+            additional_senders: A dictionary mapping a plugin name to additional
+              Senders.
+            num_readers: Number of threads reading the events of runs.
+            max_queue_size: Maximum number of events read ahead of the request
+              builder.
+            stage_metrics: Metrics to record the lag of the stages to.
+            send_stage: The stage sending the requests built by `request_sender`,
+              which is waited for at the end of each dispatch.
+        """
+        super().__init__(request_sender, additional_senders)
+        self._reader_pool = futures.ThreadPoolExecutor(
+            max_workers=num_readers, thread_name_prefix="tensorboard-read"
+        )
+        self._max_queue_size = max_queue_size
+        self._stage_metrics = stage_metrics or uploader_utils.UploadStageMetrics()
+        self._send_stage = send_stage
+
+    def dispatch_requests(
+        self, run_to_events: Dict[str, Generator[tf.compat.v1.Event, None, None]]
+    ):
+        """Routes events to the appropriate sender.
+
+        Behaves like `_Dispatcher.dispatch_requests`, except that the events of
+        different runs are read concurrently. Events of a run keep their order.
+        Returns once all the requests have been sent.
+
+        Args:
+          run_to_events: Mapping from run name to generator of `tf.compat.v1.Event`
+            values, as returned by `LogdirLoader.get_run_events`.
+        """
+        event_queue = queue.Queue(maxsize=self._max_queue_size)
+        cancelled = threading.Event()
+
+        def read_run(run_name, events, submit_time):
+            self._stage_metrics.record_lag("read", time.time() - submit_time)
+            try:
+                for event in events:
+                    _filter_graph_defs(event)
+                    if not _put_unless_cancelled(
+                        event_queue, (run_name, event, time.time()), cancelled
+                    ):
+                        return
+            finally:
+                # Marks the end of the run, even if reading it failed.
+                _put_unless_cancelled(
+                    event_queue, (run_name, None, time.time()), cancelled
+                )
+
+        reads = []
+        try:
+            for (run_name, events) in run_to_events.items():
+                self._dispatch_additional_senders(run_name)
+                if events is not None:
+                    reads.append(
+                        self._reader_pool.submit(
+                            read_run, run_name, events, time.time()
+                        )
+                    )
+
+            num_active_runs = len(reads)
+            while num_active_runs:
+                run_name, event, enqueue_time = event_queue.get()
+                self._stage_metrics.record_lag(
+                    "build", time.time() - enqueue_time, event_queue.qsize()
+                )
+                if event is None:
+                    num_active_runs -= 1
+                    continue
+                for value in event.summary.value:
+                    self._request_sender.send_request(run_name, event, value)
+            for read in reads:
+                read.result()
+
+            self._request_sender.flush()
+            if self._send_stage is not None:
+                self._send_stage.join()
+        finally:
+            cancelled.set()
+
+    def close(self):
+        """Stops the reader threads."""
+        self._reader_pool.shutdown(wait=True)
+
+
+class _RequestSendStage(object):
+    """Sends write requests with a pool of threads fed by a bounded queue.
+
+    Requests are sent in any order. The first error raised by a request is
+    re-raised by every later call to `submit()` or `join()`, and the requests
+    queued after the error are dropped.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        max_queue_size: int = _DEFAULT_MAX_PIPELINE_QUEUE_SIZE,
+        stage_metrics: Optional[uploader_utils.UploadStageMetrics] = None,
+    ):
+        """Constructs a _RequestSendStage and starts its threads.
+
+        Args:
+          num_workers: Number of threads sending requests.
+          max_queue_size: Maximum number of requests waiting to be sent.
+          stage_metrics: Metrics to record the lag of the requests to.
+        """
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._stage_metrics = stage_metrics or uploader_utils.UploadStageMetrics()
+        self._error = None
+        self._error_lock = threading.Lock()
+        self._workers = [
+            threading.Thread(
+                target=self._run, name="tensorboard-send-{}".format(i), daemon=True
+            )
+            for i in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, send: Callable[[], None]):
+        """Queues a request to be sent, blocking while the queue is full.
+
+        Args:
+          send: Function sending the request.
+
+        Raises:
+          Exception: The first error raised by a previously submitted request.
+        """
+        self._raise_error()
+        self._queue.put((send, time.time()))
+
+    def join(self):
+        """Waits until all the submitted requests have been sent.
+
+        Raises:
+          Exception: The first error raised by a submitted request.
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Sends the queued requests and stops the threads."""
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                send, enqueue_time = item
+                self._stage_metrics.record_lag(
+                    "send", time.time() - enqueue_time, self._queue.qsize()
+                )
+                if self._error is None:
+                    send()
+            except Exception as e:  # pylint: disable=broad-except
+                with self._error_lock:
+                    if self._error is None:
+                        self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        with self._error_lock:
+            error = self._error
+        if error is not None:
+            raise error
+
+
+def _put_unless_cancelled(
+    q: queue.Queue, item: Tuple, cancelled: threading.Event
+) -> bool:
+    """Puts an item on a bounded queue unless the consumer was cancelled.
+
+    Returns:
+      Whether the item was put on the queue.
+    """
+    while not cancelled.is_set():
+        try:
+            q.put(item, timeout=_PIPELINE_POLL_INTERVAL_SECS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
 class _BaseBatchedRequestSender(object):
     """Helper class for building requests that fit under a size limit.
 
@@ -758,6 +1070,7 @@ class _BaseBatchedRequestSender(object):
         max_request_size: int,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        send_stage: Optional["_RequestSendStage"] = None,
     ):
         """Constructor for _BaseBatchedRequestSender.
 
@@ -768,6 +1081,8 @@ class _BaseBatchedRequestSender(object):
           rpc_rate_limiter: until.RateLimiter to limit rate of this request sender
           max_request_size: max number of bytes to send
           tracker:
+          send_stage: If present, flushed requests are sent by this stage instead
+            of the calling thread.
         """
         self._experiment_resource_id = experiment_resource_id
         self._api = api
@@ -775,6 +1090,7 @@ class _BaseBatchedRequestSender(object):
         self._byte_budget_manager = _ByteBudgetManager(max_request_size)
         self._tracker = tracker
         self._one_platform_resource_manager = one_platform_resource_manager
+        self._send_stage = send_stage
 
         # cache: map from Tensorboard tag to TimeSeriesData
         # cleared whenever a new request is created
@@ -866,8 +1182,26 @@ class _BaseBatchedRequestSender(object):
 
         self._rpc_rate_limiter.tick()
 
+        send = functools.partial(self._send_request, request, self._get_tracker())
+        if self._send_stage is None:
+            send()
+        else:
+            self._send_stage.submit(send)
+
+        self._new_request()
+
+    def _send_request(
+        self,
+        request: tensorboard_service.WriteTensorboardExperimentDataRequest,
+        tracker: ContextManager,
+    ):
+        """Sends a write request, tracking it with the given tracker.
+
+        Raises:
+          ExperimentNotFoundError: If the experiment was deleted.
+        """
         with uploader_utils.request_logger(request):
-            with self._get_tracker():
+            with tracker:
                 try:
                     self._api.write_tensorboard_experiment_data(
                         tensorboard_experiment=request.tensorboard_experiment,
@@ -881,8 +1215,6 @@ class _BaseBatchedRequestSender(object):
                         raise ExperimentNotFoundError() from e
                     logger.error("Upload call failed with error %s", e)
 
-        self._new_request()
-
     def _create_time_series_data(
         self, run_name: str, tag_name: str, metadata: tf.compat.v1.SummaryMetadata
     ) -> tensorboard_data.TimeSeriesData:
@@ -1019,6 +1351,7 @@ class _ScalarBatchedRequestSender(_BaseBatchedRequestSender):
         max_request_size: int,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        send_stage: Optional["_RequestSendStage"] = None,
     ):
         """Constructor for _ScalarBatchedRequestSender.
 
@@ -1029,6 +1362,7 @@ class _ScalarBatchedRequestSender(_BaseBatchedRequestSender):
           rpc_rate_limiter: until.RateLimiter to limit rate of this request sender
           max_request_size: max number of bytes to send
           tracker:
+          send_stage: If present, flushed requests are sent by this stage.
         """
         super().__init__(
             experiment_resource_id,
@@ -1037,6 +1371,7 @@ class _ScalarBatchedRequestSender(_BaseBatchedRequestSender):
             max_request_size,
             tracker,
             one_platform_resource_manager,
+            send_stage=send_stage,
         )
 
     def _get_tracker(self) -> ContextManager:
@@ -1083,6 +1418,7 @@ class _TensorBatchedRequestSender(_BaseBatchedRequestSender):
         max_tensor_point_size: int,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        send_stage: Optional["_RequestSendStage"] = None,
     ):
         """Constructor for _TensorBatchedRequestSender.
 
@@ -1093,6 +1429,7 @@ class _TensorBatchedRequestSender(_BaseBatchedRequestSender):
           rpc_rate_limiter: until.RateLimiter to limit rate of this request sender
           max_request_size: max number of bytes to send
           tracker:
+          send_stage: If present, flushed requests are sent by this stage.
         """
         super().__init__(
             experiment_resource_id,
@@ -1101,6 +1438,7 @@ class _TensorBatchedRequestSender(_BaseBatchedRequestSender):
             max_request_size,
             tracker,
             one_platform_resource_manager,
+            send_stage=send_stage,
         )
         self._max_tensor_point_size = max_tensor_point_size
 
@@ -1285,6 +1623,9 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
         blob_storage_folder: str,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        send_stage: Optional["_RequestSendStage"] = None,
+        blob_upload_executor: Optional[futures.Executor] = None,
+        stage_metrics: Optional[uploader_utils.UploadStageMetrics] = None,
     ):
         super().__init__(
             experiment_resource_id,
@@ -1293,10 +1634,13 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
             max_blob_request_size,
             tracker,
             one_platform_resource_manager,
+            send_stage=send_stage,
         )
         self._max_blob_size = max_blob_size
         self._bucket = blob_storage_bucket
         self._folder = blob_storage_folder
+        self._blob_upload_executor = blob_upload_executor
+        self._stage_metrics = stage_metrics
 
     def _new_request(self):
         super()._new_request()
@@ -1344,13 +1688,19 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
             if self._folder
             else blob_path_prefix
         )
-        sent_blob_ids = []
-        for blob in blobs:
-            with self._tracker.blob_tracker(len(blob)) as blob_tracker:
-                blob_id = self._send_blob(blob, blob_path_prefix)
-                if blob_id is not None:
-                    sent_blob_ids.append(str(blob_id))
-                    blob_tracker.mark_uploaded(blob_id is not None)
+        if self._blob_upload_executor is None:
+            blob_ids = [
+                self._track_and_send_blob(blob, blob_path_prefix) for blob in blobs
+            ]
+        else:
+            uploads = [
+                self._blob_upload_executor.submit(
+                    self._track_and_send_blob, blob, blob_path_prefix, time.time()
+                )
+                for blob in blobs
+            ]
+            blob_ids = [upload.result() for upload in uploads]
+        sent_blob_ids = [str(blob_id) for blob_id in blob_ids if blob_id is not None]
 
         return tensorboard_data.TimeSeriesDataPoint(
             step=event.step,
@@ -1366,6 +1716,28 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
             ),
         )
 
+    def _track_and_send_blob(
+        self, blob, blob_path_prefix, enqueue_time: Optional[float] = None
+    ):
+        """Sends a single blob and tracks its upload.
+
+        Args:
+          blob: The bytes of the blob.
+          blob_path_prefix: The GCS path prefix of the blob.
+          enqueue_time: If present, the time at which the upload was submitted to
+            the blob upload executor, used to record the lag of the upload.
+
+        Returns:
+          The ID of blob successfully sent.
+        """
+        if enqueue_time is not None and self._stage_metrics is not None:
+            self._stage_metrics.record_lag("blob", time.time() - enqueue_time)
+        with self._tracker.blob_tracker(len(blob)) as blob_tracker:
+            blob_id = self._send_blob(blob, blob_path_prefix)
+            if blob_id is not None:
+                blob_tracker.mark_uploaded(blob_id is not None)
+        return blob_id
+
     def _send_blob(self, blob, blob_path_prefix):
         """Sends a single blob to a GCS bucket in the consumer project.
 
@@ -17,7 +17,7 @@
 """Launches Tensorboard Uploader for SDK."""
 
 import threading
-from typing import Optional
+from typing import Dict, Optional
 
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
@@ -48,6 +48,7 @@ class _TensorBoardTracker:
         run_name_prefix: Optional[str] = None,
         description: Optional[str] = None,
         verbosity: Optional[int] = 1,
+        num_workers: int = 1,
     ):
         """upload only the existing data in the logdir and then return immediately
 
@@ -74,6 +75,9 @@ class _TensorBoardTracker:
           verbosity (str): Optional. Level of verbosity, an integer. Supported
             value: 0 - No upload statistics is printed. 1 - Print upload statistics
               while uploading data (default).
+          num_workers (int): Optional. Number of threads reading runs and sending
+            requests concurrently. Blobs are uploaded with the same number of
+            threads. Defaults to 1, which uploads sequentially.
         """
         self._create_uploader(
             tensorboard_id=tensorboard_id,
@@ -85,6 +89,7 @@ class _TensorBoardTracker:
             experiment_display_name=experiment_display_name,
             run_name_prefix=run_name_prefix,
             description=description,
+            num_workers=num_workers,
         ).start_uploading()
         _LOGGER.info("One time TensorBoard log upload completed.")
 
@@ -98,6 +103,7 @@ class _TensorBoardTracker:
         experiment_display_name: Optional[str] = None,
         run_name_prefix: Optional[str] = None,
         description: Optional[str] = None,
+        num_workers: int = 1,
     ):
         """continues to listen for new data in the logdir and uploads when it appears.
 
@@ -121,6 +127,9 @@ class _TensorBoardTracker:
             invocation will have their name prefixed by this value.
           description (str): Optional. String description to assign to the
             experiment.
+          num_workers (int): Optional. Number of threads reading runs and sending
+            requests concurrently. Blobs are uploaded with the same number of
+            threads. Defaults to 1, which uploads sequentially.
         """
         if self._tensorboard_uploader:
             _LOGGER.info(
@@ -141,6 +150,7 @@ class _TensorBoardTracker:
             run_name_prefix=run_name_prefix,
             description=description,
             verbosity=0,
+            num_workers=num_workers,
         )
         threading.Thread(target=self._tensorboard_uploader.start_uploading).start()
 
@@ -162,6 +172,18 @@ class _TensorBoardTracker:
         self._tensorboard_uploader._end_uploading()
         self._tensorboard_uploader = None
 
+    def get_upload_stage_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Returns the lag metrics of the stages of the running continuous upload.
+
+        Returns:
+            A mapping from stage name to its metrics, as returned by
+            `TensorBoardUploader.get_stage_metrics`, or an empty mapping if no
+            uploader is running.
+        """
+        if not self._tensorboard_uploader:
+            return {}
+        return self._tensorboard_uploader.get_stage_metrics()
+
     def _create_uploader(
         self,
         tensorboard_id: str,
@@ -174,6 +196,7 @@ class _TensorBoardTracker:
         run_name_prefix: Optional[str] = None,
         description: Optional[str] = None,
         verbosity: Optional[int] = 1,
+        num_workers: int = 1,
     ) -> "TensorBoardUploader":  # noqa: F821
         """Create a TensorBoardUploader and a TensorBoard Experiment
 
@@ -188,6 +211,7 @@ class _TensorBoardTracker:
           run_name_prefix (str): Optional. If present, all runs created by this invocation will have their name prefixed by this value.
           description (str): Optional. String description to assign to the experiment.
           verbosity (int)): Optional. Level of verbosity. Supported value: 0 - No upload statistics is printed. 1 - Print upload statistics while uploading data (default).
+          num_workers (int): Optional. Number of threads reading runs, sending requests and uploading blobs.
 
         Returns:
             An instance of TensorBoardUploader.
@@ -257,6 +281,8 @@ class _TensorBoardTracker:
             run_name_prefix=run_name_prefix,
             description=description,
             verbosity=verbosity,
+            num_workers=num_workers,
+            num_blob_upload_workers=num_workers,
         )
         tensorboard_uploader.create_experiment()
         print(
@@ -21,6 +21,7 @@ import contextlib
 import json
 import logging
 import re
+import threading
 import time
 from typing import Callable, Dict, Generator, List, Optional, Tuple
 import uuid
@@ -441,6 +442,63 @@ class TimeSeriesResourceManager(object):
         return time_series
 
 
+class UploadStageMetrics(object):
+    """Thread-safe lag metrics of the stages of a pipelined upload.
+
+    The lag of an item in a stage is the time it waited in the queue in front of
+    the stage before the stage started processing it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    def record_lag(self, stage: str, lag_secs: float, queue_size: int = 0):
+        """Records the lag of an item in a stage.
+
+        Args:
+            stage (str):
+                Required. The name of the stage, e.g. "read", "send" or "blob".
+            lag_secs (float):
+                Required. The time the item waited for the stage in seconds.
+            queue_size (int):
+                Optional. The number of items still waiting for the stage.
+        """
+        with self._lock:
+            metrics = self._stages.setdefault(
+                stage,
+                {
+                    "count": 0,
+                    "total_lag_secs": 0.0,
+                    "max_lag_secs": 0.0,
+                    "last_lag_secs": 0.0,
+                    "queue_size": 0,
+                },
+            )
+            metrics["count"] += 1
+            metrics["total_lag_secs"] += lag_secs
+            metrics["max_lag_secs"] = max(metrics["max_lag_secs"], lag_secs)
+            metrics["last_lag_secs"] = lag_secs
+            metrics["queue_size"] = queue_size
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Returns a copy of the metrics of every stage.
+
+        Returns:
+            A mapping from stage name to its `count` of processed items, its
+            `mean_lag_secs`, `max_lag_secs` and `last_lag_secs`, and the
+            `queue_size` at the time of the last item.
+        """
+        with self._lock:
+            snapshot = {}
+            for stage, metrics in self._stages.items():
+                stage_snapshot = dict(metrics)
+                total_lag_secs = stage_snapshot.pop("total_lag_secs")
+                stage_snapshot["mean_lag_secs"] = total_lag_secs / metrics["count"]
+                snapshot[stage] = stage_snapshot
+            return snapshot
+
+
 def get_source_bucket(logdir: str) -> Optional[storage.Bucket]:
     """Returns a storage bucket object given a log directory.
 
@@ -23,6 +23,7 @@ from google.protobuf import json_format
 import abc
 
 from google.auth import credentials as auth_credentials
+from google.cloud.aiplatform import _job_watcher
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform.constants import base as constants
 from google.cloud.aiplatform import datasets
@@ -74,7 +75,7 @@ _PIPELINE_COMPLETE_STATES = set(
 )
 
 # _block_until_complete wait times
-_JOB_WAIT_TIME = 5  # start at five seconds
+_JOB_WAIT_TIME = 5  # start at five seconds, then poll less often as time passes
 _LOG_WAIT_TIME = 5
 _MAX_WAIT_TIME = 60 * 5  # 5 minute wait
 _WAIT_TIME_MULTIPLIER = 2  # scale wait by 2 every iteration
@@ -940,7 +941,7 @@ class _TrainingJob(base.VertexAiStatefulResource):
 
         log_wait = _LOG_WAIT_TIME
 
-        previous_time = time.time()
+        start_time = previous_time = time.time()
 
         while self.state not in _PIPELINE_COMPLETE_STATES:
             current_time = time.time()
@@ -956,7 +957,11 @@ class _TrainingJob(base.VertexAiStatefulResource):
                 log_wait = min(log_wait * _WAIT_TIME_MULTIPLIER, _MAX_WAIT_TIME)
                 previous_time = current_time
             self._wait_callback()
-            time.sleep(_JOB_WAIT_TIME)
+            time.sleep(
+                _job_watcher.get_poll_interval(
+                    current_time - start_time, min_interval=_JOB_WAIT_TIME
+                )
+            )
 
         self._raise_failure()
 
@@ -1009,6 +1014,14 @@ class _TrainingJob(base.VertexAiStatefulResource):
             )
         return False
 
+    @classmethod
+    def _list_cls_filter(
+        cls, gapic_resource: gca_training_pipeline.TrainingPipeline
+    ) -> bool:
+        return (
+            gapic_resource.training_task_definition in cls._supported_training_schemas
+        )
+
     @classmethod
     def list(
         cls,
@@ -1049,13 +1062,8 @@ class _TrainingJob(base.VertexAiStatefulResource):
             List[VertexAiResourceNoun] - A list of TrainingJob resource objects
         """
 
-        training_job_subclass_filter = (
-            lambda gapic_obj: gapic_obj.training_task_definition
-            in cls._supported_training_schemas
-        )
-
         return cls._list_with_local_order(
-            cls_filter=training_job_subclass_filter,
+            cls_filter=cls._list_cls_filter,
             filter=filter,
             order_by=order_by,
             project=project,
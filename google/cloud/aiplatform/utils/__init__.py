@@ -29,7 +29,6 @@ from google.protobuf import timestamp_pb2
 from google.api_core import client_options
 from google.api_core import gapic_v1
 from google.auth import credentials as auth_credentials
-from google.cloud import storage
 
 from google.cloud.aiplatform import compat
 from google.cloud.aiplatform.constants import base as constants
@@ -400,19 +399,33 @@ class ClientWithOverride:
             self._client_info = client_info
 
         def __getattr__(self, name: str) -> Any:
-            """Instantiates client and returns attribute of the client."""
-            temporary_client = self._client_class(
-                credentials=self._credentials,
-                client_options=self._client_options,
-                client_info=self._client_info,
+            """Gets the client from the client cache and returns its attribute."""
+            key = (
+                self._client_class,
+                id(self._credentials),
+                initializer._client_options_key(self._client_options),
+                self._client_info.gapic_version,
+                self._client_info.user_agent,
             )
-            return getattr(temporary_client, name)
+            client = initializer.global_client_cache.get_or_create(
+                key,
+                lambda: self._client_class(
+                    credentials=self._credentials,
+                    client_options=self._client_options,
+                    client_info=self._client_info,
+                ),
+                self._credentials,
+            )
+            return getattr(client, name)
 
     @property
     @abc.abstractmethod
     def _is_temporary(self) -> bool:
         pass
 
+    # Whether clients are shared through `initializer.global_client_cache`.
+    _is_cached = True
+
     @property
     @classmethod
     @abc.abstractmethod
@@ -622,6 +635,8 @@ class PredictionClientWithOverride(ClientWithOverride):
 
 class PredictionAsyncClientWithOverride(ClientWithOverride):
     _is_temporary = False
+    # Async gRPC channels are bound to the event loop they were created in.
+    _is_cached = False
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
         (compat.V1, prediction_service_async_client_v1.PredictionServiceAsyncClient),
@@ -766,8 +781,11 @@ def _timestamped_copy_to_gcs(
     if gcs_blob_prefix:
         blob_path = "/".join([gcs_blob_prefix, blob_path])
 
+    # Imported here to avoid a circular import of this package.
+    from google.cloud.aiplatform.utils import gcs_utils
+
     # TODO(b/171202993) add user agent
-    client = storage.Client(project=project, credentials=credentials)
+    client = gcs_utils._get_storage_client(project=project, credentials=credentials)
     bucket = client.bucket(gcs_bucket)
     blob = bucket.blob(blob_path)
     blob.upload_from_filename(local_file_path)
@@ -15,14 +15,19 @@
 # limitations under the License.
 
 
+from concurrent import futures
 import datetime
 import glob
 import logging
+import mimetypes
 import os
 import pathlib
 import tempfile
-from typing import Optional, TYPE_CHECKING
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
+from google.api_core import exceptions
 from google.auth import credentials as auth_credentials
 from google.cloud import storage
 
@@ -34,16 +39,325 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Number of threads used to transfer files concurrently.
+_DEFAULT_MAX_TRANSFER_WORKERS = min(32, max(4, (os.cpu_count() or 0) * 5))
+
+# Files of at least this size are transferred as several slices in parallel.
+_SLICED_TRANSFER_THRESHOLD_BYTES = 128 * 1024 * 1024
+
+# Lower bound for the size of a single slice of a sliced transfer.
+_MIN_SLICE_SIZE_BYTES = 32 * 1024 * 1024
+
+# GCS accepts at most 32 source objects in a single compose request.
+_MAX_COMPOSE_SOURCES = 32
+
+# Suffix of the temporary objects holding the slices of a sliced upload.
+_UPLOAD_SLICE_SUFFIX = ".vertex-ai-upload-slice-"
+
+# Content type of uploaded files whose type cannot be guessed, as in GCS.
+_DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+# Upper bound of storage clients kept alive by `_get_storage_client`.
+_MAX_CACHED_STORAGE_CLIENTS = 16
+
+_storage_clients: Dict[tuple, storage.Client] = {}
+_storage_clients_lock = threading.Lock()
+
+
+def _get_storage_client(
+    project: Optional[str] = None,
+    credentials: Optional[auth_credentials.Credentials] = None,
+) -> storage.Client:
+    """Returns a storage client shared by all transfers with the same settings.
+
+    Reusing the client lets transfers share its HTTP connection pool instead of
+    opening new connections for every call. Clients are cached per process, so
+    forked workers never reuse the connections of their parent.
+
+    Args:
+        project: Optional. Google Cloud Project of the client.
+        credentials: Optional. The custom credentials to use when making API calls.
+
+    Returns:
+        A cached `storage.Client`.
+    """
+    key = (storage.Client, project, credentials, os.getpid())
+    with _storage_clients_lock:
+        client = _storage_clients.get(key)
+        if client is None:
+            if len(_storage_clients) >= _MAX_CACHED_STORAGE_CLIENTS:
+                _storage_clients.pop(next(iter(_storage_clients)))
+            client = storage.Client(project=project, credentials=credentials)
+            _storage_clients[key] = client
+    return client
+
+
+def _get_slice_ranges(size: int) -> List[Tuple[int, int]]:
+    """Splits `size` bytes into inclusive (start, end) ranges of a sliced transfer.
+
+    Slices are never smaller than `_MIN_SLICE_SIZE_BYTES` and there are never more
+    than `_MAX_COMPOSE_SOURCES` of them, so sliced uploads can be composed with a
+    single request.
+    """
+    slice_size = max(_MIN_SLICE_SIZE_BYTES, -(-size // _MAX_COMPOSE_SOURCES))
+    return [
+        (start, min(start + slice_size, size) - 1)
+        for start in range(0, size, slice_size)
+    ]
+
+
+def _format_throughput(num_bytes: int, seconds: float) -> str:
+    """Formats the size and throughput of a transfer for logging."""
+    mebibytes = num_bytes / (1024 * 1024)
+    return f"{mebibytes:.2f} MiB in {seconds:.2f}s, {mebibytes / max(seconds, 1e-6):.2f} MiB/s"
+
+
+def _upload_file(
+    storage_client: storage.Client, source_file_path: str, destination_file_uri: str
+) -> None:
+    """Uploads a single local file with one request."""
+    start_time = time.time()
+    _logger.debug(f'Uploading "{source_file_path}" to "{destination_file_uri}"')
+    destination_blob = storage.Blob.from_string(
+        destination_file_uri, client=storage_client
+    )
+    destination_blob.upload_from_filename(filename=source_file_path)
+    _logger.debug(
+        f'Uploaded "{source_file_path}" to "{destination_file_uri}": '
+        + _format_throughput(
+            os.path.getsize(source_file_path), time.time() - start_time
+        )
+    )
+
+
+def _upload_file_slice(
+    storage_client: storage.Client,
+    source_file_path: str,
+    slice_uri: str,
+    start: int,
+    end: int,
+) -> None:
+    """Uploads the bytes [start, end] of a local file to a temporary object."""
+    with open(source_file_path, "rb") as source_file:
+        source_file.seek(start)
+        storage.Blob.from_string(slice_uri, client=storage_client).upload_from_file(
+            source_file, size=end - start + 1
+        )
+
+
+def _delete_slices(storage_client: storage.Client, slice_uris: Sequence[str]) -> None:
+    """Deletes the temporary objects of a sliced upload that exist."""
+    for slice_uri in slice_uris:
+        try:
+            storage.Blob.from_string(slice_uri, client=storage_client).delete()
+        except exceptions.NotFound:
+            pass
+
+
+def _compose_slices(
+    storage_client: storage.Client,
+    source_file_path: str,
+    destination_file_uri: str,
+    slice_uris: Sequence[str],
+) -> None:
+    """Composes uploaded slices into the destination object and deletes them."""
+    destination_blob = storage.Blob.from_string(
+        destination_file_uri, client=storage_client
+    )
+    # Slices are uploaded without a content type, so set the one that a single
+    # request upload of the file would get.
+    destination_blob.content_type = (
+        mimetypes.guess_type(source_file_path)[0] or _DEFAULT_CONTENT_TYPE
+    )
+    try:
+        destination_blob.compose(
+            [
+                storage.Blob.from_string(slice_uri, client=storage_client)
+                for slice_uri in slice_uris
+            ]
+        )
+    finally:
+        _delete_slices(storage_client, slice_uris)
+
+
+def _upload_files(
+    file_uri_pairs: Sequence[Tuple[str, str]],
+    storage_client: storage.Client,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Uploads local files to GCS concurrently.
+
+    Small files are uploaded with one request each. Large files are uploaded as
+    slices in parallel and composed into the destination object afterwards.
+
+    Args:
+        file_uri_pairs: Required. (local file path, destination GCS URI) pairs.
+        storage_client: Required. The storage client shared by all uploads.
+        max_workers: Optional. Maximum number of concurrent requests.
+    """
+    start_time = time.time()
+    total_bytes = 0
+    sliced_uploads = []
+    with futures.ThreadPoolExecutor(
+        max_workers=max_workers or _DEFAULT_MAX_TRANSFER_WORKERS
+    ) as executor:
+        submissions = []
+        for source_file_path, destination_file_uri in file_uri_pairs:
+            size = os.path.getsize(source_file_path)
+            total_bytes += size
+            if size < _SLICED_TRANSFER_THRESHOLD_BYTES:
+                submissions.append(
+                    executor.submit(
+                        _upload_file,
+                        storage_client,
+                        source_file_path,
+                        destination_file_uri,
+                    )
+                )
+                continue
+
+            _logger.debug(
+                f'Uploading "{source_file_path}" to "{destination_file_uri}" in slices'
+            )
+            slice_uris = []
+            for index, (start, end) in enumerate(_get_slice_ranges(size)):
+                slice_uri = f"{destination_file_uri}{_UPLOAD_SLICE_SUFFIX}{index:02d}"
+                slice_uris.append(slice_uri)
+                submissions.append(
+                    executor.submit(
+                        _upload_file_slice,
+                        storage_client,
+                        source_file_path,
+                        slice_uri,
+                        start,
+                        end,
+                    )
+                )
+            sliced_uploads.append((source_file_path, destination_file_uri, slice_uris))
+
+        slices_uploaded = False
+        try:
+            for submission in futures.as_completed(submissions):
+                submission.result()
+            slices_uploaded = True
+        finally:
+            if not slices_uploaded:
+                # Wait for the running uploads, so that no slice is written
+                # after the cleanup, and leave no slices in the destination.
+                for submission in submissions:
+                    submission.cancel()
+                futures.wait(submissions)
+                for _, _, slice_uris in sliced_uploads:
+                    _delete_slices(storage_client, slice_uris)
+
+        submissions = [
+            executor.submit(
+                _compose_slices,
+                storage_client,
+                source_file_path,
+                destination_file_uri,
+                slice_uris,
+            )
+            for source_file_path, destination_file_uri, slice_uris in sliced_uploads
+        ]
+        for submission in futures.as_completed(submissions):
+            submission.result()
+
+    _logger.debug(
+        f"Uploaded {len(file_uri_pairs)} file(s): "
+        + _format_throughput(total_bytes, time.time() - start_time)
+    )
+
+
+def _download_blob(blob: storage.Blob, filename: str) -> None:
+    """Downloads a single blob with one request."""
+    start_time = time.time()
+    blob.download_to_filename(filename=filename)
+    if blob.size is not None:
+        _logger.debug(
+            f'Downloaded "{blob.name}" to "{filename}": '
+            + _format_throughput(blob.size, time.time() - start_time)
+        )
+
+
+def _download_blob_slice(blob: storage.Blob, filename: str, start: int, end: int):
+    """Downloads the bytes [start, end] of a blob into the same range of a file."""
+    with open(filename, "r+b") as destination_file:
+        destination_file.seek(start)
+        blob.download_to_file(destination_file, start=start, end=end)
+
+
+def _download_blobs(
+    blob_filename_pairs: Sequence[Tuple[storage.Blob, str]],
+    max_workers: Optional[int] = None,
+) -> None:
+    """Downloads blobs to local files concurrently.
+
+    Blobs whose size is known and large enough are downloaded as byte ranges in
+    parallel, pinned to the listed generation.
+
+    Args:
+        blob_filename_pairs: Required. (blob, local file path) pairs.
+        max_workers: Optional. Maximum number of concurrent requests.
+    """
+    start_time = time.time()
+    total_bytes = 0
+    with futures.ThreadPoolExecutor(
+        max_workers=max_workers or _DEFAULT_MAX_TRANSFER_WORKERS
+    ) as executor:
+        submissions = []
+        for blob, filename in blob_filename_pairs:
+            directory = os.path.dirname(filename)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            size = blob.size
+            total_bytes += size or 0
+            if (
+                size is None
+                or size < _SLICED_TRANSFER_THRESHOLD_BYTES
+                # Ranges of transcoded objects do not match the served bytes.
+                or blob.content_encoding == "gzip"
+            ):
+                submissions.append(executor.submit(_download_blob, blob, filename))
+                continue
+
+            _logger.debug(f'Downloading "{blob.name}" to "{filename}" in slices')
+            with open(filename, "wb") as destination_file:
+                destination_file.truncate(size)
+            for start, end in _get_slice_ranges(size):
+                # Each slice gets its own blob so concurrent downloads do not
+                # update the properties of a shared object.
+                slice_blob = storage.Blob(
+                    blob.name, bucket=blob.bucket, generation=blob.generation
+                )
+                submissions.append(
+                    executor.submit(
+                        _download_blob_slice, slice_blob, filename, start, end
+                    )
+                )
+
+        for submission in futures.as_completed(submissions):
+            submission.result()
+
+    _logger.debug(
+        f"Downloaded {len(blob_filename_pairs)} file(s): "
+        + _format_throughput(total_bytes, time.time() - start_time)
+    )
+
 
 def upload_to_gcs(
     source_path: str,
     destination_uri: str,
     project: Optional[str] = None,
     credentials: Optional[auth_credentials.Credentials] = None,
+    max_workers: Optional[int] = None,
 ):
     """Uploads local files to GCS.
 
     After upload the `destination_uri` will contain the same data as the `source_path`.
+    Files are uploaded concurrently and large files are uploaded in parallel
+    slices which are composed into the destination object.
 
     Args:
         source_path: Required. Path of the local data to copy to GCS.
@@ -51,6 +365,7 @@ def upload_to_gcs(
         project: Optional. Google Cloud Project that contains the staging bucket.
         credentials: The custom credentials to use when making API calls.
             If not provided, default credentials will be used.
+        max_workers: Optional. Maximum number of concurrent upload requests.
 
     Raises:
         RuntimeError: When source_path does not exist.
@@ -63,11 +378,12 @@ def upload_to_gcs(
     project = project or initializer.global_config.project
     credentials = credentials or initializer.global_config.credentials
 
-    storage_client = storage.Client(project=project, credentials=credentials)
+    storage_client = _get_storage_client(project=project, credentials=credentials)
     if source_path_obj.is_dir():
         source_file_paths = glob.glob(
             pathname=str(source_path_obj / "**"), recursive=True
         )
+        file_uri_pairs = []
         for source_file_path in source_file_paths:
             source_file_path_obj = pathlib.Path(source_file_path)
             if source_file_path_obj.is_dir():
@@ -79,19 +395,13 @@ def upload_to_gcs(
             destination_file_uri = (
                 destination_uri.rstrip("/") + "/" + source_file_relative_posix_path
             )
-            _logger.debug(f'Uploading "{source_file_path}" to "{destination_file_uri}"')
-            destination_blob = storage.Blob.from_string(
-                destination_file_uri, client=storage_client
-            )
-            destination_blob.upload_from_filename(filename=source_file_path)
+            file_uri_pairs.append((source_file_path, destination_file_uri))
     else:
-        source_file_path = source_path
-        destination_file_uri = destination_uri
-        _logger.debug(f'Uploading "{source_file_path}" to "{destination_file_uri}"')
-        destination_blob = storage.Blob.from_string(
-            destination_file_uri, client=storage_client
-        )
-        destination_blob.upload_from_filename(filename=source_file_path)
+        file_uri_pairs = [(source_path, destination_uri)]
+
+    _upload_files(
+        file_uri_pairs, storage_client=storage_client, max_workers=max_workers
+    )
 
 
 def stage_local_data_in_gcs(
@@ -139,7 +449,7 @@ def stage_local_data_in_gcs(
         # E.g. "FailedPrecondition: 400 The Cloud Storage bucket of `gs://...` is in location `us`. It must be in the same regional location as the service location `us-central1`."
         # We are making the bucket name region-specific since the bucket is regional.
         staging_bucket_name = project + "-vertex-staging-" + location
-        client = storage.Client(project=project, credentials=credentials)
+        client = _get_storage_client(project=project, credentials=credentials)
         staging_bucket = storage.Bucket(client=client, name=staging_bucket_name)
         if not staging_bucket.exists():
             _logger.info(f'Creating staging GCS bucket "{staging_bucket_name}"')
@@ -293,12 +603,12 @@ def download_file_from_gcs(
     project = project or initializer.global_config.project
     credentials = credentials or initializer.global_config.credentials
 
-    storage_client = storage.Client(project=project, credentials=credentials)
+    storage_client = _get_storage_client(project=project, credentials=credentials)
     source_blob = storage.Blob.from_string(source_file_uri, client=storage_client)
 
     _logger.debug(f'Downloading "{source_file_uri}" to "{destination_file_path}"')
 
-    source_blob.download_to_filename(filename=destination_file_path)
+    _download_blobs([(source_blob, destination_file_path)])
 
 
 def download_from_gcs(
@@ -306,9 +616,13 @@ def download_from_gcs(
     destination_path: str,
     project: Optional[str] = None,
     credentials: Optional[auth_credentials.Credentials] = None,
+    max_workers: Optional[int] = None,
 ):
     """Downloads GCS files to local path.
 
+    Files are downloaded concurrently and large files are downloaded as parallel
+    byte ranges.
+
     Args:
         source_uri (str):
             Required. GCS URI(or prefix) of the file(s) to download.
@@ -321,6 +635,8 @@ def download_from_gcs(
         credentials (auth_credentials.Credentials):
             Optional. The custom credentials to use when making API calls.
             If not provided, default credentials will be used.
+        max_workers (int):
+            Optional. Maximum number of concurrent download requests.
 
     Raises:
         GoogleCloudError: When the download process fails.
@@ -328,12 +644,13 @@ def download_from_gcs(
     project = project or initializer.global_config.project
     credentials = credentials or initializer.global_config.credentials
 
-    storage_client = storage.Client(project=project, credentials=credentials)
+    storage_client = _get_storage_client(project=project, credentials=credentials)
 
     validate_gcs_path(source_uri)
     bucket_name, prefix = source_uri.replace("gs://", "").split("/", maxsplit=1)
 
     blobs = storage_client.list_blobs(bucket_or_name=bucket_name, prefix=prefix)
+    blob_filename_pairs = []
     for blob in blobs:
         # In SDK 2.0 remote training, we'll create some empty files.
         # These files ends with '/', and we'll skip them.
@@ -344,8 +661,9 @@ def download_from_gcs(
                 if rel_path == "."
                 else os.path.join(destination_path, rel_path)
             )
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            blob.download_to_filename(filename=filename)
+            blob_filename_pairs.append((blob, filename))
+
+    _download_blobs(blob_filename_pairs, max_workers=max_workers)
 
 
 def _upload_pandas_df_to_gcs(
@@ -374,13 +692,13 @@ def _upload_pandas_df_to_gcs(
         else:
             raise ValueError(f"Unsupported file format: {file_format}")
 
-        storage_client = storage.Client(
+        storage_client = _get_storage_client(
             project=initializer.global_config.project,
             credentials=initializer.global_config.credentials,
         )
-        storage.Blob.from_string(
-            uri=upload_gcs_path, client=storage_client
-        ).upload_from_filename(filename=local_dataset_path)
+        _upload_files(
+            [(local_dataset_path, upload_gcs_path)], storage_client=storage_client
+        )
 
 
 def validate_gcs_path(gcs_path: str) -> None:
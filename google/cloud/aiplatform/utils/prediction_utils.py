@@ -23,8 +23,8 @@ from pathlib import Path
 import re
 from typing import Any, Optional, Sequence, Tuple, Type
 
-from google.cloud import storage
 from google.cloud.aiplatform.constants import prediction
+from google.cloud.aiplatform.utils import gcs_utils
 from google.cloud.aiplatform.utils import path_utils
 
 _logger = logging.getLogger(__name__)
@@ -122,7 +122,7 @@ def download_model_artifacts(artifact_uri: str) -> None:
     """Prepares model artifacts in the current working directory.
 
     If artifact_uri is a GCS uri, the model artifacts will be downloaded to the current
-    working directory.
+    working directory. Files are downloaded concurrently.
     If artifact_uri is a local directory, the model artifacts will be copied to the current
     working directory.
 
@@ -134,8 +134,9 @@ def download_model_artifacts(artifact_uri: str) -> None:
         matches = re.match(f"{GCS_URI_PREFIX}(.*?)/(.*)", artifact_uri)
         bucket_name, prefix = matches.groups()
 
-        gcs_client = storage.Client()
+        gcs_client = gcs_utils._get_storage_client()
         blobs = gcs_client.list_blobs(bucket_name, prefix=prefix)
+        blob_filename_pairs = []
         for blob in blobs:
             name_without_prefix = blob.name[len(prefix) :]
             name_without_prefix = (
@@ -147,7 +148,8 @@ def download_model_artifacts(artifact_uri: str) -> None:
             directory = "/".join(file_split[0:-1])
             Path(directory).mkdir(parents=True, exist_ok=True)
             if name_without_prefix and not name_without_prefix.endswith("/"):
-                blob.download_to_filename(name_without_prefix)
+                blob_filename_pairs.append((blob, name_without_prefix))
+        gcs_utils._download_blobs(blob_filename_pairs)
     else:
         # Copy files to the current working directory.
         distutils.dir_util.copy_tree(artifact_uri, ".")
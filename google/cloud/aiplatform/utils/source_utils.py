@@ -15,27 +15,38 @@
 #
 
 
-import functools
+import hashlib
 import os
 import pathlib
 import shutil
-import subprocess
 import sys
+import tarfile
 import tempfile
-from typing import Optional, Sequence, Callable
+import threading
+from typing import Callable, Optional, Sequence, Set
 
 from google.auth import credentials as auth_credentials
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.utils import gcs_utils
 
 _LOGGER = base.Logger(__name__)
 
+# Files that are not part of the packaged training code.
+_IGNORED_NAMES = ("__pycache__",)
+_IGNORED_SUFFIXES = (".pyc",)
+
+_HASH_CHUNK_SIZE_BYTES = 1024 * 1024
+
 
 def _get_python_executable() -> str:
     """Returns Python executable.
 
+    The packager builds the source distribution in process and no longer calls
+    this; it is kept for callers that run the packaged module.
+
     Returns:
-        Python executable to use for setuptools packaging.
+        Python executable to run the packaged module with.
     Raises:
         EnvironmentError: If Python executable is not found.
     """
@@ -59,8 +70,7 @@ class _TrainingScriptPythonPackager:
         _TEST_MODULE_NAME: Constant name of module that will store script.
         _SETUP_PY_VERSION: Constant version of this created python package.
         _SETUP_PY_TEMPLATE: Constant template used to generate setup.py file.
-        _SETUP_PY_SOURCE_DISTRIBUTION_CMD:
-            Constant command to generate the source distribution package.
+        _PKG_INFO_TEMPLATE: Constant template of the metadata of the package.
 
     Attributes:
         script_path: local path of script or folder to package
@@ -74,6 +84,10 @@ class _TrainingScriptPythonPackager:
         project='my-project')
     module_name = packager.module_name
 
+    Packages are stored in GCS under a hash of their content, so packaging the
+    same script and requirements again reuses the stored package instead of
+    building and uploading it.
+
     The package after installed can be executed as:
     python -m aiplatform_custom_trainer_script.task
     """
@@ -94,7 +108,16 @@ setup(
     description='My training application.'
 )"""
 
-    _SETUP_PY_SOURCE_DISTRIBUTION_CMD = "setup.py sdist --formats=gztar"
+    _PKG_INFO_TEMPLATE = """Metadata-Version: 2.1
+Name: {name}
+Version: {version}
+Summary: My training application.
+{requires_dist}"""
+
+    # GCS paths of the packages known to be stored, shared by the packagers of
+    # this process.
+    _stored_package_gcs_paths: Set[str] = set()
+    _stored_package_gcs_paths_lock = threading.Lock()
 
     def __init__(
         self,
@@ -119,6 +142,65 @@ setup(
         # Module name that can be executed during training. ie. python -m
         return f"{self._ROOT_MODULE}.{self.task_module_name}"
 
+    def _get_setup_py(self) -> str:
+        """Returns the content of the setup.py file of the package."""
+        return self._SETUP_PY_TEMPLATE.format(
+            name=self._ROOT_MODULE,
+            requirements=",".join(f'"{r}"' for r in self.requirements),
+            version=self._SETUP_PY_VERSION,
+        )
+
+    def _get_pkg_info(self) -> str:
+        """Returns the content of the PKG-INFO file of the package."""
+        return self._PKG_INFO_TEMPLATE.format(
+            name=self._ROOT_MODULE,
+            version=self._SETUP_PY_VERSION,
+            requires_dist="".join(f"Requires-Dist: {r}\n" for r in self.requirements),
+        )
+
+    def get_content_hash(self) -> str:
+        """Computes the hash of the content of the package.
+
+        The hash covers the setup.py file, which holds the requirements, the
+        task module name and the packaged files, so two packagers with the same
+        hash build the same package.
+
+        Returns:
+            The hex SHA-256 digest of the content of the package.
+        """
+        content_hash = hashlib.sha256()
+
+        def _update(data: bytes):
+            # Prefixing the length keeps the boundaries between fields.
+            content_hash.update(len(data).to_bytes(8, "big"))
+            content_hash.update(data)
+
+        _update(self._get_setup_py().encode("utf-8"))
+        _update(self.task_module_name.encode("utf-8"))
+
+        if os.path.isdir(self.script_path):
+            file_paths = []
+            for root, dir_names, file_names in os.walk(self.script_path):
+                dir_names[:] = [d for d in dir_names if not _is_ignored(d)]
+                file_paths.extend(
+                    os.path.join(root, name)
+                    for name in file_names
+                    if not _is_ignored(name)
+                )
+            file_paths.sort()
+        else:
+            file_paths = [self.script_path]
+
+        for file_path in file_paths:
+            relative_path = os.path.relpath(file_path, self.script_path)
+            _update(pathlib.PurePath(relative_path).as_posix().encode("utf-8"))
+            content_hash.update(os.path.getsize(file_path).to_bytes(8, "big"))
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE_BYTES), b""):
+                    content_hash.update(chunk)
+
+        return content_hash.hexdigest()
+
     def make_package(self, package_directory: str) -> str:
         """Converts script into a Python package suitable for python module
         execution.
@@ -145,6 +227,9 @@ setup(
         # The path to setup.py in the package.
         setup_py_path = trainer_root_path / "setup.py"
 
+        # The path to the metadata of the package.
+        pkg_info_path = trainer_root_path / "PKG-INFO"
+
         # The path to the generated source distribution.
         source_distribution_path = (
             trainer_root_path
@@ -159,16 +244,9 @@ setup(
         with init_path.open("w"):
             pass
 
-        # Format the setup.py file.
-        setup_py_output = self._SETUP_PY_TEMPLATE.format(
-            name=self._ROOT_MODULE,
-            requirements=",".join(f'"{r}"' for r in self.requirements),
-            version=self._SETUP_PY_VERSION,
-        )
-
         # Write setup.py
         with setup_py_path.open("w") as fp:
-            fp.write(setup_py_output)
+            fp.write(self._get_setup_py())
 
         if os.path.isdir(self.script_path):
             # Remove destination path if it already exists
@@ -183,25 +261,25 @@ setup(
             # Copy script as module of python package.
             shutil.copy(self.script_path, script_out_path)
 
-        # Run setup.py to create the source distribution.
-        setup_cmd = [
-            _get_python_executable()
-        ] + self._SETUP_PY_SOURCE_DISTRIBUTION_CMD.split()
-
-        p = subprocess.Popen(
-            args=setup_cmd,
-            cwd=trainer_root_path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        output, error = p.communicate()
-
-        # Raise informative error if packaging fails.
-        if p.returncode != 0:
-            raise RuntimeError(
-                "Packaging of training script failed with code %d\n%s \n%s"
-                % (p.returncode, output.decode(), error.decode())
-            )
+        # Build the source distribution in-process, as `setup.py sdist` would.
+        # It only holds setup.py, PKG-INFO and the package, so there is
+        # nothing to run setuptools for.
+        with pkg_info_path.open("w") as fp:
+            fp.write(self._get_pkg_info())
+
+        distribution_name = f"{self._ROOT_MODULE}-{self._SETUP_PY_VERSION}"
+        try:
+            source_distribution_path.parent.mkdir(exist_ok=True)
+            with tarfile.open(source_distribution_path, "w:gz") as tar:
+                for path in (setup_py_path, pkg_info_path, trainer_path):
+                    tar.add(
+                        path,
+                        arcname=f"{distribution_name}/{path.name}",
+                        filter=_exclude_ignored_files,
+                    )
+        except (OSError, tarfile.TarError) as e:
+            # Raise informative error if packaging fails.
+            raise RuntimeError("Packaging of training script failed:\n%s" % e) from e
 
         return str(source_distribution_path)
 
@@ -239,10 +317,48 @@ setup(
             GCS location of Python package.
         """
 
-        copy_method = functools.partial(
-            utils._timestamped_copy_to_gcs,
-            gcs_dir=gcs_staging_dir,
-            project=project,
-            credentials=credentials,
+        gcs_bucket, gcs_blob_prefix = utils.extract_bucket_and_prefix_from_gcs_path(
+            gcs_staging_dir
         )
-        return self.package_and_copy(copy_method=copy_method)
+        blob_path = "-".join(
+            [
+                "aiplatform",
+                self.get_content_hash(),
+                f"{self._ROOT_MODULE}-{self._SETUP_PY_VERSION}.tar.gz",
+            ]
+        )
+        if gcs_blob_prefix:
+            blob_path = "/".join([gcs_blob_prefix, blob_path])
+        gcs_path = f"gs://{gcs_bucket}/{blob_path}"
+
+        with self._stored_package_gcs_paths_lock:
+            is_stored = gcs_path in self._stored_package_gcs_paths
+        if is_stored:
+            _LOGGER.info("Reusing training script package:\n%s." % gcs_path)
+            return gcs_path
+
+        client = gcs_utils._get_storage_client(project=project, credentials=credentials)
+        blob = client.bucket(gcs_bucket).blob(blob_path)
+        if blob.exists():
+            _LOGGER.info("Reusing training script package:\n%s." % gcs_path)
+        else:
+            with tempfile.TemporaryDirectory() as tmpdirname:
+                source_distribution_path = self.make_package(tmpdirname)
+                blob.upload_from_filename(source_distribution_path)
+            _LOGGER.info("Training script copied to:\n%s." % gcs_path)
+
+        with self._stored_package_gcs_paths_lock:
+            self._stored_package_gcs_paths.add(gcs_path)
+        return gcs_path
+
+
+def _is_ignored(name: str) -> bool:
+    """Returns whether a file or directory is left out of packages."""
+    return name in _IGNORED_NAMES or name.endswith(_IGNORED_SUFFIXES)
+
+
+def _exclude_ignored_files(tar_info: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+    """Filters the files added to the source distribution."""
+    if _is_ignored(os.path.basename(tar_info.name)):
+        return None
+    return tar_info
@@ -190,6 +190,14 @@ def unit(session):
     default(session)
 
 
+@nox.session(python=DEFAULT_PYTHON_VERSION)
+def benchmark(session):
+    """Run the benchmark scripts, which print their timings without asserting."""
+    session.install("-e", ".")
+    for script in sorted(CURRENT_DIRECTORY.glob("tests/benchmarks/benchmark_*.py")):
+        session.run("python", str(script), *session.posargs)
+
+
 def install_systemtest_dependencies(session, *constraints):
 
     # Use pre-release gRPC for system tests.
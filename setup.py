@@ -139,6 +139,7 @@ testing_extra_require = (
         "grpcio-testing",
         "ipython",
         "kfp",
+        "msgpack",
         "pyfakefs",
         "pytest-asyncio",
         "pytest-xdist",
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures the import time of the SDK entry points with `python -X importtime`.
+
+Usage:
+    python tests/benchmarks/benchmark_import_time.py [--repeat N]
+
+Each statement runs in a new interpreter. The fastest total self time and the
+number of imported modules are printed and not asserted.
+"""
+
+import argparse
+import subprocess
+import sys
+
+_STATEMENTS = [
+    "import google.cloud.aiplatform",
+    "import vertexai",
+    "import vertexai.preview",
+]
+
+
+def _profile_import(statement: str):
+    """Returns the total self time in microseconds and the number of modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_self_time = 0
+    num_modules = 0
+    # Lines look like "import time:   self |  cumulative |   module".
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, _ = line[len("import time:") :].split("|")
+        if self_time.strip().isdigit():
+            total_self_time += int(self_time)
+            num_modules += 1
+    return total_self_time, num_modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for statement in _STATEMENTS:
+        profiles = [_profile_import(statement) for _ in range(args.repeat)]
+        total_self_time, num_modules = min(profiles)
+        print(f"{statement}: {total_self_time / 1000:.1f} ms, {num_modules} modules")
+
+
+if __name__ == "__main__":
+    main()
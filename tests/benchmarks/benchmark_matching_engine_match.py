@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares the client CPU time of match_array with match.
+
+Usage:
+    python tests/benchmarks/benchmark_matching_engine_match.py [--repeat N]
+
+The BatchMatch calls are replaced by prebuilt responses, so only building the
+requests and converting the responses is timed. Timings are printed and not
+asserted.
+"""
+
+import argparse
+import timeit
+from unittest import mock
+
+import numpy as np
+
+from google.cloud.aiplatform.matching_engine import matching_engine_index_endpoint
+from google.cloud.aiplatform.matching_engine._protos import match_service_pb2
+
+_DEPLOYED_INDEX_ID = "benchmark_deployed_index"
+_NUM_QUERIES = 1000
+_DIMENSIONS = 768
+_NUM_NEIGHBORS = 10
+
+
+def _make_response(num_queries: int) -> match_service_pb2.BatchMatchResponse:
+    match_response = match_service_pb2.MatchResponse(
+        neighbor=[
+            match_service_pb2.MatchResponse.Neighbor(id=str(i), distance=float(i))
+            for i in range(_NUM_NEIGHBORS)
+        ]
+    )
+    return match_service_pb2.BatchMatchResponse(
+        responses=[
+            match_service_pb2.BatchMatchResponse.BatchMatchResponsePerIndex(
+                deployed_index_id=_DEPLOYED_INDEX_ID,
+                responses=[match_response] * num_queries,
+            )
+        ]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    queries = np.random.rand(_NUM_QUERIES, _DIMENSIONS).astype(np.float32)
+    query_lists = queries.tolist()
+    responses = {}
+
+    def send_batch_match_requests(self, deployed_index_id, batch_requests, _):
+        return [
+            responses.setdefault(
+                len(request.requests[0].requests),
+                _make_response(len(request.requests[0].requests)),
+            )
+            for request in batch_requests
+        ]
+
+    index_endpoint_class = matching_engine_index_endpoint.MatchingEngineIndexEndpoint
+    index_endpoint = index_endpoint_class.__new__(index_endpoint_class)
+    candidates = {
+        "match": lambda: index_endpoint.match(
+            _DEPLOYED_INDEX_ID, query_lists, num_neighbors=_NUM_NEIGHBORS
+        ),
+        "match_array": lambda: index_endpoint.match_array(
+            _DEPLOYED_INDEX_ID, queries, num_neighbors=_NUM_NEIGHBORS
+        ),
+    }
+    with mock.patch.object(
+        index_endpoint_class, "_send_batch_match_requests", send_batch_match_requests
+    ):
+        for name, match in candidates.items():
+            # Builds the responses before timing.
+            match()
+            seconds = min(timeit.repeat(match, number=1, repeat=args.repeat))
+            print(f"{name}: {seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares the conversion of prediction values with MessageToDict.
+
+Usage:
+    python tests/benchmarks/benchmark_value_utils.py [--repeat N]
+
+The values are shaped like an embedding response: 64 predictions of 768
+floats each. Timings are printed and not asserted.
+"""
+
+import argparse
+import timeit
+
+from google.protobuf import json_format
+from google.protobuf import struct_pb2
+
+from google.cloud.aiplatform.utils import _value_utils
+
+_NUM_PREDICTIONS = 64
+_EMBEDDING_DIMENSION = 768
+
+
+def _make_values():
+    values = []
+    for _ in range(_NUM_PREDICTIONS):
+        value = struct_pb2.Value()
+        json_format.ParseDict(
+            [float(i) / 7 for i in range(_EMBEDDING_DIMENSION)], value
+        )
+        values.append(value)
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = _make_values()
+    candidates = {
+        "MessageToDict": lambda: [json_format.MessageToDict(v) for v in values],
+        "values_to_python": lambda: _value_utils.values_to_python(values),
+        "values_to_numpy": lambda: _value_utils.values_to_numpy(values),
+    }
+    for name, convert in candidates.items():
+        seconds = min(timeit.repeat(convert, number=1, repeat=args.repeat))
+        print(f"{name}: {seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,7 @@ from unittest import mock
 
 from google.cloud import aiplatform
 from google.cloud.aiplatform.utils import source_utils
+from vertexai._model_garden import _model_garden_models
 import constants as test_constants
 from google.cloud.aiplatform.metadata import constants as metadata_constants
 from google.cloud.aiplatform.compat.services import (
@@ -69,6 +70,14 @@ def google_auth_mock():
         yield google_auth_mock
 
 
+@pytest.fixture(autouse=True)
+def clear_publisher_model_cache():
+    # Keeps PublisherModel resources mocked by a test from leaking into others.
+    _model_garden_models._publisher_model_cache.clear()
+    yield
+    _model_garden_models._publisher_model_cache.clear()
+
+
 # Training job fixtures
 @pytest.fixture
 def mock_python_package_to_gcs():
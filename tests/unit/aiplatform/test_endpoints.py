@@ -16,6 +16,7 @@
 #
 
 import copy
+import numpy as np
 import pytest
 import urllib3
 import json
@@ -24,10 +25,13 @@ from unittest import mock
 from importlib import reload
 from datetime import datetime, timedelta
 
+from google.api_core import exceptions as api_exceptions
 from google.api_core import operation as ga_operation
+from google.api_core import retry as api_retry
+from google.api_core import retry_async as api_retry_async
 from google.auth import credentials as auth_credentials
 
-from google.protobuf import field_mask_pb2
+from google.protobuf import field_mask_pb2, json_format, struct_pb2
 
 from google.cloud import aiplatform
 from google.cloud.aiplatform import base
@@ -1911,6 +1915,171 @@ class TestEndpoint:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_numpy_format(self, predict_client_predict_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_prediction = test_endpoint.predict(
+            instances=_TEST_INSTANCES, predictions_format="numpy"
+        )
+
+        assert isinstance(test_prediction.predictions, np.ndarray)
+        np.testing.assert_array_equal(test_prediction.predictions, _TEST_PREDICTION)
+        assert test_prediction.deployed_model_id == _TEST_ID
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_proto_format(self, predict_client_predict_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_prediction = test_endpoint.predict(
+            instances=_TEST_INSTANCES, predictions_format="proto"
+        )
+
+        assert all(
+            isinstance(prediction, struct_pb2.Value)
+            for prediction in test_prediction.predictions
+        )
+        assert [
+            json_format.MessageToDict(prediction)
+            for prediction in test_prediction.predictions
+        ] == _TEST_PREDICTION
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_invalid_format_raises(self, predict_client_predict_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        with pytest.raises(ValueError, match="Unsupported predictions_format"):
+            test_endpoint.predict(instances=_TEST_INSTANCES, predictions_format="arrow")
+        predict_client_predict_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    async def test_predict_async_numpy_format(self, predict_async_client_predict_mock):
+        """Tests the Endpoint.predict_async method with numpy predictions."""
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_prediction = await test_endpoint.predict_async(
+            instances=_TEST_INSTANCES, predictions_format="numpy"
+        )
+
+        np.testing.assert_array_equal(test_prediction.predictions, _TEST_PREDICTION)
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_many(self, predict_client_predict_mock):
+        def _predict(endpoint, instances, parameters, timeout):
+            response = gca_prediction_service.PredictResponse(
+                deployed_model_id=_TEST_MODEL_ID
+            )
+            response.predictions.extend([instance[0] for instance in instances])
+            return response
+
+        predict_client_predict_mock.side_effect = _predict
+
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_predictions = list(
+            test_endpoint.predict_many(
+                instances=([float(i)] for i in range(10)),
+                parameters={"param": 3.0},
+                max_instances_per_request=3,
+                max_concurrent_requests=2,
+            )
+        )
+
+        assert [len(p.predictions) for p in test_predictions] == [3, 3, 3, 1]
+        assert [value for p in test_predictions for value in p.predictions] == [
+            float(i) for i in range(10)
+        ]
+        assert predict_client_predict_mock.call_count == 4
+        predict_client_predict_mock.assert_any_call(
+            endpoint=_TEST_ENDPOINT_NAME,
+            instances=[[0.0], [1.0], [2.0]],
+            parameters={"param": 3.0},
+            timeout=None,
+        )
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_many_splits_by_size(self, predict_client_predict_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        large_instance = "x" * 100
+        list(
+            test_endpoint.predict_many(
+                instances=[large_instance, large_instance, "y" * 300, "z"],
+                max_bytes_per_request=250,
+            )
+        )
+
+        assert [
+            call.kwargs["instances"]
+            for call in predict_client_predict_mock.call_args_list
+        ] == [[large_instance, large_instance], ["y" * 300], ["z"]]
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_many_retries_failed_requests(self, predict_client_predict_mock):
+        response = predict_client_predict_mock.return_value
+        predict_client_predict_mock.side_effect = [
+            api_exceptions.ResourceExhausted("Quota exceeded."),
+            response,
+        ]
+
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_predictions = list(
+            test_endpoint.predict_many(
+                instances=_TEST_INSTANCES,
+                retry=api_retry.Retry(
+                    predicate=api_retry.if_exception_type(
+                        api_exceptions.ResourceExhausted
+                    ),
+                    initial=0.01,
+                ),
+            )
+        )
+
+        assert len(test_predictions) == 1
+        assert test_predictions[0].predictions == _TEST_PREDICTION
+        assert predict_client_predict_mock.call_count == 2
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_many_without_retry_raises(self, predict_client_predict_mock):
+        predict_client_predict_mock.side_effect = api_exceptions.ResourceExhausted(
+            "Quota exceeded."
+        )
+
+        test_endpoint = models.Endpoint(_TEST_ID)
+        with pytest.raises(api_exceptions.ResourceExhausted):
+            list(test_endpoint.predict_many(instances=_TEST_INSTANCES, retry=None))
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    async def test_predict_many_async(self, predict_async_client_predict_mock):
+        """Tests the Endpoint.predict_many_async method."""
+        predict_async_client_predict_mock.side_effect = [
+            api_exceptions.ServiceUnavailable("Unavailable."),
+            predict_async_client_predict_mock.return_value,
+            predict_async_client_predict_mock.return_value,
+        ]
+
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_predictions = [
+            prediction
+            async for prediction in test_endpoint.predict_many_async(
+                instances=_TEST_INSTANCES,
+                parameters={"param": 3.0},
+                max_instances_per_request=1,
+                max_concurrent_requests=1,
+                retry=api_retry_async.AsyncRetry(
+                    predicate=api_retry.if_exception_type(
+                        api_exceptions.ServiceUnavailable
+                    ),
+                    initial=0.01,
+                ),
+            )
+        ]
+
+        assert [p.predictions for p in test_predictions] == [_TEST_PREDICTION] * 2
+        assert predict_async_client_predict_mock.call_count == 3
+        predict_async_client_predict_mock.assert_called_with(
+            endpoint=_TEST_ENDPOINT_NAME,
+            instances=[_TEST_INSTANCES[1]],
+            parameters={"param": 3.0},
+            timeout=None,
+        )
+
     @pytest.mark.usefixtures("get_endpoint_mock")
     def test_explain(self, predict_client_explain_mock):
 
@@ -25,7 +25,9 @@ from unittest import mock
 from importlib import reload
 from unittest.mock import MagicMock, patch
 
+from google.api_core import exceptions as api_exceptions
 from google.api_core import operation
+from google.api_core import retry as api_retry
 from google.protobuf import field_mask_pb2, timestamp_pb2
 
 from google.cloud import aiplatform
@@ -2128,6 +2130,25 @@ class TestEntityType:
         for my_entity_type in my_entity_type_list:
             assert isinstance(my_entity_type, aiplatform.EntityType)
 
+    @pytest.mark.parametrize(
+        "featurestore_name", [_TEST_FEATURESTORE_NAME, _TEST_FEATURESTORE_ID]
+    )
+    def test_list_iter_entity_type(self, featurestore_name, list_entity_types_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_entity_type_iter = aiplatform.EntityType.list_iter(
+            featurestore_name=featurestore_name, page_size=100
+        )
+
+        list_entity_types_mock.assert_not_called()
+        my_entity_type_list = list(my_entity_type_iter)
+        list_entity_types_mock.assert_called_once_with(
+            request={"parent": _TEST_FEATURESTORE_NAME, "page_size": 100}
+        )
+        assert len(my_entity_type_list) == len(_TEST_ENTITY_TYPE_LIST)
+        for my_entity_type in my_entity_type_list:
+            assert isinstance(my_entity_type, aiplatform.EntityType)
+
     @pytest.mark.usefixtures("get_entity_type_mock")
     def test_list_features(self, list_features_mock):
         aiplatform.init(project=_TEST_PROJECT)
@@ -2705,6 +2726,68 @@ class TestEntityType:
         assert result.entity_id[0] == _TEST_READ_ENTITY_ID
         assert result.get(_TEST_FEATURE_ID)[0] == _TEST_FEATURE_VALUE
 
+    @pytest.mark.usefixtures("get_entity_type_mock", "get_feature_mock")
+    def test_read_more_than_100_entities(self, streaming_read_feature_values_mock):
+        def _streaming_read(request, metadata, timeout):
+            return [
+                gca_featurestore_online_service.ReadFeatureValuesResponse(
+                    header=_get_header_proto(feature_ids=[_TEST_FEATURE_ID])
+                )
+            ] + [
+                gca_featurestore_online_service.ReadFeatureValuesResponse(
+                    entity_view=_get_entity_view_proto(
+                        entity_id=entity_id,
+                        feature_value_types=[_TEST_FEATURE_VALUE_TYPE],
+                        feature_values=[int(entity_id)],
+                    ),
+                )
+                for entity_id in request.entity_ids
+            ]
+
+        streaming_read_feature_values_mock.side_effect = _streaming_read
+        entity_ids = [str(i) for i in range(250)]
+
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        result = my_entity_type.read(entity_ids=entity_ids)
+
+        assert streaming_read_feature_values_mock.call_count == 3
+        assert sorted(
+            len(call.kwargs["request"].entity_ids)
+            for call in streaming_read_feature_values_mock.call_args_list
+        ) == [50, 100, 100]
+        assert result.entity_id.tolist() == entity_ids
+        assert result.get(_TEST_FEATURE_ID).tolist() == list(range(250))
+
+    @pytest.mark.usefixtures("get_entity_type_mock", "get_feature_mock")
+    def test_read_record_batches(self, streaming_read_feature_values_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        record_batches = list(
+            my_entity_type.read_record_batches(
+                entity_ids=_TEST_READ_ENTITY_IDS * 3,
+                feature_ids=_TEST_FEATURE_ID,
+                batch_size=2,
+            )
+        )
+
+        assert streaming_read_feature_values_mock.call_count == 2
+        assert len(record_batches) == 2
+        assert record_batches[0].schema.names == ["entity_id", _TEST_FEATURE_ID]
+        assert record_batches[0].column(0).to_pylist() == [_TEST_READ_ENTITY_ID]
+        assert record_batches[0].column(1).to_pylist() == [_TEST_FEATURE_VALUE]
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_read_record_batches_invalid_batch_size(self):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        with pytest.raises(ValueError):
+            next(
+                my_entity_type.read_record_batches(
+                    entity_ids=_TEST_READ_ENTITY_IDS, batch_size=101
+                )
+            )
+
     @pytest.mark.usefixtures("get_entity_type_mock")
     @pytest.mark.parametrize(
         "instance, entity_id, expected_feature_values",
@@ -3120,6 +3203,129 @@ class TestEntityType:
             ],
         )
 
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_write_feature_values_dataframe_matches_dict(
+        self, write_feature_values_mock
+    ):
+        df = pd.DataFrame(
+            data={
+                "bool_feature": [True, False, True],
+                "int_feature": [1, 2, 3],
+                "double_feature": [1.5, 2.5, 3.5],
+                "string_feature": ["a", "b", "c"],
+                "array_feature": [[1.0, 2.0], [3.0], [4.0, 5.0]],
+                "feature_timestamp": [
+                    _TEST_FEATURE_TIME_DATETIME_UTC,
+                    None,
+                    _TEST_FEATURE_TIME_DATETIME_UTC,
+                ],
+            },
+            index=["entity_1", "entity_2", "entity_3"],
+        )
+
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type.write_feature_values(
+            instances=df, feature_time="feature_timestamp"
+        )
+
+        expected_payloads = my_entity_type._generate_payloads(
+            instances=df.astype(object).where(df.notna(), None).to_dict(orient="index"),
+            feature_time="feature_timestamp",
+        )
+        write_feature_values_mock.assert_called_once_with(
+            entity_type=my_entity_type.resource_name,
+            payloads=expected_payloads,
+        )
+
+    def test_generate_payloads_from_dataframe_converts_uint64_by_value(self):
+        df = pd.DataFrame(
+            data={"uint32_feature": [1, 2], "uint64_feature": [1, 2**63]},
+            index=["entity_1", "entity_2"],
+        ).astype({"uint32_feature": "uint32", "uint64_feature": "uint64"})
+
+        with mock.patch.object(
+            aiplatform.EntityType,
+            "_convert_value_to_gapic_feature_value",
+            wraps=aiplatform.EntityType._convert_value_to_gapic_feature_value,
+        ) as convert_mock, pytest.raises(ValueError):
+            aiplatform.EntityType._generate_payloads_from_dataframe(df)
+
+        # The uint32 column is converted in bulk, and the uint64 value that does
+        # not fit in an int64 raises like in the per-value conversion.
+        assert [call.kwargs["feature_id"] for call in convert_mock.call_args_list] == [
+            "uint64_feature",
+            "uint64_feature",
+        ]
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_write_feature_values_in_concurrent_batches(
+        self, write_feature_values_mock
+    ):
+        df = pd.DataFrame(
+            data={"int_feature": list(range(10))},
+            index=[f"entity_{i}" for i in range(10)],
+        )
+
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type.write_feature_values(
+            instances=df,
+            feature_time=_TEST_FEATURE_TIME_DATETIME_UTC,
+            max_payloads_per_request=3,
+            max_concurrent_requests=2,
+        )
+
+        assert write_feature_values_mock.call_count == 4
+        written_payloads = sorted(
+            (
+                payload
+                for call in write_feature_values_mock.call_args_list
+                for payload in call.kwargs["payloads"]
+            ),
+            key=lambda payload: int(payload.feature_values["int_feature"].int64_value),
+        )
+        assert [payload.entity_id for payload in written_payloads] == list(df.index)
+        assert all(
+            payload.feature_values["int_feature"].metadata.generate_time
+            == _TEST_FEATURE_TIME_DATETIME_UTC
+            for payload in written_payloads
+        )
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_write_feature_values_retries(self, write_feature_values_mock):
+        write_feature_values_mock.side_effect = [
+            api_exceptions.ServiceUnavailable("Unavailable."),
+            gca_featurestore_online_service.WriteFeatureValuesResponse(),
+        ]
+
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type.write_feature_values(
+            instances={"entity_1": {"int_feature": 1}},
+            retry=api_retry.Retry(
+                predicate=api_retry.if_exception_type(
+                    api_exceptions.ServiceUnavailable
+                ),
+                initial=0.01,
+            ),
+        )
+
+        assert write_feature_values_mock.call_count == 2
+
+    def test_split_payloads_by_feature_value_count(self):
+        payload = gca_featurestore_online_service.WriteFeatureValuesPayload(
+            entity_id="entity",
+            feature_values={
+                f"feature_{i}": gca_featurestore_online_service.FeatureValue(
+                    int64_value=i
+                )
+                for i in range(40_000)
+            },
+        )
+        batches = aiplatform.EntityType._split_payloads(payloads=[payload] * 5)
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
     @pytest.mark.usefixtures("get_entity_type_mock")
     @pytest.mark.parametrize(
         "feature_id, test_value, expected_feature_value",
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import importlib
+import subprocess
+import sys
+from typing import Dict
+
+from google.cloud import aiplatform
+
+import pytest
+
+# Modules that must only be imported when one of their names is first used.
+_AIPLATFORM_LAZY_MODULES = [
+    "google.cloud.aiplatform.datasets",
+    "google.cloud.aiplatform.featurestore",
+    "google.cloud.aiplatform.matching_engine",
+    "google.cloud.aiplatform.pipeline_job_schedules",
+    "google.cloud.aiplatform.tensorboard.uploader_tracker",
+    "google.cloud.aiplatform.training_jobs",
+]
+_VERTEXAI_LAZY_MODULES = [
+    "vertexai.language_models",
+    "vertexai.preview",
+    "vertexai.vision_models",
+]
+# Importing vertexai loads about a quarter of the modules that importing its
+# subpackages eagerly does. Module counts, unlike timings, are deterministic.
+_MAX_LAZY_IMPORT_MODULE_RATIO = 0.5
+
+
+def _profile_import(statement: str) -> Dict[str, int]:
+    """Runs a statement in a new interpreter with `-X importtime`.
+
+    Returns:
+        A dict mapping the imported module names to their cumulative import
+        time, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    # Lines look like "import time:   self |  cumulative |   module", where the
+    # module name is indented by the nesting level of the import.
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            import_times[module[1:].rstrip()] = int(cumulative)
+    return import_times
+
+
+class TestImportTime:
+    def test_import_aiplatform_does_not_import_resource_modules(self):
+        imported_modules = {
+            module.strip()
+            for module in _profile_import("import google.cloud.aiplatform")
+        }
+
+        assert "google.cloud.aiplatform" in imported_modules
+        for module in _AIPLATFORM_LAZY_MODULES:
+            assert module not in imported_modules
+
+    def test_import_vertexai_does_not_import_subpackages(self):
+        imported_modules = {
+            module.strip() for module in _profile_import("import vertexai")
+        }
+
+        assert "vertexai" in imported_modules
+        for module in _VERTEXAI_LAZY_MODULES:
+            assert module not in imported_modules
+
+    def test_import_vertexai_imports_fewer_modules_than_eager_import(self):
+        lazy_modules = _profile_import("import vertexai")
+        eager_modules = _profile_import("import vertexai.preview")
+
+        assert len(lazy_modules) < _MAX_LAZY_IMPORT_MODULE_RATIO * len(eager_modules)
+
+    @pytest.mark.parametrize("name", sorted(aiplatform._LAZY_ATTRIBUTES))
+    def test_lazy_attribute_resolves_to_definition(self, name):
+        module_name, attribute_path = aiplatform._LAZY_ATTRIBUTES[name]
+        expected = importlib.import_module(module_name)
+        for attribute in filter(None, attribute_path.split(".")):
+            expected = getattr(expected, attribute)
+
+        # Bound methods, like `log_params`, are equal but not identical.
+        assert getattr(aiplatform, name) == expected
+        assert name in dir(aiplatform)
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            aiplatform.not_a_name
@@ -345,6 +345,98 @@ class TestInit:
         assert initializer.global_config.credentials is creds
 
 
+@pytest.mark.usefixtures("google_auth_mock")
+class TestClientCache:
+    def setup_method(self):
+        importlib.reload(initializer)
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+    def teardown_method(self):
+        initializer.global_pool.shutdown(wait=True)
+
+    def test_create_client_reuses_client(self):
+        client = initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride
+        )
+        assert client is initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride
+        )
+        assert initializer.global_client_cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "size": 1,
+        }
+
+    def test_create_client_keys_on_options_and_credentials(self):
+        client = initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride
+        )
+        other_clients = [
+            initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride,
+                location_override=_TEST_LOCATION_2,
+            ),
+            initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride,
+                credentials=credentials.AnonymousCredentials(),
+            ),
+            initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride,
+                appended_user_agent=["fake_user_agent"],
+            ),
+            initializer.global_config.create_client(
+                client_class=utils.EndpointClientWithOverride
+            ),
+        ]
+        assert all(other_client is not client for other_client in other_clients)
+        assert initializer.global_client_cache.stats()["misses"] == 5
+
+    def test_create_client_does_not_cache_async_client(self):
+        client = initializer.global_config.create_client(
+            client_class=utils.PredictionAsyncClientWithOverride
+        )
+        assert client is not initializer.global_config.create_client(
+            client_class=utils.PredictionAsyncClientWithOverride
+        )
+        assert initializer.global_client_cache.stats()["size"] == 0
+
+    def test_temporary_client_reuses_gapic_client(self):
+        client = initializer.global_config.create_client(
+            client_class=utils.DatasetClientWithOverride
+        )
+        with mock.patch.object(
+            utils.DatasetClientWithOverride.get_gapic_client_class(),
+            "__init__",
+            autospec=True,
+            return_value=None,
+        ) as init_mock:
+            client.dataset_path
+            client.select_version("v1beta1").dataset_path
+            client.dataset_path
+
+        # One GAPIC client per version.
+        assert init_mock.call_count == 1
+        assert initializer.global_client_cache.stats()["misses"] == 3
+
+    def test_client_cache_evicts_least_recently_used(self):
+        cache = initializer._ClientCache(max_size=2)
+        cache.get_or_create(("a",), object)
+        cache.get_or_create(("b",), object)
+        client_a = cache.get_or_create(("a",), object)
+        cache.get_or_create(("c",), object)
+
+        assert cache.get_or_create(("a",), object) is client_a
+        assert cache.stats() == {"hits": 2, "misses": 3, "evictions": 1, "size": 2}
+
+    def test_client_cache_is_cleared_in_forked_process(self):
+        cache = initializer._ClientCache()
+        client = cache.get_or_create(("a",), object)
+        with mock.patch.object(os, "getpid", return_value=os.getpid() + 1):
+            assert cache.get_or_create(("a",), object) is not client
+        assert cache.stats()["misses"] == 2
+
+
 class TestThreadPool:
     def teardown_method(self):
         initializer.global_pool.shutdown(wait=True)
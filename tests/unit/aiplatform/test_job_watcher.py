@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import datetime
+from importlib import reload
+from unittest import mock
+
+import pytest
+
+from google.cloud import aiplatform
+from google.cloud.aiplatform import _job_watcher
+from google.cloud.aiplatform import jobs
+from google.cloud.aiplatform.compat.services import job_service_client
+from google.cloud.aiplatform.compat.types import (
+    batch_prediction_job as gca_batch_prediction_job_compat,
+    custom_job as gca_custom_job_compat,
+    job_state as gca_job_state_compat,
+)
+
+import constants as test_constants
+
+_TEST_PROJECT = test_constants.ProjectConstants._TEST_PROJECT
+_TEST_LOCATION = test_constants.ProjectConstants._TEST_LOCATION
+_TEST_PARENT = test_constants.ProjectConstants._TEST_PARENT
+
+_TEST_CUSTOM_JOB_NAMES = [f"{_TEST_PARENT}/customJobs/{i}" for i in range(3)]
+_TEST_BATCH_PREDICTION_JOB_NAME = f"{_TEST_PARENT}/batchPredictionJobs/4"
+
+_TEST_NOW = datetime.datetime(2023, 10, 1, tzinfo=datetime.timezone.utc)
+_TEST_CREATE_TIME = _TEST_NOW - datetime.timedelta(minutes=1)
+_TEST_UPDATE_TIMES = [_TEST_NOW - datetime.timedelta(seconds=i) for i in range(3)]
+
+_TEST_JOB_STATE_RUNNING = gca_job_state_compat.JobState.JOB_STATE_RUNNING
+_TEST_JOB_STATE_SUCCEEDED = gca_job_state_compat.JobState.JOB_STATE_SUCCEEDED
+_TEST_JOB_STATE_FAILED = gca_job_state_compat.JobState.JOB_STATE_FAILED
+
+
+def _make_custom_job(name, state, update_time=_TEST_UPDATE_TIMES[0]):
+    return gca_custom_job_compat.CustomJob(
+        name=name,
+        state=state,
+        create_time=_TEST_CREATE_TIME,
+        update_time=update_time,
+    )
+
+
+@pytest.fixture
+def get_custom_job_mock():
+    with mock.patch.object(
+        job_service_client.JobServiceClient, "get_custom_job"
+    ) as get_custom_job_mock:
+        get_custom_job_mock.side_effect = lambda name, **_: _make_custom_job(
+            name,
+            _TEST_JOB_STATE_RUNNING,
+            _TEST_UPDATE_TIMES[_TEST_CUSTOM_JOB_NAMES.index(name)],
+        )
+        yield get_custom_job_mock
+
+
+@pytest.fixture
+def list_custom_jobs_mock():
+    with mock.patch.object(
+        job_service_client.JobServiceClient, "list_custom_jobs"
+    ) as list_custom_jobs_mock:
+        yield list_custom_jobs_mock
+
+
+@pytest.fixture
+def get_batch_prediction_job_mock():
+    with mock.patch.object(
+        job_service_client.JobServiceClient, "get_batch_prediction_job"
+    ) as get_batch_prediction_job_mock:
+        get_batch_prediction_job_mock.return_value = (
+            gca_batch_prediction_job_compat.BatchPredictionJob(
+                name=_TEST_BATCH_PREDICTION_JOB_NAME,
+                state=_TEST_JOB_STATE_RUNNING,
+            )
+        )
+        yield get_batch_prediction_job_mock
+
+
+@pytest.fixture
+def list_batch_prediction_jobs_mock():
+    with mock.patch.object(
+        job_service_client.JobServiceClient, "list_batch_prediction_jobs"
+    ) as list_batch_prediction_jobs_mock:
+        list_batch_prediction_jobs_mock.return_value = [
+            gca_batch_prediction_job_compat.BatchPredictionJob(
+                name=_TEST_BATCH_PREDICTION_JOB_NAME,
+                state=_TEST_JOB_STATE_SUCCEEDED,
+            )
+        ]
+        yield list_batch_prediction_jobs_mock
+
+
+@pytest.fixture
+def sleep_mock():
+    # Sleeping advances a fake clock instead of waiting.
+    clock = [_TEST_NOW.timestamp()]
+
+    def _sleep(secs):
+        clock[0] += secs
+
+    with mock.patch("time.time", side_effect=lambda: clock[0]), mock.patch(
+        "time.sleep", side_effect=_sleep
+    ) as sleep_mock:
+        yield sleep_mock
+
+
+@pytest.mark.usefixtures("google_auth_mock", "get_custom_job_mock")
+class TestJobWatcher:
+    def setup_method(self):
+        reload(aiplatform.initializer)
+        reload(aiplatform)
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+    def teardown_method(self):
+        aiplatform.initializer.global_pool.shutdown(wait=True)
+
+    def _get_custom_jobs(self):
+        return [jobs.CustomJob.get(name) for name in _TEST_CUSTOM_JOB_NAMES]
+
+    def test_as_completed_lists_jobs_once_per_poll(
+        self, get_custom_job_mock, list_custom_jobs_mock, sleep_mock
+    ):
+        custom_jobs = self._get_custom_jobs()
+        list_custom_jobs_mock.side_effect = [
+            [_make_custom_job(_TEST_CUSTOM_JOB_NAMES[1], _TEST_JOB_STATE_SUCCEEDED)],
+            [
+                _make_custom_job(_TEST_CUSTOM_JOB_NAMES[0], _TEST_JOB_STATE_RUNNING),
+                _make_custom_job(_TEST_CUSTOM_JOB_NAMES[2], _TEST_JOB_STATE_FAILED),
+            ],
+            [_make_custom_job(_TEST_CUSTOM_JOB_NAMES[0], _TEST_JOB_STATE_SUCCEEDED)],
+        ]
+
+        completed_jobs = list(aiplatform.as_completed(custom_jobs))
+
+        assert completed_jobs == [custom_jobs[1], custom_jobs[2], custom_jobs[0]]
+        assert completed_jobs[1]._gca_resource.state == _TEST_JOB_STATE_FAILED
+        assert list_custom_jobs_mock.call_count == 3
+        assert get_custom_job_mock.call_count == len(custom_jobs)
+        list_custom_jobs_mock.assert_any_call(
+            request={
+                "parent": _TEST_PARENT,
+                "filter": 'update_time>="2023-09-30T23:59:58.000000Z"',
+            }
+        )
+        assert sleep_mock.call_count == 2
+
+    def test_wait_all_lists_each_kind_of_job(
+        self,
+        list_custom_jobs_mock,
+        get_batch_prediction_job_mock,
+        list_batch_prediction_jobs_mock,
+    ):
+        custom_job = self._get_custom_jobs()[0]
+        batch_prediction_job = jobs.BatchPredictionJob(_TEST_BATCH_PREDICTION_JOB_NAME)
+        list_custom_jobs_mock.return_value = [
+            _make_custom_job(_TEST_CUSTOM_JOB_NAMES[0], _TEST_JOB_STATE_SUCCEEDED)
+        ]
+
+        completed_jobs = aiplatform.wait_all([custom_job, batch_prediction_job])
+
+        assert completed_jobs == [custom_job, batch_prediction_job]
+        list_custom_jobs_mock.assert_called_once()
+        # Jobs without an update time are listed without a filter.
+        list_batch_prediction_jobs_mock.assert_called_once_with(
+            request={"parent": _TEST_PARENT}
+        )
+
+    def test_wait_all_raises_on_timeout(self, list_custom_jobs_mock, sleep_mock):
+        list_custom_jobs_mock.return_value = []
+
+        with pytest.raises(TimeoutError):
+            aiplatform.wait_all(self._get_custom_jobs(), timeout=1)
+
+        list_custom_jobs_mock.assert_called_once()
+        sleep_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_all_async(self, list_custom_jobs_mock):
+        custom_jobs = self._get_custom_jobs()
+        list_custom_jobs_mock.return_value = [
+            _make_custom_job(name, _TEST_JOB_STATE_SUCCEEDED)
+            for name in _TEST_CUSTOM_JOB_NAMES
+        ]
+
+        completed_jobs = await aiplatform.wait_all_async(custom_jobs)
+
+        assert completed_jobs == custom_jobs
+        list_custom_jobs_mock.assert_called_once()
+
+    def test_poll_interval_grows_with_job_age(self, list_custom_jobs_mock):
+        list_custom_jobs_mock.return_value = []
+        custom_jobs = self._get_custom_jobs()
+        now = _TEST_NOW.timestamp()
+
+        with mock.patch("time.time", return_value=now):
+            watcher = _job_watcher.JobWatcher(custom_jobs)
+            assert watcher.poll() == []
+        # The jobs were created a minute ago, so they are polled 6 seconds later.
+        assert watcher.next_poll_time == now + 6
+
+        with mock.patch("time.time", return_value=now + 3600):
+            assert watcher.poll() == []
+        assert watcher.next_poll_time == now + 3600 + _job_watcher._MAX_POLL_INTERVAL
+
+    @pytest.mark.parametrize(
+        "elapsed_secs, min_interval, expected_interval",
+        [(0, None, 5), (100, None, 10), (10000, None, 60), (0, 1, 1), (0, 120, 120)],
+    )
+    def test_get_poll_interval(self, elapsed_secs, min_interval, expected_interval):
+        assert (
+            _job_watcher.get_poll_interval(elapsed_secs, min_interval=min_interval)
+            == expected_interval
+        )
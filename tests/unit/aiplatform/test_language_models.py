@@ -24,7 +24,11 @@ from unittest import mock
 from urllib import request as urllib_request
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
+from google.api_core import exceptions as api_exceptions
+from google.api_core import retry as api_retry
+from google.api_core import retry_async as api_retry_async
 from google.cloud import storage
 
 from google.cloud import aiplatform
@@ -337,6 +341,23 @@ _TEST_TEXT_EMBEDDING_PREDICTION = {
     }
 }
 
+
+def _make_text_embedding_response(instances, **kwargs):
+    """Embeds every text "<i>" of a request as a vector of i."""
+    gca_predict_response = gca_prediction_service.PredictResponse()
+    for instance in instances:
+        value = float(instance["content"])
+        gca_predict_response.predictions.append(
+            {
+                "embeddings": {
+                    "values": [value] * 4,
+                    "statistics": {"truncated": False, "token_count": 1.0},
+                }
+            }
+        )
+    return gca_predict_response
+
+
 _TEST_COUNT_TOKENS_RESPONSE = {
     "total_tokens": 5,
     "total_billable_characters": 25,
@@ -1387,6 +1408,57 @@ class TestLanguageModels:
             response.candidates[0].text == _TEST_TEXT_GENERATION_PREDICTION["content"]
         )
 
+    def test_text_generation_prediction_cache(self):
+        """Tests serving deterministic text generation from the cache."""
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+        )
+        with mock.patch.object(
+            target=model_garden_service_client.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_BISON_PUBLISHER_MODEL_DICT
+            ),
+        ):
+            model = language_models.TextGenerationModel.from_pretrained(
+                "text-bison@001"
+            )
+        cache = preview_language_models.InMemoryPredictionCache()
+        assert model.enable_prediction_cache(cache) is model
+
+        gca_predict_response = gca_prediction_service.PredictResponse()
+        gca_predict_response.predictions.append(_TEST_TEXT_GENERATION_PREDICTION)
+
+        with mock.patch.object(
+            target=prediction_service_client.PredictionServiceClient,
+            attribute="predict",
+            return_value=gca_predict_response,
+        ) as mock_predict:
+            responses = [
+                model.predict("What is the meaning of life?", temperature=0)
+                for _ in range(3)
+            ]
+            assert mock_predict.call_count == 1
+
+            # Sampled responses are not cached.
+            model.predict("What is the meaning of life?", temperature=0.5)
+            model.predict("What is the meaning of life?", temperature=0.5)
+            assert mock_predict.call_count == 3
+
+            model.disable_prediction_cache()
+            model.predict("What is the meaning of life?", temperature=0)
+            assert mock_predict.call_count == 4
+
+        for response in responses:
+            assert response.text == _TEST_TEXT_GENERATION_PREDICTION["content"]
+            assert (
+                response.safety_attributes["Violent"]
+                == _TEST_TEXT_GENERATION_PREDICTION["safetyAttributes"]["scores"][0]
+            )
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 1)
+
     @pytest.mark.asyncio
     async def test_text_generation_async(self):
         """Tests the text generation model."""
@@ -2880,6 +2952,163 @@ class TestLanguageModels:
                 assert len(vector) == _TEXT_EMBEDDING_VECTOR_LENGTH
                 assert vector == _TEST_TEXT_EMBEDDING_PREDICTION["embeddings"]["values"]
 
+    @pytest.mark.asyncio
+    async def test_text_embedding_prediction_cache(self):
+        """Tests serving embeddings from the cache."""
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+        )
+        with mock.patch.object(
+            target=model_garden_service_client.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_EMBEDDING_GECKO_PUBLISHER_MODEL_DICT
+            ),
+        ):
+            model = language_models.TextEmbeddingModel.from_pretrained(
+                "textembedding-gecko@001"
+            )
+        model.enable_prediction_cache()
+
+        with mock.patch.object(
+            target=prediction_service_client.PredictionServiceClient,
+            attribute="predict",
+            side_effect=_make_text_embedding_response,
+        ) as mock_predict, mock.patch.object(
+            target=prediction_service_async_client.PredictionServiceAsyncClient,
+            attribute="predict",
+            side_effect=_make_text_embedding_response,
+        ) as mock_predict_async:
+            embeddings = model.get_embeddings(["1", "2"])
+            cached_embeddings = model.get_embeddings(["1", "2"])
+            cached_async_embeddings = await model.get_embeddings_async(["1", "2"])
+            model.get_embeddings(["1", "2"], auto_truncate=False)
+
+        assert mock_predict.call_count == 2
+        mock_predict_async.assert_not_called()
+        for results in (cached_embeddings, cached_async_embeddings):
+            assert [embedding.values for embedding in results] == [
+                embedding.values for embedding in embeddings
+            ]
+            assert results[0].statistics == embeddings[0].statistics
+
+    def test_text_embedding_iter(self):
+        """Tests embedding texts in chunks of concurrent requests."""
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+        )
+        with mock.patch.object(
+            target=model_garden_service_client.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_EMBEDDING_GECKO_PUBLISHER_MODEL_DICT
+            ),
+        ):
+            model = language_models.TextEmbeddingModel.from_pretrained(
+                "textembedding-gecko@001"
+            )
+
+        calls = []
+
+        def _predict(instances, **kwargs):
+            calls.append(instances)
+            # Fails the first request with a quota error to be retried.
+            if len(calls) == 1:
+                raise api_exceptions.ResourceExhausted("Quota exceeded.")
+            return _make_text_embedding_response(instances)
+
+        with mock.patch.object(
+            target=prediction_service_client.PredictionServiceClient,
+            attribute="predict",
+            side_effect=_predict,
+        ):
+            embeddings = list(
+                model.get_embeddings_iter(
+                    (str(i) for i in range(10)),
+                    max_instances_per_request=4,
+                    max_concurrent_requests=2,
+                    retry=api_retry.Retry(initial=0.01, maximum=0.01),
+                )
+            )
+
+        assert len(calls) == 4
+        assert [len(matrix) for matrix in embeddings] == [4, 4, 2]
+        for matrix in embeddings:
+            assert matrix.dtype == np.float32
+            assert matrix.shape[1] == 4
+        np.testing.assert_array_equal(
+            np.concatenate(embeddings)[:, 0], np.arange(10, dtype=np.float32)
+        )
+
+    def test_text_embedding_iter_splits_by_tokens(self):
+        """Tests that requests are limited by the estimated number of tokens."""
+        chunks = list(
+            _language_models._chunk_text_embedding_instances(
+                ["1" * 30, "2" * 30, "3" * 30, "4"],
+                max_instances=10,
+                max_tokens=25,
+            )
+        )
+        assert [len(chunk) for chunk in chunks] == [2, 2]
+        assert chunks[1][1] == {"content": "4"}
+
+        chunks = list(
+            _language_models._chunk_text_embedding_instances(
+                ["1" * 300, "2"], max_instances=10, max_tokens=25
+            )
+        )
+        assert [len(chunk) for chunk in chunks] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_text_embedding_iter_async(self):
+        """Tests embedding texts in chunks of concurrent async requests."""
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+        )
+        with mock.patch.object(
+            target=model_garden_service_client.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_EMBEDDING_GECKO_PUBLISHER_MODEL_DICT
+            ),
+        ):
+            model = language_models.TextEmbeddingModel.from_pretrained(
+                "textembedding-gecko@001"
+            )
+
+        calls = []
+
+        async def _predict(instances, **kwargs):
+            calls.append(instances)
+            if len(calls) == 1:
+                raise api_exceptions.ResourceExhausted("Quota exceeded.")
+            return _make_text_embedding_response(instances)
+
+        with mock.patch.object(
+            target=prediction_service_async_client.PredictionServiceAsyncClient,
+            attribute="predict",
+            side_effect=_predict,
+        ):
+            embeddings = [
+                matrix
+                async for matrix in model.get_embeddings_iter_async(
+                    [str(i) for i in range(10)],
+                    auto_truncate=False,
+                    max_instances_per_request=3,
+                    retry=api_retry_async.AsyncRetry(initial=0.01, maximum=0.01),
+                )
+            ]
+
+        assert len(calls) == 5
+        assert [len(matrix) for matrix in embeddings] == [3, 3, 3, 1]
+        np.testing.assert_array_equal(
+            np.concatenate(embeddings)[:, 0], np.arange(10, dtype=np.float32)
+        )
+        assert embeddings[0].dtype == np.float32
+
     def test_batch_prediction(
         self,
         get_endpoint_mock,
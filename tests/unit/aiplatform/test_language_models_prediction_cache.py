@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+from unittest import mock
+
+from vertexai.language_models import _prediction_cache
+
+import pytest
+
+_TEST_MODEL_NAME = "projects/123/locations/us-central1/publishers/google/models/x"
+_TEST_RESPONSE = {"predictions": [{"content": "42"}], "deployed_model_id": ""}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def create_cache(request, tmp_path):
+    def _create_cache(**kwargs):
+        if request.param == "memory":
+            return _prediction_cache.InMemoryPredictionCache(**kwargs)
+        return _prediction_cache.SqlitePredictionCache(
+            os.path.join(tmp_path, "cache", "predictions.sqlite"), **kwargs
+        )
+
+    return _create_cache
+
+
+class TestPredictionCache:
+    def test_make_cache_key(self):
+        key = _prediction_cache.make_cache_key(
+            _TEST_MODEL_NAME, [{"content": "a"}], {"temperature": 0.0, "topK": 1}
+        )
+
+        assert key == _prediction_cache.make_cache_key(
+            _TEST_MODEL_NAME, [{"content": "a"}], {"topK": 1, "temperature": 0.0}
+        )
+        assert key != _prediction_cache.make_cache_key(
+            _TEST_MODEL_NAME, [{"content": "b"}], {"temperature": 0.0, "topK": 1}
+        )
+        assert key != _prediction_cache.make_cache_key(
+            _TEST_MODEL_NAME + "2", [{"content": "a"}], {"temperature": 0.0, "topK": 1}
+        )
+
+    def test_get_and_put(self, create_cache):
+        cache = create_cache()
+
+        assert cache.get("key") is None
+        cache.put("key", _TEST_RESPONSE)
+
+        assert cache.get("key") == _TEST_RESPONSE
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 0)
+        assert stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self, create_cache):
+        cache = create_cache(max_entries=2)
+        with mock.patch("time.time", side_effect=range(100)):
+            cache.put("a", _TEST_RESPONSE)
+            cache.put("b", _TEST_RESPONSE)
+            cache.get("a")
+            cache.put("c", _TEST_RESPONSE)
+
+            assert cache.get("b") is None
+            assert cache.get("a") == _TEST_RESPONSE
+            assert cache.get("c") == _TEST_RESPONSE
+        assert cache.stats().evictions == 1
+
+    def test_expires_responses(self, create_cache):
+        cache = create_cache(ttl_secs=10)
+        with mock.patch("time.time", return_value=100):
+            cache.put("key", _TEST_RESPONSE)
+        with mock.patch("time.time", return_value=105):
+            assert cache.get("key") == _TEST_RESPONSE
+        with mock.patch("time.time", return_value=110):
+            assert cache.get("key") is None
+
+    def test_clear(self, create_cache):
+        cache = create_cache()
+        cache.put("key", _TEST_RESPONSE)
+
+        cache.clear()
+
+        assert cache.get("key") is None
+
+    def test_sqlite_cache_persists(self, tmp_path):
+        path = os.path.join(tmp_path, "predictions.sqlite")
+        cache = _prediction_cache.SqlitePredictionCache(path)
+        cache.put("key", _TEST_RESPONSE)
+        cache.close()
+
+        cache = _prediction_cache.SqlitePredictionCache(path)
+        assert cache.get("key") == _TEST_RESPONSE
+        cache.close()
+
+    def test_invalid_max_entries_raises(self):
+        with pytest.raises(ValueError):
+            _prediction_cache.InMemoryPredictionCache(max_entries=0)
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 
 import uuid
 from importlib import reload
@@ -24,6 +25,7 @@ from google.api_core import operation
 from google.cloud import aiplatform
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.matching_engine import matching_engine_index_endpoint
 from google.cloud.aiplatform.matching_engine._protos import match_service_pb2
 from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint import (
     Namespace,
@@ -45,6 +47,7 @@ import constants as test_constants
 from google.protobuf import field_mask_pb2
 
 import grpc
+import numpy as np
 
 import pytest
 
@@ -892,6 +895,274 @@ class TestMatchingEngineIndexEndpoint:
 
         index_endpoint_match_queries_mock.assert_called_with(batch_request)
 
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_queries_reuses_channels(
+        self, index_endpoint_match_queries_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        with patch.object(
+            grpc, "insecure_channel", wraps=grpc.insecure_channel
+        ) as insecure_channel_mock:
+            for _ in range(3):
+                my_index_endpoint.match(
+                    deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                    queries=_TEST_QUERIES,
+                    num_neighbors=_TEST_NUM_NEIGHBOURS,
+                )
+
+        assert (
+            insecure_channel_mock.call_count
+            == matching_engine_index_endpoint._DEFAULT_MATCH_CHANNEL_POOL_SIZE
+        )
+        assert index_endpoint_match_queries_mock.call_count == 3
+
+    def test_index_endpoint_match_queries_from_list(
+        self,
+        get_index_endpoint_mock,
+        list_index_endpoints_mock,
+        index_endpoint_match_queries_mock,
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        list_index_endpoints_mock.return_value = [get_index_endpoint_mock.return_value]
+
+        (my_index_endpoint,) = aiplatform.MatchingEngineIndexEndpoint.list()
+        neighbors = my_index_endpoint.match(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=_TEST_QUERIES,
+            num_neighbors=_TEST_NUM_NEIGHBOURS,
+        )
+
+        index_endpoint_match_queries_mock.assert_called_once()
+        assert len(neighbors) == 1
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_sync_gca_resource_closes_match_channels(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+        pool = my_index_endpoint._get_match_channel_pool(_TEST_DEPLOYED_INDEX_ID)
+
+        with patch.object(pool, "close") as close_mock:
+            my_index_endpoint._sync_gca_resource()
+
+        close_mock.assert_called_once_with()
+        assert (
+            my_index_endpoint._get_match_channel_pool(_TEST_DEPLOYED_INDEX_ID)
+            is not pool
+        )
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_queries_split_into_batches(
+        self, index_endpoint_match_queries_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        queries = [[float(i), 0.0] for i in range(5)]
+        neighbors = my_index_endpoint.match(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=queries,
+            num_neighbors=_TEST_NUM_NEIGHBOURS,
+            max_queries_per_request=2,
+            max_concurrent_requests=3,
+        )
+
+        assert index_endpoint_match_queries_mock.call_count == 3
+        sent_queries = sorted(
+            [list(request.float_val) for request in call.args[0].requests[0].requests]
+            for call in index_endpoint_match_queries_mock.call_args_list
+        )
+        assert sent_queries == [queries[0:2], queries[2:4], queries[4:5]]
+        assert len(neighbors) == 3
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_array(self, index_endpoint_match_queries_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        ids, distances = my_index_endpoint.match_array(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=np.array(_TEST_QUERIES),
+            num_neighbors=2,
+            filter=_TEST_FILTER,
+        )
+
+        index_endpoint_match_queries_mock.assert_called_once_with(
+            my_index_endpoint._build_batch_match_request(
+                _TEST_DEPLOYED_INDEX_ID, _TEST_QUERIES, 2, _TEST_FILTER
+            )
+        )
+        assert ids.shape == distances.shape == (1, 2)
+        assert distances.dtype == np.float32
+        assert ids.tolist() == [["1", ""]]
+        assert distances[0, 0] == np.float32(0.1)
+        assert np.isnan(distances[0, 1])
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_array_split_into_batches(
+        self, index_endpoint_match_queries_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        queries = np.arange(10, dtype=np.float32).reshape(5, 2)
+        ids, distances = my_index_endpoint.match_array(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=queries,
+            num_neighbors=_TEST_NUM_NEIGHBOURS,
+            max_queries_per_request=2,
+        )
+
+        sent_requests = sorted(
+            (call.args[0] for call in index_endpoint_match_queries_mock.call_args_list),
+            key=lambda request: request.requests[0].requests[0].float_val[0],
+        )
+        assert sent_requests == [
+            my_index_endpoint._build_batch_match_request(
+                _TEST_DEPLOYED_INDEX_ID,
+                queries[start : start + 2].tolist(),
+                _TEST_NUM_NEIGHBOURS,
+                [],
+            )
+            for start in (0, 2, 4)
+        ]
+        assert ids.shape == distances.shape == (3, _TEST_NUM_NEIGHBOURS)
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_array_invalid_shape(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        with pytest.raises(ValueError):
+            my_index_endpoint.match_array(
+                deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                queries=np.array(_TEST_QUERIES[0]),
+            )
+
+    def test_build_batch_match_request_from_array(self):
+        queries = np.random.rand(1000, 768).astype(np.float32)
+        index_endpoint_class = aiplatform.MatchingEngineIndexEndpoint
+
+        assert index_endpoint_class._build_batch_match_request_from_array(
+            _TEST_DEPLOYED_INDEX_ID, queries, 10, _TEST_FILTER
+        ) == index_endpoint_class._build_batch_match_request(
+            _TEST_DEPLOYED_INDEX_ID, queries.tolist(), 10, _TEST_FILTER
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    async def test_index_endpoint_match_queries_async(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        response = match_service_pb2.BatchMatchResponse(
+            responses=[
+                match_service_pb2.BatchMatchResponse.BatchMatchResponsePerIndex(
+                    deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                    responses=[
+                        match_service_pb2.MatchResponse(
+                            neighbor=[
+                                match_service_pb2.MatchResponse.Neighbor(
+                                    id="1", distance=0.1
+                                )
+                            ]
+                        )
+                    ],
+                )
+            ]
+        )
+        with patch.object(grpc.aio, "insecure_channel") as aio_channel_mock:
+            batch_match_mock = mock.AsyncMock(return_value=response)
+            aio_channel_mock.return_value.unary_unary.return_value = batch_match_mock
+
+            neighbors = await my_index_endpoint.match_async(
+                deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                queries=_TEST_QUERIES * 2,
+                num_neighbors=_TEST_NUM_NEIGHBOURS,
+                max_queries_per_request=1,
+            )
+            await my_index_endpoint.match_async(
+                deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                queries=_TEST_QUERIES,
+                num_neighbors=_TEST_NUM_NEIGHBOURS,
+            )
+
+        assert (
+            aio_channel_mock.call_count
+            == matching_engine_index_endpoint._DEFAULT_MATCH_CHANNEL_POOL_SIZE
+        )
+        assert batch_match_mock.await_count == 3
+        assert (
+            neighbors
+            == [[matching_engine_index_endpoint.MatchNeighbor(id="1", distance=0.1)]]
+            * 2
+        )
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_async_closes_channels_of_previous_loop(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+        try:
+            with patch.object(grpc.aio, "insecure_channel") as aio_channel_mock:
+                aio_channel_mock.return_value.close = mock.AsyncMock()
+                aio_channel_mock.return_value.unary_unary.return_value = mock.AsyncMock(
+                    return_value=match_service_pb2.BatchMatchResponse(
+                        responses=[
+                            match_service_pb2.BatchMatchResponse.BatchMatchResponsePerIndex(
+                                deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                                responses=[match_service_pb2.MatchResponse()],
+                            )
+                        ]
+                    )
+                )
+                for loop in loops:
+                    loop.run_until_complete(
+                        my_index_endpoint.match_async(
+                            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                            queries=_TEST_QUERIES,
+                        )
+                    )
+                aio_channel_mock.return_value.close.assert_not_awaited()
+
+                # The channels bound to the first loop are closed when it runs.
+                loops[0].run_until_complete(asyncio.sleep(0))
+                loops[0].run_until_complete(asyncio.sleep(0))
+        finally:
+            for loop in loops:
+                loop.close()
+
+        assert (
+            aio_channel_mock.return_value.close.await_count
+            == matching_engine_index_endpoint._DEFAULT_MATCH_CHANNEL_POOL_SIZE
+        )
+
     @pytest.mark.usefixtures("get_index_public_endpoint_mock")
     def test_index_public_endpoint_match_queries(
         self, index_public_endpoint_match_queries_mock
@@ -933,6 +1204,49 @@ class TestMatchingEngineIndexEndpoint:
             find_neighbors_request
         )
 
+    @pytest.mark.usefixtures("get_index_public_endpoint_mock")
+    def test_index_public_endpoint_find_neighbors_array(
+        self, index_public_endpoint_match_queries_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_pubic_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        ids, distances = my_pubic_index_endpoint.find_neighbors_array(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=np.array(_TEST_QUERIES, dtype=np.float32),
+            num_neighbors=_TEST_NUM_NEIGHBOURS,
+            filter=_TEST_FILTER,
+        )
+
+        find_neighbors_request = gca_match_service_v1beta1.FindNeighborsRequest(
+            index_endpoint=my_pubic_index_endpoint.resource_name,
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=[
+                gca_match_service_v1beta1.FindNeighborsRequest.Query(
+                    neighbor_count=_TEST_NUM_NEIGHBOURS,
+                    datapoint=gca_index_v1beta1.IndexDatapoint(
+                        feature_vector=_TEST_QUERIES[0],
+                        restricts=[
+                            gca_index_v1beta1.IndexDatapoint.Restriction(
+                                namespace="class",
+                                allow_list=["token_1"],
+                                deny_list=["token_2"],
+                            )
+                        ],
+                    ),
+                )
+            ],
+        )
+
+        index_public_endpoint_match_queries_mock.assert_called_with(
+            find_neighbors_request
+        )
+        assert ids.tolist() == [["1"]]
+        assert distances.tolist() == [[np.float32(0.1)]]
+
     @pytest.mark.usefixtures("get_index_public_endpoint_mock")
     def test_index_public_endpoint_read_index_datapoints(
         self, index_public_endpoint_read_index_datapoints_mock
@@ -17,6 +17,7 @@
 
 import os
 import copy
+import datetime
 from importlib import reload
 from unittest import mock
 from unittest.mock import patch, call
@@ -65,6 +66,9 @@ from google.cloud.aiplatform.compat.types import (
 from google.cloud.aiplatform.compat.types import (
     tensorboard_time_series as gca_tensorboard_time_series,
 )
+from google.cloud.aiplatform.compat.types import (
+    tensorboard_service as gca_tensorboard_service,
+)
 from google.cloud.aiplatform.metadata import constants
 from google.cloud.aiplatform.metadata import experiment_resources
 from google.cloud.aiplatform.metadata import experiment_run_resource
@@ -949,6 +953,7 @@ _EXPERIMENT_RUN_MOCK_POPULATED_1.metadata[constants._METRIC_KEY].update(_TEST_ME
 _EXPERIMENT_RUN_MOCK_POPULATED_2 = copy.deepcopy(
     _EXPERIMENT_RUN_MOCK_WITH_PARENT_EXPERIMENT
 )
+_EXPERIMENT_RUN_MOCK_POPULATED_2.name = _TEST_OTHER_EXPERIMENT_RUN_CONTEXT_NAME
 _EXPERIMENT_RUN_MOCK_POPULATED_2.display_name = _TEST_OTHER_RUN
 _EXPERIMENT_RUN_MOCK_POPULATED_2.metadata[constants._PARAM_KEY].update(
     _TEST_OTHER_PARAMS
@@ -1083,12 +1088,23 @@ def create_tensorboard_run_artifact_mock():
 
 @pytest.fixture
 def get_tensorboard_run_artifact_mock():
+    # Runs are queried concurrently, so artifacts are returned by name.
+    artifacts = {
+        experiment_run_resource.ExperimentRun._tensorboard_run_id(
+            _TEST_EXECUTION_ID
+        ): _TEST_TENSORBOARD_RUN_ARTIFACT,
+        experiment_run_resource.ExperimentRun._v1_format_artifact_name(
+            _TEST_EXECUTION_ID
+        ): _TEST_LEGACY_METRIC_ARTIFACT,
+    }
+
+    def _get_artifact(name, **kwargs):
+        if name.split("/")[-1] in artifacts:
+            return artifacts[name.split("/")[-1]]
+        raise exceptions.NotFound("")
+
     with patch.object(MetadataServiceClient, "get_artifact") as get_artifact_mock:
-        get_artifact_mock.side_effect = [
-            _TEST_TENSORBOARD_RUN_ARTIFACT,
-            exceptions.NotFound(""),
-            _TEST_LEGACY_METRIC_ARTIFACT,
-        ]
+        get_artifact_mock.side_effect = _get_artifact
         yield get_artifact_mock
 
 
@@ -1729,6 +1745,70 @@ class TestExperiments:
             time_series_data=ts_data,
         )
 
+    @pytest.mark.usefixtures(
+        "get_metadata_store_mock",
+        "get_experiment_mock",
+        "create_experiment_run_context_mock",
+        "add_context_children_mock",
+        "get_tensorboard_mock",
+        "get_tensorboard_run_not_found_mock",
+        "get_tensorboard_experiment_not_found_mock",
+        "get_artifact_not_found_mock",
+        "get_tensorboard_time_series_not_found_mock",
+        "list_tensorboard_time_series_mock_empty",
+        "update_context_mock",
+        "create_tensorboard_experiment_mock",
+        "create_tensorboard_run_mock",
+        "create_tensorboard_run_artifact_mock",
+        "add_context_artifacts_and_executions_mock",
+        "create_tensorboard_time_series_mock",
+        "batch_read_tensorboard_time_series_mock",
+    )
+    def test_log_time_series_metrics_async(self, write_tensorboard_run_data_mock):
+        tb = aiplatform.Tensorboard(
+            test_constants.TensorboardConstants._TEST_TENSORBOARD_NAME
+        )
+
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            experiment=_TEST_EXPERIMENT,
+            experiment_tensorboard=tb,
+        )
+
+        aiplatform.start_run(_TEST_RUN).enable_async_logging()
+        timestamp = utils.get_timestamp_proto()
+        aiplatform.log_time_series_metrics(
+            _TEST_OTHER_METRICS, step=1, wall_time=timestamp
+        )
+        aiplatform.log_time_series_metrics(
+            _TEST_OTHER_METRICS, step=2, wall_time=timestamp
+        )
+        write_tensorboard_run_data_mock.assert_not_called()
+
+        aiplatform.end_run()
+
+        ts_data = [
+            gca_tensorboard_data.TimeSeriesData(
+                tensorboard_time_series_id=test_constants.TensorboardConstants._TEST_TENSORBOARD_TIME_SERIES_ID,
+                value_type=gca_tensorboard_time_series.TensorboardTimeSeries.ValueType.SCALAR,
+                values=[
+                    gca_tensorboard_data.TimeSeriesDataPoint(
+                        scalar=gca_tensorboard_data.Scalar(value=value),
+                        wall_time=timestamp,
+                        step=step,
+                    )
+                    for step in (1, 2)
+                ],
+            )
+            for value in _TEST_OTHER_METRICS.values()
+        ]
+
+        write_tensorboard_run_data_mock.assert_called_once_with(
+            tensorboard_run=test_constants.TensorboardConstants._TEST_TENSORBOARD_RUN_NAME,
+            time_series_data=ts_data,
+        )
+
     @pytest.mark.usefixtures(
         "get_metadata_store_mock",
         "get_experiment_mock",
@@ -2027,6 +2107,103 @@ class TestExperiments:
         with pytest.raises(ValueError):
             aiplatform.get_experiment_df(_TEST_EXPERIMENT)
 
+    @pytest.mark.usefixtures("get_experiment_mock", "get_artifact_not_found_mock")
+    def test_get_experiment_df_cache(self, tmp_path):
+        completed_run = copy.deepcopy(_EXPERIMENT_RUN_MOCK_POPULATED_1)
+        completed_run.metadata[
+            constants._STATE_KEY
+        ] = gca_execution.Execution.State.COMPLETE.name
+        completed_run.update_time = utils.get_timestamp_proto()
+        running_run = copy.deepcopy(_EXPERIMENT_RUN_MOCK_POPULATED_2)
+        running_run.update_time = completed_run.update_time
+        cache_path = str(tmp_path / "experiment_cache.json")
+
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        experiment = aiplatform.Experiment(_TEST_EXPERIMENT)
+
+        with patch.object(
+            MetadataServiceClient,
+            "list_contexts",
+            return_value=[completed_run, running_run],
+        ), patch.object(MetadataServiceClient, "list_executions", return_value=[]):
+            experiment_df = experiment.get_data_frame(cache_path=cache_path)
+
+            with patch.object(
+                experiment_run_resource.ExperimentRun,
+                "_query_experiment_row",
+                wraps=experiment_run_resource.ExperimentRun._query_experiment_row,
+            ) as query_experiment_row_mock:
+                cached_experiment_df = experiment.get_data_frame(cache_path=cache_path)
+
+                # Only the running run is queried again.
+                query_experiment_row_mock.assert_called_once()
+                assert (
+                    query_experiment_row_mock.call_args.args[0].resource_name
+                    == running_run.name
+                )
+
+                completed_run.update_time = (
+                    completed_run.update_time + datetime.timedelta(seconds=1)
+                )
+                experiment.get_data_frame(cache_path=cache_path)
+                assert query_experiment_row_mock.call_count == 3
+
+        _assert_frame_equal_with_sorted_columns(cached_experiment_df, experiment_df)
+
+    def test_latest_time_series_metrics_reader_batches_runs(
+        self, batch_read_tensorboard_time_series_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+        def _list_time_series(tensorboard_run_name, credentials=None):
+            return [
+                mock.Mock(
+                    resource_name=f"{tensorboard_run_name}/timeSeries/{run_id}-loss",
+                    display_name="loss",
+                    gca_resource=gca_tensorboard_time_series.TensorboardTimeSeries(
+                        value_type=gca_tensorboard_time_series.TensorboardTimeSeries.ValueType.SCALAR
+                    ),
+                )
+            ]
+
+        batch_read_tensorboard_time_series_mock.return_value = (
+            gca_tensorboard_service.BatchReadTensorboardTimeSeriesDataResponse(
+                time_series_data=[
+                    gca_tensorboard_data.TimeSeriesData(
+                        tensorboard_time_series_id=f"{run_id}-loss",
+                        values=[
+                            gca_tensorboard_data.TimeSeriesDataPoint(
+                                scalar=gca_tensorboard_data.Scalar(value=value),
+                                step=step,
+                            )
+                            for step, value in enumerate((1.0, value))
+                        ],
+                    )
+                    for run_id, value in ((_TEST_RUN, 0.5), (_TEST_OTHER_RUN, 0.25))
+                ]
+            )
+        )
+
+        reader = experiment_resources._LatestTimeSeriesMetricsReader()
+        rows = [experiment_resources._ExperimentRow() for _ in range(2)]
+        with patch.object(
+            tensorboard_resource.TensorboardTimeSeries,
+            "list",
+            side_effect=_list_time_series,
+        ):
+            for run_id, row in zip((_TEST_RUN, _TEST_OTHER_RUN), rows):
+                reader.add(
+                    f"{test_constants.TensorboardConstants._TEST_TENSORBOARD_EXPERIMENT_NAME}/runs/{run_id}",
+                    row,
+                )
+        reader.read()
+
+        batch_read_tensorboard_time_series_mock.assert_called_once()
+        assert [row.time_series_metrics for row in rows] == [
+            {"loss": 0.5},
+            {"loss": 0.25},
+        ]
+
     @pytest.mark.usefixtures(
         "get_experiment_run_with_custom_jobs_mock",
         "get_metadata_store_mock",
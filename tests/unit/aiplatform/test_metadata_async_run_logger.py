@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+from unittest import mock
+
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.metadata import _async_run_logger
+
+import pytest
+
+_TEST_WALL_TIME = utils.get_timestamp_proto()
+# Long enough for the interval not to trigger writes during a test.
+_TEST_LONG_FLUSH_INTERVAL_SECS = 600
+
+
+def _create_logger(**kwargs):
+    writers = mock.Mock()
+    logger = _async_run_logger.AsyncRunLogger(
+        write_params=writers.write_params,
+        write_metrics=writers.write_metrics,
+        write_time_series_metrics=writers.write_time_series_metrics,
+        **{"flush_interval_secs": _TEST_LONG_FLUSH_INTERVAL_SECS, **kwargs},
+    )
+    return logger, writers
+
+
+class TestAsyncRunLogger:
+    def test_flush_coalesces_params_and_metrics(self):
+        logger, writers = _create_logger()
+
+        logger.log_params({"learning_rate": 0.1, "dropout": 0.2})
+        logger.log_params({"learning_rate": 0.01})
+        logger.log_metrics({"accuracy": 0.8})
+        logger.log_metrics({"accuracy": 0.9, "recall": 0.7})
+        logger.flush()
+
+        writers.write_params.assert_called_once_with(
+            {"learning_rate": 0.01, "dropout": 0.2}
+        )
+        writers.write_metrics.assert_called_once_with({"accuracy": 0.9, "recall": 0.7})
+        writers.write_time_series_metrics.assert_not_called()
+        logger.close()
+
+    def test_flush_batches_time_series_steps(self):
+        logger, writers = _create_logger(max_batch_points=4)
+
+        logger.log_time_series_metrics({"loss": 0.5}, 1, _TEST_WALL_TIME)
+        logger.log_time_series_metrics({"accuracy": 0.5}, 1, _TEST_WALL_TIME)
+        logger.log_time_series_metrics({"loss": 0.4}, 2, _TEST_WALL_TIME)
+        logger.log_time_series_metrics({"loss": 0.3}, 2, _TEST_WALL_TIME)
+        logger.flush()
+
+        writers.write_time_series_metrics.assert_called_once_with(
+            [
+                ({"loss": 0.5, "accuracy": 0.5}, 1, _TEST_WALL_TIME),
+                ({"loss": 0.3}, 2, _TEST_WALL_TIME),
+            ]
+        )
+        logger.close()
+
+    def test_write_when_batch_is_full(self):
+        written = threading.Event()
+        logger, writers = _create_logger(max_batch_points=2)
+        writers.write_time_series_metrics.side_effect = lambda _: written.set()
+
+        logger.log_time_series_metrics({"loss": 0.5}, 1, _TEST_WALL_TIME)
+        logger.log_time_series_metrics({"loss": 0.4}, 2, _TEST_WALL_TIME)
+
+        assert written.wait(timeout=10)
+        writers.write_time_series_metrics.assert_called_once_with(
+            [({"loss": 0.5}, 1, _TEST_WALL_TIME), ({"loss": 0.4}, 2, _TEST_WALL_TIME)]
+        )
+        logger.close()
+
+    def test_write_on_interval(self):
+        written = threading.Event()
+        logger, writers = _create_logger(flush_interval_secs=0.01)
+        writers.write_metrics.side_effect = lambda _: written.set()
+
+        logger.log_metrics({"accuracy": 0.9})
+
+        assert written.wait(timeout=10)
+        writers.write_metrics.assert_called_once_with({"accuracy": 0.9})
+        logger.close()
+
+    def test_log_time_series_metrics_blocks_when_buffer_is_full(self):
+        write_started = threading.Event()
+        resume_write = threading.Event()
+        logger, writers = _create_logger(max_batch_points=1, max_pending_points=1)
+
+        def _write_time_series_metrics(_):
+            write_started.set()
+            resume_write.wait(timeout=10)
+
+        writers.write_time_series_metrics.side_effect = _write_time_series_metrics
+
+        # The first step is being written, the second one fills the buffer.
+        logger.log_time_series_metrics({"loss": 0.5}, 1, _TEST_WALL_TIME)
+        assert write_started.wait(timeout=10)
+        logger.log_time_series_metrics({"loss": 0.4}, 2, _TEST_WALL_TIME)
+
+        third_step_logged = threading.Event()
+
+        def _log_third_step():
+            logger.log_time_series_metrics({"loss": 0.3}, 3, _TEST_WALL_TIME)
+            third_step_logged.set()
+
+        thread = threading.Thread(target=_log_third_step)
+        thread.start()
+        assert not third_step_logged.wait(timeout=0.1)
+
+        resume_write.set()
+        assert third_step_logged.wait(timeout=10)
+        thread.join()
+        logger.close()
+
+        assert writers.write_time_series_metrics.call_count == 3
+
+    def test_flush_raises_write_error_once(self):
+        logger, writers = _create_logger()
+        writers.write_metrics.side_effect = RuntimeError("write failed")
+
+        logger.log_metrics({"accuracy": 0.9})
+        with pytest.raises(RuntimeError, match="write failed"):
+            logger.flush()
+
+        writers.write_metrics.side_effect = None
+        logger.log_metrics({"accuracy": 0.95})
+        logger.flush()
+        writers.write_metrics.assert_called_with({"accuracy": 0.95})
+        logger.close()
+
+    def test_flush_writes_values_of_failed_write(self):
+        logger, writers = _create_logger()
+        writers.write_metrics.side_effect = [RuntimeError("write failed"), None]
+
+        logger.log_params({"learning_rate": 0.1})
+        logger.log_metrics({"accuracy": 0.9, "loss": 0.1})
+        logger.log_time_series_metrics({"loss": 0.5}, step=1, wall_time=_TEST_WALL_TIME)
+        logger.log_time_series_metrics({"loss": 0.4}, step=2, wall_time=_TEST_WALL_TIME)
+        with pytest.raises(RuntimeError, match="write failed"):
+            logger.flush()
+        writers.write_time_series_metrics.assert_not_called()
+
+        logger.log_metrics({"accuracy": 0.95})
+        logger.log_time_series_metrics(
+            {"accuracy": 0.6}, step=2, wall_time=_TEST_WALL_TIME
+        )
+        logger.flush()
+
+        writers.write_params.assert_called_once_with({"learning_rate": 0.1})
+        writers.write_metrics.assert_called_with({"accuracy": 0.95, "loss": 0.1})
+        writers.write_time_series_metrics.assert_called_once_with(
+            [
+                ({"loss": 0.5}, 1, _TEST_WALL_TIME),
+                ({"loss": 0.4, "accuracy": 0.6}, 2, _TEST_WALL_TIME),
+            ]
+        )
+        logger.close()
+
+    def test_flush_retries_values_without_new_logs(self):
+        logger, writers = _create_logger()
+        writers.write_params.side_effect = [RuntimeError("write failed"), None]
+
+        logger.log_params({"learning_rate": 0.1})
+        with pytest.raises(RuntimeError, match="write failed"):
+            logger.flush()
+        logger.flush()
+
+        assert writers.write_params.call_args_list == [
+            mock.call({"learning_rate": 0.1}),
+            mock.call({"learning_rate": 0.1}),
+        ]
+        logger.close()
+
+    def test_close_writes_buffered_values(self):
+        logger, writers = _create_logger()
+
+        logger.log_params({"learning_rate": 0.1})
+        logger.close()
+
+        writers.write_params.assert_called_once_with({"learning_rate": 0.1})
+        with pytest.raises(RuntimeError):
+            logger.log_params({"learning_rate": 0.2})
+        # Closing again is a no-op.
+        logger.close()
+
+    def test_invalid_batch_size_raises(self):
+        with pytest.raises(ValueError):
+            _create_logger(max_batch_points=0)
@@ -1169,3 +1169,24 @@ class TestArtifact:
         assert artifact_list[0]._gca_resource == expected_artifact
         # pylint: disable-next=protected-access
         assert artifact_list[1]._gca_resource == expected_artifact
+
+    def test_list_iter_artifacts(self, list_artifacts_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        artifact_iter = artifact.Artifact.list_iter(
+            filter="test-filter",
+            metadata_store_id=_TEST_METADATA_STORE,
+            page_size=100,
+        )
+
+        list_artifacts_mock.assert_not_called()
+        artifact_list = list(artifact_iter)
+        list_artifacts_mock.assert_called_once_with(
+            request={
+                "parent": _TEST_PARENT,
+                "filter": "test-filter",
+                "page_size": 100,
+            }
+        )
+        assert len(artifact_list) == 2
+        assert all(isinstance(a, artifact.Artifact) for a in artifact_list)
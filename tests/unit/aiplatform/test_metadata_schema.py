@@ -404,6 +404,21 @@ class TestMetadataBaseArtifactSchema:
             }
         )
 
+    def test_list_iter_artifacts(self, list_artifacts_mock):
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+        class TestArtifact(base_artifact.BaseArtifactSchema):
+            schema_title = _TEST_SCHEMA_TITLE
+
+        list(TestArtifact.list_iter(filter="test-filter", page_size=100))
+        list_artifacts_mock.assert_called_once_with(
+            request={
+                "parent": f"{_TEST_PARENT}/metadataStores/default",
+                "filter": f'test-filter AND schema_title="{_TEST_SCHEMA_TITLE}"',
+                "page_size": 100,
+            }
+        )
+
 
 @pytest.mark.usefixtures("google_auth_mock")
 class TestMetadataBaseExecutionSchema:
@@ -104,3 +104,96 @@ class TestModelGardenModels:
 
             with pytest.raises(ValueError):
                 self.FakeModelGardenModel.from_pretrained("text-bison@001")
+
+    def test_from_pretrained_caches_publisher_model(self):
+        """Tests that the PublisherModel is fetched once per project and location."""
+        aiplatform.init(
+            project=test_constants.ProjectConstants._TEST_PROJECT,
+            location=test_constants.ProjectConstants._TEST_LOCATION,
+        )
+        with mock.patch.object(
+            target=model_garden_service_client_v1.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_BISON_PUBLISHER_MODEL_DICT
+            ),
+        ) as mock_get_publisher_model, mock.patch.object(
+            self.FakeModelGardenModel,
+            "_LAUNCH_STAGE",
+            _model_garden_models._SDK_PUBLIC_PREVIEW_LAUNCH_STAGE,
+        ):
+            self.FakeModelGardenModel.from_pretrained("text-bison@001")
+            model = self.FakeModelGardenModel.from_pretrained("text-bison@001")
+            assert mock_get_publisher_model.call_count == 1
+
+            aiplatform.init(location="europe-west4")
+            other_model = self.FakeModelGardenModel.from_pretrained("text-bison@001")
+            assert mock_get_publisher_model.call_count == 2
+
+        assert model._endpoint_name == (
+            f"projects/{test_constants.ProjectConstants._TEST_PROJECT}/locations/"
+            f"{test_constants.ProjectConstants._TEST_LOCATION}/publishers/google/"
+            "models/text-bison@001"
+        )
+        assert "europe-west4" in other_model._endpoint_name
+
+    def test_publisher_model_cache_expires(self):
+        aiplatform.init(
+            project=test_constants.ProjectConstants._TEST_PROJECT,
+            location=test_constants.ProjectConstants._TEST_LOCATION,
+        )
+        cache = _model_garden_models._PublisherModelCache(ttl_secs=10)
+        with mock.patch.object(
+            target=model_garden_service_client_v1.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_BISON_PUBLISHER_MODEL_DICT
+            ),
+        ) as mock_get_publisher_model:
+            with mock.patch("time.time", return_value=100):
+                cache.get("publishers/google/models/text-bison@001")
+            with mock.patch("time.time", return_value=105):
+                cache.get("publishers/google/models/text-bison@001")
+            assert mock_get_publisher_model.call_count == 1
+            with mock.patch("time.time", return_value=110):
+                cache.get("publishers/google/models/text-bison@001")
+            assert mock_get_publisher_model.call_count == 2
+
+    def test_publisher_model_cache_dir(self, tmp_path):
+        aiplatform.init(
+            project=test_constants.ProjectConstants._TEST_PROJECT,
+            location=test_constants.ProjectConstants._TEST_LOCATION,
+        )
+        with mock.patch.object(
+            target=model_garden_service_client_v1.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_BISON_PUBLISHER_MODEL_DICT
+            ),
+        ) as mock_get_publisher_model:
+            _model_garden_models._PublisherModelCache(cache_dir=str(tmp_path)).get(
+                "publishers/google/models/text-bison@001"
+            )
+            # A new process reuses the resource from the cache directory.
+            resource = _model_garden_models._PublisherModelCache(
+                cache_dir=str(tmp_path)
+            ).get("publishers/google/models/text-bison@001")
+
+        mock_get_publisher_model.assert_called_once()
+        assert resource == gca_publisher_model.PublisherModel(
+            _TEXT_BISON_PUBLISHER_MODEL_DICT
+        )
+
+    def test_get_model_class_from_schema_uri(self):
+        from vertexai.preview import language_models as preview_language_models
+
+        assert (
+            _model_garden_models._get_model_class_from_schema_uri(
+                _TEXT_BISON_PUBLISHER_MODEL_DICT["predict_schemata"][
+                    "instance_schema_uri"
+                ]
+            )
+            is preview_language_models.TextGenerationModel
+        )
+        with pytest.raises(ValueError):
+            _model_garden_models._get_model_class_from_schema_uri("gs://unknown")
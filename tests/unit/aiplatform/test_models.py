@@ -75,6 +75,9 @@ from google.cloud.aiplatform.compat.types import (
 )
 
 from google.cloud.aiplatform.prediction import LocalModel
+from google.cloud.aiplatform_v1.services.model_service import (
+    pagers as model_service_pagers,
+)
 from google.cloud.aiplatform_v1 import Execution as GapicExecution
 from google.cloud.aiplatform.model_evaluation import model_evaluation_job
 
@@ -3450,6 +3453,46 @@ class TestModel:
             assert listed_model.versioning_registry
             assert listed_model._revisioned_resource_id_validator
 
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_list_iter(self, prefetch):
+        read_mask = field_mask_pb2.FieldMask(paths=["name", "display_name"])
+        list_next_page_mock = mock.Mock(
+            return_value=gca_model_service.ListModelsResponse(
+                models=_TEST_MODELS_LIST[2:]
+            )
+        )
+
+        def _list_models(request):
+            return model_service_pagers.ListModelsPager(
+                method=list_next_page_mock,
+                request=gca_model_service.ListModelsRequest(request),
+                response=gca_model_service.ListModelsResponse(
+                    models=_TEST_MODELS_LIST[:2], next_page_token="page-2"
+                ),
+            )
+
+        with mock.patch.object(
+            model_service_client.ModelServiceClient,
+            "list_models",
+            side_effect=_list_models,
+        ) as list_models_mock:
+
+            models_iter = models.Model.list_iter(
+                page_size=2, read_mask=read_mask, prefetch=prefetch
+            )
+            listed_models = [next(models_iter), next(models_iter)]
+            if not prefetch:
+                # The next page is only fetched once the first one is consumed.
+                list_next_page_mock.assert_not_called()
+            listed_models.extend(models_iter)
+
+        list_models_mock.assert_called_once_with(
+            request={"parent": _TEST_PARENT, "read_mask": read_mask, "page_size": 2}
+        )
+        list_next_page_mock.assert_called_once()
+        assert list_next_page_mock.call_args[0][0].page_token == "page-2"
+        assert [model._gca_resource for model in listed_models] == _TEST_MODELS_LIST
+
     @pytest.mark.usefixtures(
         "get_endpoint_mock",
         "get_model_mock",
@@ -17,15 +17,20 @@
 
 import asyncio
 import importlib
+import io
 import json
 import multiprocessing
 import os
 import pytest
 import requests
 import textwrap
+import threading
 import time
 from unittest import mock
 
+import numpy as np
+import pyarrow
+
 from fastapi import HTTPException
 from fastapi import Request
 from fastapi import Response
@@ -55,11 +60,13 @@ from google.cloud.aiplatform.prediction import DEFAULT_HTTP_PORT
 from google.cloud.aiplatform.prediction import DEFAULT_PREDICT_ROUTE
 from google.cloud.aiplatform.prediction import LocalModel
 from google.cloud.aiplatform.prediction import LocalEndpoint
+from google.cloud.aiplatform.prediction import handler as handler_module
 from google.cloud.aiplatform.prediction import handler_utils
 from google.cloud.aiplatform.prediction import local_endpoint
 from google.cloud.aiplatform.prediction import (
     model_server as model_server_module,
 )
+from google.cloud.aiplatform.prediction.batcher import MicroBatcher
 from google.cloud.aiplatform.prediction.handler import Handler
 from google.cloud.aiplatform.prediction.handler import PredictionHandler
 from google.cloud.aiplatform.prediction.model_server import CprModelServer
@@ -695,7 +702,10 @@ class TestDefaultSerializer:
         content_type = "unsupported_type"
         expected_message = (
             f"Unsupported content type of the request: {content_type}.\n"
-            f'Currently supported content-type in DefaultSerializer: "application/json".'
+            "Currently supported content-type in DefaultSerializer: "
+            '"application/json", "application/x-npy", '
+            '"application/vnd.apache.arrow.stream", "application/msgpack", '
+            '"application/x-msgpack".'
         )
         data = b'{"instances": [1, 2, 3]}'
 
@@ -753,7 +763,10 @@ class TestDefaultSerializer:
         accept = "unsupported_type"
         expected_message = (
             f"Unsupported accept of the response: {accept}.\n"
-            f'Currently supported accept in DefaultSerializer: "application/json".'
+            "Currently supported accept in DefaultSerializer: "
+            '"application/json", "application/x-npy", '
+            '"application/vnd.apache.arrow.stream", "application/msgpack", '
+            '"application/x-msgpack".'
         )
         prediction = {}
 
@@ -774,6 +787,128 @@ class TestDefaultSerializer:
         assert expected_message in exception.value.detail
 
 
+class TestDefaultSerializerBinaryFormats:
+    def test_deserialize_npy_shares_request_memory(self):
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)
+        stream = io.BytesIO()
+        np.save(stream, array)
+        data = stream.getvalue()
+
+        deserialized_data = DefaultSerializer.deserialize(
+            data, content_type="application/x-npy"
+        )
+
+        np.testing.assert_array_equal(deserialized_data, array)
+        assert deserialized_data.dtype == np.float32
+        assert not deserialized_data.flags.owndata
+
+    def test_deserialize_npy_fortran_order(self):
+        array = np.asfortranarray(np.arange(6).reshape(2, 3))
+        stream = io.BytesIO()
+        np.save(stream, array)
+
+        deserialized_data = DefaultSerializer.deserialize(
+            stream.getvalue(), content_type="application/x-npy"
+        )
+
+        np.testing.assert_array_equal(deserialized_data, array)
+
+    def test_deserialize_npy_object_array_raises_exception(self):
+        stream = io.BytesIO()
+        np.save(stream, np.array([{"a": 1}], dtype=object), allow_pickle=True)
+
+        with pytest.raises(HTTPException) as exception:
+            DefaultSerializer.deserialize(
+                stream.getvalue(), content_type="application/x-npy"
+            )
+
+        assert exception.value.status_code == 400
+        assert "arrays of Python objects are not supported" in exception.value.detail
+
+    def test_serialize_npy(self):
+        prediction = {"predictions": [1.0, 2.0]}
+
+        serialized_prediction = DefaultSerializer.serialize(
+            prediction, accept="application/x-npy"
+        )
+
+        np.testing.assert_array_equal(
+            np.load(io.BytesIO(serialized_prediction)), np.array([1.0, 2.0])
+        )
+
+    def test_deserialize_arrow_stream_columns(self):
+        table = pyarrow.table({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        deserialized_data = DefaultSerializer.deserialize(
+            sink.getvalue().to_pybytes(),
+            content_type="application/vnd.apache.arrow.stream",
+        )
+
+        np.testing.assert_array_equal(deserialized_data, [[1.0, 3.0], [2.0, 4.0]])
+
+    def test_serialize_and_deserialize_arrow_stream_fixed_size_list(self):
+        array = np.arange(6, dtype=np.float64).reshape(3, 2)
+
+        serialized_prediction = DefaultSerializer.serialize(
+            array, accept="application/vnd.apache.arrow.stream"
+        )
+        deserialized_data = DefaultSerializer.deserialize(
+            serialized_prediction, content_type="application/vnd.apache.arrow.stream"
+        )
+
+        np.testing.assert_array_equal(deserialized_data, array)
+
+    @pytest.mark.parametrize(
+        "media_type", ["application/msgpack", "application/x-msgpack"]
+    )
+    def test_serialize_and_deserialize_msgpack(self, media_type):
+        prediction = {"predictions": np.array([1, 2])}
+
+        serialized_prediction = DefaultSerializer.serialize(
+            prediction, accept=media_type
+        )
+
+        assert DefaultSerializer.deserialize(
+            serialized_prediction, content_type=media_type
+        ) == {"predictions": [1, 2]}
+
+    def test_deserialize_invalid_binary_data_raises_exception(self):
+        with pytest.raises(HTTPException) as exception:
+            DefaultSerializer.deserialize(b"invalid", content_type="application/x-npy")
+
+        assert exception.value.status_code == 400
+        assert 'Deserialization of the "application/x-npy"' in exception.value.detail
+
+    def test_serialize_application_json_numpy_values(self):
+        prediction = {"predictions": np.array([[1, 2]]), "score": np.float32(0.5)}
+
+        serialized_prediction = DefaultSerializer.serialize(
+            prediction, accept="application/json"
+        )
+
+        assert json.loads(serialized_prediction) == {
+            "predictions": [[1, 2]],
+            "score": 0.5,
+        }
+
+    @pytest.mark.parametrize(
+        "accept,expected_media_type",
+        [
+            ("application/x-npy", "application/x-npy"),
+            ("*/*", "application/json"),
+            ("application/json;q=0.5, application/x-npy", "application/x-npy"),
+            ("application/*", "application/json"),
+            ("text/html, application/msgpack;q=0.9", "application/msgpack"),
+            ("text/html", None),
+        ],
+    )
+    def test_get_media_type(self, accept, expected_media_type):
+        assert DefaultSerializer.get_media_type(accept) == expected_media_type
+
+
 class TestPredictionHandler:
     def test_init(self, predictor_mock):
         handler = PredictionHandler(_TEST_GCS_ARTIFACTS_URI, predictor=predictor_mock)
@@ -941,6 +1076,363 @@ class TestPredictionHandler:
         )
 
 
+class TestMicroBatcher:
+    @pytest.mark.asyncio
+    async def test_predict_batches_concurrent_requests(self):
+        predict_mock = mock.MagicMock(side_effect=lambda instances: instances * 2)
+        batcher = MicroBatcher(predict_mock, max_batch_size=4, max_wait_seconds=1)
+
+        results = await asyncio.gather(
+            batcher.predict(np.array([1, 2])),
+            batcher.predict(np.array([3])),
+            batcher.predict(np.array([4])),
+        )
+
+        predict_mock.assert_called_once()
+        np.testing.assert_array_equal(
+            predict_mock.call_args[0][0], np.array([1, 2, 3, 4])
+        )
+        assert [result.tolist() for result in results] == [[2, 4], [6], [8]]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_predict_splits_batches_at_max_batch_size(self):
+        predict_mock = mock.MagicMock(side_effect=lambda instances: instances)
+        batcher = MicroBatcher(predict_mock, max_batch_size=2, max_wait_seconds=1)
+
+        results = await asyncio.gather(
+            batcher.predict([[1], [2]]),
+            batcher.predict([[3]]),
+        )
+
+        assert predict_mock.call_count == 2
+        predict_mock.assert_has_calls([mock.call([[1], [2]]), mock.call([[3]])])
+        assert results == [[[1], [2]], [[3]]]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_predict_does_not_overflow_max_batch_size(self):
+        predict_mock = mock.MagicMock(side_effect=lambda instances: instances)
+        batcher = MicroBatcher(predict_mock, max_batch_size=3, max_wait_seconds=1)
+
+        results = await asyncio.gather(
+            batcher.predict([[1], [2]]),
+            batcher.predict([[3], [4]]),
+            batcher.predict([[5], [6], [7], [8]]),
+        )
+
+        predict_mock.assert_has_calls(
+            [
+                mock.call([[1], [2]]),
+                mock.call([[3], [4]]),
+                mock.call([[5], [6], [7], [8]]),
+            ]
+        )
+        assert results == [[[1], [2]], [[3], [4]], [[5], [6], [7], [8]]]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_predict_sends_partial_batch_after_max_wait(self):
+        predict_mock = mock.MagicMock(side_effect=lambda instances: instances)
+        batcher = MicroBatcher(predict_mock, max_batch_size=100, max_wait_seconds=0)
+
+        result = await batcher.predict([1])
+
+        assert result == [1]
+        predict_mock.assert_called_once_with([1])
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_predict_raises_exception_to_all_requests(self):
+        predict_mock = mock.MagicMock(side_effect=ValueError("error"))
+        batcher = MicroBatcher(predict_mock, max_batch_size=4, max_wait_seconds=1)
+
+        results = await asyncio.gather(
+            batcher.predict([1]),
+            batcher.predict([2]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_predict_fails_requests_without_length(self):
+        predict_mock = mock.MagicMock(side_effect=lambda instances: instances)
+        batcher = MicroBatcher(predict_mock, max_batch_size=4, max_wait_seconds=0)
+
+        with pytest.raises(TypeError):
+            await batcher.predict(object())
+        # The batcher keeps predicting later requests.
+        result = await batcher.predict([1])
+
+        assert result == [1]
+        predict_mock.assert_called_once_with([1])
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_pending_requests(self):
+        predict_mock = mock.MagicMock(side_effect=lambda instances: instances)
+        batcher = MicroBatcher(predict_mock, max_batch_size=4, max_wait_seconds=10)
+
+        pending_request = asyncio.ensure_future(batcher.predict([1]))
+        await asyncio.sleep(0)
+        await batcher.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await pending_request
+        predict_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_predict_raises_exception_if_results_mismatch(self):
+        predict_mock = mock.MagicMock(return_value=[1])
+        batcher = MicroBatcher(predict_mock, max_batch_size=1, max_wait_seconds=0)
+
+        with pytest.raises(ValueError) as exception:
+            await batcher.predict([1, 2])
+
+        assert "does not match the number of instances" in str(exception.value)
+        await batcher.close()
+
+    def test_init_invalid_max_batch_size_raises_exception(self):
+        with pytest.raises(ValueError):
+            MicroBatcher(mock.MagicMock(), max_batch_size=0, max_wait_seconds=0)
+
+
+class TestPredictionHandlerBatching:
+    @pytest.mark.asyncio
+    async def test_handle_batches_concurrent_requests(
+        self,
+        get_content_type_from_headers_mock,
+        get_accept_from_headers_mock,
+    ):
+        predicted_batches = []
+
+        class _BatchPredictor(Predictor):
+            def load(self, artifacts_uri):
+                pass
+
+            def preprocess(self, prediction_input):
+                return np.asarray(prediction_input["instances"])
+
+            def predict(self, instances):
+                predicted_batches.append(instances)
+                return instances.sum(axis=1)
+
+            def postprocess(self, prediction_results):
+                return {"predictions": prediction_results.tolist()}
+
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=_BatchPredictor,
+            max_batch_size=8,
+            max_batch_wait_seconds=1,
+        )
+
+        responses = await asyncio.gather(
+            handler.handle(get_test_request()),
+            handler.handle(get_test_request()),
+        )
+
+        assert len(predicted_batches) == 1
+        assert predicted_batches[0].shape == (2, 4)
+        assert [response.body for response in responses] == [
+            b'{"predictions": [10]}',
+            b'{"predictions": [10]}',
+        ]
+        await handler.close()
+
+    @pytest.mark.asyncio
+    async def test_handle_batches_instances_before_preprocess(
+        self,
+        get_content_type_from_headers_mock,
+        get_accept_from_headers_mock,
+    ):
+        class _Matrix:
+            """Preprocessed instances without a length, like xgboost's DMatrix."""
+
+            def __init__(self, instances):
+                self.data = np.asarray(instances)
+
+        preprocessed_inputs = []
+
+        class _MatrixPredictor(Predictor):
+            def load(self, artifacts_uri):
+                pass
+
+            def preprocess(self, prediction_input):
+                preprocessed_inputs.append(prediction_input)
+                return _Matrix(prediction_input["instances"])
+
+            def predict(self, instances):
+                return instances.data.sum(axis=1)
+
+            def postprocess(self, prediction_results):
+                return {"predictions": prediction_results.tolist()}
+
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=_MatrixPredictor,
+            max_batch_size=8,
+            max_batch_wait_seconds=1,
+        )
+
+        responses = await asyncio.gather(
+            handler.handle(get_test_request()),
+            handler.handle(get_test_request()),
+        )
+
+        assert preprocessed_inputs == [{"instances": [[1, 2, 3, 4], [1, 2, 3, 4]]}]
+        assert [response.body for response in responses] == [
+            b'{"predictions": [10]}',
+            b'{"predictions": [10]}',
+        ]
+        await handler.close()
+
+    @pytest.mark.asyncio
+    async def test_handle_does_not_batch_requests_with_parameters(
+        self,
+        deserialize_mock,
+        get_content_type_from_headers_mock,
+        predictor_mock,
+        get_accept_from_headers_mock,
+        serialize_mock,
+    ):
+        prediction_input = {"instances": [[1, 2, 3, 4]], "parameters": {"k": 1}}
+        deserialize_mock.return_value = prediction_input
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=predictor_mock,
+            max_batch_size=8,
+            max_batch_wait_seconds=1,
+        )
+
+        with mock.patch.object(
+            handler._batcher, "predict", autospec=True
+        ) as batcher_predict_mock:
+            await handler.handle(get_test_request())
+
+        batcher_predict_mock.assert_not_called()
+        predictor_mock().preprocess.assert_called_once_with(prediction_input)
+        await handler.close()
+
+    def test_init_without_max_batch_size_does_not_batch(self, predictor_mock):
+        handler = PredictionHandler(_TEST_GCS_ARTIFACTS_URI, predictor=predictor_mock)
+
+        assert handler._batcher is None
+
+
+class TestPredictionHandlerExecutor:
+    @pytest.mark.asyncio
+    async def test_handle_runs_predictor_off_event_loop(
+        self,
+        deserialize_mock,
+        get_content_type_from_headers_mock,
+        get_accept_from_headers_mock,
+        serialize_mock,
+    ):
+        predict_threads = []
+
+        def predict(instances):
+            predict_threads.append(threading.current_thread())
+            return _TEST_PREDICTION_OUTPUT
+
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI, predictor=get_test_predictor()
+        )
+
+        with mock.patch.object(handler._predictor, "predict", side_effect=predict):
+            response = await handler.handle(get_test_request())
+
+        assert response.status_code == 200
+        assert predict_threads[0] is not threading.main_thread()
+        assert predict_threads[0].name.startswith("predictor")
+
+    @pytest.mark.asyncio
+    async def test_handle_rejects_requests_over_max_pending_requests(
+        self,
+        deserialize_mock,
+        get_content_type_from_headers_mock,
+        get_accept_from_headers_mock,
+        serialize_mock,
+    ):
+        predict_started = threading.Event()
+        release_predict = threading.Event()
+
+        def predict(instances):
+            predict_started.set()
+            release_predict.wait()
+            return _TEST_PREDICTION_OUTPUT
+
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=get_test_predictor(),
+            max_pending_requests=1,
+        )
+
+        with mock.patch.object(handler._predictor, "predict", side_effect=predict):
+            pending_request = asyncio.ensure_future(handler.handle(get_test_request()))
+            await asyncio.get_running_loop().run_in_executor(None, predict_started.wait)
+
+            with pytest.raises(HTTPException) as exception:
+                await handler.handle(get_test_request())
+
+            release_predict.set()
+            response = await pending_request
+
+        assert exception.value.status_code == 429
+        assert response.status_code == 200
+        assert handler._pending_requests == 0
+
+    def test_init_unsupported_executor_type_raises_exception(self, predictor_mock):
+        with pytest.raises(ValueError) as exception:
+            PredictionHandler(
+                _TEST_GCS_ARTIFACTS_URI,
+                predictor=predictor_mock,
+                executor_type="unsupported",
+            )
+
+        assert 'Unsupported executor type: "unsupported"' in str(exception.value)
+
+    def test_process_predictor_functions(self, tmp_path, monkeypatch):
+        # Restores the working directory changed by _load_process_predictor.
+        monkeypatch.chdir(tmp_path)
+        predictor = mock.MagicMock()
+        predictor_class = mock.MagicMock(return_value=predictor)
+        predictor.preprocess.return_value = _TEST_DESERIALIZED_INPUT
+        predictor.predict.return_value = _TEST_PREDICTION_OUTPUT
+
+        handler_module._load_process_predictor(predictor_class, _TEST_GCS_ARTIFACTS_URI)
+        result = handler_module._run_process_predictor(
+            ("preprocess", "predict"), _TEST_INPUT
+        )
+
+        predictor.load.assert_called_once_with(_TEST_GCS_ARTIFACTS_URI)
+        predictor.preprocess.assert_called_once_with(_TEST_INPUT)
+        predictor.predict.assert_called_once_with(_TEST_DESERIALIZED_INPUT)
+        assert result == _TEST_PREDICTION_OUTPUT
+
+    def test_load_process_predictor_uses_own_working_directory(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        load_dirs = []
+        predictor = mock.MagicMock()
+        predictor.load.side_effect = lambda artifacts_uri: load_dirs.append(os.getcwd())
+
+        for artifacts_uri in ("gs://bucket/model", "model"):
+            handler_module._load_process_predictor(
+                mock.MagicMock(return_value=predictor), artifacts_uri
+            )
+            os.chdir(tmp_path)
+
+        predictor.load.assert_has_calls(
+            [mock.call("gs://bucket/model"), mock.call(str(tmp_path / "model"))]
+        )
+        assert len(set(load_dirs)) == 2
+        assert str(tmp_path) not in load_dirs
+
+
 class TestHandlerUtils:
     @pytest.mark.parametrize(
         "header_key, content_type_value, expected_content_type",
@@ -3184,6 +3676,130 @@ class TestModelServer:
 
         assert str(exception.value) == expected_message
 
+    @mock.patch.dict(
+        os.environ,
+        {
+            "AIP_HTTP_PORT": _TEST_AIP_HTTP_PORT,
+            "AIP_HEALTH_ROUTE": _TEST_AIP_HEALTH_ROUTE,
+            "AIP_PREDICT_ROUTE": _TEST_AIP_PREDICT_ROUTE,
+            "AIP_STORAGE_URI": _TEST_AIP_STORAGE_URI,
+            "HANDLER_MODULE": _DEFAULT_HANDLER_MODULE,
+            "HANDLER_CLASS": _DEFAULT_HANDLER_CLASS,
+            "VERTEX_CPR_MAX_BATCH_SIZE": "32",
+            "VERTEX_CPR_MAX_BATCH_WAIT_MS": "10",
+        },
+        clear=True,
+    )
+    def test_init_with_batching(self, importlib_import_module_mock_once, fastapi_mock):
+        class _TestPredictionHandler(PredictionHandler):
+            def __init__(self, artifacts_uri, **kwargs):
+                self.init_kwargs = kwargs
+
+        setattr(
+            importlib_import_module_mock_once.return_value,
+            _DEFAULT_HANDLER_CLASS,
+            _TestPredictionHandler,
+        )
+
+        model_server = CprModelServer()
+
+        assert model_server.handler.init_kwargs == {
+            "predictor": None,
+            "max_batch_size": 32,
+            "max_batch_wait_seconds": 0.01,
+        }
+        fastapi_mock.return_value.add_event_handler.assert_called_once_with(
+            "shutdown", model_server.handler.close
+        )
+
+    @mock.patch.dict(
+        os.environ,
+        {
+            "AIP_HTTP_PORT": _TEST_AIP_HTTP_PORT,
+            "AIP_HEALTH_ROUTE": _TEST_AIP_HEALTH_ROUTE,
+            "AIP_PREDICT_ROUTE": _TEST_AIP_PREDICT_ROUTE,
+            "AIP_STORAGE_URI": _TEST_AIP_STORAGE_URI,
+            "HANDLER_MODULE": _DEFAULT_HANDLER_MODULE,
+            "HANDLER_CLASS": _DEFAULT_HANDLER_CLASS,
+            "VERTEX_CPR_EXECUTOR_TYPE": "process",
+            "VERTEX_CPR_EXECUTOR_WORKERS": "4",
+            "VERTEX_CPR_MAX_PENDING_REQUESTS": "100",
+        },
+        clear=True,
+    )
+    def test_init_with_executor(self, importlib_import_module_mock_once, fastapi_mock):
+        class _TestPredictionHandler(PredictionHandler):
+            def __init__(self, artifacts_uri, **kwargs):
+                self.init_kwargs = kwargs
+
+        setattr(
+            importlib_import_module_mock_once.return_value,
+            _DEFAULT_HANDLER_CLASS,
+            _TestPredictionHandler,
+        )
+
+        model_server = CprModelServer()
+
+        assert model_server.handler.init_kwargs == {
+            "predictor": None,
+            "executor_type": "process",
+            "executor_workers": 4,
+            "max_pending_requests": 100,
+        }
+
+    @mock.patch.dict(
+        os.environ,
+        {
+            "AIP_HTTP_PORT": _TEST_AIP_HTTP_PORT,
+            "AIP_HEALTH_ROUTE": _TEST_AIP_HEALTH_ROUTE,
+            "AIP_PREDICT_ROUTE": _TEST_AIP_PREDICT_ROUTE,
+            "AIP_STORAGE_URI": _TEST_AIP_STORAGE_URI,
+            "HANDLER_MODULE": _DEFAULT_HANDLER_MODULE,
+            "HANDLER_CLASS": _DEFAULT_HANDLER_CLASS,
+            "VERTEX_CPR_MAX_BATCH_SIZE": "32",
+            "VERTEX_CPR_EXECUTOR_WORKERS": "4",
+        },
+        clear=True,
+    )
+    def test_init_with_batching_ignored_for_unsupported_init_args(
+        self, importlib_import_module_mock_once, fastapi_mock
+    ):
+        class _TestPredictionHandler(PredictionHandler):
+            def __init__(self, artifacts_uri, predictor=None, executor_workers=None):
+                self.executor_workers = executor_workers
+
+        setattr(
+            importlib_import_module_mock_once.return_value,
+            _DEFAULT_HANDLER_CLASS,
+            _TestPredictionHandler,
+        )
+
+        model_server = CprModelServer()
+
+        assert model_server.handler.executor_workers == 4
+
+    @mock.patch.dict(
+        os.environ,
+        {
+            "AIP_HTTP_PORT": _TEST_AIP_HTTP_PORT,
+            "AIP_HEALTH_ROUTE": _TEST_AIP_HEALTH_ROUTE,
+            "AIP_PREDICT_ROUTE": _TEST_AIP_PREDICT_ROUTE,
+            "AIP_STORAGE_URI": _TEST_AIP_STORAGE_URI,
+            "HANDLER_MODULE": _DEFAULT_HANDLER_MODULE,
+            "HANDLER_CLASS": _DEFAULT_HANDLER_CLASS,
+            "VERTEX_CPR_MAX_BATCH_SIZE": "32",
+        },
+        clear=True,
+    )
+    def test_init_with_batching_ignored_for_custom_handler(
+        self, importlib_import_module_mock_once, fastapi_mock
+    ):
+        _ = CprModelServer()
+
+        getattr(
+            importlib_import_module_mock_once.return_value, _DEFAULT_HANDLER_CLASS
+        ).assert_called_once_with(_TEST_AIP_STORAGE_URI, predictor=None)
+
     def test_health(self, model_server_env_mock, importlib_import_module_mock_twice):
         model_server = CprModelServer()
         client = TestClient(model_server.app)
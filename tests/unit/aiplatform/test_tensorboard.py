@@ -1021,6 +1021,43 @@ class TestTensorboardRun:
             time_series_data=expected_time_series_data,
         )
 
+    @pytest.mark.usefixtures(
+        "get_tensorboard_run_mock", "list_tensorboard_time_series_mock"
+    )
+    def test_write_tensorboard_scalar_data_points(
+        self, write_tensorboard_run_data_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        tb_run = tensorboard.TensorboardRun(
+            tensorboard_run_name=_TEST_TENSORBOARD_RUN_NAME
+        )
+
+        timestamp = utils.get_timestamp_proto()
+        tb_run.write_tensorboard_scalar_data_points(
+            [({"accuracy": 0.8}, 1, timestamp), ({"accuracy": 0.9}, 2, timestamp)]
+        )
+
+        expected_time_series_data = [
+            gca_tensorboard_data.TimeSeriesData(
+                tensorboard_time_series_id=_TEST_TENSORBOARD_TIME_SERIES_ID,
+                value_type=gca_tensorboard_time_series.TensorboardTimeSeries.ValueType.SCALAR,
+                values=[
+                    gca_tensorboard_data.TimeSeriesDataPoint(
+                        scalar=gca_tensorboard_data.Scalar(value=value),
+                        wall_time=timestamp,
+                        step=step,
+                    )
+                    for value, step in ((0.8, 1), (0.9, 2))
+                ],
+            ),
+        ]
+
+        write_tensorboard_run_data_mock.assert_called_once_with(
+            tensorboard_run=_TEST_TENSORBOARD_RUN_NAME,
+            time_series_data=expected_time_series_data,
+        )
+
     @pytest.mark.usefixtures(
         "get_tensorboard_run_mock", "list_tensorboard_time_series_mock"
     )
@@ -352,6 +352,7 @@ def mock_client_bucket():
         MockBucket = mock.Mock(autospec=storage.Bucket)
         MockBucket.name = _TEST_BUCKET_NAME
         MockBlob = mock.Mock(autospec=storage.Blob)
+        MockBlob.exists.return_value = False
         MockBucket.blob.side_effect = functools.partial(
             blob_side_effect, mock_blob=MockBlob, bucket=MockBucket
         )
@@ -555,6 +556,7 @@ class TestTrainingScriptPythonPackager:
     def setup_method(self):
         importlib.reload(initializer)
         importlib.reload(aiplatform)
+        source_utils._TrainingScriptPythonPackager._stored_package_gcs_paths.clear()
         with open(_TEST_LOCAL_SCRIPT_FILE_PATH, "w") as fp:
             fp.write(_TEST_PYTHON_SOURCE)
 
@@ -603,11 +605,7 @@ class TestTrainingScriptPythonPackager:
                 assert _TEST_REQUIREMENTS == setup_py.install_requires
 
     def test_packaging_fails_whith_RuntimeError(self):
-        with patch("subprocess.Popen") as mock_popen:
-            mock_subprocess = mock.Mock()
-            mock_subprocess.communicate.return_value = (b"", b"")
-            mock_subprocess.returncode = 1
-            mock_popen.return_value = mock_subprocess
+        with patch.object(tarfile, "open", side_effect=OSError("No space left")):
             tsp = source_utils._TrainingScriptPythonPackager(
                 _TEST_LOCAL_SCRIPT_FILE_PATH
             )
@@ -632,6 +630,49 @@ class TestTrainingScriptPythonPackager:
 
         assert gcs_path.endswith("-aiplatform_custom_trainer_script-0.1.tar.gz")
         assert gcs_path.startswith(f"gs://{_TEST_BUCKET_NAME}")
+        assert tsp.get_content_hash() in gcs_path
+
+    def test_content_hash_changes_with_content(self):
+        tsp = source_utils._TrainingScriptPythonPackager(_TEST_LOCAL_SCRIPT_FILE_PATH)
+        content_hash = tsp.get_content_hash()
+
+        assert (
+            source_utils._TrainingScriptPythonPackager(
+                _TEST_LOCAL_SCRIPT_FILE_PATH
+            ).get_content_hash()
+            == content_hash
+        )
+        assert (
+            source_utils._TrainingScriptPythonPackager(
+                _TEST_LOCAL_SCRIPT_FILE_PATH, requirements=_TEST_REQUIREMENTS
+            ).get_content_hash()
+            != content_hash
+        )
+
+        with open(_TEST_LOCAL_SCRIPT_FILE_PATH, "a") as fp:
+            fp.write("print('goodbye world')\n")
+        assert tsp.get_content_hash() != content_hash
+
+    def test_package_and_copy_to_gcs_reuses_stored_package(self, mock_client_bucket):
+        mock_client_bucket, mock_blob = mock_client_bucket
+        mock_blob.exists.return_value = True
+
+        tsp = source_utils._TrainingScriptPythonPackager(_TEST_LOCAL_SCRIPT_FILE_PATH)
+        with patch.object(tsp, "make_package") as mock_make_package:
+            gcs_path = tsp.package_and_copy_to_gcs(
+                gcs_staging_dir=_TEST_BUCKET_NAME, project=_TEST_PROJECT
+            )
+            # Packages stored by this process are not looked up again.
+            assert (
+                tsp.package_and_copy_to_gcs(
+                    gcs_staging_dir=_TEST_BUCKET_NAME, project=_TEST_PROJECT
+                )
+                == gcs_path
+            )
+
+        mock_make_package.assert_not_called()
+        mock_blob.upload_from_filename.assert_not_called()
+        mock_blob.exists.assert_called_once()
 
 
 @pytest.fixture
@@ -208,6 +208,8 @@ def _create_uploader(
     one_shot=None,
     allowed_plugins=_SCALARS_HISTOGRAMS_AND_GRAPHS,
     run_name_prefix=None,
+    num_workers=1,
+    num_blob_upload_workers=1,
 ):
     if writer_client is _USE_DEFAULT:
         writer_client = _create_mock_client()
@@ -249,6 +251,8 @@ def _create_uploader(
         verbosity=verbosity,
         one_shot=one_shot,
         run_name_prefix=run_name_prefix,
+        num_workers=num_workers,
+        num_blob_upload_workers=num_blob_upload_workers,
     )
 
 
@@ -706,6 +710,89 @@ class TensorboardUploaderTest(tf.test.TestCase):
         self.assertEqual(mock_tracker.tensors_tracker.call_count, 0)
         self.assertEqual(mock_tracker.blob_tracker.call_count, 0)
 
+    def _upload_scalars_and_extract_points(self, num_workers):
+        mock_client = _create_mock_client()
+        uploader = _create_uploader(
+            writer_client=mock_client,
+            logdir=_TEST_LOG_DIR_NAME,
+            max_scalar_request_size=200,
+            num_workers=num_workers,
+        )
+        uploader.create_experiment()
+
+        mock_logdir_loader = mock.create_autospec(logdir_loader.LogdirLoader)
+        mock_logdir_loader.get_run_events.side_effect = [
+            {
+                "run %d"
+                % run: _apply_compat(
+                    [
+                        _scalar_event("tag %d" % (step % 3), run * 100.0 + step)
+                        for step in range(10)
+                    ]
+                )
+                for run in range(5)
+            },
+            AbortUploadError,
+        ]
+        with mock.patch.object(
+            uploader, "_logdir_loader", mock_logdir_loader
+        ), self.assertRaises(AbortUploadError):
+            uploader.start_uploading()
+
+        points = []
+        for call_args in mock_client.write_tensorboard_experiment_data.call_args_list:
+            for run_data in call_args[1]["write_run_data_requests"]:
+                for ts_data in run_data.time_series_data:
+                    for value in ts_data.values:
+                        points.append(
+                            (
+                                run_data.tensorboard_run,
+                                ts_data.tensorboard_time_series_id,
+                                value.scalar.value,
+                            )
+                        )
+        return uploader, points
+
+    def test_start_uploading_scalars_pipelined(self):
+        _, expected_points = self._upload_scalars_and_extract_points(num_workers=1)
+        uploader, points = self._upload_scalars_and_extract_points(num_workers=4)
+
+        self.assertLen(points, 50)
+        # Run resource names are random, so points are compared by tag and value.
+        self.assertCountEqual(
+            [point[1:] for point in points], [point[1:] for point in expected_points]
+        )
+        # The points of each time series keep their order.
+        for time_series in {point[:2] for point in points}:
+            values = [point[2] for point in points if point[:2] == time_series]
+            self.assertEqual(values, sorted(values))
+        stage_metrics = uploader.get_stage_metrics()
+        self.assertEqual(stage_metrics["read"]["count"], 5)
+        self.assertGreater(stage_metrics["build"]["count"], 50)
+        self.assertGreater(stage_metrics["send"]["count"], 0)
+
+    def test_start_uploading_pipelined_experiment_not_found(self):
+        mock_client = _create_mock_client()
+        uploader = _create_uploader(
+            writer_client=mock_client,
+            logdir=_TEST_LOG_DIR_NAME,
+            num_workers=2,
+        )
+        uploader.create_experiment()
+        mock_client.write_tensorboard_experiment_data.side_effect = _grpc_error(
+            grpc.StatusCode.NOT_FOUND, "nope"
+        )
+
+        mock_logdir_loader = mock.create_autospec(logdir_loader.LogdirLoader)
+        mock_logdir_loader.get_run_events.side_effect = [
+            {"run 1": _apply_compat([_scalar_event("1.1", 5.0)])},
+            AbortUploadError,
+        ]
+        with mock.patch.object(
+            uploader, "_logdir_loader", mock_logdir_loader
+        ), self.assertRaises(uploader_lib.ExperimentNotFoundError):
+            uploader.start_uploading()
+
     def test_upload_empty_logdir(self):
         logdir = self.get_temp_dir()
         mock_client = _create_mock_client()
@@ -903,6 +990,59 @@ class TensorboardUploaderTest(tf.test.TestCase):
         self.assertEqual(mock_constructor.call_args[1], {"verbosity": 0})
         self.assertEqual(mock_tracker.scalars_tracker.call_count, 1)
 
+    def test_start_uploading_graphs_with_blob_upload_workers(self):
+        mock_client = _create_mock_client()
+        mock_bucket = mock.create_autospec(storage.Bucket)
+        mock_blob = mock.create_autospec(storage.Blob)
+        mock_bucket.blob.return_value = mock_blob
+
+        def create_time_series(tensorboard_time_series, parent=None):
+            return tensorboard_time_series_type.TensorboardTimeSeries(
+                name=_TEST_ONE_PLATFORM_TIME_SERIES_NAME,
+                display_name=tensorboard_time_series.display_name,
+            )
+
+        mock_client.create_tensorboard_time_series.side_effect = create_time_series
+        uploader = _create_uploader(
+            writer_client=mock_client,
+            logdir=_TEST_LOG_DIR_NAME,
+            max_blob_request_size=1000,
+            blob_storage_bucket=mock_bucket,
+            num_workers=2,
+            num_blob_upload_workers=3,
+        )
+        uploader.create_experiment()
+
+        graph_event = event_pb2.Event(graph_def=_create_example_graph_bytes(950))
+        mock_logdir_loader = mock.create_autospec(logdir_loader.LogdirLoader)
+        mock_logdir_loader.get_run_events.side_effect = [
+            {
+                "run %d" % run: _apply_compat([graph_event, graph_event])
+                for run in range(5)
+            },
+            AbortUploadError,
+        ]
+
+        with mock.patch.object(
+            uploader, "_logdir_loader", mock_logdir_loader
+        ), self.assertRaises(AbortUploadError):
+            uploader.start_uploading()
+
+        self.assertEqual(10, mock_bucket.blob.call_count)
+        blob_ids = {
+            call[0][0].rsplit("/", 1)[1] for call in mock_bucket.blob.call_args_list
+        }
+        sent_blob_ids = [
+            blob.id
+            for call in mock_client.write_tensorboard_experiment_data.call_args_list
+            for run_data in call[1]["write_run_data_requests"]
+            for ts_data in run_data.time_series_data
+            for value in ts_data.values
+            for blob in value.blobs.values
+        ]
+        self.assertCountEqual(sent_blob_ids, blob_ids)
+        self.assertEqual(uploader.get_stage_metrics()["blob"]["count"], 10)
+
     def test_start_uploading_graphs(self):
         mock_client = _create_mock_client()
         mock_rate_limiter = mock.create_autospec(util.RateLimiter)
@@ -2072,6 +2212,36 @@ class FileRequestSenderTest(tf.test.TestCase):
         self.assertLen(sender._source_bucket.copy_blob.call_args_list, 1)
 
 
+class UploadStageMetricsTest(tf.test.TestCase):
+    def test_snapshot(self):
+        metrics = uploader_utils.UploadStageMetrics()
+        self.assertEqual(metrics.snapshot(), {})
+
+        metrics.record_lag("send", 1.0, queue_size=3)
+        metrics.record_lag("send", 3.0, queue_size=1)
+        metrics.record_lag("read", 0.5)
+
+        self.assertEqual(
+            metrics.snapshot(),
+            {
+                "send": {
+                    "count": 2,
+                    "mean_lag_secs": 2.0,
+                    "max_lag_secs": 3.0,
+                    "last_lag_secs": 3.0,
+                    "queue_size": 1,
+                },
+                "read": {
+                    "count": 1,
+                    "mean_lag_secs": 0.5,
+                    "max_lag_secs": 0.5,
+                    "last_lag_secs": 0.5,
+                    "queue_size": 0,
+                },
+            },
+        )
+
+
 class VarintCostTest(tf.test.TestCase):
     def test_varint_cost(self):
         self.assertEqual(uploader_lib._varint_cost(0), 1)
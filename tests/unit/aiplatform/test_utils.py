@@ -28,9 +28,10 @@ from unittest import mock
 from unittest.mock import patch
 from urllib import request as urllib_request
 
+import numpy as np
 import pytest
 import yaml
-from google.api_core import client_options, gapic_v1
+from google.api_core import client_options, exceptions, gapic_v1
 from google.auth import credentials
 from google.cloud import aiplatform
 from google.cloud import storage
@@ -38,6 +39,7 @@ from google.cloud.aiplatform import compat, utils
 from google.cloud.aiplatform.compat.types import pipeline_failure_policy
 from google.cloud.aiplatform import datasets
 from google.cloud.aiplatform.utils import (
+    _value_utils,
     column_transformations_utils,
     gcs_utils,
     pipeline_utils,
@@ -51,7 +53,7 @@ from google.cloud.aiplatform_v1.services.model_service import (
 from google.cloud.aiplatform_v1beta1.services.model_service import (
     client as model_service_client_v1beta1,
 )
-from google.protobuf import timestamp_pb2
+from google.protobuf import json_format, struct_pb2, timestamp_pb2
 
 model_service_client_default = model_service_client_v1
 
@@ -68,9 +70,9 @@ def mock_storage_client():
         def __init__(self, name):
             self.name = name
 
-    blob1 = mock.MagicMock()
+    blob1 = mock.MagicMock(size=1)
     type(blob1).name = mock.PropertyMock(return_value=f"{GCS_PREFIX}/{FAKE_FILENAME}")
-    blob2 = mock.MagicMock()
+    blob2 = mock.MagicMock(size=0)
     type(blob2).name = mock.PropertyMock(return_value=f"{GCS_PREFIX}/")
 
     def get_blobs(bucket_name, prefix=""):
@@ -641,6 +643,149 @@ class TestGcsUtils:
                 filename=destination_path
             )
 
+    def test_upload_to_gcs_dir_uploads_files_concurrently(
+        self, tmp_path, mock_storage_blob_upload_from_filename
+    ):
+        for i in range(3):
+            (tmp_path / "dir").mkdir(exist_ok=True)
+            (tmp_path / "dir" / f"file-{i}").write_text("data")
+
+        gcs_utils.upload_to_gcs(
+            str(tmp_path), f"gs://{GCS_BUCKET}/{GCS_PREFIX}", max_workers=2
+        )
+
+        assert mock_storage_blob_upload_from_filename.call_count == 3
+        for i in range(3):
+            mock_storage_blob_upload_from_filename.assert_any_call(
+                filename=str(tmp_path / "dir" / f"file-{i}")
+            )
+
+    def test_upload_to_gcs_large_file_uploads_slices_and_composes(self, tmp_path):
+        source_file = tmp_path / "large-file"
+        source_file.write_bytes(b"0123456789")
+        destination_uri = f"gs://{GCS_BUCKET}/{GCS_PREFIX}/large-file"
+
+        uploaded_slices = {}
+
+        def upload_from_file(blob, file_obj, size):
+            uploaded_slices[blob.name] = file_obj.read(size)
+
+        with patch.object(
+            gcs_utils, "_SLICED_TRANSFER_THRESHOLD_BYTES", 4
+        ), patch.object(gcs_utils, "_MIN_SLICE_SIZE_BYTES", 4), patch.object(
+            storage.Blob, "upload_from_file", autospec=True
+        ) as mock_upload_from_file, patch.object(
+            storage.Blob, "compose", autospec=True
+        ) as mock_compose, patch.object(
+            storage.Blob, "delete", autospec=True
+        ) as mock_delete:
+            mock_upload_from_file.side_effect = upload_from_file
+
+            gcs_utils.upload_to_gcs(str(source_file), destination_uri)
+
+            slice_prefix = f"{GCS_PREFIX}/large-file{gcs_utils._UPLOAD_SLICE_SUFFIX}"
+            assert uploaded_slices == {
+                f"{slice_prefix}00": b"0123",
+                f"{slice_prefix}01": b"4567",
+                f"{slice_prefix}02": b"89",
+            }
+            destination_blob, slice_blobs = mock_compose.call_args[0]
+            assert destination_blob.name == f"{GCS_PREFIX}/large-file"
+            assert destination_blob.content_type == "application/octet-stream"
+            assert [blob.name for blob in slice_blobs] == sorted(uploaded_slices)
+            assert mock_delete.call_count == 3
+
+    def test_upload_to_gcs_large_file_sets_content_type(self, tmp_path):
+        source_file = tmp_path / "large-file.csv"
+        source_file.write_bytes(b"0123456789")
+
+        with patch.object(
+            gcs_utils, "_SLICED_TRANSFER_THRESHOLD_BYTES", 4
+        ), patch.object(gcs_utils, "_MIN_SLICE_SIZE_BYTES", 4), patch.object(
+            storage.Blob, "upload_from_file", autospec=True
+        ), patch.object(
+            storage.Blob, "compose", autospec=True
+        ) as mock_compose, patch.object(
+            storage.Blob, "delete", autospec=True
+        ):
+            gcs_utils.upload_to_gcs(
+                str(source_file), f"gs://{GCS_BUCKET}/{GCS_PREFIX}/large-file.csv"
+            )
+
+            destination_blob, _ = mock_compose.call_args[0]
+            assert destination_blob.content_type == "text/csv"
+
+    def test_upload_to_gcs_large_file_deletes_slices_on_failure(self, tmp_path):
+        source_file = tmp_path / "large-file"
+        source_file.write_bytes(b"0123456789")
+        slice_prefix = f"{GCS_PREFIX}/large-file{gcs_utils._UPLOAD_SLICE_SUFFIX}"
+
+        def upload_from_file(blob, file_obj, size):
+            if blob.name == f"{slice_prefix}01":
+                raise exceptions.ServiceUnavailable("Upload failed")
+
+        with patch.object(
+            gcs_utils, "_SLICED_TRANSFER_THRESHOLD_BYTES", 4
+        ), patch.object(gcs_utils, "_MIN_SLICE_SIZE_BYTES", 4), patch.object(
+            storage.Blob, "upload_from_file", autospec=True
+        ) as mock_upload_from_file, patch.object(
+            storage.Blob, "compose", autospec=True
+        ) as mock_compose, patch.object(
+            storage.Blob, "delete", autospec=True
+        ) as mock_delete:
+            mock_upload_from_file.side_effect = upload_from_file
+
+            with pytest.raises(exceptions.ServiceUnavailable):
+                gcs_utils.upload_to_gcs(
+                    str(source_file), f"gs://{GCS_BUCKET}/{GCS_PREFIX}/large-file"
+                )
+
+            mock_compose.assert_not_called()
+            assert sorted(call[0][0].name for call in mock_delete.call_args_list) == [
+                f"{slice_prefix}00",
+                f"{slice_prefix}01",
+                f"{slice_prefix}02",
+            ]
+
+    def test_download_from_gcs_large_file_downloads_ranges(self, tmp_path):
+        blob = storage.Blob(name=f"{GCS_PREFIX}/{FAKE_FILENAME}", bucket=GCS_BUCKET)
+        blob._properties["size"] = "10"
+        data = b"0123456789"
+
+        def download_to_file(blob, file_obj, start, end):
+            file_obj.write(data[start : end + 1])
+
+        with patch.object(
+            gcs_utils, "_SLICED_TRANSFER_THRESHOLD_BYTES", 4
+        ), patch.object(gcs_utils, "_MIN_SLICE_SIZE_BYTES", 4), patch(
+            "google.cloud.storage.Client.list_blobs", return_value=[blob]
+        ), patch.object(
+            storage.Blob, "download_to_file", autospec=True
+        ) as mock_download_to_file:
+            mock_download_to_file.side_effect = download_to_file
+            destination_path = tmp_path / "large-file"
+
+            gcs_utils.download_from_gcs(
+                f"gs://{GCS_BUCKET}/{GCS_PREFIX}/{FAKE_FILENAME}",
+                str(destination_path),
+            )
+
+            assert mock_download_to_file.call_count == 3
+            assert destination_path.read_bytes() == data
+
+    def test_get_storage_client_reuses_client(self, mock_storage_client):
+        client = gcs_utils._get_storage_client(project="test-project")
+
+        assert gcs_utils._get_storage_client(project="test-project") is client
+        mock_storage_client.assert_called_once_with(
+            project="test-project", credentials=None
+        )
+
+    def test_get_slice_ranges(self):
+        with patch.object(gcs_utils, "_MIN_SLICE_SIZE_BYTES", 4):
+            assert gcs_utils._get_slice_ranges(10) == [(0, 3), (4, 7), (8, 9)]
+            assert len(gcs_utils._get_slice_ranges(1000)) == 32
+
     def test_download_from_gcs_invalid_source_uri(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             source_uri = f"{GCS_BUCKET}/{GCS_PREFIX}"
@@ -952,7 +1097,7 @@ class TestPredictionUtils:
         )
         mock_storage_client().list_blobs.side_effect("")[
             0
-        ].download_to_filename.assert_called_once_with(FAKE_FILENAME)
+        ].download_to_filename.assert_called_once_with(filename=FAKE_FILENAME)
         assert (
             not mock_storage_client()
             .list_blobs.side_effect("")[1]
@@ -1062,3 +1207,66 @@ class TestYamlUtils:
         )
         with pytest.raises(ValueError, match=message):
             yaml_utils.load_yaml(uri)
+
+
+def _make_value(python_value) -> struct_pb2.Value:
+    value = struct_pb2.Value()
+    json_format.ParseDict(python_value, value)
+    return value
+
+
+class TestValueUtils:
+    @pytest.mark.parametrize(
+        "python_value",
+        [
+            None,
+            True,
+            1.5,
+            "text",
+            [],
+            {},
+            [1.0, "a", False, None, {"b": [2.0, 3.0]}],
+            {"scores": [0.25] * 32, "labels": ["a", "b"], "nested": {"x": None}},
+            [0.5] * 20 + ["not a number"] + [0.5] * 20,
+            [[float(i) for i in range(32)], [float(-i) for i in range(32)]],
+        ],
+    )
+    def test_value_to_python_matches_message_to_dict(self, python_value):
+        value = _make_value(python_value)
+        assert _value_utils.value_to_python(value) == json_format.MessageToDict(value)
+
+    def test_values_to_numpy_numbers(self):
+        values = [_make_value(v) for v in [1.0, 2.5, -3.0]]
+        array = _value_utils.values_to_numpy(values)
+        assert array.dtype == np.float64
+        np.testing.assert_array_equal(array, [1.0, 2.5, -3.0])
+
+    def test_values_to_numpy_lists(self):
+        rows = [[float(i * j) for j in range(40)] for i in range(3)]
+        array = _value_utils.values_to_numpy([_make_value(row) for row in rows])
+        assert array.shape == (3, 40)
+        np.testing.assert_array_equal(array, rows)
+
+    def test_values_to_numpy_empty(self):
+        assert _value_utils.values_to_numpy([]).shape == (0,)
+
+    @pytest.mark.parametrize(
+        "predictions",
+        [
+            [1.0, "a"],
+            ["a", "b"],
+            [[1.0, 2.0], [1.0]],
+            [[1.0, 2.0], 1.0],
+            [[1.0, "a"], [1.0, 2.0]],
+        ],
+    )
+    def test_values_to_numpy_raises_for_heterogeneous_values(self, predictions):
+        with pytest.raises(ValueError):
+            _value_utils.values_to_numpy([_make_value(p) for p in predictions])
+
+    def test_python_to_numpy(self):
+        np.testing.assert_array_equal(
+            _value_utils.python_to_numpy([[1, 2], [3, 4]]), [[1.0, 2.0], [3.0, 4.0]]
+        )
+        with pytest.raises(ValueError):
+            _value_utils.python_to_numpy([[1, 2], [3]])
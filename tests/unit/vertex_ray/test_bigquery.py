@@ -39,6 +39,7 @@ _TEST_BQ_TEMP_DESTINATION = (
     tc.ProjectConstants._TEST_GCP_PROJECT_ID + ".tempdataset.temptable"
 )
 _TEST_DISPLAY_NAME = "display_name"
+_TEST_ESTIMATED_BYTES = 1024 * 1024
 
 
 @pytest.fixture(autouse=True)
@@ -98,19 +99,51 @@ def bqs_client_full_mock(monkeypatch):
     client_mock = mock.create_autospec(bigquery_storage.BigQueryReadClient)
     client_mock.return_value = client_mock
 
-    def bqs_create_read_session(max_stream_count=0, **kwargs):
+    def bqs_create_read_session(max_stream_count=0, read_session=None, **kwargs):
+        client_mock.requested_read_sessions.append(read_session)
         read_session_proto = gcbqs_stream.ReadSession()
         read_session_proto.streams = [
-            gcbqs_stream.ReadStream() for _ in range(max_stream_count)
+            gcbqs_stream.ReadStream(name=f"stream{i}")
+            for i in range(max_stream_count or 1)
         ]
+        read_session_proto.estimated_total_bytes_scanned = _TEST_ESTIMATED_BYTES
         return read_session_proto
 
+    client_mock.requested_read_sessions = []
     client_mock.create_read_session = bqs_create_read_session
 
     monkeypatch.setattr(bigquery_storage, "BigQueryReadClient", client_mock)
     return client_mock
 
 
+@pytest.fixture(autouse=True)
+def bqs_write_client_mock(monkeypatch):
+    client_mock = mock.create_autospec(bigquery_storage.BigQueryWriteClient)
+    client_mock.return_value = client_mock
+    client_mock.table_path = bigquery_storage.BigQueryWriteClient.table_path
+
+    def bqs_append_rows(requests, **kwargs):
+        for _ in requests:
+            yield bigquery_storage.types.AppendRowsResponse()
+
+    def bqs_create_write_stream(parent, write_stream, **kwargs):
+        return bigquery_storage.types.WriteStream(
+            name=f"{parent}/streams/stream{client_mock.create_write_stream.call_count}",
+            type_=write_stream.type_,
+        )
+
+    client_mock.append_rows.side_effect = bqs_append_rows
+    client_mock.create_write_stream.side_effect = bqs_create_write_stream
+    client_mock.batch_commit_write_streams.return_value = (
+        bigquery_storage.types.BatchCommitWriteStreamsResponse()
+    )
+
+    monkeypatch.setattr(bigquery_storage, "BigQueryWriteClient", client_mock)
+    bigquery_datasource._get_write_client.cache_clear()
+    yield client_mock
+    bigquery_datasource._get_write_client.cache_clear()
+
+
 @pytest.fixture
 def bq_query_result_mock():
     with mock.patch.object(bigquery.job.QueryJob, "result") as query_result_mock:
@@ -233,6 +266,64 @@ class TestReadBigQuery:
         expected_message = "[Ray on Vertex AI]: Dataset nonexistentdataset is not found. Please ensure that it exists."
         assert str(exception.value) == expected_message
 
+    def test_estimate_inmemory_data_size(self, bqs_client_full_mock):
+        parallelism = 4
+        bq_ds = bigquery_datasource.BigQueryDatasource()
+        reader = bq_ds.create_reader(
+            project_id=tc.ProjectConstants._TEST_GCP_PROJECT_ID,
+            dataset=_TEST_BQ_DATASET,
+            parallelism=parallelism,
+        )
+        assert reader.estimate_inmemory_data_size() == _TEST_ESTIMATED_BYTES
+
+        read_tasks_list = reader.get_read_tasks(parallelism)
+        # The read session of the estimate is reused by the read tasks.
+        assert len(bqs_client_full_mock.requested_read_sessions) == 1
+        assert len(read_tasks_list) == parallelism
+        for read_task in read_tasks_list:
+            assert read_task.get_metadata().size_bytes == (
+                _TEST_ESTIMATED_BYTES // parallelism
+            )
+
+    def test_create_reader_pushdown(self, bqs_client_full_mock):
+        bq_ds = bigquery_datasource.BigQueryDatasource()
+        reader = bq_ds.create_reader(
+            project_id=tc.ProjectConstants._TEST_GCP_PROJECT_ID,
+            dataset=_TEST_BQ_DATASET,
+            columns=["a", "b"],
+            row_restriction="a > 1",
+        )
+        reader.get_read_tasks(2)
+        (requested_session,) = bqs_client_full_mock.requested_read_sessions
+        assert list(requested_session.read_options.selected_fields) == ["a", "b"]
+        assert requested_session.read_options.row_restriction == "a > 1"
+
+    def test_read_task_streams_record_batches(self):
+        record_batch = pa.record_batch([pa.array([1, 2, 3])], names=["data"])
+        page_mock = mock.Mock()
+        page_mock.to_arrow.return_value = record_batch
+        read_client_mock = mock.Mock()
+        read_client_mock.read_rows.return_value.rows.return_value.pages = [
+            page_mock
+        ] * 4
+
+        bq_ds = bigquery_datasource.BigQueryDatasource()
+        reader = bq_ds.create_reader(
+            project_id=tc.ProjectConstants._TEST_GCP_PROJECT_ID,
+            dataset=_TEST_BQ_DATASET,
+        )
+        (read_task,) = reader.get_read_tasks(1)
+        with mock.patch.object(
+            bigquery_datasource, "_get_read_client", return_value=read_client_mock
+        ), mock.patch.object(
+            bigquery_datasource, "_TARGET_BLOCK_SIZE_BYTES", record_batch.nbytes * 3
+        ):
+            blocks = list(read_task())
+
+        read_client_mock.read_rows.assert_called_once_with("stream0")
+        read_client_mock.read_rows.return_value.to_arrow.assert_not_called()
+        assert [block.num_rows for block in blocks] == [9, 3]
+
     def test_create_reader_table_not_found(self):
         parallelism = 4
         bq_ds = bigquery_datasource.BigQueryDatasource()
@@ -269,6 +360,119 @@ class TestWriteBigQuery:
         )
         assert status == "ok"
 
+    def test_write_storage_write_api(self, bq_client_full_mock, bqs_write_client_mock):
+        bq_ds = bigquery_datasource.BigQueryDatasource()
+        block = pa.Table.from_arrays(
+            [pa.array([2, 4, 5, 100], pa.int32()), pa.array(["a", "b", "c", "d"])],
+            names=["data", "label"],
+        )
+        with mock.patch.object(
+            bigquery_datasource, "_MAX_APPEND_ROWS_REQUEST_BYTES", block.nbytes // 2
+        ):
+            status = bq_ds.write(
+                blocks=[block],
+                ctx=None,
+                project_id=tc.ProjectConstants._TEST_GCP_PROJECT_ID,
+                dataset=_TEST_BQ_DATASET,
+            )
+        assert status == "ok"
+
+        (table,), _ = bq_client_full_mock.create_table.call_args
+        assert [(field.name, field.field_type) for field in table.schema] == [
+            ("data", "INTEGER"),
+            ("label", "STRING"),
+        ]
+        bq_client_full_mock.load_table_from_file.assert_not_called()
+
+        _, kwargs = bqs_write_client_mock.create_write_stream.call_args
+        assert kwargs["write_stream"].type_ == (
+            bigquery_storage.types.WriteStream.Type.PENDING
+        )
+        write_stream = "projects/{}/datasets/{}/tables/{}/streams/stream1".format(
+            tc.ProjectConstants._TEST_GCP_PROJECT_ID,
+            _TEST_BQ_DATASET_ID,
+            _TEST_BQ_TABLE_ID,
+        )
+        _, kwargs = bqs_write_client_mock.append_rows.call_args
+        assert kwargs["metadata"] == (
+            ("x-goog-request-params", f"write_stream={write_stream}"),
+        )
+        bqs_write_client_mock.finalize_write_stream.assert_called_once_with(
+            name=write_stream
+        )
+        (request,), _ = bqs_write_client_mock.batch_commit_write_streams.call_args
+        assert list(request.write_streams) == [write_stream]
+
+    def test_write_storage_write_api_retries(self, bqs_write_client_mock):
+        appended_rows = {}
+
+        def bqs_append_rows(requests, metadata, **kwargs):
+            write_stream = metadata[0][1]
+            appended_rows[write_stream] = 0
+            for request in requests:
+                if bqs_write_client_mock.append_rows.call_count == 1 and (
+                    appended_rows[write_stream]
+                ):
+                    raise exceptions.ServiceUnavailable("Unavailable")
+                appended_rows[write_stream] += pa.ipc.read_record_batch(
+                    pa.py_buffer(request.arrow_rows.rows.serialized_record_batch),
+                    pa.ipc.read_schema(
+                        pa.py_buffer(request.arrow_rows.writer_schema.serialized_schema)
+                    ),
+                ).num_rows
+                yield bigquery_storage.types.AppendRowsResponse()
+
+        bqs_write_client_mock.append_rows.side_effect = bqs_append_rows
+        bq_ds = bigquery_datasource.BigQueryDatasource()
+        block = pa.Table.from_arrays([pa.array(range(100))], names=["data"])
+        with mock.patch.object(
+            bigquery_datasource, "_MAX_APPEND_ROWS_REQUEST_BYTES", block.nbytes // 4
+        ), mock.patch.object(bigquery_datasource.time, "sleep"):
+            bq_ds.write(blocks=[block], ctx=None, dataset=_TEST_BQ_DATASET)
+
+        # The failed stream is dropped and the whole block is appended again to a
+        # new stream, which is the only one committed.
+        assert bqs_write_client_mock.append_rows.call_count == 2
+        assert bqs_write_client_mock.create_write_stream.call_count == 2
+        (failed_stream, committed_stream) = appended_rows
+        assert appended_rows[committed_stream] == 100
+        (request,), _ = bqs_write_client_mock.batch_commit_write_streams.call_args
+        assert [f"write_stream={name}" for name in request.write_streams] == [
+            committed_stream
+        ]
+
+    def test_write_falls_back_to_load_job(
+        self, bq_client_full_mock, bqs_write_client_mock
+    ):
+        bq_ds = bigquery_datasource.BigQueryDatasource()
+        arr = pa.array([1, 2], pa.timestamp("us"))
+        block = pa.Table.from_arrays([arr], names=["data"])
+        status = bq_ds.write(blocks=[block], ctx=None, dataset=_TEST_BQ_DATASET)
+        assert status == "ok"
+        bq_client_full_mock.create_table.assert_not_called()
+        bq_client_full_mock.load_table_from_file.assert_called_once()
+        bqs_write_client_mock.append_rows.assert_not_called()
+
+    def test_write_loads_block_with_table_schema(
+        self, bq_client_full_mock, bqs_write_client_mock
+    ):
+        bq_ds = bigquery_datasource.BigQueryDatasource()
+        blocks = [
+            pa.Table.from_arrays([pa.array([1, 2])], names=["data"]),
+            pa.Table.from_arrays([pa.array(["a", "b"])], names=["data"]),
+        ]
+        status = bq_ds.write(blocks=blocks, ctx=None, dataset=_TEST_BQ_DATASET)
+        assert status == "ok"
+
+        # The table is created once, and the block that cannot be cast to its
+        # schema is loaded with that schema instead of an autodetected one.
+        bq_client_full_mock.create_table.assert_called_once()
+        (table,), _ = bq_client_full_mock.create_table.call_args
+        _, kwargs = bq_client_full_mock.load_table_from_file.call_args
+        assert kwargs["job_config"].schema == table.schema
+        assert not kwargs["job_config"].autodetect
+        bqs_write_client_mock.append_rows.assert_called_once()
+
     def test_do_write_initialized(self, ray_remote_function_mock):
         """If initialized, do_write doesn't need to specify project_id."""
         aiplatform.init(
@@ -45,6 +45,7 @@ from google.cloud.aiplatform_v1beta1.types.persistent_resource import (
     PersistentResource,
     ResourcePool,
 )
+from vertexai.preview._workflow.executor import training
 
 
 _TEST_PROJECT = "test-project"
@@ -109,6 +110,22 @@ def google_auth_mock():
         yield auth_mock
 
 
+@pytest.fixture(autouse=True)
+def mock_serialized_input_cache():
+    """Mocks the GCS cache of serialized remote job inputs.
+
+    Inputs are never found in the cache, and copies to and from the cache are
+    recorded instead of being made.
+    """
+    training._serialized_input_cache.clear()
+    with mock.patch.object(
+        training, "_get_cached_input_metadata", return_value=None
+    ) as get_cached_input_metadata_mock, mock.patch.object(
+        training, "_copy_gcs_object"
+    ) as copy_gcs_object_mock:
+        yield get_cached_input_metadata_mock, copy_gcs_object_mock
+
+
 @pytest.fixture
 def mock_filesystem():
     with fake_filesystem_unittest.Patcher() as patcher:
@@ -42,6 +42,7 @@ from google.cloud.aiplatform.compat.types import (
 from google.cloud.aiplatform.compat.types import (
     tensorboard as gca_tensorboard,
 )
+from google.cloud.aiplatform.docker_utils import errors as docker_errors
 from google.cloud.aiplatform.metadata import constants as metadata_constants
 from google.cloud.aiplatform.preview import resource_pool_utils
 from google.cloud.aiplatform_v1 import (
@@ -64,6 +65,7 @@ from vertexai.preview._workflow.shared import (
 )
 from vertexai.preview.developer import remote_specs
 import numpy as np
+import pandas as pd
 import pytest
 import sklearn
 from sklearn.datasets import load_iris
@@ -185,6 +187,7 @@ _TEST_TRAINING_CONFIG_ACCELERATOR_TYPE = "NVIDIA_TESLA_K80"
 _TEST_TRAINING_CONFIG_ACCELERATOR_COUNT = 4
 _TEST_REQUIREMENTS = ["torch_cv", "xgboost==1.6.0", "numpy"]
 _TEST_CUSTOM_COMMANDS = ["apt-get update", "apt-get install -y git"]
+_TEST_ENVIRONMENT_IMAGE_REPOSITORY = "us-docker.pkg.dev/test-project/test-repo/env"
 
 _TEST_BOOT_DISK_TYPE = "test_boot_disk_type"
 _TEST_BOOT_DISK_SIZE_GB = 10
@@ -315,10 +318,18 @@ def _get_custom_job_proto(
     user_requirements=False,
     custom_commands=False,
     persistent_resource_id=None,
+    environment_image_uri=None,
 ):
     job = copy.deepcopy(_TEST_CUSTOM_JOB_PROTO)
     if display_name:
         job.display_name = display_name
+    if environment_image_uri:
+        job.job_spec.worker_pool_specs[
+            0
+        ].container_spec.image_uri = environment_image_uri
+        job.job_spec.worker_pool_specs[0].container_spec.command[-1] = (
+            "export PIP_ROOT_USER_ACTION=ignore && " + _TEST_TRAINING_COMMAND
+        )
     if container_uri:
         job.job_spec.worker_pool_specs[0].container_spec.image_uri = container_uri
         job.job_spec.worker_pool_specs[0].container_spec.command[-1] = (
@@ -661,6 +672,20 @@ def mock_get_custom_job():
         yield mock_get_custom_job
 
 
+@pytest.fixture
+def mock_docker_execute_command():
+    def _execute_command(command, input_str=None):
+        # Environment images are not stored in the registry yet.
+        return 1 if command[:3] == ["docker", "manifest", "inspect"] else 0
+
+    training._environment_images.clear()
+    with patch.object(
+        training.local_util, "execute_command", side_effect=_execute_command
+    ) as mock_docker_execute_command:
+        yield mock_docker_execute_command
+    training._environment_images.clear()
+
+
 @pytest.fixture
 def update_context_mock():
     with patch.object(MetadataServiceClient, "update_context") as update_context_mock:
@@ -784,6 +809,149 @@ class TestRemoteTraining:
         # `model.score` raises NotFittedError if the model is not updated
         model.score(_X_TEST, _Y_TEST)
 
+    @pytest.mark.usefixtures(
+        "mock_timestamped_unique_name", "mock_get_custom_job", "mock_autolog_disabled"
+    )
+    def test_remote_training_sklearn_reuses_serialized_inputs(
+        self,
+        mock_any_serializer_sklearn,
+        mock_create_custom_job,
+        mock_serialized_input_cache,
+    ):
+        (
+            mock_get_cached_input_metadata,
+            mock_copy_gcs_object,
+        ) = mock_serialized_input_cache
+        mock_get_cached_input_metadata.return_value = {
+            serializers_base.SERIALIZATION_METADATA_DEPENDENCIES_KEY: [
+                f"numpy=={np.__version__}",
+                f"cloudpickle=={cloudpickle.__version__}",
+            ],
+            serializers_base.SERIALIZATION_METADATA_CUSTOM_COMMANDS_KEY: [],
+        }
+        vertexai.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            staging_bucket=_TEST_BUCKET_NAME,
+        )
+        vertexai.preview.init(remote=True)
+
+        LogisticRegression = vertexai.preview.remote(_logistic.LogisticRegression)
+        model = LogisticRegression()
+        model.fit(_X_TRAIN, _Y_TRAIN)
+
+        # check that the cached args are copied instead of serialized
+        mock_serialize = mock_any_serializer_sklearn.return_value.serialize
+        serialized_objects = [
+            call_args.kwargs["to_serialize"]
+            if "to_serialize" in call_args.kwargs
+            else call_args.args[0]
+            for call_args in mock_serialize.call_args_list
+        ]
+        assert not any(obj is _X_TRAIN or obj is _Y_TRAIN for obj in serialized_objects)
+        x_train_cache_path = (
+            f"{_TEST_BUCKET_NAME}/vertex_ai_remote_input_cache/"
+            f"{training._get_input_fingerprint(_X_TRAIN)}/input"
+        )
+        assert (
+            mock.call(
+                x_train_cache_path,
+                os.path.join(_TEST_REMOTE_JOB_BASE_PATH, "input/X"),
+            )
+            in mock_copy_gcs_object.call_args_list
+        )
+        assert (
+            mock.call(
+                os.path.join(
+                    os.path.dirname(x_train_cache_path),
+                    "serialization_metadata_input.json",
+                ),
+                os.path.join(
+                    _TEST_REMOTE_JOB_BASE_PATH, "input/serialization_metadata_X.json"
+                ),
+            )
+            in mock_copy_gcs_object.call_args_list
+        )
+        assert mock_copy_gcs_object.call_count == 4
+
+        # check that the requirements of the cached args are installed
+        mock_create_custom_job.assert_called_once_with(
+            parent=_TEST_PARENT,
+            custom_job=_get_custom_job_proto(),
+            timeout=None,
+        )
+
+    def test_serialize_input_stores_input_once(self, mock_serialized_input_cache):
+        (
+            mock_get_cached_input_metadata,
+            mock_copy_gcs_object,
+        ) = mock_serialized_input_cache
+        serializer = mock.Mock()
+        serializer.serialize.return_value = {
+            serializers_base.SERIALIZATION_METADATA_DEPENDENCIES_KEY: ["numpy"],
+        }
+        input_paths = [
+            os.path.join(_TEST_BUCKET_NAME, f"remote-job-{i}", "input", "X")
+            for i in range(2)
+        ]
+        cache_path = (
+            f"{_TEST_BUCKET_NAME}/vertex_ai_remote_input_cache/"
+            f"{training._get_input_fingerprint(_X_TRAIN)}/input"
+        )
+
+        for input_path in input_paths:
+            assert (
+                training._serialize_input(serializer, _X_TRAIN, input_path)
+                == serializer.serialize.return_value
+            )
+
+        # The input is serialized once, and later found in this process.
+        serializer.serialize.assert_called_once_with(
+            to_serialize=_X_TRAIN, gcs_path=input_paths[0]
+        )
+        mock_get_cached_input_metadata.assert_called_once_with(cache_path)
+        assert mock_copy_gcs_object.call_args_list[:2] == [
+            mock.call(input_paths[0], cache_path),
+            mock.call(
+                os.path.join(
+                    os.path.dirname(input_paths[0]), "serialization_metadata_X.json"
+                ),
+                os.path.join(
+                    os.path.dirname(cache_path), "serialization_metadata_input.json"
+                ),
+            ),
+        ]
+        assert mock.call(cache_path, input_paths[1]) in (
+            mock_copy_gcs_object.call_args_list
+        )
+
+    def test_get_input_fingerprint(self):
+        fingerprint = training._get_input_fingerprint(_X_TRAIN)
+
+        assert training._get_input_fingerprint(_X_TRAIN.copy()) == fingerprint
+        assert training._get_input_fingerprint(_X_TRAIN + 1) != fingerprint
+        assert (
+            training._get_input_fingerprint(_X_TRAIN.astype("float32")) != fingerprint
+        )
+        assert training._get_input_fingerprint(_X_TRAIN.reshape(-1)) != fingerprint
+        # Arrays of Python objects and other objects are always serialized.
+        assert training._get_input_fingerprint(_X_TRAIN.astype(object)) is None
+        assert training._get_input_fingerprint([1, 2, 3]) is None
+
+    def test_get_input_fingerprint_dataframe(self):
+        df = pd.DataFrame(_X_TRAIN, columns=["a", "b", "c", "d"])
+        fingerprint = training._get_input_fingerprint(df)
+
+        assert training._get_input_fingerprint(df.copy()) == fingerprint
+        assert (
+            training._get_input_fingerprint(df.rename(columns={"a": "e"}))
+            != fingerprint
+        )
+        assert training._get_input_fingerprint(df.iloc[1:]) != fingerprint
+        # String columns are hashed, other Python objects are not.
+        assert training._get_input_fingerprint(df.assign(e="text")) is not None
+        assert training._get_input_fingerprint(df.assign(e=[[0]] * len(df))) is None
+
     @pytest.mark.usefixtures(
         "mock_timestamped_unique_name", "mock_get_custom_job", "mock_autolog_disabled"
     )
@@ -912,6 +1080,126 @@ class TestRemoteTraining:
         # `model.score` raises NotFittedError if the model is not updated
         model.score(_X_TEST, _Y_TEST)
 
+    @pytest.mark.usefixtures(
+        "mock_timestamped_unique_name",
+        "mock_get_custom_job",
+        "mock_autolog_disabled",
+        "mock_any_serializer_sklearn",
+    )
+    def test_remote_training_sklearn_with_environment_image(
+        self,
+        mock_create_custom_job,
+        mock_docker_execute_command,
+    ):
+        vertexai.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            staging_bucket=_TEST_BUCKET_NAME,
+        )
+        vertexai.preview.init(remote=True)
+
+        LogisticRegression = vertexai.preview.remote(_logistic.LogisticRegression)
+        model = LogisticRegression()
+        model.fit.vertex.remote_config.custom_commands = _TEST_CUSTOM_COMMANDS
+        model.fit.vertex.remote_config.environment_image_repository = (
+            _TEST_ENVIRONMENT_IMAGE_REPOSITORY
+        )
+
+        model.fit(_X_TRAIN, _Y_TRAIN)
+
+        # check that the environment image is built and pushed once
+        requirements = [
+            training.VERTEX_AI_DEPENDENCY_PATH,
+            "absl-py==1.4.0",
+            f"scikit-learn=={sklearn.__version__}",
+            f"numpy=={np.__version__}",
+            f"cloudpickle=={cloudpickle.__version__}",
+        ]
+        environment_image_uri = (
+            f"{_TEST_ENVIRONMENT_IMAGE_REPOSITORY}:"
+            + training._get_environment_hash(
+                supported_frameworks._get_cpu_container_uri(),
+                _TEST_CUSTOM_COMMANDS,
+                requirements,
+            )
+        )
+        build_command = ["docker", "build", "-t", environment_image_uri, "--rm", "-"]
+        assert mock_docker_execute_command.call_args_list == [
+            mock.call(["docker", "manifest", "inspect", environment_image_uri]),
+            mock.call(
+                build_command,
+                input_str=training._make_environment_dockerfile(
+                    supported_frameworks._get_cpu_container_uri(),
+                    _TEST_CUSTOM_COMMANDS,
+                    requirements,
+                ),
+            ),
+            mock.call(["docker", "push", environment_image_uri]),
+        ]
+
+        # check that the job runs in the environment image without installing
+        expected_custom_job = _get_custom_job_proto(
+            environment_image_uri=environment_image_uri
+        )
+        mock_create_custom_job.assert_called_once_with(
+            parent=_TEST_PARENT,
+            custom_job=expected_custom_job,
+            timeout=None,
+        )
+
+        # check that a job with the same environment reuses the image
+        assert environment_image_uri == training._get_environment_image(
+            _TEST_ENVIRONMENT_IMAGE_REPOSITORY,
+            supported_frameworks._get_cpu_container_uri(),
+            _TEST_CUSTOM_COMMANDS,
+            requirements,
+        )
+        assert mock_docker_execute_command.call_count == 3
+
+    def test_get_environment_image_reuses_stored_image(
+        self, mock_docker_execute_command
+    ):
+        mock_docker_execute_command.side_effect = None
+        mock_docker_execute_command.return_value = 0
+
+        image_uri = training._get_environment_image(
+            _TEST_ENVIRONMENT_IMAGE_REPOSITORY, "python:3.10", [], _TEST_REQUIREMENTS
+        )
+
+        assert image_uri.startswith(f"{_TEST_ENVIRONMENT_IMAGE_REPOSITORY}:")
+        mock_docker_execute_command.assert_called_once_with(
+            ["docker", "manifest", "inspect", image_uri]
+        )
+
+    def test_get_environment_image_raises_on_build_failure(
+        self, mock_docker_execute_command
+    ):
+        mock_docker_execute_command.side_effect = None
+        mock_docker_execute_command.return_value = 1
+
+        with pytest.raises(docker_errors.DockerError):
+            training._get_environment_image(
+                _TEST_ENVIRONMENT_IMAGE_REPOSITORY, "python:3.10", [], ["numpy"]
+            )
+
+        # a failed build is not remembered as stored
+        assert not training._environment_images
+
+    def test_get_environment_hash(self):
+        environment_hash = training._get_environment_hash(
+            "python:3.10", _TEST_CUSTOM_COMMANDS, _TEST_REQUIREMENTS
+        )
+
+        assert environment_hash == training._get_environment_hash(
+            "python:3.10", _TEST_CUSTOM_COMMANDS, _TEST_REQUIREMENTS[::-1]
+        )
+        assert environment_hash != training._get_environment_hash(
+            "python:3.11", _TEST_CUSTOM_COMMANDS, _TEST_REQUIREMENTS
+        )
+        assert environment_hash != training._get_environment_hash(
+            "python:3.10", [], _TEST_REQUIREMENTS
+        )
+
     @pytest.mark.usefixtures(
         "mock_timestamped_unique_name", "mock_get_custom_job", "mock_autolog_disabled"
     )
@@ -16,8 +16,10 @@
 """Tests for hyperparameter_tuning/vizier_hyperparameter_tuner.py.
 """
 
-import concurrent
+import itertools
 from importlib import reload
+import threading
+import time
 from unittest import mock
 
 from google.cloud import aiplatform
@@ -244,11 +246,30 @@ def mock_model_custom_metric():
 
 
 @pytest.fixture
-def mock_executor_map():
-    with mock.patch.object(
-        concurrent.futures.ThreadPoolExecutor, "map"
-    ) as executor_map_mock:
-        yield executor_map_mock
+def mock_run_trial():
+    with mock.patch.object(VizierHyperparameterTuner, "_run_trial") as run_trial_mock:
+        yield run_trial_mock
+
+
+def _suggest_trials_in_order(mock_suggest_trials):
+    """Makes the Vizier client suggest trial_1, trial_2, ... in order."""
+    trial_names = (f"trial_{i}" for i in itertools.count(1))
+
+    def suggest_trials(request):
+        suggest_trials_operation = mock.Mock()
+        suggest_trials_operation.result.return_value = SuggestTrialsResponse(
+            trials=[
+                Trial(name=next(trial_names))
+                for _ in range(request["suggestion_count"])
+            ]
+        )
+        return suggest_trials_operation
+
+    mock_suggest_trials.side_effect = suggest_trials
+
+
+def _get_trial_name(run_trial_args):
+    return run_trial_args[4].name
 
 
 @pytest.fixture
@@ -1372,29 +1393,22 @@ class TestVizierHyperparameterTuner:
     @pytest.mark.usefixtures("google_auth_mock", "mock_uuid", "mock_create_study")
     def test_fit(
         self,
-        mock_executor_map,
+        mock_run_trial,
         mock_suggest_trials,
         mock_complete_trial,
     ):
         def get_model_func():
             return
 
-        mock_suggest_trials.return_value.result.side_effect = [
-            SuggestTrialsResponse(
-                trials=[Trial(name="trial_1"), Trial(name="trial_2")]
-            ),
-            SuggestTrialsResponse(
-                trials=[
-                    Trial(name="trial_3"),
-                    Trial(name="trial_4"),
-                ]
-            ),
-        ]
+        _suggest_trials_in_order(mock_suggest_trials)
         model_1, model_2, model_3, model_4 = (mock.Mock() for _ in range(4))
-        mock_executor_map.side_effect = [
-            [(model_1, 0.01), (model_2, 0.03)],
-            [(model_3, 0.02), (model_4, 0.05)],
-        ]
+        trial_outputs = {
+            "trial_1": (model_1, 0.01),
+            "trial_2": (model_2, 0.03),
+            "trial_3": (model_3, 0.02),
+            "trial_4": (model_4, 0.05),
+        }
+        mock_run_trial.side_effect = lambda *args: trial_outputs[_get_trial_name(args)]
         test_tuner = VizierHyperparameterTuner(
             get_model_func=get_model_func,
             max_trial_count=4,
@@ -1403,10 +1417,17 @@ class TestVizierHyperparameterTuner:
         )
         test_tuner.fit(x=_TEST_X_TEST, y=_TEST_Y_TEST_CLASSIFICATION_BINARY)
 
-        assert mock_suggest_trials.call_count == 2
-        assert mock_executor_map.call_count == 2
-        # check fixed_runtime_params in first executor.map call is empty
-        assert not mock_executor_map.call_args_list[0][0][1][0][6]
+        suggestion_counts = [
+            call_args[0][0]["suggestion_count"]
+            for call_args in mock_suggest_trials.call_args_list
+        ]
+        # Trials are suggested as slots free up, never more than fit in them.
+        assert suggestion_counts[0] == 2
+        assert sum(suggestion_counts) == 4
+        assert max(suggestion_counts) <= 2
+        assert mock_run_trial.call_count == 4
+        # check fixed_runtime_params in first _run_trial call is empty
+        assert not mock_run_trial.call_args_list[0][0][6]
         assert mock_complete_trial.call_count == 4
         assert test_tuner.models == {
             "trial_1": model_1,
@@ -1418,35 +1439,23 @@ class TestVizierHyperparameterTuner:
     @pytest.mark.usefixtures("google_auth_mock", "mock_uuid", "mock_create_study")
     def test_fit_varying_parallel_trial_count_and_fixed_runtime_params(
         self,
-        mock_executor_map,
+        mock_run_trial,
         mock_suggest_trials,
         mock_complete_trial,
     ):
         def get_model_func():
             return
 
-        mock_suggest_trials.return_value.result.side_effect = [
-            SuggestTrialsResponse(
-                trials=[Trial(name="trial_1"), Trial(name="trial_2")]
-            ),
-            SuggestTrialsResponse(
-                trials=[
-                    Trial(name="trial_3"),
-                    Trial(name="trial_4"),
-                ]
-            ),
-            SuggestTrialsResponse(
-                trials=[
-                    Trial(name="trial_5"),
-                ]
-            ),
-        ]
+        _suggest_trials_in_order(mock_suggest_trials)
         model_1, model_2, model_3, model_4, model_5 = (mock.Mock() for _ in range(5))
-        mock_executor_map.side_effect = [
-            [(model_1, 0.01), (model_2, 0.03)],
-            [(model_3, 0.02), (model_4, 0.05)],
-            [(model_5, 0.06)],
-        ]
+        trial_outputs = {
+            "trial_1": (model_1, 0.01),
+            "trial_2": (model_2, 0.03),
+            "trial_3": (model_3, 0.02),
+            "trial_4": (model_4, 0.05),
+            "trial_5": (model_5, 0.06),
+        }
+        mock_run_trial.side_effect = lambda *args: trial_outputs[_get_trial_name(args)]
         test_tuner = VizierHyperparameterTuner(
             get_model_func=get_model_func,
             max_trial_count=5,
@@ -1461,10 +1470,16 @@ class TestVizierHyperparameterTuner:
             num_epochs=5,
         )
 
-        assert mock_suggest_trials.call_count == 3
-        assert mock_executor_map.call_count == 3
-        # check fixed_runtime_params in first executor.map call is non-empty
-        assert mock_executor_map.call_args_list[0][0][1][0][6] == {"num_epochs": 5}
+        assert (
+            sum(
+                call_args[0][0]["suggestion_count"]
+                for call_args in mock_suggest_trials.call_args_list
+            )
+            == 5
+        )
+        assert mock_run_trial.call_count == 5
+        # check fixed_runtime_params in first _run_trial call is non-empty
+        assert mock_run_trial.call_args_list[0][0][6] == {"num_epochs": 5}
         assert mock_complete_trial.call_count == 5
         assert test_tuner.models == {
             "trial_1": model_1,
@@ -1477,7 +1492,7 @@ class TestVizierHyperparameterTuner:
     @pytest.mark.usefixtures("google_auth_mock", "mock_uuid", "mock_create_study")
     def test_fit_max_failed_trial_count(
         self,
-        mock_executor_map,
+        mock_run_trial,
         mock_suggest_trials,
         mock_complete_trial,
     ):
@@ -1488,7 +1503,7 @@ class TestVizierHyperparameterTuner:
             trials=[Trial(name="trial_1")]
         )
 
-        mock_executor_map.return_value = [None]
+        mock_run_trial.return_value = None
 
         test_tuner = VizierHyperparameterTuner(
             get_model_func=get_model_func,
@@ -1508,16 +1523,16 @@ class TestVizierHyperparameterTuner:
             )
 
         assert mock_suggest_trials.call_count == 1
-        assert mock_executor_map.call_count == 1
-        # check fixed_runtime_params in first executor.map call is non-empty
-        assert mock_executor_map.call_args_list[0][0][1][0][6] == {"num_epochs": 5}
+        assert mock_run_trial.call_count == 1
+        # check fixed_runtime_params in first _run_trial call is non-empty
+        assert mock_run_trial.call_args_list[0][0][6] == {"num_epochs": 5}
         assert mock_complete_trial.call_count == 1
         assert not test_tuner.models
 
     @pytest.mark.usefixtures("google_auth_mock", "mock_uuid", "mock_create_study")
     def test_fit_all_trials_failed(
         self,
-        mock_executor_map,
+        mock_run_trial,
         mock_suggest_trials,
         mock_complete_trial,
     ):
@@ -1529,7 +1544,7 @@ class TestVizierHyperparameterTuner:
             SuggestTrialsResponse(trials=[Trial(name="trial_2")]),
         ]
 
-        mock_executor_map.return_value = [None]
+        mock_run_trial.return_value = None
 
         test_tuner = VizierHyperparameterTuner(
             get_model_func=get_model_func,
@@ -1546,7 +1561,7 @@ class TestVizierHyperparameterTuner:
             )
 
         assert mock_suggest_trials.call_count == 2
-        assert mock_executor_map.call_count == 2
+        assert mock_run_trial.call_count == 2
         assert mock_complete_trial.call_count == 2
         assert not test_tuner.models
 
@@ -1605,7 +1620,7 @@ class TestVizierHyperparameterTuner:
         self,
         test_get_model_func,
         expected_fixed_init_params,
-        mock_executor_map,
+        mock_run_trial,
         mock_suggest_trials,
         mock_complete_trial,
     ):
@@ -1616,11 +1631,11 @@ class TestVizierHyperparameterTuner:
             SuggestTrialsResponse(trials=[Trial(name="trial_4")]),
         ]
         model_1, model_2, model_3, model_4 = (mock.Mock() for _ in range(4))
-        mock_executor_map.side_effect = [
-            [(model_1, 0.01)],
-            [(model_2, 0.03)],
-            [(model_3, 0.02)],
-            [(model_4, 0.05)],
+        mock_run_trial.side_effect = [
+            (model_1, 0.01),
+            (model_2, 0.03),
+            (model_3, 0.02),
+            (model_4, 0.05),
         ]
         test_tuner = VizierHyperparameterTuner(
             get_model_func=test_get_model_func,
@@ -1636,9 +1651,9 @@ class TestVizierHyperparameterTuner:
         )
 
         assert mock_suggest_trials.call_count == 4
-        assert mock_executor_map.call_count == 4
-        # check fixed_runtime_params in first executor.map call is empty
-        assert not mock_executor_map.call_args_list[0][0][1][0][6]
+        assert mock_run_trial.call_count == 4
+        # check fixed_runtime_params in first _run_trial call is empty
+        assert not mock_run_trial.call_args_list[0][0][6]
         assert mock_complete_trial.call_count == 4
         assert test_tuner.models == {
             "trial_1": model_1,
@@ -1647,19 +1662,117 @@ class TestVizierHyperparameterTuner:
             "trial_4": model_4,
         }
 
-        test_map_args = [call_args[0] for call_args in mock_executor_map.call_args_list]
-        test_fixed_init_params = []
-        for map_args in test_map_args:
-            test_fixed_init_params.append(
-                [trial_inputs[5] for trial_inputs in map_args[1]]
-            )
+        test_fixed_init_params = [
+            call_args[0][5] for call_args in mock_run_trial.call_args_list
+        ]
         assert test_fixed_init_params == [
-            [expected_fixed_init_params],
-            [expected_fixed_init_params],
-            [expected_fixed_init_params],
-            [expected_fixed_init_params],
+            expected_fixed_init_params,
+            expected_fixed_init_params,
+            expected_fixed_init_params,
+            expected_fixed_init_params,
         ]
 
+    @pytest.mark.usefixtures("google_auth_mock", "mock_uuid", "mock_create_study")
+    def test_fit_suggests_trial_when_slot_frees(
+        self,
+        mock_run_trial,
+        mock_suggest_trials,
+        mock_complete_trial,
+    ):
+        def get_model_func():
+            return
+
+        _suggest_trials_in_order(mock_suggest_trials)
+        trial_1_finished = threading.Event()
+
+        def run_trial(*args):
+            # trial_1 runs until trial_2 and trial_3 ran in the other slot.
+            if _get_trial_name(args) == "trial_1":
+                trial_1_finished.wait(timeout=60)
+            elif _get_trial_name(args) == "trial_3":
+                trial_1_finished.set()
+            return mock.Mock(), 0.5
+
+        mock_run_trial.side_effect = run_trial
+        test_tuner = VizierHyperparameterTuner(
+            get_model_func=get_model_func,
+            max_trial_count=3,
+            parallel_trial_count=2,
+            hparam_space=[],
+        )
+        test_tuner.fit(x=_TEST_X_TEST, y=_TEST_Y_TEST_CLASSIFICATION_BINARY)
+
+        assert [
+            call_args[0][0]["suggestion_count"]
+            for call_args in mock_suggest_trials.call_args_list
+        ] == [2, 1]
+        assert mock_complete_trial.call_count == 3
+        trial_metrics = test_tuner.utilization_metrics["trials"]
+        assert trial_metrics["trial_3"]["slot"] == trial_metrics["trial_2"]["slot"]
+        assert trial_metrics["trial_1"]["slot"] != trial_metrics["trial_2"]["slot"]
+        assert all(m["state"] == "SUCCEEDED" for m in trial_metrics.values())
+        slot_metrics = test_tuner.utilization_metrics["slots"]
+        assert sorted(m["trial_count"] for m in slot_metrics.values()) == [1, 2]
+        assert 0 < test_tuner.utilization_metrics["utilization"] <= 1
+
+    @pytest.mark.usefixtures("google_auth_mock", "mock_uuid", "mock_create_study")
+    def test_fit_stops_straggler_trials(
+        self,
+        mock_run_trial,
+        mock_suggest_trials,
+        mock_complete_trial,
+    ):
+        def get_model_func():
+            return
+
+        _suggest_trials_in_order(mock_suggest_trials)
+        release_straggler = threading.Event()
+        models = {}
+
+        def run_trial(*args):
+            if _get_trial_name(args) == "trial_2":
+                release_straggler.wait(timeout=60)
+            else:
+                time.sleep(0.1)
+            models[_get_trial_name(args)] = mock.Mock()
+            return models[_get_trial_name(args)], 0.5
+
+        mock_run_trial.side_effect = run_trial
+        test_tuner = VizierHyperparameterTuner(
+            get_model_func=get_model_func,
+            max_trial_count=5,
+            parallel_trial_count=2,
+            hparam_space=[],
+            straggler_factor=3.0,
+        )
+        try:
+            test_tuner.fit(x=_TEST_X_TEST, y=_TEST_Y_TEST_CLASSIFICATION_BINARY)
+        finally:
+            release_straggler.set()
+
+        mock_complete_trial.assert_any_call(
+            {
+                "name": "trial_2",
+                "trial_infeasible": True,
+                "infeasible_reason": "Stopped as a straggler.",
+            }
+        )
+        assert mock_complete_trial.call_count == 5
+        assert set(test_tuner.models) == {"trial_1", "trial_3", "trial_4", "trial_5"}
+        trial_metrics = test_tuner.utilization_metrics["trials"]
+        assert trial_metrics["trial_2"]["state"] == "STOPPED"
+
+    @pytest.mark.usefixtures("google_auth_mock", "mock_uuid", "mock_create_study")
+    def test_vizier_hyper_parameter_tuner_invalid_straggler_factor(self):
+        with pytest.raises(ValueError, match="straggler_factor must be greater"):
+            VizierHyperparameterTuner(
+                get_model_func=None,
+                max_trial_count=4,
+                parallel_trial_count=2,
+                hparam_space=[],
+                straggler_factor=0,
+            )
+
     @pytest.mark.usefixtures("google_auth_mock", "mock_create_study")
     def test_get_lightning_train_method_and_params_local(self):
         vertexai.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
@@ -14,8 +14,29 @@
 #
 """The vertexai module."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from google.cloud.aiplatform import init
-from vertexai import preview
+
+if TYPE_CHECKING:
+    from vertexai import preview
+
+
+def __getattr__(name: str):
+    """Imports the subpackages, e.g. `vertexai.preview`, on first access (PEP 562).
+
+    `vertexai.preview` imports most of the SDK, so it is not imported up front.
+    """
+    if not name.startswith("__"):
+        module_name = f"{__name__}.{name}"
+        try:
+            return importlib.import_module(module_name)
+        except ModuleNotFoundError as e:
+            if e.name != module_name:
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "init",
@@ -16,7 +16,12 @@
 """Base class for working with Model Garden models."""
 
 import dataclasses
-from typing import Dict, Optional, Type, TypeVar
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple, Type, TypeVar
 
 from google.cloud import aiplatform
 from google.cloud.aiplatform import base
@@ -57,12 +62,21 @@ _SDK_GA_LAUNCH_STAGE = frozenset([gca_publisher_model.PublisherModel.LaunchStage
 
 _LOGGER = base.Logger(__name__)
 
+# How long resolved PublisherModel resources are reused.
+_DEFAULT_PUBLISHER_MODEL_CACHE_TTL_SECS = 3600
+# The directory of a persistent cache of PublisherModel resources, which lets new
+# processes, e.g. cold-started serverless workers, skip the lookups. Not used if
+# the environment variable is unset.
+_PUBLISHER_MODEL_CACHE_DIR_ENV_VAR = "VERTEXAI_PUBLISHER_MODEL_CACHE_DIR"
+
 T = TypeVar("T", bound="_ModelGardenModel")
 
 # When this module is initialized, _SUBCLASSES contains a mapping of SDK class to the Model Garden instance for that class.
 # The key is the SDK class since multiple classes can share a schema URI (i.e. _PreviewTextGenerationModel and TextGenerationModel)
 # For example: {"<class 'google.cloud.aiplatform.vertexai.language_models._language_models._TextGenerationModel'>: gs://google-cloud-aiplatform/schema/predict/instance/text_generation_1.0.0.yaml"}
 _SUBCLASSES = {}
+# Maps a schema URI to the first registered Preview SDK class with that schema URI.
+_PREVIEW_SUBCLASSES_BY_SCHEMA_URI = {}
 
 
 def _get_model_class_from_schema_uri(
@@ -81,15 +95,136 @@ def _get_model_class_from_schema_uri(
         ValueError
             If the provided PublisherModel schema_uri isn't supported by the SDK in Preview.
     """
-
-    for sdk_class in _SUBCLASSES:
-        class_schema_uri = _SUBCLASSES[sdk_class]
-        if class_schema_uri == schema_uri and "preview" in sdk_class.__module__:
-            return sdk_class
+    sdk_class = _PREVIEW_SUBCLASSES_BY_SCHEMA_URI.get(schema_uri)
+    if sdk_class:
+        return sdk_class
 
     raise ValueError("This model is not supported in Preview by the Vertex SDK.")
 
 
+class _PublisherModelCache:
+    """A process-wide cache of PublisherModel resources.
+
+    Resources are cached per model, project and location, and are fetched again
+    after `ttl_secs`. If a cache directory is set, resources are also stored
+    there and reused by other processes.
+    """
+
+    def __init__(
+        self,
+        ttl_secs: float = _DEFAULT_PUBLISHER_MODEL_CACHE_TTL_SECS,
+        cache_dir: Optional[str] = None,
+    ):
+        """Initializes the cache.
+
+        Args:
+            ttl_secs (float):
+                Optional. How long a fetched resource is reused, in seconds.
+            cache_dir (str):
+                Optional. The directory of the persistent cache. Resources are only
+                cached in memory if not set.
+        """
+        self._ttl_secs = ttl_secs
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        # Maps (model_id, project, location) to (fetch_time, resource).
+        self._resources: Dict[
+            Tuple[str, str, str], Tuple[float, gca_publisher_model.PublisherModel]
+        ] = {}
+
+    def get(self, model_id: str) -> gca_publisher_model.PublisherModel:
+        """Gets the PublisherModel resource of a model, fetching it if needed.
+
+        Args:
+            model_id (str):
+                Required. The resource name of the model, for example:
+                "publishers/google/models/text-bison@001".
+
+        Returns:
+            The PublisherModel resource.
+        """
+        key = (
+            model_id,
+            aiplatform_initializer.global_config.project,
+            aiplatform_initializer.global_config.location,
+        )
+        now = time.time()
+        with self._lock:
+            entry = self._resources.get(key)
+        if entry is None and self._cache_dir:
+            entry = self._read_entry(key)
+        if entry is None or entry[0] + self._ttl_secs <= now:
+            # pylint: disable-next=protected-access
+            resource = _publisher_models._PublisherModel(
+                resource_name=model_id
+            )._gca_resource
+            entry = (now, resource)
+            if self._cache_dir:
+                self._write_entry(key, entry)
+        with self._lock:
+            self._resources[key] = entry
+        return entry[1]
+
+    def clear(self):
+        """Removes the resources cached in memory."""
+        with self._lock:
+            self._resources.clear()
+
+    def _get_path(self, key: Tuple[str, str, str]) -> str:
+        """Returns the path of the file caching a resource."""
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, f"{digest}.json")
+
+    def _read_entry(
+        self, key: Tuple[str, str, str]
+    ) -> Optional[Tuple[float, gca_publisher_model.PublisherModel]]:
+        """Reads a cached resource from the cache directory, if any."""
+        try:
+            with open(self._get_path(key)) as f:
+                entry = json.load(f)
+            return (
+                entry["fetch_time"],
+                gca_publisher_model.PublisherModel.from_json(
+                    entry["publisher_model"], ignore_unknown_fields=True
+                ),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            _LOGGER.warning(f"Ignoring the invalid cached PublisherModel: {e}")
+            return None
+
+    def _write_entry(
+        self,
+        key: Tuple[str, str, str],
+        entry: Tuple[float, gca_publisher_model.PublisherModel],
+    ):
+        """Writes a resource to the cache directory."""
+        fetch_time, resource = entry
+        path = self._get_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "fetch_time": fetch_time,
+                        "publisher_model": gca_publisher_model.PublisherModel.to_json(
+                            resource
+                        ),
+                    },
+                    f,
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _LOGGER.warning(f"Failed to cache the PublisherModel: {e}")
+
+
+_publisher_model_cache = _PublisherModelCache(
+    cache_dir=os.environ.get(_PUBLISHER_MODEL_CACHE_DIR_ENV_VAR)
+)
+
+
 @dataclasses.dataclass
 class _ModelInfo:
     endpoint_name: str
@@ -130,11 +265,7 @@ def _get_model_info(
         model_id = "publishers/google/models/" + model_id
 
     if not publisher_model_res:
-        publisher_model_res = (
-            _publisher_models._PublisherModel(  # pylint: disable=protected-access
-                resource_name=model_id
-            )._gca_resource
-        )
+        publisher_model_res = _publisher_model_cache.get(model_id)
 
     if not publisher_model_res.name.startswith("publishers/google/models/"):
         raise ValueError(
@@ -277,6 +408,8 @@ class _ModelGardenModel:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         _SUBCLASSES[cls] = cls._INSTANCE_SCHEMA_URI
+        if cls._INSTANCE_SCHEMA_URI and "preview" in cls.__module__:
+            _PREVIEW_SUBCLASSES_BY_SCHEMA_URI.setdefault(cls._INSTANCE_SCHEMA_URI, cls)
 
     def __init__(self, model_id: str, endpoint_name: Optional[str] = None):
         """Creates a _ModelGardenModel.
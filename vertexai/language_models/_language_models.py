@@ -14,27 +14,50 @@
 #
 """Classes for working with language models."""
 
+import asyncio
+import collections
+from concurrent import futures
 import dataclasses
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Union
+import functools
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Union,
+)
 import warnings
 
+from google.api_core import retry as api_retry
+from google.api_core import retry_async as api_retry_async
+
 from google.cloud import aiplatform
 from google.cloud.aiplatform import _streaming_prediction
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer as aiplatform_initializer
 from google.cloud.aiplatform import utils as aiplatform_utils
 from google.cloud.aiplatform.compat import types as aiplatform_types
+from google.cloud.aiplatform.utils import _value_utils
 from google.cloud.aiplatform.utils import gcs_utils
 from vertexai._model_garden import _model_garden_models
 from vertexai.language_models import (
     _evaluatable_language_models,
 )
+from vertexai.language_models import _prediction_cache
 
 try:
     import pandas
 except ImportError:
     pandas = None
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 _LOGGER = base.Logger(__name__)
 
@@ -42,6 +65,14 @@ _LOGGER = base.Logger(__name__)
 # Endpoint label/metadata key to preserve the base model ID information
 _TUNING_BASE_MODEL_ID_LABEL_KEY = "google-vertex-llm-tuning-base-model-id"
 
+# Default chunking of TextEmbeddingModel.get_embeddings_iter. Older model versions
+# accept fewer instances per request, e.g. textembedding-gecko@001 accepts 5.
+_DEFAULT_MAX_TEXT_EMBEDDING_INSTANCES_PER_REQUEST = 250
+_DEFAULT_MAX_TEXT_EMBEDDING_TOKENS_PER_REQUEST = 20000
+# Token counts are estimated from the UTF-8 size of the texts, since most tokens
+# span several bytes this overestimates them.
+_ESTIMATED_BYTES_PER_TOKEN = 3
+
 
 def _get_model_id_from_tuning_model_id(tuning_model_id: str) -> str:
     """Gets the base model ID for the model ID labels used the tuned models.
@@ -88,6 +119,148 @@ class _LanguageModel(_model_garden_models._ModelGardenModel):
             # This is a ModelRegistry resource name
             return self._endpoint.list_models()[0].model
 
+    _response_cache: Optional[_prediction_cache.PredictionCache] = None
+    _cache_nondeterministic_predictions = False
+
+    def enable_prediction_cache(
+        self,
+        cache: Optional[_prediction_cache.PredictionCache] = None,
+        *,
+        cache_nondeterministic_predictions: bool = False,
+    ) -> "_LanguageModel":
+        """Serves repeated prediction requests of the model from a local cache.
+
+        Responses are cached by a hash of the model or endpoint resource name,
+        the instances and the parameters of the request. By default, only the
+        responses of deterministic requests are cached, i.e. embeddings and text
+        generation with a temperature of 0.
+
+        Example usage:
+            ```
+            model = TextGenerationModel.from_pretrained("text-bison@001")
+            model.enable_prediction_cache()
+            model.predict("What is life?", temperature=0)
+            # Served from the cache.
+            model.predict("What is life?", temperature=0)
+            ```
+
+        Args:
+            cache (PredictionCache):
+                Optional. The cache of the responses. Can be shared by models.
+                An `InMemoryPredictionCache` is created by default.
+            cache_nondeterministic_predictions (bool):
+                Optional. Whether to also cache the responses of sampled text
+                generation, which would otherwise differ between calls.
+
+        Returns:
+            The model.
+        """
+        self._response_cache = cache or _prediction_cache.InMemoryPredictionCache()
+        self._cache_nondeterministic_predictions = cache_nondeterministic_predictions
+        return self
+
+    def disable_prediction_cache(self):
+        """Stops serving prediction requests of the model from the cache."""
+        self._response_cache = None
+
+    def _get_cache_key(
+        self,
+        instances: List[Dict[str, Any]],
+        parameters: Optional[Dict[str, Any]],
+        deterministic: bool,
+    ) -> Optional[str]:
+        """Returns the cache key of a request, or None if it is not cached."""
+        if self._response_cache is None or not (
+            deterministic or self._cache_nondeterministic_predictions
+        ):
+            return None
+        return _prediction_cache.make_cache_key(
+            self._endpoint_name, instances, parameters
+        )
+
+    def _get_cached_prediction(
+        self, cache_key: Optional[str]
+    ) -> Optional[aiplatform.models.Prediction]:
+        """Returns the cached response of a request, or None."""
+        if cache_key is None:
+            return None
+        response = self._response_cache.get(cache_key)
+        if response is None:
+            return None
+        return aiplatform.models.Prediction(**response)
+
+    def _cache_prediction(
+        self,
+        cache_key: Optional[str],
+        prediction_response: aiplatform.models.Prediction,
+    ):
+        """Stores the response of a request in the cache."""
+        if cache_key is None:
+            return
+        self._response_cache.put(
+            cache_key,
+            {
+                "predictions": prediction_response.predictions,
+                "deployed_model_id": prediction_response.deployed_model_id,
+                "model_version_id": prediction_response.model_version_id,
+                "model_resource_name": prediction_response.model_resource_name,
+            },
+        )
+
+    def _predict(
+        self,
+        instances: List[Dict[str, Any]],
+        parameters: Optional[Dict[str, Any]],
+        *,
+        deterministic: bool,
+    ) -> aiplatform.models.Prediction:
+        """Makes a prediction, served from the cache if it is enabled.
+
+        Args:
+            instances: The instances of the request.
+            parameters: The parameters of the request.
+            deterministic: Whether the response does not vary between calls.
+
+        Returns:
+            The response of the prediction request.
+        """
+        cache_key = self._get_cache_key(instances, parameters, deterministic)
+        prediction_response = self._get_cached_prediction(cache_key)
+        if prediction_response is None:
+            prediction_response = self._endpoint.predict(
+                instances=instances,
+                parameters=parameters,
+            )
+            self._cache_prediction(cache_key, prediction_response)
+        return prediction_response
+
+    async def _predict_async(
+        self,
+        instances: List[Dict[str, Any]],
+        parameters: Optional[Dict[str, Any]],
+        *,
+        deterministic: bool,
+    ) -> aiplatform.models.Prediction:
+        """Asynchronously makes a prediction, served from the cache if enabled.
+
+        Args:
+            instances: The instances of the request.
+            parameters: The parameters of the request.
+            deterministic: Whether the response does not vary between calls.
+
+        Returns:
+            The response of the prediction request.
+        """
+        cache_key = self._get_cache_key(instances, parameters, deterministic)
+        prediction_response = self._get_cached_prediction(cache_key)
+        if prediction_response is None:
+            prediction_response = await self._endpoint.predict_async(
+                instances=instances,
+                parameters=parameters,
+            )
+            self._cache_prediction(cache_key, prediction_response)
+        return prediction_response
+
 
 @dataclasses.dataclass
 class _PredictionRequest:
@@ -772,9 +945,10 @@ class _TextGenerationModel(_LanguageModel):
             candidate_count=candidate_count,
         )
 
-        prediction_response = self._endpoint.predict(
+        prediction_response = self._predict(
             instances=[prediction_request.instance],
             parameters=prediction_request.parameters,
+            deterministic=_is_deterministic(prediction_request.parameters),
         )
 
         return _parse_text_generation_model_multi_candidate_response(prediction_response)
@@ -814,9 +988,10 @@ class _TextGenerationModel(_LanguageModel):
             candidate_count=candidate_count,
         )
 
-        prediction_response = await self._endpoint.predict_async(
+        prediction_response = await self._predict_async(
             instances=[prediction_request.instance],
             parameters=prediction_request.parameters,
+            deterministic=_is_deterministic(prediction_request.parameters),
         )
 
         return _parse_text_generation_model_multi_candidate_response(prediction_response)
@@ -920,6 +1095,11 @@ class _TextGenerationModel(_LanguageModel):
             yield _parse_text_generation_model_response(prediction_obj)
 
 
+def _is_deterministic(parameters: Optional[Dict[str, Any]]) -> bool:
+    """Returns whether text generation with the parameters is deterministic."""
+    return bool(parameters) and parameters.get("temperature") == 0
+
+
 def _create_text_generation_prediction_request(
     prompt: str,
     *,
@@ -1280,6 +1460,80 @@ class TextEmbeddingInput:
     title: Optional[str] = None
 
 
+def _to_text_embedding_instance(
+    text: Union[str, TextEmbeddingInput]
+) -> Dict[str, str]:
+    """Converts a text to embed to a prediction instance."""
+    if isinstance(text, TextEmbeddingInput):
+        instance = {"content": text.text}
+        if text.task_type:
+            instance["task_type"] = text.task_type
+        if text.title:
+            instance["title"] = text.title
+    elif isinstance(text, str):
+        instance = {"content": text}
+    else:
+        raise TypeError(f"Unsupported text embedding input type: {text}.")
+    return instance
+
+
+def _estimate_token_count(instance: Dict[str, str]) -> int:
+    """Estimates the number of tokens of a text embedding instance."""
+    text_bytes = len(instance["content"].encode("utf-8"))
+    if "title" in instance:
+        text_bytes += len(instance["title"].encode("utf-8"))
+    return text_bytes // _ESTIMATED_BYTES_PER_TOKEN + 1
+
+
+def _chunk_text_embedding_instances(
+    texts: Iterable[Union[str, TextEmbeddingInput]],
+    max_instances: int,
+    max_tokens: int,
+) -> Iterator[List[Dict[str, str]]]:
+    """Lazily converts texts to instances in chunks limited by count and tokens.
+
+    Args:
+        texts (Iterable[Union[str, TextEmbeddingInput]]):
+            Required. The texts to convert and split.
+        max_instances (int):
+            Required. The maximum number of instances in a chunk.
+        max_tokens (int):
+            Required. The maximum estimated number of tokens of a chunk. A text
+            that is longer by itself forms its own chunk.
+
+    Yields:
+        Lists of the instances of consecutive texts.
+    """
+    chunk = []
+    chunk_tokens = 0
+    for text in texts:
+        instance = _to_text_embedding_instance(text)
+        instance_tokens = _estimate_token_count(instance)
+        if chunk and (
+            len(chunk) >= max_instances or chunk_tokens + instance_tokens > max_tokens
+        ):
+            yield chunk
+            chunk = []
+            chunk_tokens = 0
+        chunk.append(instance)
+        chunk_tokens += instance_tokens
+    if chunk:
+        yield chunk
+
+
+def _text_embeddings_to_numpy(
+    prediction_response: aiplatform.models.Prediction,
+) -> "np.ndarray":
+    """Converts the embeddings of a "proto" format response to a float32 matrix."""
+    import numpy as np
+
+    values = [
+        prediction.struct_value.fields["embeddings"].struct_value.fields["values"]
+        for prediction in prediction_response.predictions
+    ]
+    return _value_utils.values_to_numpy(values).astype(np.float32)
+
+
 class TextEmbeddingModel(_LanguageModel):
     """TextEmbeddingModel class calculates embeddings for the given texts.
 
@@ -1316,19 +1570,7 @@ class TextEmbeddingModel(_LanguageModel):
         Returns:
             A `_MultiInstancePredictionRequest` object.
         """
-        instances = []
-        for text in texts:
-            if isinstance(text, TextEmbeddingInput):
-                instance = {"content": text.text}
-                if text.task_type:
-                    instance["task_type"] = text.task_type
-                if text.title:
-                    instance["title"] = text.title
-            elif isinstance(text, str):
-                instance = {"content": text}
-            else:
-                raise TypeError(f"Unsupported text embedding input type: {text}.")
-            instances.append(instance)
+        instances = [_to_text_embedding_instance(text) for text in texts]
         parameters = {"autoTruncate": auto_truncate}
         return _MultiInstancePredictionRequest(
             instances=instances,
@@ -1373,9 +1615,10 @@ class TextEmbeddingModel(_LanguageModel):
             auto_truncate=auto_truncate,
         )
 
-        prediction_response = self._endpoint.predict(
+        prediction_response = self._predict(
             instances=prediction_request.instances,
             parameters=prediction_request.parameters,
+            deterministic=True,
         )
 
         results = []
@@ -1408,9 +1651,10 @@ class TextEmbeddingModel(_LanguageModel):
             auto_truncate=auto_truncate,
         )
 
-        prediction_response = await self._endpoint.predict_async(
+        prediction_response = await self._predict_async(
             instances=prediction_request.instances,
             parameters=prediction_request.parameters,
+            deterministic=True,
         )
 
         results = []
@@ -1423,6 +1667,158 @@ class TextEmbeddingModel(_LanguageModel):
 
         return results
 
+    def get_embeddings_iter(
+        self,
+        texts: Iterable[Union[str, TextEmbeddingInput]],
+        *,
+        auto_truncate: bool = True,
+        max_instances_per_request: int = (
+            _DEFAULT_MAX_TEXT_EMBEDDING_INSTANCES_PER_REQUEST
+        ),
+        max_tokens_per_request: int = _DEFAULT_MAX_TEXT_EMBEDDING_TOKENS_PER_REQUEST,
+        max_concurrent_requests: int = (
+            aiplatform.models._DEFAULT_MAX_CONCURRENT_REQUESTS
+        ),
+        retry: Optional[api_retry.Retry] = (
+            aiplatform.models._DEFAULT_PREDICT_MANY_RETRY
+        ),
+    ) -> Iterator["np.ndarray"]:
+        """Calculates embeddings for any number of texts in concurrent requests.
+
+        The texts are consumed lazily and split into requests of at most
+        `max_instances_per_request` texts and about `max_tokens_per_request`
+        tokens. Up to `max_concurrent_requests` requests are in flight at a time,
+        and requests that failed with a quota or transient server error are
+        retried.
+
+        Example usage:
+            ```
+            for embeddings in model.get_embeddings_iter(read_documents()):
+                index.add(embeddings)
+            ```
+
+        Args:
+            texts (Iterable[Union[str, TextEmbeddingInput]]):
+                Required. The texts or `TextEmbeddingInput` objects to embed. Any
+                iterable, e.g. a generator, is accepted.
+            auto_truncate (bool):
+                Optional. Whether to automatically truncate long texts.
+            max_instances_per_request (int):
+                Optional. The maximum number of texts in a request.
+            max_tokens_per_request (int):
+                Optional. The maximum number of tokens in a request, estimated
+                from the size of the texts. A longer text is sent in its own
+                request.
+            max_concurrent_requests (int):
+                Optional. The maximum number of requests in flight at a time.
+            retry (google.api_core.retry.Retry):
+                Optional. How to retry each request. No retry is made if None.
+
+        Yields:
+            A float32 numpy array with a row per text of a request, in the order
+            of the texts.
+        """
+        parameters = {"autoTruncate": auto_truncate}
+
+        def _embed_chunk(instances: List[Dict[str, str]]) -> "np.ndarray":
+            predict_fn = functools.partial(
+                self._endpoint.predict,
+                instances=instances,
+                parameters=parameters,
+                predictions_format=_value_utils.PREDICTIONS_FORMAT_PROTO,
+            )
+            if retry is not None:
+                predict_fn = retry(predict_fn)
+            return _text_embeddings_to_numpy(predict_fn())
+
+        with futures.ThreadPoolExecutor(
+            max_workers=max_concurrent_requests
+        ) as executor:
+            pending = collections.deque()
+            for instances in _chunk_text_embedding_instances(
+                texts, max_instances_per_request, max_tokens_per_request
+            ):
+                if len(pending) >= max_concurrent_requests:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_embed_chunk, instances))
+            while pending:
+                yield pending.popleft().result()
+
+    async def get_embeddings_iter_async(
+        self,
+        texts: Iterable[Union[str, TextEmbeddingInput]],
+        *,
+        auto_truncate: bool = True,
+        max_instances_per_request: int = (
+            _DEFAULT_MAX_TEXT_EMBEDDING_INSTANCES_PER_REQUEST
+        ),
+        max_tokens_per_request: int = _DEFAULT_MAX_TEXT_EMBEDDING_TOKENS_PER_REQUEST,
+        max_concurrent_requests: int = (
+            aiplatform.models._DEFAULT_MAX_CONCURRENT_REQUESTS
+        ),
+        retry: Optional[api_retry_async.AsyncRetry] = (
+            aiplatform.models._DEFAULT_PREDICT_MANY_ASYNC_RETRY
+        ),
+    ) -> AsyncIterator["np.ndarray"]:
+        """Asynchronously calculates embeddings for any number of texts.
+
+        Works like `get_embeddings_iter`, but sends the requests with the
+        asynchronous prediction client.
+
+        Example usage:
+            ```
+            async for embeddings in model.get_embeddings_iter_async(documents):
+                index.add(embeddings)
+            ```
+
+        Args:
+            texts (Iterable[Union[str, TextEmbeddingInput]]):
+                Required. The texts or `TextEmbeddingInput` objects to embed. Any
+                iterable, e.g. a generator, is accepted.
+            auto_truncate (bool):
+                Optional. Whether to automatically truncate long texts.
+            max_instances_per_request (int):
+                Optional. The maximum number of texts in a request.
+            max_tokens_per_request (int):
+                Optional. The maximum number of tokens in a request, estimated
+                from the size of the texts. A longer text is sent in its own
+                request.
+            max_concurrent_requests (int):
+                Optional. The maximum number of requests in flight at a time.
+            retry (google.api_core.retry_async.AsyncRetry):
+                Optional. How to retry each request. No retry is made if None.
+
+        Yields:
+            A float32 numpy array with a row per text of a request, in the order
+            of the texts.
+        """
+        parameters = {"autoTruncate": auto_truncate}
+
+        async def _embed_chunk(instances: List[Dict[str, str]]) -> "np.ndarray":
+            predict_fn = functools.partial(
+                self._endpoint.predict_async,
+                instances=instances,
+                parameters=parameters,
+                predictions_format=_value_utils.PREDICTIONS_FORMAT_PROTO,
+            )
+            if retry is not None:
+                predict_fn = retry(predict_fn)
+            return _text_embeddings_to_numpy(await predict_fn())
+
+        pending = collections.deque()
+        try:
+            for instances in _chunk_text_embedding_instances(
+                texts, max_instances_per_request, max_tokens_per_request
+            ):
+                if len(pending) >= max_concurrent_requests:
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(_embed_chunk(instances)))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
 
 class _PreviewTextEmbeddingModel(
     TextEmbeddingModel, _ModelWithBatchPredict, _CountTokensMixin
@@ -2332,9 +2728,10 @@ class CodeGenerationModel(_LanguageModel):
             candidate_count=candidate_count,
         )
 
-        prediction_response = self._endpoint.predict(
+        prediction_response = self._predict(
             instances=[prediction_request.instance],
             parameters=prediction_request.parameters,
+            deterministic=_is_deterministic(prediction_request.parameters),
         )
         return _parse_text_generation_model_multi_candidate_response(prediction_response)
 
@@ -2371,9 +2768,10 @@ class CodeGenerationModel(_LanguageModel):
             candidate_count=candidate_count,
         )
 
-        prediction_response = await self._endpoint.predict_async(
+        prediction_response = await self._predict_async(
             instances=[prediction_request.instance],
             parameters=prediction_request.parameters,
+            deterministic=_is_deterministic(prediction_request.parameters),
         )
         return _parse_text_generation_model_multi_candidate_response(prediction_response)
 
@@ -0,0 +1,334 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Local caches of language model prediction responses.
+
+Responses are stored by a hash of the model resource name, the instances and
+the parameters of the request, so that resending the same request does not call
+the endpoint.
+"""
+
+import abc
+import collections
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+_DEFAULT_MAX_ENTRIES = 1024
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    expire_time REAL,
+    access_time REAL NOT NULL
+)
+"""
+_SQLITE_ACCESS_TIME_INDEX = (
+    "CREATE INDEX IF NOT EXISTS predictions_access_time " "ON predictions (access_time)"
+)
+
+
+def make_cache_key(
+    model_resource_name: str,
+    instances: List[Any],
+    parameters: Optional[Dict[str, Any]],
+) -> str:
+    """Computes the cache key of a prediction request.
+
+    Args:
+        model_resource_name (str):
+            Required. The resource name of the model or endpoint.
+        instances (List[Any]):
+            Required. The JSON serializable instances of the request.
+        parameters (Dict[str, Any]):
+            Optional. The JSON serializable parameters of the request.
+
+    Returns:
+        The hex SHA-256 digest of the canonical JSON of the request.
+    """
+    request = json.dumps(
+        [model_resource_name, instances, parameters or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+@dataclasses.dataclass
+class PredictionCacheStats:
+    """Counters of a prediction cache.
+
+    Attributes:
+        hits: The number of lookups that found a response.
+        misses: The number of lookups that found no response or an expired one.
+        evictions: The number of responses removed to bound the cache size.
+    """
+
+    __module__ = "vertexai.preview.language_models"
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found a response."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PredictionCache(abc.ABC):
+    """Base class of the caches of prediction responses.
+
+    Responses are JSON serializable dicts. Every response expires `ttl_secs`
+    after it is stored, and the least recently used responses are evicted when
+    more than `max_entries` are stored.
+    """
+
+    __module__ = "vertexai.preview.language_models"
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl_secs: Optional[float] = None,
+    ):
+        """Initializes the cache.
+
+        Args:
+            max_entries (int):
+                Optional. The maximum number of stored responses.
+            ttl_secs (float):
+                Optional. How long a response is valid after it is stored, in
+                seconds. Responses do not expire if None.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self._max_entries = max_entries
+        self._ttl_secs = ttl_secs
+        self._stats = PredictionCacheStats()
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the response stored for a key, or None."""
+        response = self._get(key, time.time())
+        with self._stats_lock:
+            if response is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return response
+
+    def put(self, key: str, response: Dict[str, Any]):
+        """Stores the response for a key."""
+        expire_time = None
+        if self._ttl_secs is not None:
+            expire_time = time.time() + self._ttl_secs
+        evictions = self._put(key, response, expire_time)
+        if evictions:
+            with self._stats_lock:
+                self._stats.evictions += evictions
+
+    def stats(self) -> PredictionCacheStats:
+        """Returns a snapshot of the counters of the cache."""
+        with self._stats_lock:
+            return dataclasses.replace(self._stats)
+
+    @abc.abstractmethod
+    def clear(self):
+        """Removes all the stored responses."""
+        pass
+
+    @abc.abstractmethod
+    def _get(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        """Returns the unexpired response stored for a key, or None."""
+        pass
+
+    @abc.abstractmethod
+    def _put(
+        self, key: str, response: Dict[str, Any], expire_time: Optional[float]
+    ) -> int:
+        """Stores a response and returns the number of evicted responses."""
+        pass
+
+
+class InMemoryPredictionCache(PredictionCache):
+    """A least recently used cache of prediction responses in memory.
+
+    Example usage:
+        ```
+        model = TextEmbeddingModel.from_pretrained("textembedding-gecko@001")
+        model.enable_prediction_cache(InMemoryPredictionCache(max_entries=10000))
+        ```
+    """
+
+    __module__ = "vertexai.preview.language_models"
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl_secs: Optional[float] = None,
+    ):
+        """Initializes the cache.
+
+        Args:
+            max_entries (int):
+                Optional. The maximum number of stored responses.
+            ttl_secs (float):
+                Optional. How long a response is valid after it is stored, in
+                seconds. Responses do not expire if None.
+        """
+        super().__init__(max_entries=max_entries, ttl_secs=ttl_secs)
+        self._lock = threading.Lock()
+        # Maps keys to (response, expire_time), from least to most recently used.
+        self._entries: Dict[
+            str, Tuple[str, Optional[float]]
+        ] = collections.OrderedDict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            serialized_response, expire_time = entry
+            if expire_time is not None and expire_time <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Responses are stored serialized so that callers cannot modify them.
+        return json.loads(serialized_response)
+
+    def _put(
+        self, key: str, response: Dict[str, Any], expire_time: Optional[float]
+    ) -> int:
+        serialized_response = json.dumps(response)
+        evictions = 0
+        with self._lock:
+            self._entries[key] = (serialized_response, expire_time)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                evictions += 1
+        return evictions
+
+
+class SqlitePredictionCache(PredictionCache):
+    """A least recently used cache of prediction responses in a SQLite file.
+
+    The cache persists across processes, and can be shared by the processes of
+    a machine.
+
+    Example usage:
+        ```
+        model = TextGenerationModel.from_pretrained("text-bison@001")
+        model.enable_prediction_cache(
+            SqlitePredictionCache("~/.cache/text-bison.sqlite", ttl_secs=86400)
+        )
+        ```
+    """
+
+    __module__ = "vertexai.preview.language_models"
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl_secs: Optional[float] = None,
+    ):
+        """Opens the cache, creating the database file if needed.
+
+        Args:
+            path (str):
+                Required. The path of the database file.
+            max_entries (int):
+                Optional. The maximum number of stored responses.
+            ttl_secs (float):
+                Optional. How long a response is valid after it is stored, in
+                seconds. Responses do not expire if None.
+        """
+        super().__init__(max_entries=max_entries, ttl_secs=ttl_secs)
+        self._path = os.path.expanduser(path)
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_SQLITE_SCHEMA)
+            self._connection.execute(_SQLITE_ACCESS_TIME_INDEX)
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM predictions")
+
+    def _get(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT response, expire_time FROM predictions WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            serialized_response, expire_time = row
+            if expire_time is not None and expire_time <= now:
+                self._connection.execute(
+                    "DELETE FROM predictions WHERE key = ?", (key,)
+                )
+                return None
+            self._connection.execute(
+                "UPDATE predictions SET access_time = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(serialized_response)
+
+    def _put(
+        self, key: str, response: Dict[str, Any], expire_time: Optional[float]
+    ) -> int:
+        serialized_response = json.dumps(response)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?)",
+                (key, serialized_response, expire_time, time.time()),
+            )
+            (entry_count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM predictions"
+            ).fetchone()
+            evictions = max(entry_count - self._max_entries, 0)
+            if evictions:
+                self._connection.execute(
+                    "DELETE FROM predictions WHERE key IN (SELECT key FROM "
+                    "predictions ORDER BY access_time LIMIT ?)",
+                    (evictions,),
+                )
+        return evictions
@@ -14,12 +14,16 @@
 #
 
 import collections
+import concurrent.futures
 import datetime
+import hashlib
 import inspect
+import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import warnings
@@ -30,13 +34,17 @@ import vertexai
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform.preview import jobs
 from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.docker_utils import errors
+from google.cloud.aiplatform.docker_utils import local_util
 from google.cloud.aiplatform.metadata import metadata
+from google.cloud.aiplatform.utils import gcs_utils
 from google.cloud.aiplatform.utils import resource_manager_utils
 from vertexai.preview._workflow import shared
 from vertexai.preview._workflow.serialization_engine import (
     any_serializer,
 )
 from vertexai.preview._workflow.serialization_engine import (
+    serializers,
     serializers_base,
 )
 from vertexai.preview._workflow.shared import constants
@@ -72,6 +80,29 @@ _LOGGER = base.Logger("vertexai.remote_execution")
 _LOG_POLL_INTERVAL = 5
 _LOG_WAIT_INTERVAL = 30
 
+# Serialized DataFrames and arrays are stored once per content under this
+# directory at the root of the staging bucket, and copied into the input
+# directory of each remote job that uses them. Being at the root, they are
+# shared by jobs with different staging directories, like tuning trials.
+_SERIALIZED_INPUT_CACHE_DIR = "vertex_ai_remote_input_cache"
+_SERIALIZED_INPUT_CACHE_FILE_NAME = "input"
+_MAX_SERIALIZATION_WORKERS = 8
+
+# Mapping from the cached inputs known to be stored to their serialization
+# metadata.
+_serialized_input_cache: Dict[str, Dict[str, Any]] = {}
+_serialized_input_cache_lock = threading.Lock()
+
+# Dependency environment images known to be stored in their repository. The
+# lock also keeps concurrent jobs from building the same image twice.
+_environment_images: Set[str] = set()
+_environment_images_lock = threading.Lock()
+
+# Temporary fix for git not installed in pytorch cuda image
+# Remove it once SDK 2.0 is release and don't need to be installed from git
+_PYTORCH_CUDA_CONTAINER_URI = "pytorch/pytorch:2.0.0-cuda11.7-cudnn8-runtime"
+_INSTALL_GIT_COMMAND = "apt-get update && apt-get install -y git"
+
 
 # TODO(b/271855597) Serialize all input args
 PASS_THROUGH_ARG_TYPES = [str, int, float, bool]
@@ -337,6 +368,284 @@ def _dedupe_requirements(requirements: List[str]) -> List[str]:
     return res
 
 
+def _get_environment_hash(
+    base_image: str, setup_commands: List[str], requirements: List[str]
+) -> str:
+    """Computes a hash of a dependency environment.
+
+    Args:
+        base_image (str):
+            Required. The image the environment is installed on.
+        setup_commands (List[str]):
+            Required. The commands run before the requirements are installed.
+        requirements (List[str]):
+            Required. The python packages to install.
+
+    Returns:
+        The hex digest of the environment.
+    """
+    environment = {
+        "base_image": base_image,
+        "setup_commands": setup_commands,
+        "requirements": sorted(requirements),
+    }
+    return hashlib.sha256(
+        json.dumps(environment, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _make_environment_dockerfile(
+    base_image: str, setup_commands: List[str], requirements: List[str]
+) -> str:
+    """Returns a Dockerfile installing a dependency environment on an image."""
+    install_commands = list(setup_commands)
+    if requirements:
+        quoted_requirements = " ".join(f"'{req}'" for req in requirements)
+        install_commands += [
+            "pip install --upgrade pip",
+            f"pip install --no-cache-dir {quoted_requirements}",
+        ]
+    return "\n".join(
+        [
+            f"FROM {base_image}",
+            "ENV PIP_ROOT_USER_ACTION=ignore",
+            f"RUN {' && '.join(install_commands)}",
+            "",
+        ]
+    )
+
+
+def _get_environment_image(
+    repository: str,
+    base_image: str,
+    setup_commands: List[str],
+    requirements: List[str],
+) -> str:
+    """Gets the image of a dependency environment, building it if needed.
+
+    The image is tagged by the hash of the environment, so that it is built and
+    pushed once, and reused by every remote job with the same environment.
+
+    Args:
+        repository (str):
+            Required. The container image repository storing the environments.
+        base_image (str):
+            Required. The image the environment is installed on.
+        setup_commands (List[str]):
+            Required. The commands run before the requirements are installed.
+        requirements (List[str]):
+            Required. The python packages to install.
+
+    Returns:
+        The URI of the environment image.
+
+    Raises:
+        DockerError: An error occurred when building or pushing the image.
+    """
+    environment_hash = _get_environment_hash(base_image, setup_commands, requirements)
+    image_uri = f"{repository}:{environment_hash}"
+    with _environment_images_lock:
+        if image_uri in _environment_images:
+            return image_uri
+
+        # `docker manifest inspect` looks the image up in the registry without
+        # pulling it.
+        inspect_command = ["docker", "manifest", "inspect", image_uri]
+        if local_util.execute_command(inspect_command) == 0:
+            _LOGGER.info(f"Reusing dependency environment image {image_uri}.")
+        else:
+            _LOGGER.info(f"Building dependency environment image {image_uri}.")
+            build_command = ["docker", "build", "-t", image_uri, "--rm", "-"]
+            return_code = local_util.execute_command(
+                build_command,
+                input_str=_make_environment_dockerfile(
+                    base_image, setup_commands, requirements
+                ),
+            )
+            if return_code != 0:
+                errors.raise_docker_error_with_command(build_command, return_code)
+
+            push_command = ["docker", "push", image_uri]
+            return_code = local_util.execute_command(push_command)
+            if return_code != 0:
+                errors.raise_docker_error_with_command(push_command, return_code)
+
+        _environment_images.add(image_uri)
+    return image_uri
+
+
+def _get_input_fingerprint(to_serialize: Any) -> Optional[str]:
+    """Computes a hash of the content of a pandas DataFrame or numpy array.
+
+    Args:
+        to_serialize (Any):
+            Required. An argument of the remote method.
+
+    Returns:
+        The hex SHA-256 digest of the content, or None if the argument is not a
+        DataFrame or array, holds Python objects other than strings, or has a
+        custom serializer.
+    """
+    if any(
+        cls in any_serializer.AnySerializer._custom_serialization_scheme
+        for cls in to_serialize.__class__.__mro__
+    ):
+        return None
+
+    content_hash = hashlib.sha256()
+    # numpy is already imported if the argument is an array.
+    np = sys.modules.get("numpy")
+    if supported_frameworks._is_pandas_dataframe(to_serialize):
+        import pandas as pd
+
+        # Other Python objects would be hashed by their string representation.
+        if any(
+            dtype == object
+            and pd.api.types.infer_dtype(column, skipna=True) not in ("string", "empty")
+            for dtype, (_, column) in zip(to_serialize.dtypes, to_serialize.items())
+        ):
+            return None
+        try:
+            row_hashes = pd.util.hash_pandas_object(to_serialize, index=True)
+        except TypeError:
+            return None
+        content_hash.update(f"pandas=={pd.__version__}".encode())
+        content_hash.update(repr(to_serialize.columns.tolist()).encode())
+        content_hash.update(repr(to_serialize.dtypes.tolist()).encode())
+        content_hash.update(repr(to_serialize.index.names).encode())
+        content_hash.update(row_hashes.to_numpy().tobytes())
+    elif np is not None and type(to_serialize) is np.ndarray:
+        if to_serialize.dtype.hasobject:
+            return None
+        content_hash.update(f"numpy=={np.__version__}".encode())
+        content_hash.update(f"{to_serialize.dtype.str}{to_serialize.shape}".encode())
+        content_hash.update(np.ascontiguousarray(to_serialize).tobytes())
+    else:
+        return None
+    return content_hash.hexdigest()
+
+
+def _get_storage_client():
+    """Returns the storage client of the global config."""
+    return gcs_utils._get_storage_client(
+        project=vertexai.preview.global_config.project,
+        credentials=vertexai.preview.global_config.credentials,
+    )
+
+
+def _copy_gcs_object(source_uri: str, destination_uri: str):
+    """Copies a GCS object without downloading it."""
+    client = _get_storage_client()
+    source_bucket, source_name = utils.extract_bucket_and_prefix_from_gcs_path(
+        source_uri
+    )
+    (
+        destination_bucket,
+        destination_name,
+    ) = utils.extract_bucket_and_prefix_from_gcs_path(destination_uri)
+    source_blob = client.bucket(source_bucket).blob(source_name)
+    destination_blob = client.bucket(destination_bucket).blob(destination_name)
+    # Large objects may take several rewrite calls.
+    rewrite_token, _, _ = destination_blob.rewrite(source_blob)
+    while rewrite_token is not None:
+        rewrite_token, _, _ = destination_blob.rewrite(source_blob, token=rewrite_token)
+
+
+def _get_cached_input_metadata(cached_input_path: str) -> Optional[Dict[str, Any]]:
+    """Gets the serialization metadata of a cached input.
+
+    Args:
+        cached_input_path (str):
+            Required. The GCS path of the cached input.
+
+    Returns:
+        The serialization metadata, or None if the input is not cached.
+    """
+    metadata_path = serializers.get_metadata_path_from_file_gcs_uri(cached_input_path)
+    bucket_name, blob_name = utils.extract_bucket_and_prefix_from_gcs_path(
+        metadata_path
+    )
+    blob = _get_storage_client().bucket(bucket_name).blob(blob_name)
+    try:
+        return json.loads(blob.download_as_bytes())
+    except api_exceptions.NotFound:
+        return None
+
+
+def _serialize_input(
+    serializer: any_serializer.AnySerializer,
+    to_serialize: Any,
+    gcs_path: str,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Serializes an argument of a remote method, reusing identical inputs.
+
+    DataFrames and arrays are stored once per content in the staging bucket.
+    When an input with the same content was already stored, it is copied
+    within GCS to `gcs_path` instead of being serialized and uploaded again.
+
+    Args:
+        serializer (any_serializer.AnySerializer):
+            Required. The serializer of the remote job.
+        to_serialize (Any):
+            Required. The argument to serialize.
+        gcs_path (str):
+            Required. The path of the argument in the input directory of the
+            remote job.
+        **kwargs:
+            Keyword arguments forwarded to the serializer.
+
+    Returns:
+        The serialization metadata of the argument.
+    """
+    fingerprint = (
+        _get_input_fingerprint(to_serialize) if gcs_path.startswith("gs://") else None
+    )
+    if fingerprint is None:
+        return serializer.serialize(
+            to_serialize=to_serialize, gcs_path=gcs_path, **kwargs
+        )
+
+    bucket_name, _ = utils.extract_bucket_and_prefix_from_gcs_path(gcs_path)
+    cached_input_path = "/".join(
+        [
+            f"gs://{bucket_name}",
+            _SERIALIZED_INPUT_CACHE_DIR,
+            fingerprint,
+            _SERIALIZED_INPUT_CACHE_FILE_NAME,
+        ]
+    )
+    paths = [
+        (cached_input_path, gcs_path),
+        (
+            serializers.get_metadata_path_from_file_gcs_uri(cached_input_path),
+            serializers.get_metadata_path_from_file_gcs_uri(gcs_path),
+        ),
+    ]
+
+    with _serialized_input_cache_lock:
+        serialization_metadata = _serialized_input_cache.get(cached_input_path)
+    if serialization_metadata is None:
+        serialization_metadata = _get_cached_input_metadata(cached_input_path)
+
+    if serialization_metadata is not None:
+        _LOGGER.info(f"Reusing serialized input {cached_input_path}.")
+        for cached_path, input_path in paths:
+            _copy_gcs_object(cached_path, input_path)
+    else:
+        serialization_metadata = serializer.serialize(
+            to_serialize=to_serialize, gcs_path=gcs_path, **kwargs
+        )
+        # The metadata is copied last, so that a cached input is only found
+        # once it is complete.
+        for cached_path, input_path in paths:
+            _copy_gcs_object(input_path, cached_path)
+
+    with _serialized_input_cache_lock:
+        _serialized_input_cache[cached_input_path] = serialization_metadata
+    return serialization_metadata
+
+
 def _get_remote_logs(
     job_id: str,
     logger: "google.cloud.logging.Logger",  # noqa: F821
@@ -591,6 +900,7 @@ def remote_training(invokable: shared._Invokable, rewrapper: Any):
         serializers_base.SERIALIZATION_METADATA_DEPENDENCIES_KEY
     ]
     # serialize args
+    serialize_kwargs = {}
     for arg_name, arg_value in serialized_args.items():
         if supported_frameworks._is_bigframe(arg_value):
             # Throw error for Python 3.11 + Bigframes Torch
@@ -599,20 +909,30 @@ def remote_training(invokable: shared._Invokable, rewrapper: Any):
                     "Currently Bigframes Torch serializer does not support"
                     "Python 3.11 since torcharrow is not supported on Python 3.11."
                 )
-            serialization_metadata = serializer.serialize(
-                to_serialize=arg_value,
-                gcs_path=os.path.join(remote_job_input_path, f"{arg_name}"),
-                framework=detected_framework,
-            )
+            serialize_kwargs[arg_name] = {"framework": detected_framework}
         else:
-            serialization_metadata = serializer.serialize(
-                to_serialize=arg_value,
-                gcs_path=os.path.join(remote_job_input_path, f"{arg_name}"),
-            )
-        # serializer.get_dependencies() must be run after serializer.serialize()
-        requirements += serialization_metadata[
-            serializers_base.SERIALIZATION_METADATA_DEPENDENCIES_KEY
-        ]
+            serialize_kwargs[arg_name] = {}
+    # Args are independent of each other, so they are serialized in parallel.
+    if serialized_args:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(serialized_args), _MAX_SERIALIZATION_WORKERS)
+        ) as executor:
+            serialization_futures = [
+                executor.submit(
+                    _serialize_input,
+                    serializer,
+                    arg_value,
+                    os.path.join(remote_job_input_path, f"{arg_name}"),
+                    **serialize_kwargs[arg_name],
+                )
+                for arg_name, arg_value in serialized_args.items()
+            ]
+        for serialization_future in serialization_futures:
+            serialization_metadata = serialization_future.result()
+            # serializer.get_dependencies() must be run after serializer.serialize()
+            requirements += serialization_metadata[
+                serializers_base.SERIALIZATION_METADATA_DEPENDENCIES_KEY
+            ]
 
     # execute the method in CustomJob
     # set training configuration
@@ -641,7 +961,6 @@ def remote_training(invokable: shared._Invokable, rewrapper: Any):
         requirements = _dedupe_requirements(vertex_requirements + config.requirements)
 
     requirements = _add_indirect_dependency_versions(requirements)
-    command = ["export PIP_ROOT_USER_ACTION=ignore &&"]
 
     # Combine user custom_commands and serializer custom_commands
     custom_commands += serialization_metadata[
@@ -650,6 +969,22 @@ def remote_training(invokable: shared._Invokable, rewrapper: Any):
     custom_commands += config.custom_commands
     custom_commands = list(dict.fromkeys(custom_commands))
 
+    # Install the dependencies once into a prebuilt image, so that the job
+    # starts without an install step.
+    if config.environment_image_repository and (requirements or custom_commands):
+        setup_commands = custom_commands
+        if container_uri == _PYTORCH_CUDA_CONTAINER_URI:
+            setup_commands = [_INSTALL_GIT_COMMAND] + setup_commands
+        container_uri = _get_environment_image(
+            config.environment_image_repository,
+            container_uri,
+            setup_commands,
+            requirements,
+        )
+        custom_commands = []
+        requirements = []
+
+    command = ["export PIP_ROOT_USER_ACTION=ignore &&"]
     if custom_commands:
         custom_commands = [f"{command} &&" for command in custom_commands]
         command.extend(custom_commands)
@@ -693,10 +1028,8 @@ def remote_training(invokable: shared._Invokable, rewrapper: Any):
         + autolog_command
     )
     command.append(training_command)
-    # Temporary fix for git not installed in pytorch cuda image
-    # Remove it once SDK 2.0 is release and don't need to be installed from git
-    if container_uri == "pytorch/pytorch:2.0.0-cuda11.7-cudnn8-runtime":
-        command = ["apt-get update && apt-get install -y git &&"] + command
+    if container_uri == _PYTORCH_CUDA_CONTAINER_URI:
+        command = [f"{_INSTALL_GIT_COMMAND} &&"] + command
 
     command = ["sh", "-c", " ".join(command)]
 
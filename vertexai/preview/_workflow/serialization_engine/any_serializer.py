@@ -16,8 +16,11 @@
 #
 # pylint: disable=line-too-long, bad-continuation,protected-access
 """Defines the Serializer classes."""
+import collections
+import copy
 import json
 import os
+import threading
 from typing import Any, Dict, Union, List, TypeVar, Type
 
 from google.cloud.aiplatform import base
@@ -113,6 +116,19 @@ SERIALIZATION_METADATA_FRAMEWORK_KEY = "framework"
 
 _LIGHTNING_ROOT_DIR = "/vertex_lightning_root_dir/"
 
+# Serializers keep the metadata of the object they serialize on their class, so
+# objects are serialized one at a time per serializer class. Objects handled by
+# different serializers can be serialized concurrently.
+_serializer_locks: Dict[type, threading.RLock] = collections.defaultdict(
+    threading.RLock
+)
+_serializer_locks_lock = threading.Lock()
+
+
+def _get_serializer_lock(serializer_cls: type) -> threading.RLock:
+    with _serializer_locks_lock:
+        return _serializer_locks[serializer_cls]
+
 
 def _check_dependency_versions(required_packages: List[str]):
     for package in required_packages:
@@ -207,32 +223,35 @@ class AnySerializer(serializers_base.Serializer):
                 serializer_path = _get_custom_serializer_path_from_file_gcs_uri(
                     gcs_path, serializer.__class__.__name__
                 )
-                serializers.CloudPickleSerializer().serialize(
-                    serializer, serializer_path
-                )
+                with _get_serializer_lock(serializers.CloudPickleSerializer):
+                    serializers.CloudPickleSerializer().serialize(
+                        serializer, serializer_path
+                    )
             else:
                 serializer = AnySerializer._get_predefined_serializer(
                     step_type
                 ).get_instance()
 
-            try:
-                serializer.serialize(
-                    to_serialize=to_serialize, gcs_path=gcs_path, **kwargs
-                )
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                if serializer.__class__.__name__ != "CloudPickleSerializer":
-                    _LOGGER.warning(
-                        "Failed to serialize %s with %s due to error %s",
-                        to_serialize.__class__.__name__,
-                        serializer.__class__.__name__,
-                        e,
+            with _get_serializer_lock(serializer.__class__):
+                try:
+                    serializer.serialize(
+                        to_serialize=to_serialize, gcs_path=gcs_path, **kwargs
                     )
-                    # Falling back to Serializers of super classes
-                    continue
-                else:
-                    raise serializers_base.SerializationError from e
-
-            metadata = serializer._metadata.to_dict()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    if serializer.__class__.__name__ != "CloudPickleSerializer":
+                        _LOGGER.warning(
+                            "Failed to serialize %s with %s due to error %s",
+                            to_serialize.__class__.__name__,
+                            serializer.__class__.__name__,
+                            e,
+                        )
+                        # Falling back to Serializers of super classes
+                        continue
+                    else:
+                        raise serializers_base.SerializationError from e
+
+                # Copied, since the metadata is changed by the next object.
+                metadata = copy.deepcopy(serializer._metadata.to_dict())
             serializers_base.write_and_upload_data(
                 json.dumps(metadata).encode(), metadata_path
             )
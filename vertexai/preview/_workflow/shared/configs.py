@@ -101,6 +101,14 @@ class RemoteConfig(_BaseConfig):
         custom_commands (List[str]):
             List of custom commands to be run in the remote job environment.
             These commands will be run before the requirements are installed.
+        environment_image_repository (str):
+            Container image repository to store prebuilt dependency environments
+            in, for example "us-docker.pkg.dev/my-project/my-repo/remote-env".
+            When set, the custom commands and requirements are installed once
+            into an image on top of the training container, tagged by the hash
+            of the environment and pushed to this repository with the local
+            Docker client. Remote jobs with the same environment reuse the
+            image and start without an install step.
     """
 
     enable_cuda: bool = False
@@ -109,6 +117,7 @@ class RemoteConfig(_BaseConfig):
     service_account: Optional[str] = None
     requirements: List[str] = dataclasses.field(default_factory=list)
     custom_commands: List[str] = dataclasses.field(default_factory=list)
+    environment_image_repository: Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -165,6 +174,7 @@ class VertexConfig:
         service_account: Optional[str] = None,
         requirements: List[str] = [],
         custom_commands: List[str] = [],
+        environment_image_repository: Optional[str] = None,
         replica_count: Optional[int] = None,
         boot_disk_type: Optional[str] = None,
         boot_disk_size_gb: Optional[int] = None,
@@ -254,6 +264,13 @@ class VertexConfig:
             custom_commands (List[str]):
                 List of custom commands to be run in the remote job environment.
                 These commands will be run before the requirements are installed.
+            environment_image_repository (str):
+                Container image repository to store prebuilt dependency
+                environments in. When set, the custom commands and requirements
+                are installed once into an image tagged by the hash of the
+                environment, and remote jobs with the same environment start
+                without an install step. This parameter is specifically for
+                TrainingConfig.
             replica_count (int):
                 The number of worker replicas. Assigns 1 chief replica and
                 replica_count - 1 worker replicas. This is specifically for
@@ -20,6 +20,8 @@ import functools
 import inspect
 import logging
 import os
+import statistics
+import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import uuid
 
@@ -100,6 +102,13 @@ _SUPPORTED_CLASSIFICATION_METRIC_IDS = frozenset(
 _STUDY_NAME_PREFIX = "vizier_hyperparameter_tuner_study"
 _CLIENT_ID = "client"
 
+# Trial scheduling constants
+_MIN_FINISHED_TRIALS_FOR_STRAGGLER_DETECTION = 3
+_STRAGGLER_INFEASIBLE_REASON = "Stopped as a straggler."
+_TRIAL_STATE_SUCCEEDED = "SUCCEEDED"
+_TRIAL_STATE_FAILED = "FAILED"
+_TRIAL_STATE_STOPPED = "STOPPED"
+
 # Train and test split constants
 _DEFAULT_TEST_FRACTION = 0.25
 
@@ -130,6 +139,7 @@ class VizierHyperparameterTuner:
         project: Optional[str] = None,
         location: Optional[str] = None,
         study_display_name_prefix: str = _STUDY_NAME_PREFIX,
+        straggler_factor: Optional[float] = None,
     ):
         """Initializes a VizierHyperparameterTuner instance.
 
@@ -196,7 +206,24 @@ class VizierHyperparameterTuner:
             study_display_name_prefix (str):
                 Optional. Prefix of the study display name. Default is
                 'vizier-hyperparameter-tuner-study'.
+            straggler_factor (float):
+                Optional. If set, a running trial is stopped once it has run
+                longer than straggler_factor times the median duration of the
+                trials finished so far, and a new trial takes its place.
+                Stopped trials are reported as infeasible and their results are
+                discarded. Stragglers are only detected after 3 trials have
+                finished. Default is None, which never stops trials.
+
+                Note that a stopped trial is not cancelled: its training, and
+                its remote job when running remotely, keeps running until it
+                returns. The number of concurrent trainings, and their cost,
+                can therefore exceed parallel_trial_count.
         """
+        if straggler_factor is not None and straggler_factor <= 0:
+            raise ValueError(
+                f"straggler_factor must be greater than 0 but was {straggler_factor}."
+            )
+
         self.get_model_func = get_model_func
         self.max_trial_count = max_trial_count
         self.parallel_trial_count = parallel_trial_count
@@ -211,6 +238,7 @@ class VizierHyperparameterTuner:
         self.metric_goal = metric_goal
         self.max_failed_trial_count = max_failed_trial_count
         self.search_algorithm = search_algorithm
+        self.straggler_factor = straggler_factor
 
         # Initializes Vertex config
         self.vertex = configs.VertexConfig()
@@ -225,6 +253,9 @@ class VizierHyperparameterTuner:
         # self.models should be a mapping from trial names to trained models.
         self.models = {}
 
+        # Utilization metrics of the trials and slots of the last fit() call.
+        self.utilization_metrics = {}
+
     def _create_study(
         self,
         project: str,
@@ -264,12 +295,11 @@ class VizierHyperparameterTuner:
     def _suggest_trials(self, num_trials: int) -> List[gca_study.Trial]:
         """Suggests trials using the Vizier client.
 
-        During each round of tuning, num_trials number of trials will
-        be suggested. For each trial, training will be performed locally or
-        remotely. After training finishes, we use the trained model to measure
-        the metrics and report the metrics to the trial before marking it as
-        completed. At the next round of tuning, another parallel_trial_count
-        of trials will be suggested based on previous measurements.
+        Trials are suggested whenever trial slots are free. For each trial,
+        training will be performed locally or remotely. After training
+        finishes, we use the trained model to measure the metrics and report
+        the metrics to the trial before marking it as completed, so that the
+        next suggestions are based on the measurements reported so far.
 
         Args:
             num_trials (int): Required. Number of trials to suggest.
@@ -496,6 +526,95 @@ class VizierHyperparameterTuner:
                 {"name": trial_name, "trial_infeasible": True}
             )
 
+    def _stop_trial(self, trial_name: str) -> None:
+        """Stops a straggler trial by reporting it as infeasible.
+
+        The training of the trial is not interrupted, but its result will be
+        discarded.
+
+        Args:
+            trial_name (str):
+                Required. The trial name.
+        """
+        self.vizier_client.complete_trial(
+            {
+                "name": trial_name,
+                "trial_infeasible": True,
+                "infeasible_reason": _STRAGGLER_INFEASIBLE_REASON,
+            }
+        )
+
+    def _get_straggler_deadline(
+        self, start_time: float, finished_durations: List[float]
+    ) -> Optional[float]:
+        """Gets the time after which a running trial is a straggler.
+
+        Args:
+            start_time (float):
+                Required. The time the trial started, from time.monotonic().
+            finished_durations (List[float]):
+                Required. The durations of the trials finished so far, in
+                seconds.
+        Returns:
+            The deadline of the trial, or None if it should not be stopped.
+        """
+        if (
+            self.straggler_factor is None
+            or len(finished_durations) < _MIN_FINISHED_TRIALS_FOR_STRAGGLER_DETECTION
+        ):
+            return None
+        return start_time + self.straggler_factor * statistics.median(
+            finished_durations
+        )
+
+    def _get_utilization_metrics(
+        self,
+        trial_metrics: Dict[str, Dict[str, Any]],
+        wall_time_secs: float,
+    ) -> Dict[str, Any]:
+        """Summarizes how busy the trial slots were during tuning.
+
+        Args:
+            trial_metrics (Dict[str, Dict[str, Any]]):
+                Required. A mapping from trial names to their slot, duration in
+                seconds and final state.
+            wall_time_secs (float):
+                Required. The duration of the tuning, in seconds.
+        Returns:
+            A dictionary with the following keys:
+                'trials': trial_metrics.
+                'slots': A mapping from slot indices to their busy time in
+                seconds, number of trials and utilization.
+                'wall_time_secs': wall_time_secs.
+                'utilization': The fraction of the slot time spent running
+                trials.
+        """
+        slot_metrics = {
+            slot: {"busy_secs": 0.0, "trial_count": 0, "utilization": 0.0}
+            for slot in range(self.parallel_trial_count)
+        }
+        for trial_metric in trial_metrics.values():
+            slot_metric = slot_metrics[trial_metric["slot"]]
+            slot_metric["busy_secs"] += trial_metric["duration_secs"]
+            slot_metric["trial_count"] += 1
+        if wall_time_secs > 0:
+            for slot_metric in slot_metrics.values():
+                slot_metric["utilization"] = slot_metric["busy_secs"] / wall_time_secs
+
+        busy_secs = sum(
+            slot_metric["busy_secs"] for slot_metric in slot_metrics.values()
+        )
+        return {
+            "trials": trial_metrics,
+            "slots": slot_metrics,
+            "wall_time_secs": wall_time_secs,
+            "utilization": (
+                busy_secs / (wall_time_secs * self.parallel_trial_count)
+                if wall_time_secs > 0
+                else 0.0
+            ),
+        }
+
     def _get_model_param_type_mapping(self):
         """Gets a mapping from parameter_id to its type.
 
@@ -866,6 +985,11 @@ class VizierHyperparameterTuner:
         Extra runtime arguments will be forwarded to a model's fit() or
         @vertexai.preview.developer.mark.train()-decorated method.
 
+        Up to parallel_trial_count trials run at a time, and a new trial is
+        suggested as soon as one finishes. After tuning, utilization_metrics
+        holds the duration, slot and state of each trial, and how busy each
+        slot was.
+
         Example Usage:
         ```
         def get_model_func(parameter_a, parameter_b):
@@ -935,50 +1059,127 @@ class VizierHyperparameterTuner:
 
         # Disable remote job logs when running trials.
         logging.getLogger("vertexai.remote_execution").disabled = True
+        # Trials run in a steady state: a new trial is suggested as soon as a
+        # slot is free, instead of after all the trials of a round finish.
+        # Stopped stragglers keep their thread until their training returns, so
+        # the executor can have more threads than slots.
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(self.max_trial_count, 1)
+        )
+        tuning_start_time = time.monotonic()
+        num_started_trials = 0
+        num_completed_trials = 0
+        num_failed_trials = 0
+        num_stopped_trials = 0
+        free_slots = list(range(self.parallel_trial_count))
+        # Mapping from the futures of running trials to their trial, slot and
+        # start time.
+        running_trials = {}
+        finished_durations = []
+        trial_metrics = {}
         try:
-            num_completed_trials = 0
-            num_failed_trials = 0
-            while num_completed_trials < self.max_trial_count:
+            while num_started_trials < self.max_trial_count or running_trials:
                 num_new_trials = min(
-                    (self.max_trial_count - num_completed_trials),
-                    self.parallel_trial_count,
-                )
-                suggested_trials = self._suggest_trials(num_new_trials)
-                inputs = [
-                    (x, y, x_test, y_test, trial, fixed_init_params, kwargs)
-                    for trial in suggested_trials
-                ]
-                _LOGGER.info(
-                    f"Number of completed trials: {num_completed_trials}, "
-                    f"Number of new trials: {num_new_trials}."
+                    self.max_trial_count - num_started_trials, len(free_slots)
                 )
-
-                with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=num_new_trials
-                ) as executor:
-                    trial_outputs = list(
-                        executor.map(lambda t: self._run_trial(*t), inputs)
+                if num_new_trials > 0:
+                    _LOGGER.info(
+                        f"Number of completed trials: {num_completed_trials}, "
+                        f"Number of new trials: {num_new_trials}."
                     )
+                    suggested_trials = self._suggest_trials(num_new_trials)
+                    for trial in suggested_trials[:num_new_trials]:
+                        future = executor.submit(
+                            self._run_trial,
+                            x,
+                            y,
+                            x_test,
+                            y_test,
+                            trial,
+                            fixed_init_params,
+                            kwargs,
+                        )
+                        running_trials[future] = (
+                            trial,
+                            free_slots.pop(0),
+                            time.monotonic(),
+                        )
+                        num_started_trials += 1
+                if not running_trials:
+                    # The study has no more trials to suggest.
+                    break
+
+                deadlines = {
+                    future: self._get_straggler_deadline(start_time, finished_durations)
+                    for future, (_, _, start_time) in running_trials.items()
+                }
+                next_deadline = min(
+                    (d for d in deadlines.values() if d is not None),
+                    default=None,
+                )
+                done_futures, _ = concurrent.futures.wait(
+                    running_trials,
+                    timeout=(
+                        None
+                        if next_deadline is None
+                        else max(next_deadline - time.monotonic(), 0)
+                    ),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
 
-                for i in range(num_new_trials):
-                    trial_output = trial_outputs[i]
-                    self._add_model_and_report_trial_metrics(
-                        suggested_trials[i].name, trial_output
-                    )
-                    if not trial_output:
+                now = time.monotonic()
+                for future in list(running_trials):
+                    trial, slot, start_time = running_trials[future]
+                    if future in done_futures:
+                        trial_output = future.result()
+                        self._add_model_and_report_trial_metrics(
+                            trial.name, trial_output
+                        )
+                        num_completed_trials += 1
+                        finished_durations.append(now - start_time)
+                        state = (
+                            _TRIAL_STATE_SUCCEEDED
+                            if trial_output
+                            else _TRIAL_STATE_FAILED
+                        )
+                    elif deadlines[future] is not None and deadlines[future] <= now:
+                        _LOGGER.warning(
+                            f"Trial {trial.name} has run for {now - start_time:.1f} "
+                            "seconds, stopping it as a straggler."
+                        )
+                        self._stop_trial(trial.name)
+                        num_stopped_trials += 1
+                        state = _TRIAL_STATE_STOPPED
+                    else:
+                        continue
+
+                    del running_trials[future]
+                    free_slots.append(slot)
+                    trial_metrics[trial.name] = {
+                        "slot": slot,
+                        "duration_secs": now - start_time,
+                        "state": state,
+                    }
+                    if state == _TRIAL_STATE_FAILED:
                         num_failed_trials += 1
                         if num_failed_trials == self.max_failed_trial_count:
                             raise ValueError("Maximum number of failed trials reached.")
-                num_completed_trials += num_new_trials
         except Exception as e:
             raise e
         finally:
+            executor.shutdown(wait=False)
             # Enable remote job logs after trials are complete.
             logging.getLogger("vertexai.remote_execution").disabled = False
+            self.utilization_metrics = self._get_utilization_metrics(
+                trial_metrics, time.monotonic() - tuning_start_time
+            )
 
         if num_failed_trials == num_completed_trials:
             raise ValueError("All trials failed.")
 
         _LOGGER.info(
-            f"Number of completed trials: {num_completed_trials}. Tuning complete."
+            f"Number of completed trials: {num_completed_trials}, "
+            f"Number of stopped trials: {num_stopped_trials}. Tuning complete. "
+            "Trial slot utilization: "
+            f"{self.utilization_metrics['utilization']:.1%}."
         )
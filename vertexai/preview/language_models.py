@@ -32,6 +32,13 @@ from vertexai.language_models._language_models import (
     TuningEvaluationSpec,
 )
 
+from vertexai.language_models._prediction_cache import (
+    InMemoryPredictionCache,
+    PredictionCache,
+    PredictionCacheStats,
+    SqlitePredictionCache,
+)
+
 from vertexai.language_models._evaluatable_language_models import (
     EvaluationTextGenerationSpec,
     EvaluationTextSummarizationSpec,
@@ -62,7 +69,11 @@ __all__ = [
     "EvaluationTextSummarizationSpec",
     "EvaluationQuestionAnsweringSpec",
     "EvaluationTextClassificationSpec",
+    "InMemoryPredictionCache",
     "InputOutputTextPair",
+    "PredictionCache",
+    "PredictionCacheStats",
+    "SqlitePredictionCache",
     "TextEmbedding",
     "TextEmbeddingInput",
     "TextEmbeddingModel",